@@ -0,0 +1,79 @@
+"""
+Measure service deployment throughput and memory per deployed instance.
+
+Deploying copies a service blueprint into a running instance. This compares
+the template clone the game uses with a full ``copy.deepcopy`` of the
+blueprint (how deployment used to work), over every service in the content.
+
+Usage (from the neon_destiny directory):
+    python benchmarks/deploy.py --instances 20000
+"""
+
+import argparse
+import copy
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+# Make the package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neon_shadow.content.services import SERVICES
+from neon_shadow.service import CloudService, create_service
+
+
+def clone_deploy(blueprint: CloudService, instance_id: str) -> CloudService:
+    service = blueprint.clone(instance_id)
+    service.is_deployed = True
+    service.deployment_region = "us-east-1"
+    return service
+
+
+def deepcopy_deploy(blueprint: CloudService, instance_id: str) -> CloudService:
+    service = copy.deepcopy(blueprint)
+    service.instance_id = instance_id
+    service.is_deployed = True
+    service.deployment_region = "us-east-1"
+    return service
+
+
+def measure(deploy: Callable[[CloudService, str], CloudService],
+            blueprints: List[CloudService], count: int):
+    """Return (deploys per second, bytes per live instance)."""
+    ids = [f"i-{n:08x}" for n in range(count)]
+    gc.collect()
+    start = time.perf_counter()
+    for n, instance_id in enumerate(ids):
+        deploy(blueprints[n % len(blueprints)], instance_id)
+    rate = count / (time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    live = [deploy(blueprints[n % len(blueprints)], instance_id)
+            for n, instance_id in enumerate(ids)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rate, (after - before) / len(live)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--instances", type=int, default=20000,
+                        help="instances to deploy per method (default: 20000)")
+    args = parser.parse_args(argv)
+
+    blueprints = [create_service(data, f"bp-{n}") for n, data in enumerate(SERVICES.values())]
+    print(f"Blueprints: {len(blueprints)}  Instances per method: {args.instances}")
+    print(f"{'method':<10} {'deploys/s':>12} {'bytes/instance':>15}")
+    for name, deploy in (("deepcopy", deepcopy_deploy), ("clone", clone_deploy)):
+        rate, size = measure(deploy, blueprints, args.instances)
+        print(f"{name:<10} {rate:>12,.0f} {size:>15.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""
+Load-test the game server with many idle sessions and a few busy ones.
+
+Starts ``server.py`` on a free local port (or uses one given with --port),
+opens the idle sessions, which read the title screen and then wait, then
+plays turns in the busy sessions. Reports how long each busy prompt took to
+answer while the idle sessions were held open, and the server's memory and
+thread count.
+
+With --workers N the sessions go through ``router.py`` to N worker
+processes instead, and the router's per-worker table is printed at the end.
+With --web they play ``web.py`` over WebSockets, through a stand-in for the
+browser page that keeps the screen from the server's line updates; it also
+reports how many of the screen's lines the updates had to send.
+
+Busy sessions mostly explore, check their status and inventory every
+fourth turn and rest every fourth turn. Resting pauses the
+game for a second or two by design; those prompts are reported apart, as
+the pause only holds up the session that is resting.
+
+Usage (from the neon_destiny directory):
+    python benchmarks/load_sessions.py --idle 2000 --busy 20 --turns 30
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GO_AHEAD = b"\xff\xf9"
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+RANGE = re.compile(r"(\d+) and (\d+)")
+ACTIONS = ("1", "4", "1", "7")  # Explore, status, explore, rest
+LISTENING = re.compile(r" on \S*:(\d+)")  # Port in the server's first line
+
+
+class TcpClient:
+    """A player on server.py, started with --go-ahead to mark the end of every prompt."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.played = 0  # Turns played
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "TcpClient":
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def prompt(self) -> str:
+        """Read up to the end of the next prompt and return the text, without colors."""
+        data = await self.reader.readuntil(GO_AHEAD)
+        return ANSI_ESCAPE.sub("", data[:-len(GO_AHEAD)].decode("utf-8", "replace"))
+
+    def answer(self, line: str) -> None:
+        self.writer.write(line.encode() + b"\r\n")
+
+    def connected(self) -> bool:
+        return not self.reader.at_eof()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class WebClient(TcpClient):
+    """A stand-in for the browser page on web.py: a WebSocket client that
+    keeps the screen up to date from the server's line updates."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        super().__init__(reader, writer)
+        self.lines: List[str] = []
+        self.received: List[str] = []  # Lines sent as text, by number
+        self.changed = 0  # Lines the updates changed
+        self.sent = 0  # Of those, lines sent as text rather than by number
+        self.shown = 0  # Lines on screen after each update
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "WebClient":
+        reader, writer = await asyncio.open_connection(host, port)
+        key = base64.b64encode(os.urandom(16)).decode()
+        writer.write(f"GET /play HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\n"
+                     f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+                     f"Sec-WebSocket-Version: 13\r\n\r\n".encode())
+        head = await reader.readuntil(b"\r\n\r\n")
+        if not head.startswith(b"HTTP/1.1 101"):
+            raise ConnectionError(head.split(b"\r\n", 1)[0].decode())
+        return cls(reader, writer)
+
+    async def prompt(self) -> str:
+        """Apply updates up to the next prompt and return the screen, without colors."""
+        while True:
+            first, second = await self.reader.readexactly(2)
+            length = second & 0x7F
+            if length >= 126:
+                length = int.from_bytes(await self.reader.readexactly(2 if length == 126 else 8), "big")
+            payload = await self.reader.readexactly(length)
+            if first & 0x0F == 0x8:  # Closed
+                raise asyncio.IncompleteReadError(b"", None)
+            update = json.loads(payload)
+            del self.lines[:update.get("drop", 0)]
+            del self.lines[update["rows"]:]
+            self.lines += [""] * (update["rows"] - len(self.lines))
+            for row, line in update["set"]:
+                if isinstance(line, int):
+                    line = self.received[line]
+                else:
+                    self.received.append(line)
+                    self.sent += 1
+                self.lines[row] = line
+            self.changed += len(update["set"])
+            self.shown += update["rows"]
+            if update.get("prompt"):
+                return ANSI_ESCAPE.sub("", "\n".join(self.lines))
+
+    def answer(self, line: str) -> None:
+        data = line.encode()
+        mask = os.urandom(4)
+        masked = bytes(byte ^ mask[i % 4] for i, byte in enumerate(data))
+        self.writer.write(bytes((0x81, 0x80 | len(data))) + mask + masked)  # Text, masked, short
+
+
+def answer(prompt: str, turn: int) -> Tuple[str, bool]:
+    """Return the answer to a prompt and whether it starts a turn."""
+    last = prompt.rsplit("\n", 1)[-1]
+    if "(1-9)" in last:
+        # Mostly explore, checking the status screen and resting every few turns
+        return ACTIONS[turn % len(ACTIONS)], True
+    if "(y/n)" in last:
+        return "n", False
+    if "ranger name" in last:
+        return "Load Ranger", False
+    if "Press Enter" in last or not last.endswith(": "):
+        return "", False
+    bounds = RANGE.findall(prompt)  # After an out-of-range answer
+    return (bounds[-1][0] if bounds else "1"), False
+
+
+def rests(prompt: str, reply: str) -> bool:
+    """Return True if the reply to a prompt starts a day of rest."""
+    return "(1-3)" in prompt.rsplit("\n", 1)[-1] and reply == "1"
+
+
+async def open_idle(client: type, host: str, port: int, opened: List[float]) -> TcpClient:
+    """Open a session and read its title screen."""
+    start = time.perf_counter()
+    session = await client.connect(host, port)
+    await session.prompt()
+    opened.append(time.perf_counter() - start)
+    return session
+
+
+async def busy_session(client: type, host: str, port: int, turns: int, latencies: List[float],
+                       paced: List[float]) -> TcpClient:
+    """Play turns in a session, timing every answer, and return it once closed.
+
+    Answers to prompts that start a rest are timed into paced, the rest
+    into latencies.
+    """
+    session = await client.connect(host, port)
+    await session.prompt()
+    session.answer("1")  # Start a new game
+    resting = False
+    for _ in range(turns * 20):  # Bounded, in case a menu keeps asking
+        start = time.perf_counter()
+        prompt = await session.prompt()
+        (paced if resting else latencies).append(time.perf_counter() - start)
+        reply, new_turn = answer(prompt, session.played)
+        if new_turn:
+            if session.played == turns:
+                break
+            session.played += 1
+        resting = rests(prompt, reply)
+        session.answer(reply)
+    session.close()
+    return session
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))] if values else 0.0
+
+
+def server_stats(pid: int) -> Optional[Tuple[int, int]]:
+    """Return the server's resident memory in KiB and its thread count (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            fields = dict(line.split(":", 1) for line in f)
+    except OSError:
+        return None
+    return int(fields["VmRSS"].split()[0]), int(fields["Threads"])
+
+
+async def run(client: type, host: str, port: int, idle: int, busy: int, turns: int,
+              pid: Optional[int], batch: int) -> None:
+    baseline = server_stats(pid) if pid else None
+    opened: List[float] = []
+    start = time.perf_counter()
+    idlers = []
+    for first in range(0, idle, batch):
+        # Open in batches so the listen backlog never overflows
+        idlers += await asyncio.gather(*(open_idle(client, host, port, opened)
+                                         for _ in range(first, min(idle, first + batch))))
+    ramp = time.perf_counter() - start
+    print(f"Idle sessions:   {len(opened)} open in {ramp:.1f}s "
+          f"(title screen p50 {percentile(opened, 0.5) * 1e3:.1f} ms, "
+          f"p99 {percentile(opened, 0.99) * 1e3:.1f} ms)")
+    held = server_stats(pid) if pid else None
+    if baseline and held:
+        print(f"Server:          {held[0] / 1024:.0f} MiB resident, {held[1]} threads "
+              f"({(held[0] - baseline[0]) / max(1, idle):.0f} KiB per idle session)")
+
+    latencies: List[float] = []
+    paced: List[float] = []
+    start = time.perf_counter()
+    sessions = await asyncio.gather(*(busy_session(client, host, port, turns, latencies, paced)
+                                      for _ in range(busy)))
+    elapsed = time.perf_counter() - start
+    played = [session.played for session in sessions]
+    print(f"Busy sessions:   {busy} played {sum(played)} turns in {elapsed:.1f}s "
+          f"({sum(played) / elapsed:.0f} turns/s, {len(latencies)} prompts)")
+    print(f"Prompt latency:  p50 {percentile(latencies, 0.5) * 1e3:.1f} ms, "
+          f"p90 {percentile(latencies, 0.9) * 1e3:.1f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1e3:.1f} ms, "
+          f"max {max(latencies, default=0) * 1e3:.1f} ms")
+    print(f"Rests:           {len(paced)}, answered in "
+          f"{sum(paced) / max(1, len(paced)):.2f}s on average (paused by design)")
+    if client is WebClient:
+        shown = sum(session.shown for session in sessions)
+        changed = sum(session.changed for session in sessions)
+        sent = sum(session.sent for session in sessions)
+        print(f"Screen updates:  {shown} lines on screen, {changed} changed "
+              f"({100 * changed / max(1, shown):.0f}%), {sent} sent as text "
+              f"({100 * sent / max(1, shown):.0f}%)")
+
+    alive = sum(session.connected() for session in idlers)
+    for session in idlers:
+        session.close()
+    print(f"Idle sessions still connected at the end: {alive}/{idle}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--idle", type=int, default=1000,
+                        help="sessions opened and left waiting (default: 1000)")
+    parser.add_argument("--busy", type=int, default=10,
+                        help="sessions playing turns meanwhile (default: 10)")
+    parser.add_argument("--turns", type=int, default=20,
+                        help="turns played by each busy session (default: 20)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None,
+                        help="use a running server (server.py started with --go-ahead, "
+                             "or web.py) instead of starting one")
+    parser.add_argument("--batch", type=int, default=200,
+                        help="idle sessions opened at a time (default: 200)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="serve through router.py with this many worker processes")
+    parser.add_argument("--web", action="store_true",
+                        help="play web.py over WebSockets instead of server.py over TCP")
+    args = parser.parse_args(argv)
+    if args.web and args.workers:
+        parser.error("--web and --workers cannot be combined")
+    client = WebClient if args.web else TcpClient
+
+    server = None
+    port, pid = args.port, None
+    if port is None:
+        command = [sys.executable, os.path.join(ROOT, "server.py"), "--go-ahead"]
+        if args.workers:
+            command = [sys.executable, os.path.join(ROOT, "router.py"), "--go-ahead",
+                       "--workers", str(args.workers), "--stats", "0"]
+        elif args.web:
+            command = [sys.executable, os.path.join(ROOT, "web.py")]
+        server = subprocess.Popen(
+            command + ["--port", "0", "--render", "instant",
+                       "--max-sessions", str(args.idle + args.busy)],
+            stdout=subprocess.PIPE, text=True, cwd=ROOT)
+        port = int(LISTENING.search(server.stdout.readline()).group(1))
+        if not args.workers:
+            pid = server.pid  # The router's own memory says nothing about the sessions
+    try:
+        asyncio.run(run(client, args.host, port, args.idle, args.busy, args.turns, pid, args.batch))
+    finally:
+        if server is not None:
+            if args.workers:
+                time.sleep(1.5)  # Let every worker report its last turns
+                server.send_signal(signal.SIGINT)
+                print(server.communicate()[0], end="")
+            else:
+                server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
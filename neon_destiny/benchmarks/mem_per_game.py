@@ -0,0 +1,101 @@
+"""
+Measure the resident memory of one headless game with tracemalloc.
+
+Builds a batch of games, plays each for a number of turns with a simulator
+policy, keeps them all alive and reports the traced bytes per game, split
+by the domain object types that make up the world.
+
+Usage (from the neon_destiny directory):
+    python benchmarks/mem_per_game.py --games 200 --days 60
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from collections import Counter
+
+# Make the package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neon_shadow.game import Game
+from neon_shadow.sim import POLICIES, PolicyDriver, CampaignAborted
+from neon_shadow.service import CloudService
+from neon_shadow.artifact import CloudArtifact
+from neon_shadow.event import CloudEvent
+from neon_shadow.quest import Quest
+from neon_shadow.location import Location
+
+DOMAIN_TYPES = (CloudService, CloudArtifact, CloudEvent, Quest, Location)
+
+
+class _DayLimit(Exception):
+    """Stops a game after the requested number of days."""
+
+
+def build_game(seed: int, days: int, policy: str) -> Game:
+    """Create a game and play it for up to the given number of days."""
+    driver = PolicyDriver(POLICIES[policy](random.Random(seed)))
+    game = Game(io=driver, seed=seed)
+    driver.game = game
+    game.create_player("Bench Ranger", 1 + seed % 4)
+
+    # Stop at the main menu once the day limit is reached
+    choose = driver.policy.choose
+
+    def limited(game_, prompt_text, options):
+        if game_.current_day > days:
+            raise _DayLimit
+        return choose(game_, prompt_text, options)
+
+    driver.policy.choose = limited
+    try:
+        game.game_loop()
+    except (_DayLimit, CampaignAborted):
+        pass
+    return game
+
+
+def count_domain_objects() -> Counter:
+    """Count the live domain objects."""
+    counts = Counter()
+    for obj in gc.get_objects():
+        if isinstance(obj, DOMAIN_TYPES):
+            counts[type(obj).__name__] += 1
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=200, help="games to keep alive (default: 200)")
+    parser.add_argument("--days", type=int, default=60, help="days to play per game (default: 60)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy",
+                        help="simulator policy (default: greedy)")
+    args = parser.parse_args(argv)
+
+    # Warm up imports and caches so they are not charged to the first game
+    build_game(0, 2, args.policy)
+    gc.collect()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    games = [build_game(seed, args.days, args.policy) for seed in range(1, args.games + 1)]
+    gc.collect()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_game = (after - before) / len(games)
+    counts = count_domain_objects()
+    print(f"Games: {len(games)}  Days each: {args.days}  Policy: {args.policy}")
+    print(f"Resident per game: {per_game / 1024:.1f} KiB")
+    print(f"Peak while building: {(peak - before) / 1024 / 1024:.1f} MiB")
+    print("Domain objects per game:")
+    for name, count in sorted(counts.items()):
+        print(f"  {name:<14} {count / len(games):>7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
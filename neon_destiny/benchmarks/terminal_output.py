@@ -0,0 +1,138 @@
+"""
+Measure what reaches the terminal per rendered screen.
+
+Compares the terminal driver writing through a colorama-wrapped, line
+buffered sys.stdout (how the game used to run on every platform) with the
+RawOutput backend it now uses on POSIX terminals, both with the driver
+dropping redundant color sequences (as it does in play) and with text
+written as given. Each case counts the bytes and write system calls that
+reach the file descriptor, and the time spent.
+
+Cases:
+    status screen  the turn's frame: status box, location and action menu
+    messages       20 lines of action results written outside a frame
+    typed line     a 60 character line typed out by print_slow (cinematic)
+
+Usage (from the neon_destiny directory):
+    python benchmarks/terminal_output.py --screens 2000
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+# Measure colored output even when this script's own stdout is not a terminal
+os.environ.setdefault("FORCE_COLOR", "1")
+
+# Make the package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neon_shadow.driver import RawOutput, TerminalDriver, use_driver
+from neon_shadow.game import Game
+from neon_shadow.ui import echo, print_slow, set_render_profile
+
+
+CASES = ("status screen", "messages", "typed line")
+
+
+class CountingRaw(io.RawIOBase):
+    """A terminal stand-in that counts and discards what is written to it."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.bytes = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.calls += 1
+        self.bytes += len(data)
+        return len(data)
+
+
+def colorama_output(raw: CountingRaw):
+    """Return sys.stdout as the game used to set it up, over raw."""
+    import colorama.ansitowin32
+    stdout = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8", line_buffering=True)
+    return colorama.ansitowin32.AnsiToWin32(stdout, autoreset=True).stream
+
+
+def raw_output(raw: CountingRaw) -> RawOutput:
+    return RawOutput(raw)
+
+
+def cases(game: Game, driver: TerminalDriver) -> Dict[str, Callable[[], None]]:
+    def status_screen():
+        driver.screen.touched()  # In play the last action's output is still on screen
+        driver.clear()
+        game.display_status()
+        game.player.current_location.display()
+        game.display_actions()
+        driver.flush()
+
+    def messages():
+        for n in range(20):
+            echo(f"Service i-{n:08x} earned {n * 1.5:.2f} credits")
+        driver.flush()
+
+    def typed_line():
+        print_slow("Exploring Cloud City... scanning the perimeter for anomalies.", delay=0)
+
+    return {"status screen": status_screen, "messages": messages, "typed line": typed_line}
+
+
+def measure(make_output, compact: bool, screens: int) -> Dict[str, tuple]:
+    """Return case name -> (bytes, write calls, microseconds) per screen."""
+    results = {}
+    for name in CASES:
+        raw = CountingRaw()
+        driver = TerminalDriver(make_output(raw), compact=compact)
+        game = Game(io=driver, seed=1)
+        game.create_player("Bench Ranger", 1)
+        run = cases(game, driver)[name]
+        with use_driver(driver):
+            run()  # Warm up
+            driver.flush()
+            raw.calls = raw.bytes = 0
+            start = time.perf_counter()
+            for _ in range(screens):
+                run()
+            elapsed = time.perf_counter() - start
+        results[name] = (raw.bytes / screens, raw.calls / screens, elapsed / screens * 1e6)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--screens", type=int, default=2000,
+                        help="screens rendered per case (default: 2000)")
+    args = parser.parse_args(argv)
+    set_render_profile("cinematic")
+
+    backends = [("verbatim", raw_output, False), ("raw", raw_output, True)]
+    try:
+        import colorama  # noqa: F401
+        backends.insert(0, ("colorama", colorama_output, False))
+    except ImportError:
+        print("colorama is not installed; measuring the raw backends only")
+
+    print(f"Screens per case: {args.screens}")
+    print(f"{'case':<14} {'backend':<9} {'bytes':>8} {'writes':>7} {'us':>8}")
+    results = {backend: measure(make_output, compact, args.screens)
+               for backend, make_output, compact in backends}
+    for name in results["raw"]:
+        for backend in results:
+            size, calls, micros = results[backend][name]
+            print(f"{name:<14} {backend:<9} {size:>8.0f} {calls:>7.1f} {micros:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
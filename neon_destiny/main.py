@@ -2,9 +2,10 @@
 import os
 import sys
 import traceback
+from neon_shadow.driver import ScriptExhausted, use_driver
 from neon_shadow.game import Game
 from neon_shadow.utils import get_valid_input
-from neon_shadow.ui import clear_screen, display_ascii_art
+from neon_shadow.ui import clear_screen, display_ascii_art, echo
 from neon_shadow.constants import CLR_RESET, CLR_TITLE, CLR_ERROR
 
 
@@ -13,19 +14,13 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
 
-def main():
-    """Main function to start the game."""
-    # Initialize colorama if available
-    try:
-        import colorama
-        colorama.init(autoreset=True)
-    except ImportError:
-        print("Warning: Colorama library not installed. Colors will not display correctly.")
-        sys.exit(1)
+def play(game):
+    """Show the title screen and play a game through its driver."""
+    with use_driver(game.io):
+        _play(game)
 
-    # Create and start game
-    game = Game()
 
+def _play(game):
     try:
         clear_screen()
 
@@ -47,28 +42,37 @@ def main():
 
         display_ascii_art(title_art, CLR_TITLE)
 
-        print(f"\n{CLR_TITLE}Welcome to Cloud Ranger: Digital Frontier!{CLR_RESET}")
-        print("A text-based RPG set in a world where cloud infrastructure comes to life.")
+        echo(f"\n{CLR_TITLE}Welcome to Cloud Ranger: Digital Frontier!{CLR_RESET}")
+        echo("A text-based RPG set in a world where cloud infrastructure comes to life.")
 
-        print("\nOptions:")
-        print("1. Start New Game")
-        print("2. Exit")
+        echo("\nOptions:")
+        echo("1. Start New Game")
+        echo("2. Exit")
 
         choice = get_valid_input("\nSelect an option: ", range(1, 3))
 
         if choice == 1:
             game.start_game()
         else:
-            print("\nThanks for checking out Cloud Ranger: Digital Frontier!")
+            echo("\nThanks for checking out Cloud Ranger: Digital Frontier!")
 
     except KeyboardInterrupt:
-        print("\n\nGame terminated by user.")
+        echo("\n\nGame terminated by user.")
+    except ScriptExhausted:
+        # Out of input (or the client has gone): let the driver's owner handle it
+        raise
     except Exception as e:
-        print(f"\n\n{CLR_ERROR}An error occurred: {str(e)}{CLR_RESET}")
+        echo(f"\n\n{CLR_ERROR}An error occurred: {str(e)}{CLR_RESET}", flush=True)
         if game.debug_mode:
             traceback.print_exc()
 
-    print("\nThanks for playing!")
+    echo("\nThanks for playing!", flush=True)
+
+
+def main():
+    """Main function to start the game."""
+    # Create and start game
+    play(Game())
 
 
 if __name__ == "__main__":
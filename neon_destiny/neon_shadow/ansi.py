@@ -0,0 +1,224 @@
+"""
+Compact ANSI styling for the Neon Shadow game.
+
+Text is styled with SGR ("select graphic rendition") escape sequences. The
+naive way to color a piece of text, ``color + text + CLR_RESET``, writes two
+sequences per piece even when the next piece is the same color, and the
+sequences can add up to more bytes than the text itself.
+
+StyledText tracks the style the terminal is in and the style the next text
+should have, and writes a sequence only when a character would otherwise be
+drawn in the wrong style. Switching is written as the shortest sequence that
+gets from one style to the other, and spaces and newlines, which only show
+the background, do not make the foreground switch.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# (intensity, foreground, background) as SGR codes; None for a style that
+# includes codes this module does not track
+Style = Tuple[int, int, int]
+DEFAULT: Style = (22, 39, 49)
+
+CSI = re.compile(r"\x1b\[([0-9;?]*)([A-Za-z])")
+_BLANK = " \n\r"  # Characters that show nothing but the background
+
+
+@lru_cache(maxsize=None)
+def _apply(style: Optional[Style], params: str) -> Optional[Style]:
+    """Return the style after an SGR sequence with these parameters."""
+    intensity, foreground, background = style or (None, None, None)
+    known = style is not None
+    for param in params.split(";"):
+        code = int(param) if param else 0
+        if code == 0:
+            intensity, foreground, background = DEFAULT
+            known = True
+        elif code in (1, 2, 22):
+            intensity = code
+        elif 30 <= code <= 37 or 90 <= code <= 97 or code == 39:
+            foreground = code
+        elif 40 <= code <= 47 or 100 <= code <= 107 or code == 49:
+            background = code
+        else:
+            known = False
+    return (intensity, foreground, background) if known else None
+
+
+@lru_cache(maxsize=None)
+def _parse(style: str) -> Optional[Style]:
+    """Return the style that SGR sequences set, starting from the default style."""
+    result = DEFAULT
+    for params, final in CSI.findall(style):
+        if final == "m":
+            result = _apply(result, params)
+    return result
+
+
+@lru_cache(maxsize=None)
+def transition(shown: Optional[Style], style: Style) -> str:
+    """Return the shortest SGR sequence that switches from one style to another.
+
+    Args:
+        shown: The style in effect, or None if it is not known
+        style: The style wanted
+
+    Returns:
+        The sequence, or "" if the styles are the same
+    """
+    if style == shown:
+        return ""
+    # From a reset: every attribute of the wanted style that is not the default
+    codes = ["0"] + [str(code) for code, default in zip(style, DEFAULT) if code != default]
+    if shown is not None and style != DEFAULT:
+        changes = []
+        if style[0] != shown[0]:
+            # Bold and dim can be on together, so one has to be turned off first
+            if 22 not in (style[0], shown[0]):
+                changes.append("22")
+            changes.append(str(style[0]))
+        changes += [str(new) for new, old in zip(style[1:], shown[1:]) if new != old]
+        if len(";".join(changes)) < len(";".join(codes)):
+            codes = changes
+    return f"\x1b[{';'.join(codes)}m"
+
+
+class StyledText:
+    """Builds text with as few SGR sequences as it takes to draw it.
+
+    ``add`` takes text and the style to draw it in; ``feed`` takes text with
+    escape sequences embedded in it, as written to a terminal. Either way a
+    sequence is only written once there is something to draw in the new
+    style, so a reset followed by the same color writes nothing at all.
+
+    Args:
+        shown: Style the output starts in (DEFAULT, or None if not known)
+    """
+
+    __slots__ = ("_parts", "_shown", "_style")
+
+    def __init__(self, shown: Optional[Style] = DEFAULT) -> None:
+        self._parts: List[str] = []
+        self._shown = shown  # Style in effect after the text built so far
+        self._style = shown  # Style the next text should be drawn in
+
+    def add(self, text: str, style: str = "") -> "StyledText":
+        """Append text drawn in a style.
+
+        Args:
+            text: Plain text
+            style: SGR sequences (e.g. ``CLR_BRIGHT + CLR_CYAN``), applied
+                from the default style; "" for plain text
+        """
+        self._style = _parse(style)
+        if text:
+            self._text(text)
+        return self
+
+    def line(self, text: str = "", style: str = "") -> "StyledText":
+        """Append text drawn in a style, then a newline."""
+        return self.add(text + "\n", style)
+
+    def feed(self, text: str) -> "StyledText":
+        """Append text that may contain escape sequences, dropping any SGR
+        sequence that does not change how something is drawn."""
+        if "\x1b" not in text:
+            if text:
+                self._text(text)
+            return self
+        # Plain text, then the parameters and final letter of each sequence
+        pieces = CSI.split(text)
+        for i in range(0, len(pieces) - 1, 3):
+            if pieces[i]:
+                self._text(pieces[i])
+            params, final = pieces[i + 1], pieces[i + 2]
+            if final != "m":
+                # Erasing and scrolling fill with the background
+                self._sync(background_only=True)
+                self._parts.append(f"\x1b[{params}{final}")
+                continue
+            style = _apply(self._style, params)
+            if style is None:
+                # Not tracked: pass it through and forget what is on screen
+                self._sync()
+                self._parts.append(f"\x1b[{params}m")
+                self._shown = None
+            self._style = style
+        if pieces[-1]:
+            self._text(pieces[-1])
+        return self
+
+    def _sync(self, background_only: bool = False) -> None:
+        """Bring the shown style up to date (just its background, if that is all that shows)."""
+        style, shown = self._style, self._shown
+        if style == shown or style is None:
+            return
+        if background_only and shown is not None and style[2] == shown[2]:
+            return
+        self._parts.append(transition(shown, style))
+        self._shown = style
+
+    def _text(self, text: str) -> None:
+        if self._style != self._shown:
+            blanks = len(text) - len(text.lstrip(_BLANK))
+            if blanks:
+                # Leading blanks only need the right background
+                self._sync(background_only=True)
+                self._parts.append(text[:blanks])
+                text = text[blanks:]
+            if text:
+                self._sync()
+        self._parts.append(text)
+
+    def take(self) -> str:
+        """Return the text built since the last take, leaving the style as it is.
+
+        Sequences not yet needed stay pending; call ``flush`` first to write
+        them too, e.g. before the player types at the cursor.
+        """
+        text = "".join(self._parts)
+        self._parts = []
+        return text
+
+    def flush(self) -> "StyledText":
+        """Write any style switch still pending."""
+        self._sync()
+        return self
+
+    def text(self) -> str:
+        """Return everything built, ending in the default style."""
+        self._style = DEFAULT
+        self._sync()
+        return "".join(self._parts)
+
+    def __str__(self) -> str:
+        return self.text()
+
+
+def compact(text: str) -> str:
+    """Return text, starting and ending in the default style, with redundant SGR sequences removed."""
+    return StyledText().feed(text).text()
+
+
+def split_lines(text: str, style: Optional[Style] = DEFAULT) -> Tuple[List[str], Optional[Style]]:
+    """Split text into lines that each start and end in the default style,
+    so any one of them can be drawn without the lines before it.
+
+    Args:
+        text: Text that may contain escape sequences
+        style: Style in effect where the text starts
+
+    Returns:
+        The lines, and the style in effect where the text ends
+    """
+    lines = []
+    for line in text.split("\n"):
+        builder = StyledText()
+        builder._style = style
+        builder.feed(line)
+        style = builder._style
+        lines.append(builder.text())
+    return lines, style
+
@@ -2,24 +2,76 @@
 CloudArtifact class for the Neon Shadow game.
 """
 
+from typing import Any, Dict, NamedTuple, Optional
+
 from .constants import *
-from .utils import display_notification
+from .utils import display_notification, echo
+from .templates import TemplateCache, template_field
+
+
+class ArtifactTemplate(NamedTuple):
+    """Content data shared by every instance of an artifact."""
+    name: str
+    description: str
+    artifact_type: str
+    aws_service: Optional[str]
+    cost: int
+    power: int  # Base power before upgrades
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "ArtifactTemplate":
+        """Build a template from an ARTIFACTS entry or an event's artifact effect."""
+        return cls(
+            name=data["name"],
+            description=data["description"],
+            artifact_type=data["artifact_type"],
+            aws_service=data.get("aws_service"),
+            cost=data.get("cost", 0),
+            power=data.get("power", 1),
+        )
+
+
+_TEMPLATES: TemplateCache[ArtifactTemplate] = TemplateCache(ArtifactTemplate.from_data)
+
+
+def create_artifact(data: Dict[str, Any]) -> "CloudArtifact":
+    """Create an artifact instance from content data.
+
+    Every instance made from the same dict shares one ArtifactTemplate.
+    """
+    return CloudArtifact.from_template(_TEMPLATES.get(data))
 
 
 class CloudArtifact:
     """Represents an AWS service or tool the player can use."""
 
+    # Content data, shared through the template
+    name = template_field("name")
+    description = template_field("description")
+    artifact_type = template_field("artifact_type")
+    aws_service = template_field("aws_service")
+    cost = template_field("cost")
+
+    max_upgrade = 3  # Maximum upgrade level
+
+    __slots__ = ("template", "power", "upgrade_level", "cooldown")
+
     def __init__(self, name: str, description: str, artifact_type: str, aws_service: str, cost: int, power: int):
-        self.name = name
-        self.description = description
-        self.artifact_type = artifact_type
-        self.aws_service = aws_service
-        self.cost = cost
+        self.template = ArtifactTemplate(name, description, artifact_type, aws_service, cost, power)
         self.power = power
         self.upgrade_level = 0  # Current upgrade level
-        self.max_upgrade = 3  # Maximum upgrade level
         self.cooldown = 0  # Turns until artifact can be used again
 
+    @classmethod
+    def from_template(cls, template: ArtifactTemplate) -> "CloudArtifact":
+        """Create a fresh instance sharing an existing template."""
+        artifact = cls.__new__(cls)
+        artifact.template = template
+        artifact.power = template.power
+        artifact.upgrade_level = 0
+        artifact.cooldown = 0
+        return artifact
+
     def __str__(self):
         upgrade_stars = '★' * self.upgrade_level + \
             '☆' * (self.max_upgrade - self.upgrade_level)
@@ -40,14 +92,14 @@ class CloudArtifact:
                 f"{self.name} is on cooldown for {self.cooldown} more turns", "warning")
             return False
 
-        print(f"Using {self.name}...")
+        echo(f"Using {self.name}...")
         # Set cooldown based on power - more powerful artifacts have longer cooldowns
         self.cooldown = 1 + (self.power // 3)
         return True
 
-    def update_cooldown(self):
-        """Update the artifact cooldown timer."""
+    def update_cooldown(self, days=1):
+        """Update the artifact cooldown timer by some days."""
         if self.cooldown > 0:
-            self.cooldown -= 1
+            self.cooldown = max(0, self.cooldown - days)
             return True
         return False
@@ -0,0 +1,282 @@
+"""
+Process-wide content catalogue for the Neon Shadow game.
+
+The ``content`` modules are parsed, validated and compiled once per process
+into prototype ``Location``, ``Quest`` and ``CloudEvent`` objects and a
+``LocationGraph`` of the connections between locations. Each game
+gets its own objects, created from the prototypes only when first looked up.
+Per-game objects share every read-only field with their prototype (texts,
+connections, hazards, vendors, effects); fields the game mutates are either
+rebound on write or, for quest objectives, copied when the object is created.
+Prototypes must never be modified.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generic, Iterator, List, Mapping, Tuple, TypeVar
+
+from neon_shadow.effects import CompiledEffect, ContentError, compile_damage, compile_effect
+from neon_shadow.event import CloudEvent
+from neon_shadow.graph import LocationGraph
+from neon_shadow.location import Location
+from neon_shadow.quest import Quest
+from neon_shadow.scheduler import EventIndex
+from neon_shadow.tracker import ObjectiveCheck, QuestIndex, compile_check
+from neon_shadow.weather import WeatherTable
+
+from neon_shadow.content.artifacts import ARTIFACTS
+from neon_shadow.content.services import SERVICES
+from neon_shadow.content.quests import QUESTS
+from neon_shadow.content.events import EVENTS
+from neon_shadow.content.locations import LOCATIONS
+from neon_shadow.content.vendors import VENDORS, FOUND_CONSUMABLES
+from neon_shadow.content.weather import WEATHER_TYPES, SEVERITY_LEVELS, REGIONAL_WEATHER_TENDENCIES
+
+T = TypeVar("T")
+
+
+def _copy_slots(prototype: T) -> T:
+    """Return a new object sharing every slot value with prototype."""
+    cls = type(prototype)
+    obj = cls.__new__(cls)
+    for slot in cls.__slots__:
+        setattr(obj, slot, getattr(prototype, slot))
+    return obj
+
+
+def spawn_location(prototype: Location) -> Location:
+    """Create a game's location from its prototype."""
+    return _copy_slots(prototype)
+
+
+def spawn_quest(prototype: Quest) -> Quest:
+    """Create a game's quest from its prototype, with its own objectives."""
+    quest = _copy_slots(prototype)
+    quest.objectives = [dict(obj) for obj in prototype.objectives]
+    return quest
+
+
+def spawn_event(prototype: CloudEvent) -> CloudEvent:
+    """Create a game's event from its prototype."""
+    return _copy_slots(prototype)
+
+
+class LazyObjects(Mapping[str, T], Generic[T]):
+    """Mapping of a game's objects, each created on first lookup.
+
+    Keys, order and length come from the catalogue, so membership tests and
+    iterating over keys never create anything. Looking up a value (including
+    through ``values()`` or ``items()``) creates it from its prototype.
+
+    Args:
+        prototypes: Catalogue prototypes, by key
+        spawn: Creates a game object from a prototype
+    """
+
+    __slots__ = ("_prototypes", "_spawn", "_objects")
+
+    def __init__(self, prototypes: Mapping[str, T], spawn: Callable[[T], T]) -> None:
+        self._prototypes = prototypes
+        self._spawn = spawn
+        self._objects: Dict[str, T] = {}
+
+    def __getitem__(self, key: str) -> T:
+        obj = self._objects.get(key)
+        if obj is None:
+            obj = self._objects[key] = self._spawn(self._prototypes[key])
+        return obj
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._prototypes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._prototypes)
+
+    def __len__(self) -> int:
+        return len(self._prototypes)
+
+    def loaded(self) -> Dict[str, T]:
+        """Return the objects created so far, by key.
+
+        Objects not in here are still identical to their prototype.
+        """
+        return self._objects
+
+
+class ContentCatalogue:
+    """Game content parsed, validated and compiled once per process.
+
+    Problems that do not stop a game from running (a hazard with a bad damage
+    spec, a reference to unknown content) are collected in ``warnings``.
+
+    Raises:
+        ContentError: If a content entry is missing a required field
+    """
+
+    def __init__(self) -> None:
+        self.warnings: List[str] = []
+        self.artifacts: Dict[str, Dict[str, Any]] = ARTIFACTS
+        self.services: Dict[str, Dict[str, Any]] = SERVICES
+        self.weather = WeatherTable(WEATHER_TYPES, SEVERITY_LEVELS, REGIONAL_WEATHER_TENDENCIES)
+        try:
+            self.locations = self._load_locations()
+            self.quests = self._load_quests()
+            self.events = self._load_events()
+            self.consumable_effects = self._load_consumables()
+            self._load_vendors()
+        except KeyError as e:
+            raise ContentError(f"Content entry is missing field {e}") from e
+        self.graph = LocationGraph.from_locations(self.locations)
+        self._validate()
+        self.event_index = EventIndex(self.events, self.locations)
+        self.quest_index = QuestIndex(self.quests, self._load_quest_checks())
+
+        # Status effects applied by content, by name
+        self.status_effects: Dict[str, Dict[str, Any]] = {}
+        for event in self.events.values():
+            if "status_effect" in event.effects:
+                effect = event.effects["status_effect"]
+                self.status_effects.setdefault(effect["name"], effect)
+        for location in self.locations.values():
+            for hazard in location.hazards:
+                if "status_effect" in hazard:
+                    effect = hazard["status_effect"]
+                    self.status_effects.setdefault(effect["name"], effect)
+
+    def _load_locations(self) -> Dict[str, Location]:
+        locations = {}
+        for loc_data in LOCATIONS.values():
+            location = Location(
+                name=loc_data["name"],
+                description=loc_data["description"],
+                region=loc_data.get("region"),
+                connections=loc_data.get("connections", []),
+                events=tuple(loc_data.get("events", ())),
+                services=tuple(loc_data.get("services", ())),
+                difficulty=loc_data.get("difficulty", 1)
+            )
+
+            # Hazards carry their damage spec compiled once
+            for hazard in loc_data.get("hazards", ()):
+                try:
+                    roll = compile_damage(hazard.get("damage", 10))
+                except ContentError as e:
+                    self.warnings.append(f"{loc_data['name']} hazard {hazard['name']}: {e}")
+                    roll = compile_damage(10)
+                location.add_hazard(dict(hazard, roll=roll))
+
+            locations[location.name] = location
+        return locations
+
+    def _load_quests(self) -> Dict[str, Quest]:
+        quests = {}
+        for quest_id, quest_data in QUESTS.items():
+            quest = Quest(
+                id=quest_data["id"],
+                title=quest_data["title"],
+                description=quest_data["description"],
+                objectives=[dict(obj) for obj in quest_data["objectives"]],
+                reward=quest_data["reward"],
+                prereq_quests=quest_data.get("prereq_quests", []),
+                min_skill_level=quest_data.get("min_skill_level", {}),
+                min_faction_rep=quest_data.get("min_faction_rep", {}),
+                location=quest_data.get("location")
+            )
+            if "difficulty" in quest_data:
+                quest.difficulty = quest_data["difficulty"]
+            if "time_limit" in quest_data:
+                quest.time_limit = quest_data["time_limit"]
+            if "hidden" in quest_data:
+                quest.hidden = quest_data["hidden"]
+            quests[quest_id] = quest
+        return quests
+
+    def _load_events(self) -> Dict[str, CloudEvent]:
+        events = {}
+        for event_id, event_data in EVENTS.items():
+            event = CloudEvent(
+                id=event_data["id"],
+                name=event_data["name"],
+                description=event_data["description"],
+                event_type=event_data["event_type"],
+                effects=event_data.get("effects", {}),
+                requirements=event_data.get("requirements", {}),
+                chance=event_data.get("chance", 100),
+                repeatable=event_data.get("repeatable", False)
+            )
+            if "cooldown_duration" in event_data:
+                event.cooldown_duration = event_data["cooldown_duration"]
+            events[event_id] = event
+        return events
+
+    def _load_consumables(self) -> Dict[str, CompiledEffect]:
+        # Every consumable effect, keyed by display name
+        effects: Dict[str, CompiledEffect] = {}
+        consumables = [(item["name"], item) for item in FOUND_CONSUMABLES]
+        for vendor_data in VENDORS.values():
+            consumables.extend(vendor_data["inventory"].get("consumables", {}).items())
+        for name, item in consumables:
+            name = name.replace("_", " ")
+            if name in effects or "effect" not in item:
+                continue
+            try:
+                effects[name] = compile_effect(item["effect"])
+            except ContentError as e:
+                self.warnings.append(f"Consumable {name}: {e}")
+        return effects
+
+    def _load_quest_checks(self) -> Dict[str, List[Tuple[int, ObjectiveCheck]]]:
+        # Compiled objective checks by quest ID, with the objective's index
+        checks: Dict[str, List[Tuple[int, ObjectiveCheck]]] = {}
+        for quest_id, quest in self.quests.items():
+            ids = {obj["id"] for obj in quest.objectives}
+            for i, obj in enumerate(quest.objectives):
+                if "check" not in obj:
+                    continue
+                try:
+                    check = compile_check(obj["check"])
+                except ContentError as e:
+                    self.warnings.append(f"Quest {quest_id} objective {obj['id']}: {e}")
+                    continue
+                if check.after and check.after not in ids:
+                    self.warnings.append(
+                        f"Quest {quest_id} objective {obj['id']}: unknown objective {check.after}")
+                    continue
+                checks.setdefault(quest_id, []).append((i, check))
+        return checks
+
+    def _load_vendors(self) -> None:
+        for vendor_id, vendor_data in VENDORS.items():
+            if vendor_data["location"] not in LOCATIONS:
+                self.warnings.append(
+                    f"Vendor {vendor_id}: unknown location {vendor_data['location']}")
+                continue
+            location_name = LOCATIONS[vendor_data["location"]]["name"]
+            self.locations[location_name].add_vendor({
+                "name": vendor_data["name"],
+                "description": vendor_data["description"],
+                "inventory": vendor_data["inventory"],
+                "reputation_required": vendor_data.get("reputation_required", {})
+            })
+
+    def _validate(self) -> None:
+        """Report references to content that does not exist."""
+        for location in self.locations.values():
+            for event_id in location.events:
+                if event_id not in self.events:
+                    self.warnings.append(f"{location.name}: unknown event {event_id}")
+        for name, connection in self.graph.broken:
+            self.warnings.append(f"{name}: unknown connection {connection}")
+        for region, weather in self.weather.unknown:
+            self.warnings.append(f"Region {region}: unknown weather {weather}")
+        for quest_id, quest in self.quests.items():
+            for prereq in quest.prereq_quests:
+                if prereq not in self.quests:
+                    self.warnings.append(f"Quest {quest_id}: unknown prerequisite {prereq}")
+            if quest.location and quest.location not in self.locations:
+                self.warnings.append(f"Quest {quest_id}: unknown location {quest.location}")
+
+
+@lru_cache(maxsize=None)
+def get_catalogue() -> ContentCatalogue:
+    """Return the process-wide content catalogue, building it on first use."""
+    return ContentCatalogue()
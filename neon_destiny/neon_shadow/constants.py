@@ -49,6 +49,9 @@ neon_shadow_game/                # Project root
 Global constants used throughout the Neon Shadow game.
 """
 
+import os
+import sys
+
 
 # Game constants
 GAME_CONSTANTS = {
@@ -57,50 +60,67 @@ GAME_CONSTANTS = {
     'DEFAULT_SKILL_LEVEL': 1
 }
 
+# Most days the fast-forward action lets pass at once
+FAST_FORWARD_MAX_DAYS = 365
+
+# Percent chance that a turn rolls for a location event
+DAILY_EVENT_CHANCE = 30
+
 # Type definitions
 LocationType = dict  # Dict[str, Union[str, List[str], int]]
 ReputationType = dict  # Dict[str, int]
 
-# --- Attempt to import and initialize colorama ---
-try:
-    import colorama
-    colorama.init(autoreset=True)  # Autoreset resets color after each print
-    CLR_RESET = colorama.Style.RESET_ALL
-    # Define Foreground Colors
-    CLR_BLACK = colorama.Fore.BLACK
-    CLR_RED = colorama.Fore.RED
-    CLR_GREEN = colorama.Fore.GREEN
-    CLR_YELLOW = colorama.Fore.YELLOW
-    CLR_BLUE = colorama.Fore.BLUE
-    CLR_MAGENTA = colorama.Fore.MAGENTA
-    CLR_CYAN = colorama.Fore.CYAN
-    CLR_WHITE = colorama.Fore.WHITE
-    CLR_LIGHTBLACK_EX = colorama.Fore.LIGHTBLACK_EX
-    CLR_LIGHTRED_EX = colorama.Fore.LIGHTRED_EX
-    CLR_LIGHTGREEN_EX = colorama.Fore.LIGHTGREEN_EX
-    CLR_LIGHTYELLOW_EX = colorama.Fore.LIGHTYELLOW_EX
-    CLR_LIGHTBLUE_EX = colorama.Fore.LIGHTBLUE_EX
-    CLR_LIGHTMAGENTA_EX = colorama.Fore.LIGHTMAGENTA_EX
-    CLR_LIGHTCYAN_EX = colorama.Fore.LIGHTCYAN_EX
-    CLR_LIGHTWHITE_EX = colorama.Fore.LIGHTWHITE_EX
-    # Define Background Colors
-    CLR_BACK_RED = colorama.Back.RED
-    CLR_BACK_GREEN = colorama.Back.GREEN
-    CLR_BACK_BLUE = colorama.Back.BLUE
-    CLR_BACK_BLACK = colorama.Back.BLACK
-    CLR_BACK_CYAN = colorama.Back.CYAN
-    # Define Styles
-    CLR_BRIGHT = colorama.Style.BRIGHT
-    CLR_DIM = colorama.Style.DIM
-    CLR_NORMAL = colorama.Style.NORMAL
-except ImportError:
-    print("Warning: Colorama library not found. Colors will not be used.")
-    CLR_RESET = ""
-    CLR_BLACK = CLR_RED = CLR_GREEN = CLR_YELLOW = CLR_BLUE = CLR_MAGENTA = CLR_CYAN = CLR_WHITE = ""
-    CLR_LIGHTBLACK_EX = CLR_LIGHTRED_EX = CLR_LIGHTGREEN_EX = CLR_LIGHTYELLOW_EX = CLR_LIGHTBLUE_EX = ""
-    CLR_LIGHTMAGENTA_EX = CLR_LIGHTCYAN_EX = CLR_LIGHTWHITE_EX = ""
-    CLR_BACK_RED = CLR_BACK_GREEN = CLR_BACK_BLUE = CLR_BACK_BLACK = CLR_BACK_CYAN = ""
-    CLR_BRIGHT = CLR_DIM = CLR_NORMAL = ""
+# --- Terminal colors ---
+# Colors are plain ANSI SGR sequences, used when stdout is a terminal or
+# FORCE_COLOR is set, unless NO_COLOR is set. POSIX terminals understand them
+# natively; colorama is only needed to make older Windows consoles understand them.
+USE_COLOR = ((sys.stdout.isatty() or "FORCE_COLOR" in os.environ)
+             and "NO_COLOR" not in os.environ)
+if USE_COLOR and os.name == "nt":
+    try:
+        import colorama
+        if hasattr(colorama, "just_fix_windows_console"):
+            colorama.just_fix_windows_console()
+        else:  # colorama < 0.4.6
+            colorama.init()
+    except ImportError:
+        print("Warning: Colorama library not found. Colors will not be used.")
+        USE_COLOR = False
+
+
+def _sgr(*codes: int) -> str:
+    """Return the ANSI sequence that sets these SGR codes, or "" without colors."""
+    return f"\x1b[{';'.join(map(str, codes))}m" if USE_COLOR else ""
+
+
+CLR_RESET = _sgr(0)
+# Define Foreground Colors
+CLR_BLACK = _sgr(30)
+CLR_RED = _sgr(31)
+CLR_GREEN = _sgr(32)
+CLR_YELLOW = _sgr(33)
+CLR_BLUE = _sgr(34)
+CLR_MAGENTA = _sgr(35)
+CLR_CYAN = _sgr(36)
+CLR_WHITE = _sgr(37)
+CLR_LIGHTBLACK_EX = _sgr(90)
+CLR_LIGHTRED_EX = _sgr(91)
+CLR_LIGHTGREEN_EX = _sgr(92)
+CLR_LIGHTYELLOW_EX = _sgr(93)
+CLR_LIGHTBLUE_EX = _sgr(94)
+CLR_LIGHTMAGENTA_EX = _sgr(95)
+CLR_LIGHTCYAN_EX = _sgr(96)
+CLR_LIGHTWHITE_EX = _sgr(97)
+# Define Background Colors
+CLR_BACK_RED = _sgr(41)
+CLR_BACK_GREEN = _sgr(42)
+CLR_BACK_BLUE = _sgr(44)
+CLR_BACK_BLACK = _sgr(40)
+CLR_BACK_CYAN = _sgr(46)
+# Define Styles
+CLR_BRIGHT = _sgr(1)
+CLR_DIM = _sgr(2)
+CLR_NORMAL = _sgr(22)
 
 # --- Constants for Game Elements ---
 CLR_NARRATOR = CLR_LIGHTCYAN_EX
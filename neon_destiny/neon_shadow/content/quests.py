@@ -1,6 +1,10 @@
 """
 Definition of all quests available in the game.
 Each quest is stored as a dictionary with the required attributes.
+
+Objectives the game can verify by itself carry a "check"; see
+neon_shadow.tracker.compile_check for the supported types. Objectives
+without one are never completed automatically.
 """
 
 QUESTS = {
@@ -10,11 +14,12 @@ QUESTS = {
         "title": "Cloud Ranger Training",
         "description": "Complete basic training to become a certified Cloud Ranger.",
         "objectives": [
-            {"id": "tutorial_1", "description": "Visit Cloud City", "completed": False},
+            {"id": "tutorial_1", "description": "Visit Cloud City", "completed": False,
+                "check": {"type": "visit_location", "location": "Cloud City"}},
             {"id": "tutorial_2", "description": "Acquire your first artifact",
-                "completed": False},
+                "completed": False, "check": {"type": "own_artifact"}},
             {"id": "tutorial_3", "description": "Deploy your first service",
-                "completed": False}
+                "completed": False, "check": {"type": "deploy_service"}}
         ],
         "reward": {
             "credits": 50,
@@ -34,13 +39,16 @@ QUESTS = {
         "description": "Investigate a service outage reported in the Database District.",
         "objectives": [
             {"id": "outage_1", "description": "Visit Database District",
-                "completed": False},
+                "completed": False,
+                "check": {"type": "visit_location", "location": "Database District"}},
             {"id": "outage_2", "description": "Scan the affected RDS instance",
                 "completed": False},
             {"id": "outage_3", "description": "Find evidence of the attack",
                 "completed": False},
             {"id": "outage_4", "description": "Report your findings to Security Perimeter",
-                "completed": False}
+                "completed": False,
+                "check": {"type": "visit_location", "location": "Security Perimeter",
+                          "after": "outage_3"}}
         ],
         "reward": {
             "credits": 100,
@@ -59,7 +67,11 @@ QUESTS = {
         "description": "Follow the clues left by the mysterious Shadow Admin who seems to be behind recent incidents.",
         "objectives": [
             {"id": "shadow_1", "description": "Collect all Shadow Admin clues",
-                "completed": False},
+                "completed": False,
+                "check": {"type": "collect_clue", "clues": [
+                    "The Shadow Admin leaves cryptic messages on compromised systems.",
+                    "The Shadow Admin uses custom tools to move through the cloud undetected."
+                ]}},
             {"id": "shadow_2", "description": "Decrypt the secret message",
                 "completed": False},
             {"id": "shadow_3", "description": "Find the Shadow Admin's hidden access point",
@@ -87,7 +99,8 @@ QUESTS = {
         "description": "Help recover crucial data from a failed database cluster in Cache Cove.",
         "objectives": [
             {"id": "recovery_1", "description": "Travel to Cache Cove",
-                "completed": False},
+                "completed": False,
+                "check": {"type": "visit_location", "location": "Cache Cove"}},
             {"id": "recovery_2", "description": "Assess database damage",
                 "completed": False},
             {"id": "recovery_3", "description": "Deploy RDS with recovery mode",
@@ -113,7 +126,8 @@ QUESTS = {
         "description": "Master serverless technologies by completing a series of challenges in Serverless Valley.",
         "objectives": [
             {"id": "serverless_1", "description": "Deploy 3 Lambda functions",
-                "completed": False},
+                "completed": False,
+                "check": {"type": "deploy_service", "service": "Lambda Function", "count": 3}},
             {"id": "serverless_2",
                 "description": "Create API Gateway endpoints", "completed": False},
             {"id": "serverless_3",
@@ -164,7 +178,8 @@ QUESTS = {
         "title": "Shadow Network Infiltration",
         "description": "Gain the trust of the Shadow Network by completing a series of covert operations.",
         "objectives": [
-            {"id": "infiltrate_1", "description": "Meet the Shadow Network contact in Blockchain Bazaar", "completed": False},
+            {"id": "infiltrate_1", "description": "Meet the Shadow Network contact in Blockchain Bazaar", "completed": False,
+                "check": {"type": "visit_location", "location": "Blockchain Bazaar"}},
             {"id": "infiltrate_2",
                 "description": "Complete a test mission to prove your skills", "completed": False},
             {"id": "infiltrate_3",
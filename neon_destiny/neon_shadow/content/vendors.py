@@ -139,3 +139,15 @@ VENDORS = {
         }
     }
 }
+
+# Consumables that can be found while exploring (see Game.explore_location)
+FOUND_CONSUMABLES = [
+    {"name": "Emergency Patch", "description": "Restores 30 health",
+     "effect": "player.heal(30)"},
+    {"name": "Energy Cell", "description": "Restores 50 energy",
+     "effect": "player.restore_energy(50)"},
+    {"name": "Firewall Patch", "description": "Increases service security by 2",
+     "effect": "service.enhance_security(2)"},
+    {"name": "Performance Tuner", "description": "Increases service performance by 2",
+     "effect": "service.optimize_performance(2)"},
+]
@@ -1,6 +1,9 @@
 """
 Definition of all weather conditions that can affect game locations.
 Weather conditions have various effects on gameplay.
+
+Numeric "consequences" are scaled by the location's severity multiplier
+and read by the game through WeatherEngine.modifier.
 """
 
 WEATHER_TYPES = [
@@ -28,7 +31,8 @@ WEATHER_TYPES = [
         "description": "Extreme computational heat causing systems to require more energy to operate.",
         "consequences": {
             "energy_drain": 0.1,  # 10% faster energy drain
-            "service_performance": -1  # -1 to service performance
+            "service_performance": -1,  # -1 to service performance
+            "energy_recovery": -0.3  # 30% less energy recovered by resting
         }
     },
     {
@@ -37,7 +41,8 @@ WEATHER_TYPES = [
         "description": "Cold conditions slowing memory access and overall service performance.",
         "consequences": {
             "service_performance": -2,
-            "service_revenue": -0.1  # 10% less service revenue
+            "service_revenue": -0.1,  # 10% less service revenue
+            "service_wear": 1  # Deployed services lose 1 performance a day, more when severe
         }
     },
     {
@@ -47,7 +52,9 @@ WEATHER_TYPES = [
         "consequences": {
             "all_bonus": 0.05,  # 5% bonus to all stats
             "service_performance": 1,  # +1 to service performance
-            "energy_recovery": 0.2  # 20% faster energy recovery
+            "energy_recovery": 0.2,  # 20% faster energy recovery
+            "health_recovery": 0.2,  # 20% faster health recovery
+            "exploration_efficiency": 0.1  # 10% more effective exploration
         }
     },
     {
@@ -0,0 +1,310 @@
+"""
+I/O drivers for the Neon Shadow game.
+
+All game output, prompts, screen clears and pauses go through the active
+driver, so the same engine can run in a terminal, from a script or headless.
+"""
+
+import io
+import os
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterable, List, Optional, Union
+
+from .ansi import StyledText
+from .constants import CLR_PROMPT, CLR_ERROR, CLR_RESET
+from .screen import FrameRenderer, strip_ansi
+
+
+class ScriptExhausted(EOFError):
+    """Raised when a driver is asked for input it cannot provide."""
+
+
+class IODriver:
+    """Base class for the game's input/output backends."""
+
+    # Headless drivers never sleep, never clear and never render ANSI
+    headless = False
+
+    # The game may read and write files on this machine for the player
+    # (saves, profiler exports). Off for players of a shared server
+    local_files = True
+
+    # Render profile chosen for this driver's player; None follows the
+    # process default (see ``ui.set_render_profile``)
+    render_profile: Optional[str] = None
+
+    def write(self, text: str) -> None:
+        """Write text to the output."""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Flush any buffered output."""
+
+    def read_line(self, prompt: str = "") -> str:
+        """Show a prompt and read one line of input."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Clear the screen."""
+
+    def sleep(self, seconds: float) -> None:
+        """Pause for the given number of seconds."""
+
+    @contextmanager
+    def skippable(self):
+        """Context for an animation the player may cut short with a keypress."""
+        yield
+
+    def key_pressed(self) -> bool:
+        """Return True (and consume the key) if a key has been pressed."""
+        return False
+
+    def read_choice(self, prompt: str, valid_range) -> int:
+        """Read a number until it falls within valid_range."""
+        while True:
+            try:
+                value = int(self.read_line(f"{CLR_PROMPT}{prompt}{CLR_RESET}"))
+                if value in valid_range:
+                    return value
+                self.write(
+                    f"{CLR_ERROR}Please enter a number between {min(valid_range)} and {max(valid_range)}{CLR_RESET}\n")
+            except ValueError:
+                self.write(f"{CLR_ERROR}Please enter a valid number{CLR_RESET}\n")
+
+    def confirm(self, prompt: str) -> bool:
+        """Ask a yes/no question."""
+        response = self.read_line(f"{CLR_PROMPT}{prompt} (y/n): {CLR_RESET}").lower()
+        return response == 'y' or response == 'yes'
+
+
+class RawOutput:
+    """Text output collected in memory and written with one system call per flush.
+
+    Stands in for sys.stdout on POSIX terminals, skipping the text layer's
+    line buffering (a write per line) and any stream wrapper around it.
+
+    Args:
+        raw: Unbuffered binary file, e.g. ``io.FileIO(1, "wb", closefd=False)``
+        encoding: Text encoding of the terminal
+    """
+
+    def __init__(self, raw: io.RawIOBase, encoding: str = "utf-8") -> None:
+        self.raw = raw
+        self.encoding = encoding
+        self._pending: List[str] = []
+
+    def write(self, text: str) -> None:
+        self._pending.append(text)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        data = memoryview("".join(self._pending).encode(self.encoding, "replace"))
+        self._pending = []
+        while data:
+            data = data[self.raw.write(data):]
+
+    def isatty(self) -> bool:
+        return self.raw.isatty()
+
+
+class TerminalDriver(IODriver):
+    """Interactive driver backed by stdin/stdout.
+
+    Each screen is drawn as a frame (see ``neon_shadow.screen``): output
+    after a clear is buffered until the next flush, pause or prompt, then
+    written at once. On a POSIX terminal output goes straight to the file
+    descriptor through RawOutput; anywhere else it goes to sys.stdout, and
+    screens are only cleared if that is a terminal.
+
+    Everything written passes through one StyledText (see
+    ``neon_shadow.ansi``), which knows the style the terminal is in and
+    drops color sequences that would not change it.
+
+    Args:
+        output: Stream to write to instead (anything with write, flush and
+            isatty)
+        compact: Drop redundant color sequences (False writes text as given)
+    """
+
+    def __init__(self, output=None, compact: bool = True) -> None:
+        self.screen = FrameRenderer()
+        self.styles: Optional[StyledText] = StyledText() if compact else None
+        self._output = output
+
+    @property
+    def output(self):
+        """The stream output is written to."""
+        if self._output is not None:
+            return self._output
+        stdout = sys.stdout
+        if os.name != 'nt' and stdout is sys.__stdout__ and stdout.isatty():
+            stdout.flush()
+            self._output = RawOutput(io.FileIO(stdout.fileno(), "wb", closefd=False),
+                                     stdout.encoding or "utf-8")
+            return self._output
+        # Looked up on every write so redirecting sys.stdout still works
+        return stdout
+
+    def _send(self, text: str) -> None:
+        if self.styles is not None:
+            text = self.styles.feed(text).take()
+        self.output.write(text)
+
+    def write(self, text: str) -> None:
+        if self.screen.open:
+            self.screen.add(text)
+        else:
+            self._send(text)
+            self.screen.touched()
+
+    def _present(self, tail: str = "") -> None:
+        """Draw the frame being composed, if any, ending with tail."""
+        if self.screen.open:
+            self._send(self.screen.render(tail))
+        elif tail:
+            self._send(tail)
+            self.screen.touched()
+
+    def flush(self) -> None:
+        self._present()
+        if self.styles is not None:
+            # Leave the terminal in the style the text asked for
+            self.output.write(self.styles.flush().take())
+        self.output.flush()
+
+    def read_line(self, prompt: str = "") -> str:
+        # The prompt is drawn with the frame, so the frame is one write
+        self._present(prompt)
+        self.flush()
+        return input()
+
+    def clear(self) -> None:
+        if self.output.isatty():
+            self.screen.begin()
+
+    def sleep(self, seconds: float) -> None:
+        self.flush()
+        time.sleep(seconds)
+
+    @contextmanager
+    def skippable(self):
+        # Put the terminal in cbreak mode so a single key can be detected
+        # without waiting for Enter
+        if os.name == 'nt' or not sys.stdin.isatty():
+            yield
+            return
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    def key_pressed(self) -> bool:
+        if os.name == 'nt':
+            import msvcrt
+            if msvcrt.kbhit():
+                msvcrt.getwch()
+                return True
+            return False
+        if not sys.stdin.isatty():
+            return False
+        import select
+        ready, _, _ = select.select([sys.stdin], [], [], 0)
+        if ready:
+            os.read(sys.stdin.fileno(), 1024)
+            return True
+        return False
+
+
+class ScriptedDriver(IODriver):
+    """Headless driver that answers prompts from a script.
+
+    Args:
+        inputs: Lines to feed to successive prompts, or a callable that
+            receives the prompt text and returns the answer
+        capture: Keep the (ANSI-stripped) output in ``self.output``
+    """
+
+    headless = True
+
+    def __init__(self, inputs: Union[Iterable[str], Callable[[str], str]] = (),
+                 capture: bool = False) -> None:
+        self.responder: Optional[Callable[[str], str]] = inputs if callable(inputs) else None
+        self.inputs = deque() if callable(inputs) else deque(inputs)
+        self.capture = capture
+        self.output: List[str] = []
+
+    def write(self, text: str) -> None:
+        if self.capture:
+            self.output.append(strip_ansi(text))
+
+    def read_line(self, prompt: str = "") -> str:
+        if self.capture and prompt:
+            self.output.append(strip_ansi(prompt))
+        if self.responder:
+            return self.responder(strip_ansi(prompt))
+        if not self.inputs:
+            raise ScriptExhausted("Script ran out of input")
+        return self.inputs.popleft()
+
+    def feed(self, *lines: str) -> None:
+        """Queue more input lines."""
+        self.inputs.extend(lines)
+
+    def text(self) -> str:
+        """Return everything captured so far."""
+        return "".join(self.output)
+
+
+class NullDriver(IODriver):
+    """Headless driver that discards output and presses Enter at every prompt.
+
+    Numbered menus cannot be answered, so reaching one raises ScriptExhausted.
+    """
+
+    headless = True
+
+    def write(self, text: str) -> None:
+        pass
+
+    def read_line(self, prompt: str = "") -> str:
+        return ""
+
+    def read_choice(self, prompt: str, valid_range) -> int:
+        raise ScriptExhausted(f"No choice available for prompt: {strip_ansi(prompt)!r}")
+
+    def confirm(self, prompt: str) -> bool:
+        return False
+
+
+_default_driver = TerminalDriver()
+_current_driver: ContextVar[IODriver] = ContextVar("neon_shadow_driver")
+
+
+def get_driver() -> IODriver:
+    """Return the driver active in the current context."""
+    return _current_driver.get(_default_driver)
+
+
+def set_driver(driver: IODriver) -> None:
+    """Make driver the active driver for the current context."""
+    _current_driver.set(driver)
+
+
+@contextmanager
+def use_driver(driver: IODriver):
+    """Make driver the active driver for the current context until the block exits."""
+    token = _current_driver.set(driver)
+    try:
+        yield driver
+    finally:
+        _current_driver.reset(token)
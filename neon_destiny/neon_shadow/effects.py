@@ -0,0 +1,209 @@
+"""
+Compiler for the small expressions used in game content.
+
+Hazard damage and consumable effects used to be Python source strings run
+through eval(). They are now parsed once into plain callables that draw from
+the game's random number generator. Anything outside the supported forms is
+rejected with a ContentError instead of being executed.
+
+Hazard damage specs:
+    12                              fixed damage
+    "random.randint(5, 15)"         uniform range (legacy form)
+    "5-15"                          uniform range
+    "2d6+3"                         dice roll with an optional modifier
+    {"fixed": 12}
+    {"uniform": [5, 15]}
+    {"dice": "2d6+3"}
+    {"curve": {"start": 5, "end": 25, "days": 365, "spread": 3}}
+                                    grows linearly from start to end over the
+                                    campaign, plus or minus spread
+
+Consumable effects are a single whitelisted call, for example
+"player.heal(30)" or "service.enhance_security(2)".
+"""
+
+import ast
+import random
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Tuple
+
+DamageRoll = Callable[[random.Random, int], int]
+
+_LEGACY_RANDINT = re.compile(r"^\s*random\.randint\(\s*(-?\d+)\s*,\s*(-?\d+)\s*\)\s*$")
+_RANGE = re.compile(r"^\s*(\d+)\s*-\s*(\d+)\s*$")
+_DICE = re.compile(r"^\s*(\d*)[dD](\d+)\s*(?:([+-])\s*(\d+))?\s*$")
+_CALL = re.compile(r"^\s*(player|service|special)\.(\w+)\((.*)\)\s*$")
+
+
+class ContentError(ValueError):
+    """Raised when a content spec cannot be compiled."""
+
+
+def _fixed(amount: int) -> DamageRoll:
+    return lambda rng, day: amount
+
+
+def _uniform(low: int, high: int) -> DamageRoll:
+    if low > high:
+        raise ContentError(f"Empty damage range {low}-{high}")
+    return lambda rng, day: rng.randint(low, high)
+
+
+def _dice(spec: str) -> DamageRoll:
+    match = _DICE.match(spec)
+    if not match:
+        raise ContentError(f"Invalid dice spec {spec!r}")
+    count = int(match.group(1) or 1)
+    sides = int(match.group(2))
+    modifier = int(match.group(4) or 0)
+    if match.group(3) == '-':
+        modifier = -modifier
+    if count < 1 or sides < 1:
+        raise ContentError(f"Invalid dice spec {spec!r}")
+
+    def roll(rng: random.Random, day: int) -> int:
+        return max(0, sum(rng.randint(1, sides) for _ in range(count)) + modifier)
+    return roll
+
+
+def _curve(spec: Dict[str, Any]) -> DamageRoll:
+    try:
+        start = float(spec["start"])
+        end = float(spec["end"])
+        days = max(1, int(spec.get("days", 365)))
+        spread = int(spec.get("spread", 0))
+    except (KeyError, TypeError, ValueError) as e:
+        raise ContentError(f"Invalid curve spec {spec!r}") from e
+    slope = (end - start) / days
+
+    def roll(rng: random.Random, day: int) -> int:
+        base = start + slope * min(day, days)
+        jitter = rng.randint(-spread, spread) if spread else 0
+        return max(0, int(round(base)) + jitter)
+    return roll
+
+
+def compile_damage(spec: Any) -> DamageRoll:
+    """Compile a hazard damage spec into a callable.
+
+    Args:
+        spec: Damage spec in one of the forms listed in the module docstring
+
+    Returns:
+        Callable taking the game's random generator and the current day and
+        returning the damage dealt
+
+    Raises:
+        ContentError: If the spec is not a supported form
+    """
+    if isinstance(spec, bool):
+        raise ContentError(f"Invalid damage spec {spec!r}")
+    if isinstance(spec, int):
+        return _fixed(spec)
+    if isinstance(spec, str):
+        return _compile_damage_string(spec)
+    if isinstance(spec, dict) and len(spec) == 1:
+        (kind, value), = spec.items()
+        if kind == "fixed" and isinstance(value, int):
+            return _fixed(value)
+        if kind == "uniform" and isinstance(value, (list, tuple)) and len(value) == 2:
+            return _uniform(int(value[0]), int(value[1]))
+        if kind == "dice" and isinstance(value, str):
+            return _dice(value)
+        if kind == "curve" and isinstance(value, dict):
+            return _curve(value)
+    raise ContentError(f"Invalid damage spec {spec!r}")
+
+
+@lru_cache(maxsize=None)
+def _compile_damage_string(spec: str) -> DamageRoll:
+    # Strings are cached: every game shares one compiled roll per spec
+    match = _LEGACY_RANDINT.match(spec) or _RANGE.match(spec)
+    if match:
+        return _uniform(int(match.group(1)), int(match.group(2)))
+    if spec.strip().isdigit():
+        return _fixed(int(spec))
+    return _dice(spec)
+
+
+class EffectContext(NamedTuple):
+    """What a consumable effect can act on."""
+    player: Any
+    service: Any = None
+
+
+def _heal(ctx: EffectContext, amount: int) -> None:
+    ctx.player.heal(amount)
+
+
+def _restore_energy(ctx: EffectContext, amount: int) -> None:
+    ctx.player.restore_energy(amount)
+
+
+def _add_status_effect(ctx: EffectContext, name: str, duration: int) -> None:
+    ctx.player.add_status_effect({"name": name.replace("_", " ").title(), "duration": duration})
+
+
+def _boost_all_skills(ctx: EffectContext, amount: int, days: int) -> None:
+    for skill in ctx.player.skills:
+        ctx.player.temp_skill_boosts.append(
+            {"skill": skill, "amount": amount, "remaining_days": days})
+
+
+def _enhance_security(ctx: EffectContext, amount: int) -> None:
+    ctx.service.enhance_security(amount)
+
+
+def _optimize_performance(ctx: EffectContext, amount: int) -> None:
+    ctx.service.optimize_performance(amount)
+
+
+# (target, method) -> (implementation, argument types)
+EFFECTS: Dict[Tuple[str, str], Tuple[Callable[..., None], Tuple[type, ...]]] = {
+    ("player", "heal"): (_heal, (int,)),
+    ("player", "restore_energy"): (_restore_energy, (int,)),
+    ("player", "add_status_effect"): (_add_status_effect, (str, int)),
+    ("player", "boost_all_skills"): (_boost_all_skills, (int, int)),
+    ("service", "enhance_security"): (_enhance_security, (int,)),
+    ("service", "optimize_performance"): (_optimize_performance, (int,)),
+}
+
+
+class CompiledEffect(NamedTuple):
+    """A parsed consumable effect."""
+    target: str  # "player" or "service"
+    apply: Callable[[EffectContext], None]
+
+
+@lru_cache(maxsize=None)
+def compile_effect(spec: str) -> CompiledEffect:
+    """Compile a consumable effect string such as "player.heal(30)".
+
+    Args:
+        spec: A single call on ``player`` or ``service`` from the EFFECTS table,
+            with literal arguments
+
+    Returns:
+        The effect's target and a callable taking an EffectContext
+
+    Raises:
+        ContentError: If the call is not whitelisted or its arguments are wrong
+    """
+    match = _CALL.match(spec) if isinstance(spec, str) else None
+    if not match:
+        raise ContentError(f"Invalid effect {spec!r}")
+    target, method, raw_args = match.groups()
+    if (target, method) not in EFFECTS:
+        raise ContentError(f"Unsupported effect {target}.{method}")
+    func, types = EFFECTS[(target, method)]
+
+    try:
+        args = ast.literal_eval(f"({raw_args},)") if raw_args.strip() else ()
+    except (ValueError, SyntaxError) as e:
+        raise ContentError(f"Invalid arguments in effect {spec!r}") from e
+    if len(args) != len(types) or not all(
+            isinstance(arg, kind) and not isinstance(arg, bool) for arg, kind in zip(args, types)):
+        raise ContentError(f"Wrong arguments in effect {spec!r}")
+
+    return CompiledEffect(target, lambda ctx: func(ctx, *args))
@@ -1,18 +1,21 @@
 import random
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from neon_shadow.constants import (
     CLR_BRIGHT, CLR_CYAN, CLR_RESET, CLR_SUCCESS,
     CLR_ERROR, CLR_WARNING
 )
-from neon_shadow.ui import print_slow
-from neon_shadow.artifact import CloudArtifact
-from neon_shadow.service import CloudService
+from neon_shadow.ui import print_slow, echo
+from neon_shadow.artifact import create_artifact
+from neon_shadow.service import create_service
 
 
 class CloudEvent:
     """Represents an event that can occur at a location."""
 
+    __slots__ = ("id", "name", "description", "event_type", "effects", "requirements",
+                 "chance", "repeatable", "has_occurred", "cooldown", "cooldown_duration")
+
     def __init__(self, id: str, name: str, description: str, event_type: str,
                  effects: Optional[Dict[str, Any]] = None,
                  requirements: Optional[Dict[str, Any]] = None,
@@ -41,11 +44,13 @@ class CloudEvent:
         self.cooldown = 0  # Turns until event can trigger again
         self.cooldown_duration = 0  # How long the cooldown should be when triggered
 
-    def can_trigger(self, player) -> bool:
+    def can_trigger(self, player, rng: Optional[random.Random] = None) -> bool:
         """Check if the event can be triggered.
         
         Args:
             player: The player object to check requirements against
+            rng: Random number generator for the chance roll (defaults to the
+                global random module)
             
         Returns:
             True if the event can be triggered, False otherwise
@@ -56,7 +61,21 @@ class CloudEvent:
         if not self.repeatable and self.has_occurred:
             return False
 
-        # Check player requirements
+        if not self.requirements_met(player):
+            return False
+
+        # Random chance
+        return self.roll(rng)
+
+    def requirements_met(self, player) -> bool:
+        """Check the player requirements only (no cooldown or chance).
+        
+        Args:
+            player: The player object to check requirements against
+            
+        Returns:
+            True if every requirement is satisfied, False otherwise
+        """
         if 'min_skill' in self.requirements:
             for skill, level in self.requirements['min_skill'].items():
                 if player.skills.get(skill, 0) < level:
@@ -78,32 +97,58 @@ class CloudEvent:
                 if player.faction_reputation.get(faction, 0) < level:
                     return False
 
-        # Random chance
-        if random.randint(1, 100) > self.chance:
-            return False
-
         return True
 
-    def trigger(self, player) -> bool:
+    def roll(self, rng: Optional[random.Random] = None) -> bool:
+        """Roll the event's percentage chance.
+        
+        Args:
+            rng: Random number generator (defaults to the global random module)
+            
+        Returns:
+            True if the roll succeeds
+        """
+        return (rng or random).randint(1, 100) <= self.chance
+
+    def requirement_keys(self) -> List[Tuple[str, str]]:
+        """List the (kind, name) player attributes this event's requirements read.
+        
+        Returns:
+            Keys such as ('skill', 'security') or ('artifact', 'S3_Scanner')
+        """
+        keys = []
+        for skill in self.requirements.get('min_skill', {}):
+            keys.append(('skill', skill))
+        for artifact in self.requirements.get('artifacts', []):
+            keys.append(('artifact', artifact))
+        for clue in self.requirements.get('clues', []):
+            keys.append(('clue', clue))
+        for faction in self.requirements.get('min_faction_rep', {}):
+            keys.append(('faction', faction))
+        return keys
+
+    def trigger(self, player, rng: Optional[random.Random] = None) -> bool:
         """Trigger the event and apply its effects.
         
         Args:
             player: The player object to apply effects to
+            rng: Random number generator for ids of granted items (defaults
+                to the global random module)
             
         Returns:
             True if the event was successfully triggered
         """
-        print(f"\n{CLR_BRIGHT}{CLR_CYAN}══════ EVENT: {self.name} ══════{CLR_RESET}")
+        echo(f"\n{CLR_BRIGHT}{CLR_CYAN}══════ EVENT: {self.name} ══════{CLR_RESET}")
         print_slow(self.description, color=CLR_CYAN)
 
         # Apply effects
         if 'credits' in self.effects:
             player.cloud_credits += self.effects['credits']
             if self.effects['credits'] > 0:
-                print(
+                echo(
                     f"{CLR_SUCCESS}Gained {self.effects['credits']} Cloud Credits{CLR_RESET}")
             else:
-                print(
+                echo(
                     f"{CLR_ERROR}Lost {-self.effects['credits']} Cloud Credits{CLR_RESET}")
 
         if 'skill' in self.effects:
@@ -118,50 +163,34 @@ class CloudEvent:
                     player.faction_reputation[faction] = max(
                         0, min(100, old_rep + change))
                     if change > 0:
-                        print(
+                        echo(
                             f"{CLR_SUCCESS}{faction} reputation increased by {change} (Now: {player.faction_reputation[faction]}){CLR_RESET}")
                     else:
-                        print(
+                        echo(
                             f"{CLR_ERROR}{faction} reputation decreased by {-change} (Now: {player.faction_reputation[faction]}){CLR_RESET}")
                 else:
-                    print(
+                    echo(
                         f"{CLR_WARNING}Warning: Unknown faction '{faction}' in event effect.{CLR_RESET}")
 
         if 'artifact' in self.effects:
-            artifact = CloudArtifact(
-                self.effects['artifact']['name'],
-                self.effects['artifact']['description'],
-                self.effects['artifact']['artifact_type'],
-                self.effects['artifact'].get('aws_service'),
-                self.effects['artifact'].get('cost', 0),
-                self.effects['artifact'].get('power', 1)
-            )
+            artifact = create_artifact(self.effects['artifact'])
             player.add_artifact(artifact)
 
         if 'clue' in self.effects:
             player.add_clue(self.effects['clue'])
 
         if 'service' in self.effects:
-            service = CloudService(
-                name=self.effects['service']['name'],
-                description=self.effects['service']['description'],
-                service_type=self.effects['service'].get(
-                    'service_type', self.effects['service']['type']),
-                cost_per_hour=self.effects['service'].get('cost_per_hour', 1),
-                deploy_cost=self.effects['service'].get('deploy_cost', 10),
-                region_availability=self.effects['service'].get(
-                    'region_availability', ['us-east-1']),
-                dependencies=self.effects['service'].get('dependencies', [])
-            )
+            service = create_service(self.effects['service'],
+                                     instance_id=f"{(rng or random).getrandbits(32):08x}")
             player.add_service(service)
 
         if 'time' in self.effects:
             player.time_left += self.effects['time']
             if self.effects['time'] > 0:
-                print(
+                echo(
                     f"{CLR_SUCCESS}Gained {self.effects['time']} days{CLR_RESET}")
             else:
-                print(
+                echo(
                     f"{CLR_ERROR}Lost {-self.effects['time']} days{CLR_RESET}")
 
         if 'health' in self.effects:
@@ -173,13 +202,13 @@ class CloudEvent:
         if 'energy' in self.effects:
             if self.effects['energy'] > 0:
                 amt = player.restore_energy(self.effects['energy'])
-                print(f"{CLR_SUCCESS}Restored {amt} energy{CLR_RESET}")
+                echo(f"{CLR_SUCCESS}Restored {amt} energy{CLR_RESET}")
             else:
                 if player.use_energy(-self.effects['energy']):
-                    print(
+                    echo(
                         f"{CLR_WARNING}Used {-self.effects['energy']} energy{CLR_RESET}")
                 else:
-                    print(f"{CLR_ERROR}Not enough energy!{CLR_RESET}")
+                    echo(f"{CLR_ERROR}Not enough energy!{CLR_RESET}")
 
         if 'status_effect' in self.effects:
             player.add_status_effect(self.effects['status_effect'])
@@ -188,7 +217,7 @@ class CloudEvent:
             item_name = self.effects['consumable']['name']
             count = self.effects['consumable'].get('count', 1)
             player.inventory.add_consumable(item_name, count)
-            print(f"{CLR_SUCCESS}Acquired {count}x {item_name}{CLR_RESET}")
+            echo(f"{CLR_SUCCESS}Acquired {count}x {item_name}{CLR_RESET}")
 
         self.has_occurred = True
         # Set cooldown if defined
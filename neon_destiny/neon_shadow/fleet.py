@@ -0,0 +1,271 @@
+"""
+Struct-of-arrays storage for large sets of deployed services.
+
+While a ``CloudService`` is attached to a ``ServiceFleet`` its hot numeric
+attributes live in the fleet's NumPy arrays and the object is a thin view
+over its slot. The daily tick then computes uptime, revenue, costs, event
+rolls and damage for every service in one vectorized pass.
+
+NumPy is optional: without it ``HAS_NUMPY`` is False and the game keeps its
+per-service update loop.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Below this many deployed services the per-service loop is faster than the
+# fixed overhead of NumPy calls, so the game only switches to a fleet once it
+# has grown past FLEET_MIN_SIZE and goes back once it shrinks below half that
+FLEET_MIN_SIZE = 32
+
+# Order matters: rolls index into this tuple
+SERVICE_EVENT_TYPES = ("health_hit", "performance_drop", "security_breach", "cost_spike")
+
+
+class FleetField:
+    """Service attribute stored on the object, or in its fleet while attached."""
+
+    def __init__(self, cast: Callable[[Any], Any]) -> None:
+        self.cast = cast
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+        self.private = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        fleet = obj._fleet
+        if fleet is None:
+            return getattr(obj, self.private)
+        return self.cast(fleet.columns[self.name][obj._slot])
+
+    def __set__(self, obj, value) -> None:
+        fleet = obj._fleet
+        if fleet is None:
+            setattr(obj, self.private, value)
+        else:
+            fleet.columns[self.name][obj._slot] = value
+
+
+class ServiceFleet:
+    """Deployed services stored column-wise in NumPy arrays.
+
+    Args:
+        seed: Seed for the fleet's NumPy generator (event rolls)
+        capacity: Initial number of slots; the arrays double when full
+    """
+
+    COLUMNS = {
+        "health": "int64",
+        "security_level": "int64",
+        "performance": "int64",
+        "uptime_days": "int64",
+        "cost_per_hour": "float64",
+        "revenue_per_hour": "float64",
+        "is_deployed": "bool",
+    }
+
+    def __init__(self, seed: Optional[int] = None, capacity: int = FLEET_MIN_SIZE) -> None:
+        if not HAS_NUMPY:
+            raise RuntimeError("ServiceFleet requires NumPy")
+        self.rng = np.random.default_rng(seed)
+        self.columns: Dict[str, Any] = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in self.COLUMNS.items()
+        }
+        self.services: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.services)
+
+    def _grow(self) -> None:
+        for name, column in self.columns.items():
+            grown = np.zeros(len(column) * 2, dtype=column.dtype)
+            grown[:len(column)] = column
+            self.columns[name] = grown
+
+    def attach(self, service) -> None:
+        """Move a service's numeric state into the fleet."""
+        if service._fleet is self:
+            return
+        slot = len(self.services)
+        if slot == len(self.columns["health"]):
+            self._grow()
+        for name, column in self.columns.items():
+            column[slot] = getattr(service, name)
+        self.services.append(service)
+        service._fleet = self
+        service._slot = slot
+
+    def detach(self, service) -> None:
+        """Copy a service's state back onto the object and free its slot."""
+        if service._fleet is not self:
+            return
+        slot = service._slot
+        values = {name: getattr(service, name) for name in self.columns}
+        service._fleet = None
+        service._slot = -1
+        for name, value in values.items():
+            setattr(service, name, value)
+
+        # Keep the arrays dense: move the last service into the freed slot
+        last = self.services.pop()
+        if last is not service:
+            for column in self.columns.values():
+                column[slot] = column[len(self.services)]
+            self.services[slot] = last
+            last._slot = slot
+
+    def detach_all(self) -> None:
+        """Detach every service."""
+        while self.services:
+            self.detach(self.services[-1])
+
+    def sync(self, services: List[Any]) -> None:
+        """Make the fleet hold exactly the given services."""
+        if len(services) == len(self.services) and all(s._fleet is self for s in services):
+            return
+        current = {id(service) for service in services}
+        for service in self.services[:]:
+            if id(service) not in current:
+                self.detach(service)
+        for service in services:
+            if service._fleet is not self:
+                self.attach(service)
+
+    def tick(self, location_difficulty: int, event_multiplier: float,
+             severity_multiplier: float,
+             wear: int) -> Tuple[float, List[Tuple[Any, str, int]]]:
+        """Advance every online service by one day.
+
+        Mirrors the per-service loop in ``Game.update_game_state``: uptime,
+        status effects, revenue and costs, weather wear and the daily event
+        roll. Events are only chosen here; the caller resolves them.
+
+        Args:
+            location_difficulty: Difficulty of the player's current location
+            event_multiplier: Difficulty scaling of the event chance
+            severity_multiplier: Difficulty scaling of event damage
+            wear: Performance each online service loses to the weather today
+
+        Returns:
+            Net credit change for the day and a list of (service, event type,
+            health-hit damage) for every service whose event roll succeeded
+        """
+        n = len(self.services)
+        if n == 0:
+            return 0.0, []
+        cols = {name: column[:n] for name, column in self.columns.items()}
+        online = cols["is_deployed"]
+        uptime = cols["uptime_days"]
+        uptime[online] += 1
+
+        # Status effects run arbitrary callbacks, so they stay per object;
+        # they write straight through to the arrays
+        for service in self.services:
+            if service.status_effects and service.is_deployed:
+                service.update_status_effects()
+        online = cols["is_deployed"]
+
+        net = self._net(cols)
+        threshold = self._thresholds(cols, location_difficulty, event_multiplier)
+
+        if wear:
+            performance = cols["performance"]
+            performance[online] = np.maximum(1, performance[online] - wear)
+
+        rng = self.rng
+        rolls = rng.integers(1, 101, size=n)
+        hit_slots = np.flatnonzero(online & (rolls <= threshold))
+        if len(hit_slots) == 0:
+            return net, []
+
+        kinds = rng.integers(0, len(SERVICE_EVENT_TYPES), size=len(hit_slots))
+        damage = np.maximum(1, np.trunc(
+            (rng.integers(5, 16, size=len(hit_slots)) + location_difficulty)
+            * severity_multiplier)).astype(np.int64)
+
+        services = self.services
+        events = [(services[slot], SERVICE_EVENT_TYPES[kind], int(amount))
+                  for slot, kind, amount in zip(hit_slots.tolist(), kinds.tolist(), damage.tolist())]
+        return net, events
+
+    def roll_quiet(self, days_ahead: int, location_difficulty: int,
+                   event_multiplier: float) -> bool:
+        """Draw the event rolls of a coming day; return True if none succeeds.
+
+        The caller makes sure no service has status effects and that the
+        days before this one were quiet too. It puts the generator back
+        (``rng.bit_generator.state``) if the day is to be played by ``tick``.
+
+        Args:
+            days_ahead: Which coming day the rolls are for, 1 for the next
+            location_difficulty: Difficulty of the player's current location
+            event_multiplier: Difficulty scaling of the event chance
+        """
+        n = len(self.services)
+        if n == 0:
+            return True
+        cols = {name: column[:n] for name, column in self.columns.items()}
+        online = cols["is_deployed"]
+        rolls = self.rng.integers(1, 101, size=n)
+        # Uptime as it will be on that day
+        cols["uptime_days"] = cols["uptime_days"] + days_ahead * online
+        return not (online & (rolls <= self._thresholds(cols, location_difficulty,
+                                                        event_multiplier))).any()
+
+    def advance_quiet(self, days: int, wear: int) -> List[float]:
+        """Advance every online service by days whose rolls ``roll_quiet`` drew.
+
+        Each day is what ``tick`` does on a day when no event roll succeeds.
+
+        Args:
+            days: Days to advance
+            wear: Performance each online service loses to the weather each day
+
+        Returns:
+            The net credit change of each day
+        """
+        n = len(self.services)
+        if n == 0:
+            return [0.0] * days
+        cols = {name: column[:n] for name, column in self.columns.items()}
+        online = cols["is_deployed"]
+        uptime = cols["uptime_days"]
+        performance = cols["performance"]
+        nets = []
+        for _ in range(days):
+            uptime[online] += 1
+            nets.append(self._net(cols))
+            if wear:
+                performance[online] = np.maximum(1, performance[online] - wear)
+        return nets
+
+    @staticmethod
+    def _net(cols: Dict[str, Any]) -> float:
+        """Return the day's income less costs of the online services."""
+        online = cols["is_deployed"]
+        # Same formula as CloudService.calculate_revenue
+        revenue = (cols["revenue_per_hour"]
+                   * (0.8 + cols["performance"] / 10 * 0.4)
+                   * (0.9 + cols["security_level"] / 10 * 0.2)
+                   * (1 - (100 - cols["health"]) / 100 * 0.5)
+                   * np.minimum(1.5, 1 + cols["uptime_days"] / 100))
+        income = float(revenue[online].sum()) * 24
+        costs = float(cols["cost_per_hour"][online].sum()) * 24
+        return income - costs
+
+    @staticmethod
+    def _thresholds(cols: Dict[str, Any], location_difficulty: int, event_multiplier: float):
+        """Return each service's event roll threshold (out of 100) for the day."""
+        # Event chance: 5% base, +1% per 10 days uptime, -security,
+        # +half the location difficulty, scaled by game difficulty
+        chance = (5 + cols["uptime_days"] // 10 - cols["security_level"]
+                  + location_difficulty // 2) * event_multiplier
+        return np.maximum(1, np.trunc(chance))
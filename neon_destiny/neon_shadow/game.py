@@ -2,57 +2,124 @@ import os
 import sys
 import time
 import json
-import copy
 import random
-import uuid
+import functools
 from collections import defaultdict
+from contextlib import nullcontext
 from typing import Dict, Optional, List, Union, Set, Any, Tuple
 
+from neon_shadow.ansi import StyledText
 from neon_shadow.constants import (
     CLR_RESET, CLR_TITLE, CLR_SECTION, CLR_ERROR, CLR_SUCCESS,
     CLR_WARNING, CLR_BRIGHT, CLR_CYAN, CLR_CREDITS, CLR_SHADOW_ADMIN,
-    CLR_CLUE, CLR_HAZARD, CLR_BONUS, PRESS_ENTER
+    CLR_CLUE, CLR_HAZARD, CLR_BONUS, PRESS_ENTER, FAST_FORWARD_MAX_DAYS, DAILY_EVENT_CHANCE
 )
+from neon_shadow.driver import IODriver, get_driver, use_driver
 from neon_shadow.ui import (
-    clear_screen, print_slow, display_ascii_art, display_loading_bar,
-    terminal_effect, hacker_animation, display_choices,
-    display_notification, display_mini_map, display_aws_info
+    echo, prompt, pause, clear_screen, print_slow, display_ascii_art,
+    display_loading_bar, terminal_effect, hacker_animation, display_choices,
+    display_notification, display_mini_map, display_aws_info,
+    RENDER_PROFILES, get_render_profile, set_render_profile
 )
 from neon_shadow.utils import get_valid_input, confirm_action
 from neon_shadow.player import CloudRanger
 from neon_shadow.location import Location
 from neon_shadow.quest import Quest
 from neon_shadow.event import CloudEvent
-from neon_shadow.artifact import CloudArtifact
-from neon_shadow.service import CloudService
+from neon_shadow.scheduler import EventScheduler
+from neon_shadow.profiler import TurnProfiler, profile_path
+from neon_shadow.tracker import QuestTracker
+from neon_shadow.weather import WeatherEngine
+from neon_shadow.graph import travel_energy
+from neon_shadow.effects import CompiledEffect, EffectContext
+from neon_shadow.catalogue import (
+    ContentCatalogue, LazyObjects, get_catalogue, spawn_event, spawn_location, spawn_quest
+)
+from neon_shadow.artifact import CloudArtifact, create_artifact
+from neon_shadow.service import CloudService, create_service
+from neon_shadow.fleet import HAS_NUMPY, FLEET_MIN_SIZE, SERVICE_EVENT_TYPES, ServiceFleet
+from neon_shadow.savegame import (
+    SaveGameError, dump_player, dump_random_state, load_player, load_random_state,
+    read_save, save_path, write_save
+)
 
 # Import content
-from neon_shadow.content.artifacts import ARTIFACTS
-from neon_shadow.content.services import SERVICES
-from neon_shadow.content.quests import QUESTS
-from neon_shadow.content.events import EVENTS
-from neon_shadow.content.locations import LOCATIONS
-from neon_shadow.content.vendors import VENDORS
-from neon_shadow.content.weather import WEATHER_TYPES, SEVERITY_LEVELS, REGIONAL_WEATHER_TENDENCIES
+from neon_shadow.content.vendors import FOUND_CONSUMABLES
+
+
+def _playing(method):
+    """Run a Game method with the game's own driver active in the current context."""
+    @functools.wraps(method)
+    def play(self, *args, **kwargs):
+        with use_driver(self.io):
+            return method(self, *args, **kwargs)
+    return play
 
 
 class Game:
     """Main game class that manages the game state and flow."""
 
-    def __init__(self, difficulty: str = "normal") -> None:
+    # Status effects the game itself applies, by name. Saves keep only an
+    # effect's plain fields; its callbacks are looked up here (or in the
+    # event content) when the game is loaded
+    STATUS_EFFECTS: Dict[str, Dict[str, Any]] = {
+        "Security Vulnerability": {
+            "name": "Security Vulnerability",
+            "duration": 3,
+            "per_turn_effect": lambda svc: svc.apply_damage(2)
+        },
+        "Enhanced Security": {
+            "name": "Enhanced Security",
+            "duration": 3,
+            "per_turn_effect": lambda svc: None  # No ongoing effect
+        },
+        "Security Shield": {
+            "name": "Security Shield",
+            "duration": 3,
+            "per_turn_effect": lambda player: None  # Just protection
+        },
+    }
+
+    # Profiler phase of each main-menu action, by menu number
+    ACTION_PHASES: Dict[int, str] = {
+        1: "action:explore",
+        2: "action:travel",
+        3: "action:quests",
+        4: "action:status",
+        5: "action:services",
+        6: "action:artifact",
+        7: "action:rest",
+        8: "action:vendors",
+        9: "action:system",
+    }
+
+    def __init__(self, difficulty: str = "normal", io: Optional[IODriver] = None,
+                 seed: Optional[int] = None) -> None:
         """Initialize a new game.
 
         Args:
             difficulty: Game difficulty level ("easy", "normal", or "hard")
+            io: I/O driver for this game; defaults to the active driver
+                (the terminal unless another one has been set). It is made
+                the active driver while the game plays (``start_game`` and
+                ``game_loop``) and put back when they return
+            seed: Seed for the game's random number generator; the same seed
+                and the same inputs always play out the same campaign
         """
+        # Every game mechanic draws from this generator, never the global one
+        self.seed: int = seed if seed is not None else random.randrange(2 ** 63)
+        self.rng: random.Random = random.Random(self.seed)
+
+        # All output and prompts go through this driver while the game plays
+        self.io: IODriver = io if io is not None else get_driver()
+
         # Initialize core game components
         self.player: Optional[CloudRanger] = None
         self.current_location: Optional[Location] = None
-        self.locations: Dict[str, Location] = {}
-        self.quests: Dict[str, Quest] = {}
-        self.events: Dict[str, CloudEvent] = {}
-        self.artifacts: Dict[str, Dict[str, Any]] = {}
-        self.services: Dict[str, Dict[str, Any]] = {}
+        self.locations: LazyObjects[Location]
+        self.quests: LazyObjects[Quest]
+        self.events: LazyObjects[CloudEvent]
+        self.event_scheduler: EventScheduler
 
         # Game state variables
         self.current_day: int = 1
@@ -63,144 +130,51 @@ class Game:
         self.paused: bool = False
         self.battle_mode: bool = False
         self.debug_mode: bool = False
+        self.profiler: Optional[TurnProfiler] = None  # Times each turn while debug mode is on
         self.current_enemy: Optional[Any] = None
         self.discovered_locations: Set[str] = set()
-        self.weather_conditions: Dict[str, Dict[str, Any]] = {}
         self.global_events: List[str] = []
-
-        # Create game content
-        self._create_locations()
-        self._create_artifacts()
-        self._create_services()
-        self._create_quests()
-        self._create_events()
-        self._create_weather_conditions()
-        self._create_vendors()
-
-    def _create_locations(self) -> None:
-        """Create game world locations from the LOCATIONS data."""
-        for loc_id, loc_data in LOCATIONS.items():
-            # Create the base location
-            location = Location(
-                name=loc_data["name"],
-                description=loc_data["description"],
-                region=loc_data.get("region"),
-                connections=loc_data.get("connections", []),
-                events=loc_data.get("events", []),
-                services=loc_data.get("services", []),
-                difficulty=loc_data.get("difficulty", 1)
-            )
-
-            # Add hazards if present
-            if "hazards" in loc_data:
-                for hazard in loc_data["hazards"]:
-                    location.add_hazard(hazard)
-
-            # Store the location
-            self.locations[loc_data["name"]] = location
-
-    def _create_artifacts(self) -> None:
-        """Create artifact templates from the ARTIFACTS data."""
-        self.artifacts = ARTIFACTS
-
-    def _create_services(self) -> None:
-        """Create service templates from the SERVICES data."""
-        self.services = SERVICES
-
-    def _create_quests(self) -> None:
-        """Create game quests from the QUESTS data."""
-        for quest_id, quest_data in QUESTS.items():
-            quest = Quest(
-                id=quest_data["id"],
-                title=quest_data["title"],
-                description=quest_data["description"],
-                objectives=quest_data["objectives"],
-                reward=quest_data["reward"],
-                prereq_quests=quest_data.get("prereq_quests", []),
-                min_skill_level=quest_data.get("min_skill_level", {}),
-                min_faction_rep=quest_data.get("min_faction_rep", {}),
-                location=quest_data.get("location")
-            )
-
-            # Set additional properties
-            if "difficulty" in quest_data:
-                quest.difficulty = quest_data["difficulty"]
-            if "time_limit" in quest_data:
-                quest.time_limit = quest_data["time_limit"]
-            if "hidden" in quest_data:
-                quest.hidden = quest_data["hidden"]
-
-            self.quests[quest_id] = quest
-
-    def _create_events(self) -> None:
-        """Create game events from the EVENTS data."""
-        for event_id, event_data in EVENTS.items():
-            event = CloudEvent(
-                id=event_data["id"],
-                name=event_data["name"],
-                description=event_data["description"],
-                event_type=event_data["event_type"],
-                effects=event_data.get("effects", {}),
-                requirements=event_data.get("requirements", {}),
-                chance=event_data.get("chance", 100),
-                repeatable=event_data.get("repeatable", False)
-            )
-
-            # Set additional properties
-            if "cooldown_duration" in event_data:
-                event.cooldown_duration = event_data["cooldown_duration"]
-
-            self.events[event_id] = event
-
-    def _create_weather_conditions(self) -> None:
-        """Create weather conditions for locations."""
-        for loc_name, location in self.locations.items():
-            # Choose appropriate weather based on region
-            region = location.region if location.region else "unknown"
-            regional_weather = REGIONAL_WEATHER_TENDENCIES.get(region,
-                                                             REGIONAL_WEATHER_TENDENCIES["unknown"])
-
-            # Weight toward region-appropriate weather but allow any
-            if random.randint(1, 100) <= 70:  # 70% chance for regional weather
-                weather_name = random.choice(regional_weather)
-                weather = next((w for w in WEATHER_TYPES if w["name"] == weather_name),
-                              random.choice(WEATHER_TYPES))
-            else:
-                weather = random.choice(WEATHER_TYPES)
-
-            # Severity based on location difficulty
-            severity_level = min(
-                6, max(1, location.difficulty // 2 + random.randint(-1, 1)))
-            severity = SEVERITY_LEVELS[severity_level]
-
-            self.weather_conditions[loc_name] = {
-                "current": weather,
-                # Weather will change after this many days
-                "duration": random.randint(2, 5),
-                "severity": severity,
-                "severity_level": severity_level
-            }
-
-    def _create_vendors(self) -> None:
-        """Create vendors for various locations based on VENDORS data."""
-        for vendor_id, vendor_data in VENDORS.items():
-            if vendor_data["location"] in LOCATIONS:
-                location_name = LOCATIONS[vendor_data["location"]]["name"]
-                if location_name in self.locations:
-                    self.locations[location_name].add_vendor({
-                        "name": vendor_data["name"],
-                        "description": vendor_data["description"],
-                        "inventory": vendor_data["inventory"],
-                        "reputation_required": vendor_data.get("reputation_required", {})
-                    })
-
+        self.fleet: Optional[ServiceFleet] = None  # Created once enough services are deployed
+        self.services_lost: int = 0  # Deployed services destroyed by service events
+        self.objectives_completed: int = 0  # Quest objectives completed by the tracker
+        self._rolls_ahead: List[int] = []  # Percent rolls drawn by fast-forward, last first
+
+        # Game content comes from the shared catalogue; locations, quests and
+        # events are only created when first looked up
+        self.catalogue: ContentCatalogue = get_catalogue()
+        self.artifacts: Dict[str, Dict[str, Any]] = self.catalogue.artifacts
+        self.services: Dict[str, Dict[str, Any]] = self.catalogue.services
+        self.consumable_effects: Dict[str, CompiledEffect] = self.catalogue.consumable_effects
+        self.content_warnings: List[str] = list(self.catalogue.warnings)  # Content that failed to compile
+        self._create_world()
+        self.weather = WeatherEngine(self.catalogue.weather, self.catalogue.locations,
+                                     random.Random(self.rng.getrandbits(64)))
+        self.weather.roll()
+
+    def _create_world(self) -> None:
+        """Give this game fresh locations, quests and events."""
+        (self.locations, self.quests, self.events,
+         self.event_scheduler, self.quest_tracker) = self._new_world()
+        self.graph = self.catalogue.graph
+
+    def _new_world(self) -> Tuple[LazyObjects[Location], LazyObjects[Quest], LazyObjects[CloudEvent],
+                                  EventScheduler, QuestTracker]:
+        """Return fresh locations, quests and events, with a scheduler and quest tracker for them."""
+        catalogue = self.catalogue
+        locations = LazyObjects(catalogue.locations, spawn_location)
+        quests = LazyObjects(catalogue.quests, spawn_quest)
+        events = LazyObjects(catalogue.events, spawn_event)
+        return (locations, quests, events, EventScheduler(events, catalogue.event_index),
+                QuestTracker(quests, catalogue.quest_index))
+
+    @_playing
     def start_game(self) -> None:
         """Start a new game."""
-        print(
+        echo(
             f"\n{CLR_TITLE}╔══════════════════════════════════════════════════════════╗{CLR_RESET}")
-        print(
+        echo(
             f"{CLR_TITLE}║            CLOUD RANGER: DIGITAL FRONTIER                ║{CLR_RESET}")
-        print(
+        echo(
             f"{CLR_TITLE}╚══════════════════════════════════════════════════════════╝{CLR_RESET}")
 
         print_slow(
@@ -209,17 +183,36 @@ class Game:
             "As a newly recruited Cloud Ranger, your mission is to protect the cloud, solve mysteries,")
         print_slow("and uncover the identity of the notorious Shadow Admin.")
 
-        print(f"\n{CLR_SECTION}[CHARACTER CREATION]{CLR_RESET}")
-        name = input("Enter your ranger name: ")
+        echo(f"\n{CLR_SECTION}[CHARACTER CREATION]{CLR_RESET}")
+        name = prompt("Enter your ranger name: ")
 
-        print("\nSelect your specialization:")
-        print("1. Security Specialist (Security +2, Investigation +1)")
-        print("2. Network Engineer (Network +2, Cloud +1)")
-        print("3. Database Administrator (Database +2, Serverless +1)")
-        print("4. DevOps Engineer (Cloud +2, Security +1)")
+        echo("\nSelect your specialization:")
+        echo("1. Security Specialist (Security +2, Investigation +1)")
+        echo("2. Network Engineer (Network +2, Cloud +1)")
+        echo("3. Database Administrator (Database +2, Serverless +1)")
+        echo("4. DevOps Engineer (Cloud +2, Security +1)")
 
         choice = get_valid_input("Enter your choice (1-4): ", range(1, 5))
 
+        self.create_player(name, choice)
+
+        echo(f"\n{CLR_SUCCESS}Character created! Welcome, {self.player.name} the {self.player.specialty}!{CLR_RESET}")
+        prompt("\nPress Enter to begin your adventure...")
+
+        # Start the game loop
+        if self.player:
+            self.game_loop()
+
+    def create_player(self, name: str, choice: int) -> CloudRanger:
+        """Create the player character without prompting.
+
+        Args:
+            name: Ranger name
+            choice: Specialization (1-4, as listed in the character creation menu)
+
+        Returns:
+            The new player character
+        """
         # Set initial skills based on specialization
         initial_skills = {}
         if choice == 1:
@@ -244,7 +237,8 @@ class Game:
         if tutorial_quest:
             self.player.active_quests.append(tutorial_quest.id)
         else:
-            print(f"{CLR_WARNING}Warning: Tutorial quest not found!{CLR_RESET}")
+            echo(f"{CLR_WARNING}Warning: Tutorial quest not found!{CLR_RESET}")
+        self.quest_tracker.attach(self.player)
 
         # Set game parameters based on difficulty
         if self.difficulty == "easy":
@@ -252,14 +246,7 @@ class Game:
             self.player.time_left = 400
             s3_scanner_data = self.artifacts.get("S3_Scanner")
             if s3_scanner_data:
-                scanner = CloudArtifact(
-                    s3_scanner_data["name"],
-                    s3_scanner_data["description"],
-                    s3_scanner_data["artifact_type"],
-                    s3_scanner_data["aws_service"],
-                    s3_scanner_data["cost"],
-                    s3_scanner_data["power"]
-                )
+                scanner = create_artifact(s3_scanner_data)
                 self.player.add_artifact(scanner)
 
         elif self.difficulty == "normal":
@@ -269,49 +256,71 @@ class Game:
             self.player.cloud_credits = 300
             self.player.time_left = 300
 
-        print(f"\n{CLR_SUCCESS}Character created! Welcome, {self.player.name} the {self.player.specialty}!{CLR_RESET}")
-        input("\nPress Enter to begin your adventure...")
+        return self.player
 
-        # Start the game loop
-        if self.player:
-            self.game_loop()
+    def new_instance_id(self) -> str:
+        """Return a short unique id drawn from the game's generator."""
+        return f"{self.rng.getrandbits(32):08x}"
 
+    @_playing
     def game_loop(self) -> None:
         """Main game loop."""
         if not self.player:
-            print(f"{CLR_ERROR}Error: No player initialized{CLR_RESET}")
+            echo(f"{CLR_ERROR}Error: No player initialized{CLR_RESET}")
             return
 
         while not self.game_over:
             if not self.player.current_location:
-                print(f"{CLR_ERROR}Error: Player location not set{CLR_RESET}")
+                echo(f"{CLR_ERROR}Error: Player location not set{CLR_RESET}")
                 break
 
-            self.update_game_state()
-            self.display_status()
+            # Debug mode may be toggled during the turn; keep the profiler it started with
+            profiler = self.profiler
+            phase = profiler.phase if profiler else self._no_phase
+            if profiler:
+                profiler.start_turn()
+
+            with phase("update_game_state"):
+                self.update_game_state()
+            with phase("display_status"):
+                self.display_status()
 
             # Location events
             current_loc_name = self.player.current_location.name
-            self.player.current_location.display()
+            with phase("location_display"):
+                self.player.current_location.display()
 
             # Check for triggerable events
-            self.check_events()
+            with phase("check_events"):
+                self.check_events()
 
             # Check for location hazards
-            self.check_hazards()
+            with phase("check_hazards"):
+                self.check_hazards()
 
             # Display actions
-            self.display_actions()
-            choice = self.get_player_action()
-            self.process_action(choice)
+            with phase("display_actions"):
+                self.display_actions()
+            with phase("input"):
+                choice = self.get_player_action()
+            with phase(self.ACTION_PHASES.get(choice, "action")):
+                self.process_action(choice)
 
             # Check win/lose conditions after each turn
-            if self.check_game_over():
+            with phase("check_game_over"):
+                over = self.check_game_over()
+            if profiler:
+                profiler.end_turn()
+            if over:
                 break
 
         # Game over
         self.end_game()
 
+    @staticmethod
+    def _no_phase(name: str) -> nullcontext:
+        return nullcontext()
+
     def update_game_state(self) -> None:
         """Update game state at the beginning of each turn."""
         if not self.player or self.game_over:
@@ -327,9 +336,15 @@ class Game:
         total_costs = 0
         services_to_remove = []  # Track instance IDs of services that failed
 
+        if self._fleet_active(len(self.player.inventory.deployed_services)):
+            # Large fleets are updated in one vectorized pass
+            self._update_fleet()
+
         # Use a copy in case the list is modified during iteration
-        if hasattr(self.player.inventory, 'deployed_services'):
+        elif hasattr(self.player.inventory, 'deployed_services'):
             deployed_services_copy = self.player.inventory.deployed_services[:]
+            wear = self._weather_wear()
+            location_difficulty = self._location_difficulty()
 
             for service in deployed_services_copy:
                 if not service.is_deployed:
@@ -345,32 +360,13 @@ class Game:
                 total_income += income * 24  # Daily income
                 total_costs += cost
 
-                # --- Random Events for Services --- #
-                event_chance = 5  # Base 5% chance per service per day
-                # Increase chance based on factors:
-                event_chance += service.uptime_days // 10  # +1% every 10 days uptime
-                event_chance -= service.security_level    # Higher security reduces chance
-
-                # Apply location difficulty modifier
-                current_loc_name = self.player.current_location.name if self.player.current_location else None
-                if current_loc_name and current_loc_name in self.locations:
-                    # Higher location difficulty increases chance
-                    event_chance += self.locations[current_loc_name].difficulty // 2
-
                 # Apply weather effects
-                if current_loc_name in self.weather_conditions:
-                    weather = self.weather_conditions[current_loc_name]
-                    if "Memory Frost" in weather["current"]["name"]:
-                        service.performance = max(1, service.performance - 1)
-
-                # Apply difficulty modifier
-                if self.difficulty == 'easy':
-                    event_chance *= 0.7  # Reduce chance on easy
-                elif self.difficulty == 'hard':
-                    event_chance *= 1.5  # Increase chance on hard
+                if wear:
+                    service.performance = max(1, service.performance - wear)
 
+                # --- Random Events for Services --- #
                 # Trigger service event if roll succeeds
-                if random.randint(1, 100) <= max(1, int(event_chance)):
+                if self._percent_roll() <= self._service_event_threshold(service, location_difficulty):
                     service_failed = self._trigger_service_event(service)
                     if service_failed:
                         services_to_remove.append(service.instance_id)
@@ -383,6 +379,7 @@ class Game:
             # Remove services that failed this turn
             for instance_id in services_to_remove:
                 self.player.inventory.remove_deployed_service(instance_id)
+            self.services_lost += len(services_to_remove)
 
         # --- Update Player State --- #
         # Update artifacts cooldowns
@@ -393,8 +390,7 @@ class Game:
         self.player.update_status_effects()
 
         # Update event cooldowns
-        for event in self.events.values():
-            event.update_cooldown()
+        self.event_scheduler.advance()
 
         # Apply temporary skill boosts/debuffs (decrement duration)
         updated_boosts = []
@@ -425,81 +421,66 @@ class Game:
         # --- Check Quest Progress --- #
         self.check_quest_progress()
 
-    def update_weather(self) -> None:
-        """Update weather conditions across all locations."""
-        for loc_name, weather in self.weather_conditions.items():
-            # Decrease duration counter
-            weather["duration"] -= 1
-
-            # Change weather if duration expired
-            if weather["duration"] <= 0:
-                # Determine location and its region
-                region = "unknown"
-                if loc_name in self.locations:
-                    location = self.locations[loc_name]
-                    region = location.region if location.region else "unknown"
-
-                # Choose appropriate weather based on region
-                regional_weather = REGIONAL_WEATHER_TENDENCIES.get(region,
-                                                                REGIONAL_WEATHER_TENDENCIES["unknown"])
-
-                # Weight toward region-appropriate weather but allow any
-                if random.randint(1, 100) <= 70:  # 70% chance for regional weather
-                    weather_name = random.choice(regional_weather)
-                    new_weather = next((w for w in WEATHER_TYPES if w["name"] == weather_name),
-                                      random.choice(WEATHER_TYPES))
-                else:
-                    new_weather = random.choice(WEATHER_TYPES)
+    def update_weather(self, turns: int = 1) -> None:
+        """Update weather conditions across all locations.
 
-                # Set new weather
-                weather["current"] = new_weather
-                weather["duration"] = random.randint(2, 5)
+        Weather moves on one day per turn, however many days the turn's
+        action took.
 
-                # If this is the player's current location, notify them of the change
-                if self.player and self.player.current_location and self.player.current_location.name == loc_name:
-                    display_notification(
-                        f"Weather changed to: {weather['current']['name']} - {weather['current']['effect']}",
-                        "info")
+        Args:
+            turns: Turns to move the weather on by (fast-forward skips several)
+        """
+        changed = self.weather.advance(turns)
+        # If the player's current location changed, notify them
+        current_loc = self.player.current_location if self.player else None
+        if current_loc and current_loc.name in changed:
+            weather = self.weather.current(current_loc.name)
+            display_notification(
+                f"Weather changed to: {weather['name']} - {weather['effect']}",
+                "info")
+
+    def _weather_wear(self) -> int:
+        """Return the performance deployed services lose to today's weather.
 
-    def check_hazards(self) -> None:
-        """Check for hazards at the current location."""
+        Weather that wears services at all takes at least 1 a day, however
+        mild its severity.
+        """
+        current_loc = self.player.current_location
+        if not current_loc:
+            return 0
+        wear = self.weather.modifier(current_loc.name, "service_wear")
+        return max(1, round(wear)) if wear > 0 else 0
+
+    def check_hazards(self) -> bool:
+        """Check for hazards at the current location.
+
+        Returns:
+            True if a hazard hit the player, False otherwise
+        """
         if not self.player or not self.player.current_location:
-            return
+            return False
 
         hazards = self.player.current_location.hazards
         if not hazards:
-            return
+            return False
 
         for hazard in hazards:
             # Check if hazard triggers
-            if random.randint(1, 100) <= hazard.get("chance", 10):
+            if self._percent_roll() <= hazard.get("chance", 10):
                 # Check if player can avoid it with skills
                 avoidable_skill = hazard.get("avoidable_with_skill")
                 if avoidable_skill and avoidable_skill in self.player.skills:
                     skill_level = self.player.skills[avoidable_skill]
                     # Higher skill gives better chance to avoid
                     avoid_chance = skill_level * 10
-                    if random.randint(1, 100) <= avoid_chance:
+                    if self.rng.randint(1, 100) <= avoid_chance:
                         display_notification(
                             f"You used your {avoidable_skill} skill to avoid the {hazard['name']}!",
                             "success")
                         continue
 
                 # Hazard hits player
-                # Handle string-based damage functions that came from the data file
-                damage_func = hazard.get("damage", lambda: 10)
-                if isinstance(damage_func, str) and "random.randint" in damage_func:
-                    # Parse and evaluate the random damage function
-                    # Be very careful with eval - this is safe only because we control the input
-                    try:
-                        damage = eval(damage_func)
-                    except Exception:
-                        damage = 10  # Default if evaluation fails
-                elif callable(damage_func):
-                    damage = damage_func()
-                else:
-                    # Try to convert to int if it's a fixed value
-                    damage = int(damage_func)
+                damage = hazard["roll"](self.rng, self.current_day)
 
                 display_notification(
                     f"Hazard encountered: {hazard['name']} - {hazard['description']}",
@@ -511,60 +492,23 @@ class Game:
                 if "status_effect" in hazard:
                     self.player.add_status_effect(hazard["status_effect"])
 
-                break  # Only one hazard per turn for balance
+                return True  # Only one hazard per turn for balance
+
+        return False
 
     def check_quest_progress(self) -> None:
         """Check and update quest progress."""
         if not self.player:
             return
 
-        # Get quests from player's active quests
-        active_quests = []
-        for quest_id in self.player.active_quests:
-            if quest_id in self.quests:
-                active_quests.append(self.quests[quest_id])
-
-        # Check each active quest
-        for quest in active_quests:
-            # Auto-complete location-based objectives
-            current_loc = self.player.current_location.name if self.player.current_location else None
-
-            # Tutorial quest special handling
-            if quest.id == "tutorial":
-                # Check if player visited Cloud City
-                if current_loc == "Cloud City" and not quest.objectives[0]["completed"]:
-                    quest.objectives[0]["completed"] = True
-                    display_notification(
-                        "Tutorial Objective Completed: Visit Cloud City", "success")
-
-                # Check if player has acquired an artifact
-                if len(self.player.inventory.artifacts) > 0 and not quest.objectives[1]["completed"]:
-                    quest.objectives[1]["completed"] = True
-                    display_notification(
-                        "Tutorial Objective Completed: Acquire your first artifact", "success")
-
-                # Check if player has deployed a service
-                if len(self.player.inventory.deployed_services) > 0 and not quest.objectives[2]["completed"]:
-                    quest.objectives[2]["completed"] = True
-                    display_notification(
-                        "Tutorial Objective Completed: Deploy your first service", "success")
-
-            # Mysterious outage quest special handling
-            elif quest.id == "mysterious_outage":
-                # Check if player visited Database District
-                if current_loc == "Database District" and not quest.objectives[0]["completed"]:
-                    quest.objectives[0]["completed"] = True
-                    display_notification(
-                        "Objective Completed: Visit Database District", "success")
-
-                # Check if player reported findings at Security Perimeter
-                if current_loc == "Security Perimeter" and quest.objectives[2]["completed"] and not quest.objectives[3]["completed"]:
-                    quest.objectives[3]["completed"] = True
-                    display_notification(
-                        "Objective Completed: Report your findings to Security Perimeter", "success")
+        for quest, completed in self.quest_tracker.update():
+            prefix = "Tutorial Objective" if quest.id == "tutorial" else "Objective"
+            for obj in completed:
+                display_notification(f"{prefix} Completed: {obj['description']}", "success")
+            self.objectives_completed += len(completed)
 
             # Check if all objectives are completed
-            if all(obj["completed"] for obj in quest.objectives):
+            if quest.check_completion():
                 self.complete_quest(quest)
 
     def complete_quest(self, quest: Quest) -> None:
@@ -576,6 +520,7 @@ class Game:
         if quest.id in self.player.active_quests:
             self.player.active_quests.remove(quest.id)
         self.player.completed_quests.append(quest.id)
+        self.quest_tracker.completed(quest.id)
 
         # Quest completion notification
         display_notification(f"Quest Completed: {quest.title}!", "success")
@@ -599,14 +544,7 @@ class Game:
             for artifact_name in rewards["artifacts"]:
                 if artifact_name in self.artifacts:
                     artifact_data = self.artifacts[artifact_name]
-                    new_artifact = CloudArtifact(
-                        artifact_data["name"],
-                        artifact_data["description"],
-                        artifact_data["artifact_type"],
-                        artifact_data["aws_service"],
-                        artifact_data["cost"],
-                        artifact_data["power"]
-                    )
+                    new_artifact = create_artifact(artifact_data)
                     self.player.add_artifact(new_artifact)
 
         if "consumables" in rewards:
@@ -620,11 +558,100 @@ class Game:
             self.game_over = True
             self.win_reason = "You have unmasked the Shadow Admin and saved Cloud City!"
 
-    def _trigger_service_event(self, service: CloudService) -> bool:
+    def _fleet_active(self, count: int) -> bool:
+        """Decide whether deployed services are updated through a ServiceFleet.
+
+        Args:
+            count: Number of deployed services
+
+        Returns:
+            True if the fleet path should be used this turn
+        """
+        if not HAS_NUMPY:
+            return False
+        if self.fleet is None:
+            if count < FLEET_MIN_SIZE:
+                return False
+            self.fleet = ServiceFleet(seed=self.rng.getrandbits(64))
+        elif count < FLEET_MIN_SIZE // 2:
+            # Shrunk well below the threshold: hand state back to the objects
+            self.fleet.detach_all()
+            self.fleet = None
+            return False
+        return True
+
+    def _percent_roll(self) -> int:
+        """Roll 1-100 for a service event, location event or hazard.
+
+        Rolls that fast-forward drew ahead, looking for quiet days, are used
+        up first, so the generator gives out the same numbers in the same
+        order as if they had not been drawn early.
+        """
+        if self._rolls_ahead:
+            return self._rolls_ahead.pop()
+        return self.rng.randint(1, 100)
+
+    def _location_difficulty(self) -> int:
+        """Return the difficulty of the player's current location (0 if unknown)."""
+        current_loc = self.player.current_location
+        if current_loc and current_loc.name in self.locations:
+            return self.locations[current_loc.name].difficulty
+        return 0
+
+    def _service_event_threshold(self, service: CloudService, location_difficulty: int,
+                                 days_ahead: int = 0) -> int:
+        """Return the roll (out of 100) at or below which a service has an event today.
+
+        Args:
+            service: An online service, its uptime already counting today
+            location_difficulty: Difficulty of the player's current location
+            days_ahead: Days after today the roll is for
+        """
+        event_chance = 5  # Base 5% chance per service per day
+        # Increase chance based on factors:
+        event_chance += (service.uptime_days + days_ahead) // 10  # +1% every 10 days uptime
+        event_chance -= service.security_level    # Higher security reduces chance
+        # Higher location difficulty increases chance
+        event_chance += location_difficulty // 2
+
+        # Apply difficulty modifier
+        if self.difficulty == 'easy':
+            event_chance *= 0.7  # Reduce chance on easy
+        elif self.difficulty == 'hard':
+            event_chance *= 1.5  # Increase chance on hard
+        return max(1, int(event_chance))
+
+    def _update_fleet(self) -> None:
+        """Update all deployed services through the vectorized fleet."""
+        location_difficulty = self._location_difficulty()
+
+        event_multiplier = {"easy": 0.7, "hard": 1.5}.get(self.difficulty, 1)
+        severity_multiplier = {"easy": 0.7, "hard": 1.3}.get(self.difficulty, 1.0)
+
+        self.fleet.sync(self.player.inventory.deployed_services)
+        net_change, service_events = self.fleet.tick(
+            location_difficulty, event_multiplier, severity_multiplier, self._weather_wear())
+
+        services_to_remove = []
+        for service, event_type, damage in service_events:
+            if self._trigger_service_event(service, event_type, damage):
+                services_to_remove.append(service.instance_id)
+
+        if net_change != 0:
+            self.player.cloud_credits += net_change
+
+        for instance_id in services_to_remove:
+            self.player.inventory.remove_deployed_service(instance_id)
+        self.services_lost += len(services_to_remove)
+
+    def _trigger_service_event(self, service: CloudService, event_type: Optional[str] = None,
+                               damage: Optional[int] = None) -> bool:
         """Triggers a random negative event on a deployed service.
 
         Args:
             service: The service to trigger an event on
+            event_type: Event to trigger; chosen at random if omitted
+            damage: Pre-rolled health-hit damage (from a ServiceFleet tick)
 
         Returns:
             True if service failed (health reached 0), False otherwise
@@ -632,8 +659,8 @@ class Game:
         if not service.is_deployed:
             return False  # Don't trigger on already offline services
 
-        event_type = random.choice(
-            ["health_hit", "performance_drop", "security_breach", "cost_spike"])
+        if event_type is None:
+            event_type = self.rng.choice(SERVICE_EVENT_TYPES)
         location_difficulty = 0
         if self.player.current_location and self.player.current_location.name in self.locations:
             location_difficulty = self.locations[self.player.current_location.name].difficulty
@@ -646,9 +673,10 @@ class Game:
             severity_multiplier = 1.3
 
         if event_type == "health_hit":
-            damage = int((random.randint(5, 15) +
-                          location_difficulty) * severity_multiplier)
-            damage = max(1, damage)  # Ensure at least 1 damage
+            if damage is None:
+                damage = int((self.rng.randint(5, 15) +
+                              location_difficulty) * severity_multiplier)
+                damage = max(1, damage)  # Ensure at least 1 damage
             display_notification(
                 f"System Anomaly @ {service.name} ({service.instance_id}): Health -{damage}%", "warning")
             # Returns True if service failed
@@ -656,7 +684,7 @@ class Game:
 
         elif event_type == "performance_drop":
             # More likely to be 1
-            drop = int(random.choice([1, 1, 2]) * severity_multiplier)
+            drop = int(self.rng.choice([1, 1, 2]) * severity_multiplier)
             drop = max(1, drop)
             if service.performance > 1:
                 service.performance = max(1, service.performance - drop)
@@ -667,8 +695,8 @@ class Game:
         elif event_type == "security_breach":
             # More likely if security is low
             breach_chance = (10 - service.security_level) + location_difficulty
-            if random.randint(1, 20) <= max(1, int(breach_chance * severity_multiplier)):
-                severity = int(random.choice([1, 1, 2]) * severity_multiplier)
+            if self.rng.randint(1, 20) <= max(1, int(breach_chance * severity_multiplier)):
+                severity = int(self.rng.choice([1, 1, 2]) * severity_multiplier)
                 severity = max(1, severity)
                 if service.security_level > 1:
                     service.security_level = max(
@@ -676,15 +704,15 @@ class Game:
                     display_notification(
                         f"Security Alert @ {service.name} ({service.instance_id}): Minor breach detected! Security -{severity}", "error")
                     # Potential for data leak clue?
-                    if random.randint(1, 10) <= 3:
+                    if self.rng.randint(1, 10) <= 3:
                         # Add random int for uniqueness
-                        clue_id = f"breach_clue_{service.instance_id}_{random.randint(100, 999)}"
+                        clue_id = f"breach_clue_{service.instance_id}_{self.rng.randint(100, 999)}"
                         self.player.add_clue(clue_id)
-                        print(
+                        echo(
                             f"{CLR_CLUE}Evidence of data exfiltration found during the breach analysis.{CLR_RESET}")
                 else:
                     # Security already minimal, trigger health hit instead
-                    damage = int((random.randint(3, 8)) * severity_multiplier)
+                    damage = int((self.rng.randint(3, 8)) * severity_multiplier)
                     display_notification(
                         f"Security Alert @ {service.name} ({service.instance_id}): Breach attempted on unsecured service! Health -{damage}%", "error")
                     # Returns True if service failed
@@ -693,7 +721,7 @@ class Game:
 
         elif event_type == "cost_spike":
             # Simulate unexpected usage spike
-            cost_increase_multiplier = random.uniform(
+            cost_increase_multiplier = self.rng.uniform(
                 0.5, 1.5) * (location_difficulty / 5.0) * severity_multiplier
             cost_increase = service.cost_per_hour * cost_increase_multiplier
             # Ensure minimum cost spike
@@ -706,35 +734,38 @@ class Game:
     def display_status(self) -> None:
         """Display player status and game information."""
         clear_screen()
-        print(
-            f"\n{CLR_TITLE}╔══════════════════════ CLOUD RANGER STATUS ══════════════════════╗{CLR_RESET}")
+        text = StyledText().line().line(
+            "╔══════════════════════ CLOUD RANGER STATUS ══════════════════════╗", CLR_TITLE)
+
+        def row(content):
+            text.add("║", CLR_TITLE).add(f" {content}").line("║", CLR_TITLE)
+
         # Delegate most display to player object
         if self.player:
-            print(f"{CLR_TITLE}║{CLR_RESET} Day: {self.current_day} / {self.player.time_left}{' ' * (20 - len(str(self.current_day)) - len(str(self.player.time_left)))}{CLR_TITLE}║{CLR_RESET}")
+            row(f"Day: {self.current_day} / {self.player.time_left}{' ' * (20 - len(str(self.current_day)) - len(str(self.player.time_left)))}")
 
             # Display current weather if available
-            if self.player.current_location and self.player.current_location.name in self.weather_conditions:
-                weather = self.weather_conditions[self.player.current_location.name]["current"]
-                print(
-                    f"{CLR_TITLE}║{CLR_RESET} Weather: {weather['name']} - {weather['effect']}{' ' * max(0, 20 - len(weather['name']) - len(weather['effect']))}{CLR_TITLE}║{CLR_RESET}")
+            weather = self.weather.current(self.player.current_location.name) if self.player.current_location else None
+            if weather:
+                row(f"Weather: {weather['name']} - {weather['effect']}{' ' * max(0, 20 - len(weather['name']) - len(weather['effect']))}")
         else:
-            print(
-                f"{CLR_TITLE}║{CLR_RESET} No active player.{' ' * 17}{CLR_TITLE}║{CLR_RESET}")
-        print(
-            f"{CLR_TITLE}╚═════════════════════════════════════════════════════════════════╝{CLR_RESET}")
+            row(f"No active player.{' ' * 17}")
+        text.line(
+            "╚═════════════════════════════════════════════════════════════════╝", CLR_TITLE)
+        echo(text, end="")
 
     def display_actions(self) -> None:
         """Display available actions to the player."""
-        print(f"\n{CLR_SECTION}[AVAILABLE ACTIONS]{CLR_RESET}")
-        print("1. Explore Location")
-        print("2. Travel")
-        print("3. View Quests")
-        print("4. View Inventory/Status")
-        print("5. Manage Services")
-        print("6. Use Artifact")
-        print("7. Rest (skip day)")
-        print("8. Interact with Vendors")
-        print("9. System Menu (Save/Quit)")
+        echo(f"\n{CLR_SECTION}[AVAILABLE ACTIONS]{CLR_RESET}")
+        echo("1. Explore Location")
+        echo("2. Travel")
+        echo("3. View Quests")
+        echo("4. View Inventory/Status")
+        echo("5. Manage Services")
+        echo("6. Use Artifact")
+        echo("7. Rest / Fast-forward")
+        echo("8. Interact with Vendors")
+        echo("9. System Menu (Save/Quit)")
 
     def get_player_action(self) -> int:
         """Get player's chosen action."""
@@ -750,12 +781,14 @@ class Game:
             self.view_quests()
         elif choice == 4:
             self.player.display_status()
+            if self.player.inventory.consumables:
+                self.consumables_menu()
         elif choice == 5:
             self.manage_services()
         elif choice == 6:
             self.use_artifact()
         elif choice == 7:
-            self.rest()
+            self.rest_menu()
         elif choice == 8:
             self.interact_with_vendors()
         elif choice == 9:
@@ -767,7 +800,7 @@ class Game:
         if not self.player.use_energy(10):
             display_notification(
                 "Not enough energy to explore! (10 required)", "error")
-            input(PRESS_ENTER)
+            prompt(PRESS_ENTER)
             return
 
         print_slow(f"\nExploring {self.player.current_location.name}...")
@@ -784,25 +817,26 @@ class Game:
         discovery_chance -= location_difficulty * 2
 
         # Weather effects on exploration
-        if self.player.current_location.name in self.weather_conditions:
-            weather = self.weather_conditions[self.player.current_location.name]["current"]
-            if "Processing Fog" in weather["name"]:
-                discovery_chance -= 15
-                print(
-                    f"{CLR_WARNING}The Processing Fog makes exploration more difficult.{CLR_RESET}")
-            elif "Clear Signals" in weather["name"]:
-                discovery_chance += 10
-                print(
-                    f"{CLR_SUCCESS}The Clear Signals improve your ability to explore.{CLR_RESET}")
+        loc_name = self.player.current_location.name
+        efficiency = self.weather.modifier(loc_name, "exploration_efficiency")
+        if efficiency:
+            weather = self.weather.current(loc_name)
+            discovery_chance += int(efficiency * 100)
+            if efficiency < 0:
+                echo(
+                    f"{CLR_WARNING}The {weather['name']} makes exploration more difficult.{CLR_RESET}")
+            else:
+                echo(
+                    f"{CLR_SUCCESS}The {weather['name']} improves your ability to explore.{CLR_RESET}")
 
         found_something = False
 
-        if random.randint(1, 100) <= discovery_chance:
+        if self.rng.randint(1, 100) <= discovery_chance:
             # Generate a discovery
-            discovery_type = random.choice(
+            discovery_type = self.rng.choice(
                 ["artifact", "clue", "credits", "service", "consumable"])
 
-            if discovery_type == "artifact" and random.randint(1, 100) <= 30:
+            if discovery_type == "artifact" and self.rng.randint(1, 100) <= 30:
                 # Find a random artifact based on location difficulty
                 possible_artifacts = []
                 for artifact_id, artifact_data in self.artifacts.items():
@@ -815,21 +849,14 @@ class Game:
                         possible_artifacts.append((artifact_id, artifact_data))
 
                 if possible_artifacts:
-                    artifact_id, artifact_data = random.choice(
+                    artifact_id, artifact_data = self.rng.choice(
                         possible_artifacts)
 
-                    new_artifact = CloudArtifact(
-                        artifact_data["name"],
-                        artifact_data["description"],
-                        artifact_data["artifact_type"],
-                        artifact_data["aws_service"],
-                        artifact_data["cost"],
-                        artifact_data["power"]
-                    )
+                    new_artifact = create_artifact(artifact_data)
 
-                    print(
+                    echo(
                         f"\n{CLR_SUCCESS}You discovered a {new_artifact.name}!{CLR_RESET}")
-                    print(f"{new_artifact.description}")
+                    echo(f"{new_artifact.description}")
 
                     self.player.add_artifact(new_artifact)
                     found_something = True
@@ -837,30 +864,30 @@ class Game:
             elif discovery_type == "clue":
                 # Generate a meaningful clue based on location
                 location_name = self.player.current_location.name
-                clue_id = f"clue_{location_name}_{random.randint(1000, 9999)}"
+                clue_id = f"clue_{location_name}_{self.rng.randint(1000, 9999)}"
 
                 # More interesting clues in higher difficulty areas
                 if location_difficulty >= 7:
-                    clue_prefix = random.choice([
+                    clue_prefix = self.rng.choice([
                         "You found encrypted data pointing to",
                         "A hidden terminal reveals information about",
                         "Secret communications indicate"
                     ])
 
-                    clue_content = random.choice([
+                    clue_content = self.rng.choice([
                         "the Shadow Admin's next target",
                         "a sophisticated attack pattern",
                         "unauthorized resource provisioning",
                         "a backdoor in critical infrastructure"
                     ])
                 else:
-                    clue_prefix = random.choice([
+                    clue_prefix = self.rng.choice([
                         "You discovered evidence of",
                         "System logs indicate",
                         "You found traces of"
                     ])
 
-                    clue_content = random.choice([
+                    clue_content = self.rng.choice([
                         "unusual activity",
                         "suspicious logins",
                         "modified configurations",
@@ -870,19 +897,19 @@ class Game:
                 clue_text = f"{clue_prefix} {clue_content} in {location_name}."
 
                 self.player.add_clue(clue_id)
-                print(f"\n{CLR_SUCCESS}You discovered a clue!{CLR_RESET}")
-                print(f"{clue_text}")
+                echo(f"\n{CLR_SUCCESS}You discovered a clue!{CLR_RESET}")
+                echo(f"{clue_text}")
                 found_something = True
 
             elif discovery_type == "credits":
                 # Credits scale with location difficulty
                 base_credits = 10
                 difficulty_bonus = location_difficulty * 5
-                credits_found = random.randint(
+                credits_found = self.rng.randint(
                     base_credits, base_credits + difficulty_bonus)
 
                 self.player.cloud_credits += credits_found
-                print(
+                echo(
                     f"\n{CLR_SUCCESS}You found {credits_found} Cloud Credits!{CLR_RESET}")
                 found_something = True
 
@@ -900,124 +927,192 @@ class Game:
                             service_candidates.append((svc_id, svc_data))
 
                 if service_candidates:
-                    service_id, service_data = random.choice(
+                    service_id, service_data = self.rng.choice(
                         service_candidates)
 
-                    new_service = CloudService(
-                        service_data["name"],
-                        service_data["description"],
-                        service_data["service_type"],
-                        service_data["cost_per_hour"],
-                        service_data["deploy_cost"],
-                        service_data["region_availability"],
-                        service_data["dependencies"]
-                    )
+                    new_service = create_service(service_data, self.new_instance_id())
 
-                    print(
+                    echo(
                         f"\n{CLR_SUCCESS}You discovered {new_service.name} service!{CLR_RESET}")
-                    print(f"{new_service.description}")
+                    echo(f"{new_service.description}")
 
                     self.player.add_service(new_service)
                     found_something = True
 
             elif discovery_type == "consumable":
                 # Find consumables
-                consumable_types = [
-                    {"name": "Emergency Patch", "description": "Restores 30 health"},
-                    {"name": "Energy Cell", "description": "Restores 50 energy"},
-                    {"name": "Firewall Patch",
-                        "description": "Increases service security by 2"},
-                    {"name": "Performance Tuner",
-                        "description": "Increases service performance by 2"}
-                ]
+                consumable_types = FOUND_CONSUMABLES
 
                 # Higher difficulty areas have better chances for more items
                 count = 1
                 if location_difficulty >= 5:
-                    count = random.randint(1, 2)
+                    count = self.rng.randint(1, 2)
                 if location_difficulty >= 8:
-                    count = random.randint(1, 3)
+                    count = self.rng.randint(1, 3)
 
-                consumable = random.choice(consumable_types)
+                consumable = self.rng.choice(consumable_types)
                 self.player.inventory.add_consumable(consumable["name"], count)
 
-                print(
+                echo(
                     f"\n{CLR_SUCCESS}You found {count}x {consumable['name']}!{CLR_RESET}")
-                print(f"{consumable['description']}")
+                echo(f"{consumable['description']}")
                 found_something = True
 
         # Only print "nothing of interest" if we truly found nothing
         if not found_something:
-            print("\nYou found nothing of interest.")
+            echo("\nYou found nothing of interest.")
 
         # Exploring takes time
         self.current_day += 1
-        input("\nPress Enter to continue...")
+        prompt("\nPress Enter to continue...")
 
     def travel(self) -> None:
         """Travel to a different location."""
         current_location = self.player.current_location
+        destinations = self.graph.neighbours(current_location.name)
 
-        print(
+        echo(
             f"\n{CLR_SECTION}[TRAVEL FROM {current_location.name}]{CLR_RESET}")
 
-        if not current_location.connections:
-            print("There are no accessible locations from here.")
+        if not destinations:
+            echo("There are no accessible locations from here.")
             return
 
-        print("Available destinations:")
-        for i, destination in enumerate(current_location.connections, 1):
-            if destination in self.locations:
-                difficulty = self.locations[destination].difficulty
-                diff_stars = '★' * difficulty + '☆' * (10 - difficulty)
-                print(f"{i}. {destination} - Difficulty: {diff_stars}")
-            else:
-                print(f"{i}. {destination} - ERROR: Location not found")
+        echo("Available destinations:")
+        for i, destination in enumerate(destinations, 1):
+            difficulty = self.graph.difficulty[self.graph.ids[destination]]
+            diff_stars = '★' * difficulty + '☆' * (10 - difficulty)
+            echo(f"{i}. {destination} - Difficulty: {diff_stars}")
 
-        print(f"{len(current_location.connections) + 1}. Cancel")
+        plan_choice = len(destinations) + 1
+        echo(f"{plan_choice}. Plan a route to a discovered location")
+        echo(f"{plan_choice + 1}. Cancel")
 
-        choice = get_valid_input("\nEnter your choice: ", range(
-            1, len(current_location.connections) + 2))
+        choice = get_valid_input("\nEnter your choice: ", range(1, plan_choice + 2))
 
-        if choice == len(current_location.connections) + 1:
-            print("Travel canceled.")
+        if choice == plan_choice + 1:
+            echo("Travel canceled.")
             return
 
-        # Add validation before accessing connections
-        if not isinstance(choice, int) or choice < 1 or choice > len(current_location.connections):
-            print(f"{CLR_ERROR}Invalid choice for travel destination.{CLR_RESET}")
+        if choice == plan_choice:
+            self.plan_route()
             return
 
-        destination_name = current_location.connections[choice - 1]
-        if destination_name not in self.locations:
-            print(
-                f"{CLR_ERROR}Error: Destination '{destination_name}' not found in game locations!{CLR_RESET}")
+        if self._travel_hop(self.locations[destinations[choice - 1]]):
+            prompt("\nPress Enter to continue...")
+
+    def plan_route(self) -> None:
+        """Pick a discovered location and travel there along the cheapest route."""
+        current = self.player.current_location.name
+        max_difficulty = max(self.player.skills.values()) + 3
+        options = []
+        for name in sorted(self.discovered_locations):
+            if name == current or name not in self.graph.ids:
+                continue
+            route = self.graph.route(current, name, max_difficulty)
+            if route:
+                options.append((name, route))
+
+        echo(f"\n{CLR_SECTION}[PLAN ROUTE FROM {current}]{CLR_RESET}")
+        if not options:
+            echo("You know no route to anywhere you could survive.")
+            prompt(PRESS_ENTER)
             return
 
-        destination = self.locations[destination_name]
+        for i, (name, route) in enumerate(options, 1):
+            echo(f"{i}. {name} - {len(route) - 1} hop(s), "
+                 f"{self.graph.route_cost(route)} energy")
+        echo(f"{len(options) + 1}. Cancel")
 
-        # Check if player has enough energy
-        travel_energy = 15 + (destination.difficulty -
-                              current_location.difficulty) * 2
-        travel_energy = max(10, travel_energy)  # Minimum 10 energy
+        choice = get_valid_input("\nSelect a destination: ", range(1, len(options) + 2))
+        if choice == len(options) + 1:
+            echo("Travel canceled.")
+            return
+
+        if self.travel_to(options[choice - 1][0]):
+            prompt("\nPress Enter to continue...")
+
+    def travel_to(self, destination_name: str) -> bool:
+        """Travel to any location along the cheapest route the player can survive.
 
-        if not self.player.use_energy(travel_energy):
+        Each hop is a turn, exactly as travelling there by hand would be: it
+        costs its own energy and a day and applies the weather where it
+        lands, and every hop after the first starts with the daily tick and
+        the events and hazards of the location the last one reached. The
+        journey stops early if one of those moves the player or ends the game.
+
+        Args:
+            destination_name: Name of the location to reach
+
+        Returns:
+            True if the player arrived at the destination
+        """
+        current = self.player.current_location.name
+        if destination_name not in self.graph.ids or destination_name == current:
+            display_notification(f"Cannot travel to {destination_name}.", "error")
+            return False
+
+        route = self.graph.route(current, destination_name,
+                                 max(self.player.skills.values()) + 3)
+        if route is None:
             display_notification(
-                f"Not enough energy to travel! ({travel_energy} required)", "error")
-            input(PRESS_ENTER)
-            return
+                f"No route to {destination_name} that your skills can survive.", "error")
+            prompt(PRESS_ENTER)
+            return False
+
+        energy = self.graph.route_cost(route)
+        if energy > self.player.energy:
+            display_notification(
+                f"Not enough energy for the route! ({energy} required)", "error")
+            prompt(PRESS_ENTER)
+            return False
+
+        echo(f"Route: {' -> '.join(route)}")
+        for here, there in zip(route, route[1:]):
+            if here != current:
+                # What the game loop does between one hop's turn and the next
+                prompt("\nPress Enter to continue...")
+                if self.check_game_over():
+                    return False
+                self.update_game_state()
+                self.display_status()
+                self.player.current_location.display()
+                self.check_events()
+                self.check_hazards()
+                if self.game_over or self.player.current_location.name != here:
+                    return False
+            if not self._travel_hop(self.locations[there]):
+                return False
+        return True
+
+    def _travel_hop(self, destination: Location) -> bool:
+        """Move the player to a location connected to the current one.
+
+        Returns:
+            True if the player arrived
+        """
+        current_location = self.player.current_location
+        destination_name = destination.name
+
+        # Check if player has enough energy
+        energy = travel_energy(current_location.difficulty, destination.difficulty)
+        if not self.player.use_energy(energy):
+            display_notification(
+                f"Not enough energy to travel! ({energy} required)", "error")
+            prompt(PRESS_ENTER)
+            return False
 
         # Check if player can travel to this location
         if destination.difficulty > max(self.player.skills.values()) + 3:
-            print(
+            echo(
                 f"\n{CLR_ERROR}This location is too dangerous for your current skill level!{CLR_RESET}")
-            print(
+            echo(
                 f"You need more experience before traveling to {destination_name}.")
 
             # Refund energy since travel failed
-            self.player.restore_energy(travel_energy)
-            input("\nPress Enter to continue...")
-            return
+            self.player.restore_energy(energy)
+            prompt("\nPress Enter to continue...")
+            return False
 
         # Travel successful
         self.player.current_location = destination
@@ -1027,34 +1122,33 @@ class Game:
 
         # Travel takes time
         self.current_day += 1
-        print(f"\n{CLR_SUCCESS}You have arrived at {destination_name}.{CLR_RESET}")
+        echo(f"\n{CLR_SUCCESS}You have arrived at {destination_name}.{CLR_RESET}")
 
         # Display weather at the new location
-        if destination_name in self.weather_conditions:
-            weather = self.weather_conditions[destination_name]["current"]
-            print(
-                f"{CLR_CYAN}Current weather: {weather['name']} - {weather['description']}{CLR_RESET}")
+        weather = self.weather.current(destination_name)
+        if weather:
+            severity = self.weather.severity_at(destination_name)
+            echo(
+                f"{CLR_CYAN}Current weather: {weather['name']} ({severity['name']}) - {weather['description']}{CLR_RESET}")
 
             # Apply immediate weather effects
-            if "CPU Heatwave" in weather["name"]:
-                energy_loss = int(self.player.energy * 0.1)
-                if energy_loss > 0:
-                    self.player.use_energy(energy_loss)
-                    print(
-                        f"{CLR_WARNING}The CPU Heatwave drains {energy_loss} energy!{CLR_RESET}")
-
-            elif "Data Storm" in weather["name"]:
-                bandwidth_loss = int(self.player.bandwidth * 0.2)
-                if bandwidth_loss > 0:
-                    self.player.bandwidth -= bandwidth_loss
-                    print(
-                        f"{CLR_WARNING}The Data Storm reduces your bandwidth by {bandwidth_loss}!{CLR_RESET}")
-
-        input("\nPress Enter to continue...")
+            energy_loss = int(self.player.energy * self.weather.modifier(destination_name, "energy_drain"))
+            if energy_loss > 0:
+                self.player.use_energy(energy_loss)
+                echo(
+                    f"{CLR_WARNING}The {weather['name']} drains {energy_loss} energy!{CLR_RESET}")
+
+            bandwidth_loss = int(self.player.bandwidth * -self.weather.modifier(destination_name, "bandwidth"))
+            if bandwidth_loss > 0:
+                self.player.bandwidth -= bandwidth_loss
+                echo(
+                    f"{CLR_WARNING}The {weather['name']} reduces your bandwidth by {bandwidth_loss}!{CLR_RESET}")
+
+        return True
 
     def view_quests(self) -> None:
         """View active and available quests."""
-        print(f"\n{CLR_SECTION}[ACTIVE QUESTS]{CLR_RESET}")
+        echo(f"\n{CLR_SECTION}[ACTIVE QUESTS]{CLR_RESET}")
 
         active_quests = []
         for quest_id in self.player.active_quests:
@@ -1062,7 +1156,7 @@ class Game:
                 active_quests.append(self.quests[quest_id])
 
         if not active_quests:
-            print("You have no active quests.")
+            echo("You have no active quests.")
         else:
             for i, quest in enumerate(active_quests, 1):
                 # Calculate completion percentage
@@ -1070,10 +1164,10 @@ class Game:
                     1 for obj in quest.objectives if obj["completed"])
                 total = len(quest.objectives)
                 percentage = (completed / total) * 100
-                print(
+                echo(
                     f"{i}. {quest.title} - Progress: {completed}/{total} ({percentage:.0f}%)")
 
-            print("\nSelect a quest to view details (0 to return):")
+            echo("\nSelect a quest to view details (0 to return):")
             choice = get_valid_input("Enter quest number: ", range(
                 0, len(active_quests) + 1))
 
@@ -1081,55 +1175,42 @@ class Game:
                 active_quests[choice - 1].display()
 
         # Check for available quests at this location
-        current_loc = self.player.current_location.name
-        available_quests = []
-
-        # Logic to determine available quests based on location and player progress
-        for quest_id, quest in self.quests.items():
-            # Skip quests already active or completed
-            if quest_id in self.player.active_quests or quest_id in self.player.completed_quests:
-                continue
-
-            # Check location requirements if any
-            if quest.location and quest.location != current_loc:
-                continue
-
-            # Check if quest prerequisites are met
-            if quest.is_available(self.player):
-                available_quests.append(quest)
+        available_quests = self.quest_tracker.available(
+            self.player.current_location.name)
 
         # Display available quests
         if available_quests:
-            print(f"\n{CLR_SECTION}[AVAILABLE QUESTS]{CLR_RESET}")
+            echo(f"\n{CLR_SECTION}[AVAILABLE QUESTS]{CLR_RESET}")
             for i, quest in enumerate(available_quests, 1):
                 if quest.difficulty:
-                    print(
+                    echo(
                         f"{i}. {quest.title} (Difficulty: {'★' * quest.difficulty}{'☆' * (10 - quest.difficulty)})")
                 else:
-                    print(f"{i}. {quest.title}")
+                    echo(f"{i}. {quest.title}")
 
-            print("\nAccept a quest (0 to return):")
+            echo("\nAccept a quest (0 to return):")
             choice = get_valid_input(
                 "Enter quest number: ", range(0, len(available_quests) + 1))
 
             if choice > 0:
                 selected_quest = available_quests[choice - 1]
                 self.player.active_quests.append(selected_quest.id)
-                print(
+                self.quest_tracker.activate(selected_quest.id)
+                echo(
                     f"\n{CLR_SUCCESS}Quest accepted: {selected_quest.title}{CLR_RESET}")
                 selected_quest.display()
 
-        input("\nPress Enter to continue...")
+        prompt("\nPress Enter to continue...")
 
     def manage_services(self) -> None:
         """Deploy or manage cloud services."""
         while True:
             clear_screen()
-            print(f"\n{CLR_SECTION}[SERVICE MANAGEMENT]{CLR_RESET}")
-            print("1. Deploy a new service")
-            print("2. Manage deployed services")
-            print("3. View service analytics")
-            print("4. Return to main menu")
+            echo(f"\n{CLR_SECTION}[SERVICE MANAGEMENT]{CLR_RESET}")
+            echo("1. Deploy a new service")
+            echo("2. Manage deployed services")
+            echo("3. View service analytics")
+            echo("4. Return to main menu")
 
             choice = get_valid_input(
                 "\nEnter your choice (1-4): ", range(1, 5))
@@ -1145,67 +1226,61 @@ class Game:
 
     def deploy_service(self) -> None:
         """Deploy a service to the cloud."""
-        print(f"\n{CLR_SECTION}[DEPLOY SERVICE]{CLR_RESET}")
+        echo(f"\n{CLR_SECTION}[DEPLOY SERVICE]{CLR_RESET}")
 
         if not self.player.inventory.services:
-            print("You don't have any services to deploy.")
-            input("\nPress Enter to continue...")
+            echo("You don't have any services to deploy.")
+            prompt("\nPress Enter to continue...")
             return
 
-        print("Choose a service to deploy:")
+        echo("Choose a service to deploy:")
         for i, service in enumerate(self.player.inventory.services, 1):
-            print(f"{i}. {service.name} (Cost: {service.deploy_cost} credits)")
-        print(f"{len(self.player.inventory.services) + 1}. Cancel")
+            echo(f"{i}. {service.name} (Cost: {service.deploy_cost} credits)")
+        echo(f"{len(self.player.inventory.services) + 1}. Cancel")
 
         choice = get_valid_input("\nEnter your choice: ", range(
             1, len(self.player.inventory.services) + 2))
 
         if choice == len(self.player.inventory.services) + 1:
-            print("Deployment canceled.")
+            echo("Deployment canceled.")
             return
 
         selected_service = self.player.inventory.services[choice - 1]
 
         # Check if player has enough credits
         if self.player.cloud_credits < selected_service.deploy_cost:
-            print(
+            echo(
                 f"\n{CLR_ERROR}You don't have enough Cloud Credits to deploy this service.{CLR_RESET}")
-            input("\nPress Enter to continue...")
+            prompt("\nPress Enter to continue...")
             return
 
         # Check dependencies
         for dependency in selected_service.dependencies:
-            has_dependency = False
-            for deployed in self.player.inventory.deployed_services:
-                if deployed.name == dependency and deployed.is_deployed:
-                    has_dependency = True
-                    break
-
-            if not has_dependency:
-                print(
+            if not self.player.inventory.has_deployed_service(dependency):
+                echo(
                     f"\n{CLR_ERROR}You need to deploy {dependency} before deploying this service.{CLR_RESET}")
-                input("\nPress Enter to continue...")
+                prompt("\nPress Enter to continue...")
                 return
 
         # Check region availability
         current_region = self.player.current_location.region
         if current_region not in selected_service.region_availability and "global" not in selected_service.region_availability:
-            print(
+            echo(
                 f"\n{CLR_ERROR}This service is not available in the {current_region} region.{CLR_RESET}")
-            input("\nPress Enter to continue...")
+            prompt("\nPress Enter to continue...")
             return
 
         # Deploy the service
         self.player.cloud_credits -= selected_service.deploy_cost
-        deployed_service = copy.deepcopy(selected_service)
+        deployed_service = selected_service.clone(
+            f"{selected_service.name[:3]}-{self.new_instance_id()}")
         deployed_service.is_deployed = True
         deployed_service.deployment_region = current_region
-        deployed_service.instance_id = f"{deployed_service.name[:3]}-{str(uuid.uuid4())[:8]}"
 
         # neon_shadow/game.py (continued)
 
-        self.player.inventory.deployed_services.append(deployed_service)
-        self.player.inventory.services.remove(selected_service)
+        self.player.inventory.add_deployed_service(deployed_service)
+        self.player.inventory.discard_service(selected_service)
 
         display_loading_bar("Deploying service...", 1.5)
         display_notification(
@@ -1213,27 +1288,27 @@ class Game:
 
         # Deployment takes time
         self.current_day += 1
-        input("\nPress Enter to continue...")
+        prompt("\nPress Enter to continue...")
 
     def manage_deployed_services(self) -> None:
         """Manage already deployed services."""
         if not self.player.inventory.deployed_services:
-            print("\nYou don't have any deployed services to manage.")
-            input("\nPress Enter to continue...")
+            echo("\nYou don't have any deployed services to manage.")
+            prompt("\nPress Enter to continue...")
             return
 
         while True:
-            print(f"\n{CLR_SECTION}[MANAGE DEPLOYED SERVICES]{CLR_RESET}")
+            echo(f"\n{CLR_SECTION}[MANAGE DEPLOYED SERVICES]{CLR_RESET}")
 
             # Display deployed services
             for i, service in enumerate(self.player.inventory.deployed_services, 1):
                 status = f"{CLR_SUCCESS}ONLINE{CLR_RESET}" if service.is_deployed else f"{CLR_ERROR}OFFLINE{CLR_RESET}"
-                print(f"{i}. {service.name} ({service.instance_id}) - {status}")
-                print(f"   Region: {service.deployment_region}")
-                print(
+                echo(f"{i}. {service.name} ({service.instance_id}) - {status}")
+                echo(f"   Region: {service.deployment_region}")
+                echo(
                     f"   Health: {service.health}% | Security: {service.security_level}/10 | Performance: {service.performance}/10")
 
-            print(f"{len(self.player.inventory.deployed_services) + 1}. Return")
+            echo(f"{len(self.player.inventory.deployed_services) + 1}. Return")
 
             choice = get_valid_input("\nSelect a service to manage (or return): ",
                                      range(1, len(self.player.inventory.deployed_services) + 2))
@@ -1247,32 +1322,32 @@ class Game:
     def service_action_menu(self, service: CloudService) -> None:
         """Show actions for a specific service."""
         while True:
-            print(
+            echo(
                 f"\n{CLR_SECTION}[MANAGE {service.name} ({service.instance_id})]{CLR_RESET}")
-            print(f"Status: {'ONLINE' if service.is_deployed else 'OFFLINE'}")
-            print(f"Health: {service.health}%")
-            print(f"Security Level: {service.security_level}/10")
-            print(f"Performance: {service.performance}/10")
-            print(f"Region: {service.deployment_region}")
-            print(f"Uptime: {service.uptime_days} days")
-            print(f"Revenue: {service.calculate_revenue():.2f} credits/hour")
+            echo(f"Status: {'ONLINE' if service.is_deployed else 'OFFLINE'}")
+            echo(f"Health: {service.health}%")
+            echo(f"Security Level: {service.security_level}/10")
+            echo(f"Performance: {service.performance}/10")
+            echo(f"Region: {service.deployment_region}")
+            echo(f"Uptime: {service.uptime_days} days")
+            echo(f"Revenue: {service.calculate_revenue():.2f} credits/hour")
 
             if service.status_effects:
-                print("\nActive Status Effects:")
+                echo("\nActive Status Effects:")
                 for effect in service.status_effects:
-                    print(
+                    echo(
                         f"• {effect['name']} ({effect['duration']} turns remaining)")
 
-            print("\nActions:")
+            echo("\nActions:")
             if service.is_deployed:
-                print("1. Repair Service (+Health)")
-                print("2. Enhance Security (+Security)")
-                print("3. Optimize Performance (+Performance)")
-                print("4. Undeploy Service")
+                echo("1. Repair Service (+Health)")
+                echo("2. Enhance Security (+Security)")
+                echo("3. Optimize Performance (+Performance)")
+                echo("4. Undeploy Service")
             else:
-                print("1. Redeploy Service")
+                echo("1. Redeploy Service")
 
-            print("5. Return")
+            echo("5. Return" if service.is_deployed else "2. Return")
 
             # Limit options based on service status
             max_option = 5 if service.is_deployed else 2
@@ -1287,9 +1362,9 @@ class Game:
                     repair_cost = 10 * (100 - service.health) // 10
                     repair_amount = 30
 
-                    print(
+                    echo(
                         f"\nRepairing will restore up to {repair_amount}% health.")
-                    print(f"Cost: {repair_cost} credits")
+                    echo(f"Cost: {repair_cost} credits")
 
                     if confirm_action(f"Repair {service.name} for {repair_cost} credits?"):
                         if self.player.cloud_credits >= repair_cost:
@@ -1306,9 +1381,9 @@ class Game:
                     security_cost = 15 * (10 - service.security_level)
                     security_amount = 2
 
-                    print(
+                    echo(
                         f"\nEnhancing security will increase security level by {security_amount}.")
-                    print(f"Cost: {security_cost} credits")
+                    echo(f"Cost: {security_cost} credits")
 
                     if confirm_action(f"Enhance {service.name} security for {security_cost} credits?"):
                         if self.player.cloud_credits >= security_cost:
@@ -1326,9 +1401,9 @@ class Game:
                     perf_cost = 20 * (10 - service.performance)
                     perf_amount = 2
 
-                    print(
+                    echo(
                         f"\nOptimizing will increase performance by {perf_amount}.")
-                    print(f"Cost: {perf_cost} credits")
+                    echo(f"Cost: {perf_cost} credits")
 
                     if confirm_action(f"Optimize {service.name} performance for {perf_cost} credits?"):
                         if self.player.cloud_credits >= perf_cost:
@@ -1348,11 +1423,14 @@ class Game:
                         display_notification(
                             f"Service {service.name} has been undeployed.", "warning")
 
+                elif choice == 5:
+                    break
+
             elif choice == 1:
                 # Redeploy service
                 redeploy_cost = service.deploy_cost // 2  # Half the original cost
 
-                print(f"\nRedeploying will cost {redeploy_cost} credits.")
+                echo(f"\nRedeploying will cost {redeploy_cost} credits.")
 
                 if confirm_action(f"Redeploy {service.name} for {redeploy_cost} credits?"):
                     if self.player.cloud_credits >= redeploy_cost:
@@ -1371,11 +1449,11 @@ class Game:
     def view_service_analytics(self) -> None:
         """View analytics for deployed services."""
         if not self.player.inventory.deployed_services:
-            print("\nYou don't have any deployed services to analyze.")
-            input("\nPress Enter to continue...")
+            echo("\nYou don't have any deployed services to analyze.")
+            prompt("\nPress Enter to continue...")
             return
 
-        print(f"\n{CLR_SECTION}[SERVICE ANALYTICS]{CLR_RESET}")
+        echo(f"\n{CLR_SECTION}[SERVICE ANALYTICS]{CLR_RESET}")
 
         # Calculate total revenue, costs
         total_hourly_revenue = 0
@@ -1404,10 +1482,10 @@ class Game:
                 services_by_type[service.service_type] += 1
 
         # Display summary statistics
-        print(f"\n{CLR_CYAN}Summary Statistics:{CLR_RESET}")
-        print(
+        echo(f"\n{CLR_CYAN}Summary Statistics:{CLR_RESET}")
+        echo(
             f"Total Deployed Services: {len(self.player.inventory.deployed_services)}")
-        print(f"Active Services: {active_services}")
+        echo(f"Active Services: {active_services}")
 
         if active_services > 0:
             # Calculate daily values (24 hours)
@@ -1415,33 +1493,33 @@ class Game:
             daily_cost = total_hourly_cost * 24
             daily_profit = daily_revenue - daily_cost
 
-            print(f"\n{CLR_CREDITS}Financial Analytics:{CLR_RESET}")
-            print(f"Total Hourly Revenue: {total_hourly_revenue:.2f} credits")
-            print(f"Total Hourly Cost: {total_hourly_cost:.2f} credits")
-            print(
+            echo(f"\n{CLR_CREDITS}Financial Analytics:{CLR_RESET}")
+            echo(f"Total Hourly Revenue: {total_hourly_revenue:.2f} credits")
+            echo(f"Total Hourly Cost: {total_hourly_cost:.2f} credits")
+            echo(
                 f"Hourly Profit: {total_hourly_revenue - total_hourly_cost:.2f} credits")
-            print(f"Estimated Daily Profit: {daily_profit:.2f} credits")
+            echo(f"Estimated Daily Profit: {daily_profit:.2f} credits")
 
             # Calculate averages
             avg_health = total_health / active_services
             avg_security = total_security / active_services
             avg_performance = total_performance / active_services
 
-            print(f"\n{CLR_CYAN}Performance Metrics:{CLR_RESET}")
-            print(f"Average Health: {avg_health:.1f}%")
-            print(f"Average Security Level: {avg_security:.1f}/10")
-            print(f"Average Performance: {avg_performance:.1f}/10")
+            echo(f"\n{CLR_CYAN}Performance Metrics:{CLR_RESET}")
+            echo(f"Average Health: {avg_health:.1f}%")
+            echo(f"Average Security Level: {avg_security:.1f}/10")
+            echo(f"Average Performance: {avg_performance:.1f}/10")
 
             # Distribution by region
-            print(f"\n{CLR_CYAN}Regional Distribution:{CLR_RESET}")
+            echo(f"\n{CLR_CYAN}Regional Distribution:{CLR_RESET}")
             for region, count in services_by_region.items():
-                print(
+                echo(
                     f"{region}: {count} services ({count/active_services*100:.1f}%)")
 
             # Distribution by service type
-            print(f"\n{CLR_CYAN}Service Type Distribution:{CLR_RESET}")
+            echo(f"\n{CLR_CYAN}Service Type Distribution:{CLR_RESET}")
             for svc_type, count in services_by_type.items():
-                print(
+                echo(
                     f"{svc_type}: {count} services ({count/active_services*100:.1f}%)")
 
             # Incident history analysis if any services have history
@@ -1458,13 +1536,13 @@ class Game:
                         })
 
             if incidents:
-                print(
+                echo(
                     f"\n{CLR_HAZARD}Recent Incidents ({min(5, len(incidents))} of {len(incidents)}):{CLR_RESET}")
                 # Sort by most recent
                 incidents.sort(key=lambda x: x["day"], reverse=True)
 
                 for incident in incidents[:5]:  # Show 5 most recent
-                    print(f"Day {incident['day']}: {incident['service']} ({incident['instance'][:6]}) - " +
+                    echo(f"Day {incident['day']}: {incident['service']} ({incident['instance'][:6]}) - " +
                           f"{incident['type'].capitalize()} of {incident['amount']}")
 
             # Most profitable service
@@ -1475,20 +1553,75 @@ class Game:
                 )
 
                 profit = most_profitable.calculate_revenue() - most_profitable.cost_per_hour
-                print(f"\n{CLR_BONUS}Most Profitable Service:{CLR_RESET}")
-                print(
+                echo(f"\n{CLR_BONUS}Most Profitable Service:{CLR_RESET}")
+                echo(
                     f"{most_profitable.name} ({most_profitable.instance_id[:6]}): {profit:.2f} credits/hour")
 
-        input("\nPress Enter to continue...")
+        prompt("\nPress Enter to continue...")
+
+    def use_consumable(self, item_name: str, service: Optional[CloudService] = None) -> bool:
+        """Use one consumable from the player's inventory.
+
+        Args:
+            item_name: Inventory name of the consumable
+            service: Deployed service to apply it to, for service consumables
+
+        Returns:
+            True if the consumable was used, False otherwise
+        """
+        effect = self.consumable_effects.get(item_name.replace("_", " "))
+        if effect is None:
+            display_notification(f"{item_name} has no usable effect.", "warning")
+            return False
+        if effect.target == "service" and service is None:
+            display_notification(f"{item_name} must be applied to a deployed service.", "error")
+            return False
+        if not self.player.inventory.use_consumable(item_name):
+            display_notification(f"You don't have any {item_name}.", "error")
+            return False
+
+        effect.apply(EffectContext(self.player, service))
+        return True
+
+    def consumables_menu(self) -> None:
+        """Let the player use a consumable."""
+        items = list(self.player.inventory.consumables.items())
+
+        echo(f"\n{CLR_SECTION}[USE CONSUMABLE]{CLR_RESET}")
+        for i, (name, count) in enumerate(items, 1):
+            echo(f"{i}. {name.replace('_', ' ')} x{count}")
+        echo(f"{len(items) + 1}. Cancel")
+
+        choice = get_valid_input("Select a consumable to use: ", range(1, len(items) + 2))
+        if choice == len(items) + 1:
+            return
+
+        item_name = items[choice - 1][0]
+        effect = self.consumable_effects.get(item_name.replace("_", " "))
+        service = None
+        if effect is not None and effect.target == "service":
+            online = [s for s in self.player.inventory.deployed_services if s.is_deployed]
+            if not online:
+                display_notification("You have no online services to apply this to.", "error")
+                return
+            for i, candidate in enumerate(online, 1):
+                echo(f"{i}. {candidate.name} ({candidate.instance_id})")
+            echo(f"{len(online) + 1}. Cancel")
+            pick = get_valid_input("Select a service: ", range(1, len(online) + 2))
+            if pick == len(online) + 1:
+                return
+            service = online[pick - 1]
+
+        self.use_consumable(item_name, service)
 
     def use_artifact(self) -> None:
         """Use an artifact from the inventory."""
         if not self.player.inventory.artifacts:
-            print("\nYou don't have any artifacts to use.")
-            input("\nPress Enter to continue...")
+            echo("\nYou don't have any artifacts to use.")
+            prompt("\nPress Enter to continue...")
             return
 
-        print(f"\n{CLR_SECTION}[USE ARTIFACT]{CLR_RESET}")
+        echo(f"\n{CLR_SECTION}[USE ARTIFACT]{CLR_RESET}")
 
         # Show artifacts with their status
         available_artifacts = []
@@ -1496,36 +1629,36 @@ class Game:
             cooldown_status = ""
             if artifact.cooldown > 0:
                 cooldown_status = f" [COOLDOWN: {artifact.cooldown}]"
-                print(
+                echo(
                     f"{i}. {artifact.name} - {artifact.description}{cooldown_status} (UNAVAILABLE)")
             else:
                 available_artifacts.append(artifact)
-                print(f"{i}. {artifact.name} - {artifact.description}")
+                echo(f"{i}. {artifact.name} - {artifact.description}")
 
         if not available_artifacts:
-            print("\nAll your artifacts are on cooldown.")
-            input("\nPress Enter to continue...")
+            echo("\nAll your artifacts are on cooldown.")
+            prompt("\nPress Enter to continue...")
             return
 
-        print(f"{len(self.player.inventory.artifacts) + 1}. Cancel")
+        echo(f"{len(self.player.inventory.artifacts) + 1}. Cancel")
 
         choice = get_valid_input("\nSelect an artifact to use: ",
                                  range(1, len(self.player.inventory.artifacts) + 2))
 
         if choice == len(self.player.inventory.artifacts) + 1:
-            print("Cancelled.")
+            echo("Cancelled.")
             return
 
         selected_artifact = self.player.inventory.artifacts[choice - 1]
 
         if selected_artifact.cooldown > 0:
-            print(
+            echo(
                 f"\n{CLR_ERROR}This artifact is on cooldown for {selected_artifact.cooldown} more turns.{CLR_RESET}")
-            input("\nPress Enter to continue...")
+            prompt("\nPress Enter to continue...")
             return
 
         # Use the artifact
-        print(f"\nUsing {selected_artifact.name}...")
+        echo(f"\nUsing {selected_artifact.name}...")
 
         # Different effects based on artifact type
         if selected_artifact.artifact_type == "Scanner":
@@ -1546,7 +1679,7 @@ class Game:
             benefit = selected_artifact.power + selected_artifact.upgrade_level
 
             # Random effect based on artifact power
-            effect_type = random.choice(["credits", "skill", "clue", "repair"])
+            effect_type = self.rng.choice(["credits", "skill", "clue", "repair"])
 
             if effect_type == "credits":
                 credits_gained = benefit * 10
@@ -1554,12 +1687,12 @@ class Game:
                 display_notification(
                     f"Generated {credits_gained} credits!", "success")
             elif effect_type == "skill":
-                skill = random.choice(list(self.player.skills.keys()))
+                skill = self.rng.choice(list(self.player.skills.keys()))
                 self.player.increase_skill(skill, 1)
             elif effect_type == "clue":
-                clue_id = f"artifact_clue_{random.randint(1000, 9999)}"
+                clue_id = f"artifact_clue_{self.rng.randint(1000, 9999)}"
                 self.player.add_clue(clue_id)
-                print(
+                echo(
                     f"{CLR_CLUE}You discovered a new lead using the {selected_artifact.name}.{CLR_RESET}")
             elif effect_type == "repair":
                 if self.player.inventory.deployed_services:
@@ -1578,7 +1711,7 @@ class Game:
 
         # Using an artifact advances time slightly
         self.current_day += 1
-        input("\nPress Enter to continue...")
+        prompt("\nPress Enter to continue...")
 
     def use_scanner_artifact(self, artifact: CloudArtifact) -> None:
         """Use a scanner-type artifact."""
@@ -1588,12 +1721,12 @@ class Game:
         discovery_chance = 40 + (artifact.power * 5) + \
             (artifact.upgrade_level * 10)
 
-        if random.randint(1, 100) <= discovery_chance:
+        if self.rng.randint(1, 100) <= discovery_chance:
             # Found something
             current_loc = self.player.current_location.name
 
             # Generate a meaningful clue
-            clue_id = f"scan_clue_{current_loc}_{random.randint(1000, 9999)}"
+            clue_id = f"scan_clue_{current_loc}_{self.rng.randint(1000, 9999)}"
 
             # Create descriptive clue based on location and artifact
             if "S3" in artifact.name:
@@ -1608,29 +1741,25 @@ class Game:
                 clue_text = f"Your scan uncovered evidence of suspicious activity in {current_loc}."
 
             self.player.add_clue(clue_id)
-            print(f"\n{CLR_SUCCESS}Scan Complete!{CLR_RESET}")
-            print(f"{CLR_CLUE}{clue_text}{CLR_RESET}")
+            echo(f"\n{CLR_SUCCESS}Scan Complete!{CLR_RESET}")
+            echo(f"{CLR_CLUE}{clue_text}{CLR_RESET}")
 
             # Chance to find vulnerabilities in deployed services
-            if self.player.inventory.deployed_services and random.randint(1, 100) <= 30:
-                service = random.choice(
+            if self.player.inventory.deployed_services and self.rng.randint(1, 100) <= 30:
+                service = self.rng.choice(
                     self.player.inventory.deployed_services)
                 if service.is_deployed:
-                    print(
+                    echo(
                         f"\n{CLR_WARNING}The scan also detected a vulnerability in {service.name} ({service.instance_id}).{CLR_RESET}")
-                    print(f"You should enhance the security of this service soon.")
+                    echo(f"You should enhance the security of this service soon.")
 
                     # Add small security penalty if ignored
                     if service.security_level > 1:
                         service.security_level -= 1
-                        service.add_status_effect({
-                            "name": "Security Vulnerability",
-                            "duration": 3,
-                            "per_turn_effect": lambda svc: svc.apply_damage(2)
-                        })
+                        service.add_status_effect(self.STATUS_EFFECTS["Security Vulnerability"])
         else:
-            print(f"\n{CLR_SUCCESS}Scan Complete!{CLR_RESET}")
-            print("No anomalies detected during this scan.")
+            echo(f"\n{CLR_SUCCESS}Scan Complete!{CLR_RESET}")
+            echo("No anomalies detected during this scan.")
 
     def use_security_artifact(self, artifact: CloudArtifact) -> None:
         """Use a security-type artifact."""
@@ -1641,25 +1770,25 @@ class Game:
 
         if self.player.inventory.deployed_services:
             # Ask which service to enhance
-            print("\nSelect a service to enhance security:")
+            echo("\nSelect a service to enhance security:")
             deployed_services = [
                 s for s in self.player.inventory.deployed_services if s.is_deployed]
 
             if not deployed_services:
-                print("No active services to enhance.")
+                echo("No active services to enhance.")
                 return
 
             for i, service in enumerate(deployed_services, 1):
-                print(
+                echo(
                     f"{i}. {service.name} ({service.instance_id}) - Security: {service.security_level}/10")
 
-            print(f"{len(deployed_services) + 1}. Cancel")
+            echo(f"{len(deployed_services) + 1}. Cancel")
 
             choice = get_valid_input(
                 "Select a service: ", range(1, len(deployed_services) + 2))
 
             if choice == len(deployed_services) + 1:
-                print("Cancelled.")
+                echo("Cancelled.")
                 return
 
             selected_service = deployed_services[choice - 1]
@@ -1680,22 +1809,14 @@ class Game:
             )
 
             # Add protection status effect
-            selected_service.add_status_effect({
-                "name": "Enhanced Security",
-                "duration": 3,
-                "per_turn_effect": lambda svc: None  # No ongoing effect
-            })
+            selected_service.add_status_effect(self.STATUS_EFFECTS["Enhanced Security"])
         else:
             # Apply to player if no services
-            print(
+            echo(
                 f"\n{CLR_SUCCESS}Security enhanced for your personal systems!{CLR_RESET}")
 
             # Temporary protection status effect for player
-            self.player.add_status_effect({
-                "name": "Security Shield",
-                "duration": 3,
-                "per_turn_effect": lambda player: None  # Just protection
-            })
+            self.player.add_status_effect(self.STATUS_EFFECTS["Security Shield"])
 
             # Maybe heal some damage
             if self.player.health < self.player.max_health:
@@ -1714,18 +1835,20 @@ class Game:
             undiscovered = [loc for loc in self.locations.keys(
             ) if loc not in self.discovered_locations]
 
-            if undiscovered and random.randint(1, 100) <= 30 + (network_power * 5):
-                discovered_loc = random.choice(undiscovered)
+            if undiscovered and self.rng.randint(1, 100) <= 30 + (network_power * 5):
+                discovered_loc = self.rng.choice(undiscovered)
                 self.discovered_locations.add(discovered_loc)
 
                 # Add connection if reasonable
-                if random.randint(1, 100) <= 50:
+                if self.rng.randint(1, 100) <= 50:
                     current_loc_name = self.player.current_location.name
                     if discovered_loc not in self.player.current_location.connections:
                         self.player.current_location.add_connection(
                             discovered_loc)
                         self.locations[discovered_loc].add_connection(
                             current_loc_name)
+                        self.graph = self.graph.with_edges(
+                            [(current_loc_name, discovered_loc), (discovered_loc, current_loc_name)])
                         display_notification(
                             f"Discovered new route to {discovered_loc}!", "success")
                 else:
@@ -1733,35 +1856,35 @@ class Game:
                         f"Detected presence of {discovered_loc} in network traffic!", "info")
 
         # Network analysis
-        print(f"\n{CLR_SUCCESS}Network analysis complete!{CLR_RESET}")
+        echo(f"\n{CLR_SUCCESS}Network analysis complete!{CLR_RESET}")
 
         # Show some network statistics
         most_connected = max(self.locations.items(),
                              key=lambda x: len(x[1].connections))
-        print(
+        echo(
             f"Most connected node: {most_connected[0]} ({len(most_connected[1].connections)} connections)")
 
         # Bandwidth boost
         bandwidth_boost = network_power * 5
         old_bandwidth = self.player.bandwidth
         self.player.bandwidth += bandwidth_boost
-        print(
+        echo(
             f"Bandwidth optimized: {old_bandwidth} → {self.player.bandwidth} (+{bandwidth_boost})")
 
         # Chance to find suspicious traffic
-        if random.randint(1, 100) <= 20 + (network_power * 3):
-            print(
+        if self.rng.randint(1, 100) <= 20 + (network_power * 3):
+            echo(
                 f"\n{CLR_WARNING}Alert: Suspicious traffic pattern detected!{CLR_RESET}")
-            suspicious_location = random.choice(list(self.locations.keys()))
-            print(f"Origin appears to be {suspicious_location}.")
+            suspicious_location = self.rng.choice(list(self.locations.keys()))
+            echo(f"Origin appears to be {suspicious_location}.")
 
             # Add clue
-            clue_id = f"network_clue_{random.randint(1000, 9999)}"
+            clue_id = f"network_clue_{self.rng.randint(1000, 9999)}"
             self.player.add_clue(clue_id)
 
             # Chance to find Shadow Admin trace
-            if random.randint(1, 100) <= 10:
-                print(
+            if self.rng.randint(1, 100) <= 10:
+                echo(
                     f"\n{CLR_SHADOW_ADMIN}You detected a trace signature matching the Shadow Admin!{CLR_RESET}")
                 self.player.update_faction_reputation("ShadowNetwork", 2)
 
@@ -1776,7 +1899,7 @@ class Game:
             # Choose between healing services or player
             targets = ["services", "player"]
             weights = [0.7, 0.3]  # 70% chance for services, 30% for player
-            target = random.choices(targets, weights=weights)[0]
+            target = self.rng.choices(targets, weights=weights)[0]
 
             if target == "services":
                 # Find all damaged services
@@ -1789,13 +1912,13 @@ class Game:
 
                     for service in damaged_services:
                         actual_heal = service.repair(heal_amount)
-                        print(
+                        echo(
                             f"{CLR_SUCCESS}Repaired {service.name} by {actual_heal}%{CLR_RESET}")
 
                     display_notification(
                         f"Recovery complete! Services restored.", "success")
                 else:
-                    print(
+                    echo(
                         f"{CLR_SUCCESS}No damaged services found. All systems nominal.{CLR_RESET}")
                     # Heal player instead
                     heal_amount = recovery_power * 5
@@ -1833,7 +1956,7 @@ class Game:
         credits_gain = db_power * 15
 
         # Generate some random insights
-        print(f"\n{CLR_CYAN}Database analysis complete!{CLR_RESET}")
+        echo(f"\n{CLR_CYAN}Database analysis complete!{CLR_RESET}")
 
         insights = [
             f"Analyzed {intelligence_gain} records for patterns.",
@@ -1841,77 +1964,274 @@ class Game:
             f"Knowledge extraction complete."
         ]
 
-        for insight in random.sample(insights, k=min(2, len(insights))):
-            print(insight)
+        for insight in self.rng.sample(insights, k=min(2, len(insights))):
+            echo(insight)
 
         # Award credits from optimization
         self.player.cloud_credits += credits_gain
-        print(
+        echo(
             f"{CLR_CREDITS}+{credits_gain} credits from query optimization{CLR_RESET}")
 
         # Chance for skill increase
-        if random.randint(1, 100) <= 20 + (db_power * 5):
-            skill = random.choice(["database", "investigation", "cloud"])
+        if self.rng.randint(1, 100) <= 20 + (db_power * 5):
+            skill = self.rng.choice(["database", "investigation", "cloud"])
             self.player.increase_skill(skill, 1)
 
         # Chance to find important information
-        if random.randint(1, 100) <= 30 + (db_power * 3):
-            clue_id = f"db_clue_{random.randint(1000, 9999)}"
+        if self.rng.randint(1, 100) <= 30 + (db_power * 3):
+            clue_id = f"db_clue_{self.rng.randint(1000, 9999)}"
             self.player.add_clue(clue_id)
-            print(
+            echo(
                 f"\n{CLR_CLUE}Your database analysis uncovered a hidden connection!{CLR_RESET}")
 
+    def rest_menu(self) -> None:
+        """Rest for a day or let several days pass."""
+        echo(f"\n{CLR_SECTION}[REST]{CLR_RESET}")
+        echo("1. Rest for a day")
+        echo("2. Fast-forward several days")
+        echo("3. Cancel")
+
+        choice = get_valid_input("\nEnter your choice (1-3): ", range(1, 4))
+        if choice == 1:
+            self.rest()
+        elif choice == 2:
+            days_left = self.player.time_left - self.current_day
+            if days_left <= 1:
+                echo("There is no time left to let pass.")
+                return
+            max_days = min(FAST_FORWARD_MAX_DAYS, days_left - 1)
+            days = get_valid_input(f"Days to fast-forward (1-{max_days}): ",
+                                   range(1, max_days + 1))
+            credits = self.player.cloud_credits
+            passed, reason = self.fast_forward(days)
+            echo(f"\n{CLR_SUCCESS}{passed} day(s) passed. It is now day {self.current_day}.{CLR_RESET}")
+            echo(f"Cloud Credits: {self.player.cloud_credits - credits:+.0f}")
+            if reason:
+                echo(f"{CLR_WARNING}Stopped early: {reason}{CLR_RESET}")
+            prompt(PRESS_ENTER)
+
+    def fast_forward(self, days: int) -> Tuple[int, Optional[str]]:
+        """Let days pass where the player stands, without any menus.
+
+        Each day is an idle turn: the daily tick (weather, services, artifact
+        cooldowns, status effects, event cooldowns, skill boosts, recovery
+        and quest progress) followed by the location's event and hazard
+        checks. Runs of days on which nothing can happen are let pass in one
+        step (see ``_skip_quiet_days``), leaving the game as playing them
+        one by one would. Stops early when a deployed service is lost, a
+        hazard hits, an event fires or a quest objective is completed, or
+        when the game ends.
+
+        Args:
+            days: Most days to let pass
+
+        Returns:
+            (days passed, why it stopped early or None)
+        """
+        passed = 0
+        while passed < days:
+            if not self.player or self.game_over:
+                return passed, self.win_reason or None
+            # The first day is played in full, so the game-over checks have run
+            if passed:
+                skipped = self._skip_quiet_days(days - passed)
+                if skipped:
+                    passed += skipped
+                    continue
+
+            services_lost = self.services_lost
+            objectives_completed = self.objectives_completed
+
+            self.update_game_state()
+            event_fired = not self.game_over and self.check_events()
+            hazard_hit = not self.game_over and self.check_hazards()
+            passed += 1
+
+            if self.check_game_over():
+                return passed, self.win_reason
+            if self.services_lost != services_lost:
+                return passed, "A deployed service failed."
+            if hazard_hit:
+                return passed, "You were hit by a hazard."
+            if self.objectives_completed != objectives_completed:
+                return passed, "You made progress on a quest."
+            if event_fired:
+                return passed, "Something happened nearby."
+        return days, None
+
+    def _skip_quiet_days(self, limit: int) -> int:
+        """Let the coming days on which nothing can happen pass in one step.
+
+        A day is quiet when none of its service event, location event or
+        hazard rolls succeeds, and nothing falls due on it: no status effect
+        or skill boost runs out, the time limit is not reached and, while
+        services are deployed, the weather here (which wears them) does not
+        change. Its daily tick is then only bookkeeping, so the weather,
+        cooldowns, effects, recovery and services are advanced by all the
+        quiet days at once. The rolls are still drawn, in the order the
+        daily tick and the checks draw them, so the random number generators
+        end up where playing the days one by one would leave them.
+
+        Args:
+            limit: Most days to let pass
+
+        Returns:
+            Days passed; 0 if the next day has to be played in full
+        """
+        if self._rolls_ahead:
+            return 0  # The next day's rolls are drawn: it is not quiet
+        player = self.player
+        location = player.current_location
+        if location is None or self.quest_tracker.pending:
+            return 0
+        if any('per_turn_effect' in effect for effect in player.status_effects):
+            return 0
+        deployed = player.inventory.deployed_services
+        services = [service for service in deployed if service.is_deployed]
+        if any(service.status_effects for service in services):
+            return 0
+        fleet = self.fleet if HAS_NUMPY else None
+        if HAS_NUMPY and (fleet is None and len(deployed) >= FLEET_MIN_SIZE
+                          or fleet is not None and len(deployed) < FLEET_MIN_SIZE // 2):
+            return 0  # The next tick builds or drops the fleet
+
+        # Stop short of the next day something falls due
+        limit = min(limit, player.time_left - self.current_day - 1)
+        for effect in player.status_effects:
+            limit = min(limit, effect['duration'] - 1)
+        for boost in player.temp_skill_boosts:
+            limit = min(limit, boost['remaining_days'] - 1)
+        if services:
+            limit = min(limit, self.weather.days_left(location.name) - 1)
+        if limit <= 0:
+            return 0
+
+        rng = self.rng
+        location_difficulty = self._location_difficulty()
+        event_multiplier = {"easy": 0.7, "hard": 1.5}.get(self.difficulty, 1)
+        rolling = services if fleet is None else ()  # Fleet services roll on the fleet's generator
+        fixed = [DAILY_EVENT_CHANCE] + [hazard.get("chance", 10) for hazard in location.hazards or ()]
+
+        def quiet(days_ahead: int) -> bool:
+            """Draw the game's rolls for a day; return True if none succeeds.
+
+            The rolls of a day that is not quiet are kept for the day's
+            tick and checks, which draw the same rolls in the same order.
+            """
+            thresholds = [self._service_event_threshold(service, location_difficulty, days_ahead)
+                          for service in rolling]
+            thresholds += fixed
+            rolls = []
+            for threshold in thresholds:
+                rolls.append(rng.randint(1, 100))
+                if rolls[-1] <= threshold:
+                    rolls.reverse()
+                    self._rolls_ahead = rolls
+                    return False
+            return True
+
+        if fleet is not None:
+            fleet.sync(deployed)
+        days = 0
+        while days < limit:
+            if fleet is not None:
+                fleet_state = fleet.rng.bit_generator.state
+            if ((fleet is not None and not fleet.roll_quiet(days + 1, location_difficulty,
+                                                            event_multiplier))
+                    or not quiet(days + 1)):
+                if fleet is not None:
+                    fleet.rng.bit_generator.state = fleet_state
+                break
+            days += 1
+        if not days:
+            return 0
+
+        wear = self._weather_wear()
+        self.current_day += days
+        self.update_weather(days)
+
+        if fleet is not None:
+            for net_change in fleet.advance_quiet(days, wear):
+                if net_change != 0:
+                    player.cloud_credits += net_change
+        elif services:
+            # Credits add up day by day, as the daily tick adds them
+            for _ in range(days):
+                total_income = 0
+                total_costs = 0
+                for service in services:
+                    service.uptime_days += 1
+                    total_income += service.calculate_revenue() * 24
+                    total_costs += service.cost_per_hour * 24
+                    if wear:
+                        service.performance = max(1, service.performance - wear)
+                net_change = total_income - total_costs
+                if net_change != 0:
+                    player.cloud_credits += net_change
+
+        player.inventory.update_all_artifacts(days)
+        for effect in player.status_effects:
+            effect['duration'] -= days
+        self.event_scheduler.advance(days)
+        for boost in player.temp_skill_boosts:
+            boost['remaining_days'] -= days
+        if player.health < player.max_health:
+            player.heal(2 * days)
+        if player.energy < player.max_energy:
+            player.restore_energy(5 * days)
+        return days
+
     def rest(self) -> None:
         """Rest to recover energy and health."""
-        print(f"\n{CLR_SECTION}[REST]{CLR_RESET}")
-        print("You decide to take some time to rest and recover.")
+        echo("You decide to take some time to rest and recover.")
 
         # Check if player is in a safe location
         current_loc = self.player.current_location
         is_safe = current_loc.difficulty <= 3
 
         if is_safe:
-            print(f"{current_loc.name} is a relatively safe place to rest.")
+            echo(f"{current_loc.name} is a relatively safe place to rest.")
             health_recovery = 20
             energy_recovery = 70
         else:
-            print(f"{current_loc.name} is not the safest place to rest.")
-            print("You'll need to stay alert, limiting your recovery.")
+            echo(f"{current_loc.name} is not the safest place to rest.")
+            echo("You'll need to stay alert, limiting your recovery.")
             health_recovery = 10
             energy_recovery = 40
 
         # Check for weather effects
-        if current_loc.name in self.weather_conditions:
-            weather = self.weather_conditions[current_loc.name]["current"]
-            if "CPU Heatwave" in weather["name"]:
-                energy_recovery = int(energy_recovery * 0.7)
-                print(
-                    f"{CLR_WARNING}The CPU Heatwave makes rest less effective.{CLR_RESET}")
-            elif "Clear Signals" in weather["name"]:
-                health_recovery = int(health_recovery * 1.2)
-                energy_recovery = int(energy_recovery * 1.2)
-                print(
-                    f"{CLR_SUCCESS}The Clear Signals help you rest more effectively.{CLR_RESET}")
+        health_bonus = self.weather.modifier(current_loc.name, "health_recovery")
+        energy_bonus = self.weather.modifier(current_loc.name, "energy_recovery")
+        if health_bonus or energy_bonus:
+            weather = self.weather.current(current_loc.name)
+            health_recovery = int(health_recovery * max(0.0, 1 + health_bonus))
+            energy_recovery = int(energy_recovery * max(0.0, 1 + energy_bonus))
+            if health_bonus + energy_bonus < 0:
+                echo(
+                    f"{CLR_WARNING}The {weather['name']} makes rest less effective.{CLR_RESET}")
+            else:
+                echo(
+                    f"{CLR_SUCCESS}The {weather['name']} helps you rest more effectively.{CLR_RESET}")
 
         # Apply recovery
         health_gained = self.player.heal(health_recovery)
         energy_gained = self.player.restore_energy(energy_recovery)
 
         print_slow("Resting...", delay=0.1)
-        time.sleep(1)
+        pause(1)
 
         # Display results
-        print(f"\n{CLR_SUCCESS}You've rested and recovered:{CLR_RESET}")
-        print(f"Health: +{health_gained}")
-        print(f"Energy: +{energy_gained}")
+        echo(f"\n{CLR_SUCCESS}You've rested and recovered:{CLR_RESET}")
+        echo(f"Health: +{health_gained}")
+        echo(f"Energy: +{energy_gained}")
 
         # Check for random events during rest
         event_chance = 20 if is_safe else 40
 
-        if random.randint(1, 100) <= event_chance:
-            print(
+        if self.rng.randint(1, 100) <= event_chance:
+            echo(
                 f"\n{CLR_WARNING}However, your rest was interrupted...{CLR_RESET}")
-            time.sleep(1)
+            pause(1)
 
             # Trigger a random event
             self.trigger_random_event()
@@ -1919,15 +2239,15 @@ class Game:
         # Resting advances time
         self.current_day += 1
 
-        input("\nPress Enter to continue...")
+        prompt("\nPress Enter to continue...")
 
     def trigger_random_event(self) -> None:
         """Trigger a random event during rest."""
         event_types = ["discovery", "encounter", "dream"]
-        event_type = random.choice(event_types)
+        event_type = self.rng.choice(event_types)
 
         if event_type == "discovery":
-            print(f"While resting, you notice something you hadn't seen before.")
+            echo(f"While resting, you notice something you hadn't seen before.")
 
             discoveries = [
                 {"text": "A hidden terminal that seems to have been recently used.",
@@ -1938,20 +2258,20 @@ class Game:
                  "reward": "health"}
             ]
 
-            discovery = random.choice(discoveries)
-            print(discovery["text"])
+            discovery = self.rng.choice(discoveries)
+            echo(discovery["text"])
 
             if discovery["reward"] == "clue":
-                clue_id = f"rest_clue_{random.randint(1000, 9999)}"
+                clue_id = f"rest_clue_{self.rng.randint(1000, 9999)}"
                 self.player.add_clue(clue_id)
             elif discovery["reward"] == "credits":
-                credits = random.randint(10, 30)
+                credits = self.rng.randint(10, 30)
                 self.player.cloud_credits += credits
-                print(f"{CLR_CREDITS}You found {credits} cloud credits!{CLR_RESET}")
+                echo(f"{CLR_CREDITS}You found {credits} cloud credits!{CLR_RESET}")
             elif discovery["reward"] == "health":
-                health = random.randint(10, 25)
+                health = self.rng.randint(10, 25)
                 actual_heal = self.player.heal(health)
-                print(
+                echo(
                     f"{CLR_SUCCESS}You found medical supplies! +{actual_heal} health{CLR_RESET}")
 
         elif event_type == "encounter":
@@ -1964,21 +2284,21 @@ class Game:
                  "effect": "shadow"}
             ]
 
-            encounter = random.choice(encounters)
-            print(encounter["text"])
+            encounter = self.rng.choice(encounters)
+            echo(encounter["text"])
 
             if encounter["effect"] == "reputation":
                 self.player.update_faction_reputation("CorpSec", 2)
             elif encounter["effect"] == "skill":
-                skill = random.choice(list(self.player.skills.keys()))
+                skill = self.rng.choice(list(self.player.skills.keys()))
                 self.player.increase_skill(skill, 1)
             elif encounter["effect"] == "shadow":
                 self.player.update_faction_reputation("ShadowNetwork", 1)
-                print(
+                echo(
                     f"{CLR_SHADOW_ADMIN}They disappear before you can approach them.{CLR_RESET}")
 
         elif event_type == "dream":
-            print("While resting, you have a vivid dream...")
+            echo("While resting, you have a vivid dream...")
 
             dreams = [
                 "You dream of vast data centers, humming with activity. In the dream, you can see the flow of information like rivers of light.",
@@ -1986,34 +2306,34 @@ class Game:
                 "You dream of standing atop a mountain of servers, overlooking the entire cloud infrastructure."
             ]
 
-            dream_text = random.choice(dreams)
+            dream_text = self.rng.choice(dreams)
             print_slow(dream_text, color=CLR_BRIGHT + CLR_CYAN)
 
             # Dreams can provide insights or small bonuses
-            print(
+            echo(
                 f"\n{CLR_SUCCESS}The dream leaves you with new insights.{CLR_RESET}")
 
             # Small random bonus
-            effect = random.choice(["energy", "skill_temp", "shadow_insight"])
+            effect = self.rng.choice(["energy", "skill_temp", "shadow_insight"])
 
             if effect == "energy":
-                energy = random.randint(10, 30)
+                energy = self.rng.randint(10, 30)
                 self.player.restore_energy(energy)
-                print(f"You feel more energized. +{energy} energy")
+                echo(f"You feel more energized. +{energy} energy")
             elif effect == "skill_temp":
-                skill = random.choice(list(self.player.skills.keys()))
+                skill = self.rng.choice(list(self.player.skills.keys()))
                 boost = {
                     "skill": skill,
                     "amount": 1,
                     "remaining_days": 2
                 }
                 self.player.temp_skill_boosts.append(boost)
-                print(
+                echo(
                     f"You have a temporary insight into {skill}. +1 for 2 days")
             elif effect == "shadow_insight":
-                print(
+                echo(
                     f"{CLR_SHADOW_ADMIN}You feel you've glimpsed something important about the Shadow Admin...{CLR_RESET}")
-                clue_id = f"shadow_dream_{random.randint(1000, 9999)}"
+                clue_id = f"shadow_dream_{self.rng.randint(1000, 9999)}"
                 self.player.add_clue(clue_id)
 
     def interact_with_vendors(self) -> None:
@@ -2021,11 +2341,11 @@ class Game:
         current_loc = self.player.current_location
 
         if not current_loc.vendors:
-            print(f"\n{CLR_ERROR}There are no vendors at this location.{CLR_RESET}")
-            input("\nPress Enter to continue...")
+            echo(f"\n{CLR_ERROR}There are no vendors at this location.{CLR_RESET}")
+            prompt("\nPress Enter to continue...")
             return
 
-        print(f"\n{CLR_SECTION}[VENDORS AT {current_loc.name}]{CLR_RESET}")
+        echo(f"\n{CLR_SECTION}[VENDORS AT {current_loc.name}]{CLR_RESET}")
 
         # List available vendors
         available_vendors = []
@@ -2037,21 +2357,21 @@ class Game:
                     if faction in self.player.faction_reputation:
                         if self.player.faction_reputation[faction] < level:
                             can_access = False
-                            print(f"{i}. {vendor['name']} - {vendor['description']} " +
+                            echo(f"{i}. {vendor['name']} - {vendor['description']} " +
                                   f"({CLR_ERROR}Requires {faction} reputation {level}{CLR_RESET})")
                             break
 
             if can_access:
                 available_vendors.append(vendor)
-                print(f"{i}. {vendor['name']} - {vendor['description']}")
+                echo(f"{i}. {vendor['name']} - {vendor['description']}")
 
         if not available_vendors:
-            print(
+            echo(
                 f"\n{CLR_ERROR}You don't have sufficient reputation to access any vendors here.{CLR_RESET}")
-            input("\nPress Enter to continue...")
+            prompt("\nPress Enter to continue...")
             return
 
-        print(f"{len(current_loc.vendors) + 1}. Cancel")
+        echo(f"{len(current_loc.vendors) + 1}. Cancel")
 
         choice = get_valid_input("Select a vendor: ",
                                  range(1, len(current_loc.vendors) + 2))
@@ -2067,7 +2387,7 @@ class Game:
                 break
 
         if not selected_vendor:
-            print(f"{CLR_ERROR}Error selecting vendor.{CLR_RESET}")
+            echo(f"{CLR_ERROR}Error selecting vendor.{CLR_RESET}")
             return
 
         # Check if player can access this vendor
@@ -2077,9 +2397,9 @@ class Game:
                 if faction in self.player.faction_reputation:
                     if self.player.faction_reputation[faction] < level:
                         can_access = False
-                        print(
+                        echo(
                             f"{CLR_ERROR}You need {faction} reputation of at least {level} to access this vendor.{CLR_RESET}")
-                        input("\nPress Enter to continue...")
+                        prompt("\nPress Enter to continue...")
                         return
 
         # Show vendor menu
@@ -2088,14 +2408,14 @@ class Game:
     def vendor_menu(self, vendor) -> None:
         """Display the vendor's menu."""
         while True:
-            print(f"\n{CLR_SECTION}[{vendor['name']}]{CLR_RESET}")
-            print(f"Your Credits: {self.player.cloud_credits}")
-            print("\nWhat would you like to do?")
-            print("1. Buy Artifacts")
-            print("2. Buy Services")
-            print("3. Buy Consumables")
-            print("4. Sell Items")
-            print("5. Return")
+            echo(f"\n{CLR_SECTION}[{vendor['name']}]{CLR_RESET}")
+            echo(f"Your Credits: {self.player.cloud_credits}")
+            echo("\nWhat would you like to do?")
+            echo("1. Buy Artifacts")
+            echo("2. Buy Services")
+            echo("3. Buy Consumables")
+            echo("4. Sell Items")
+            echo("5. Return")
 
             options = []
             if "inventory" in vendor and "artifacts" in vendor["inventory"] and vendor["inventory"]["artifacts"]:
@@ -2124,11 +2444,11 @@ class Game:
     def buy_artifacts(self, vendor) -> None:
         """Buy artifacts from a vendor."""
         if "inventory" not in vendor or "artifacts" not in vendor["inventory"] or not vendor["inventory"]["artifacts"]:
-            print(f"{CLR_ERROR}This vendor doesn't sell artifacts.{CLR_RESET}")
+            echo(f"{CLR_ERROR}This vendor doesn't sell artifacts.{CLR_RESET}")
             return
 
-        print(f"\n{CLR_SECTION}[BUY ARTIFACTS]{CLR_RESET}")
-        print(f"Your Credits: {self.player.cloud_credits}")
+        echo(f"\n{CLR_SECTION}[BUY ARTIFACTS]{CLR_RESET}")
+        echo(f"Your Credits: {self.player.cloud_credits}")
 
         available_artifacts = []
         for artifact_name in vendor["inventory"]["artifacts"]:
@@ -2139,15 +2459,15 @@ class Game:
                     (artifact_name, artifact_data, cost))
 
         if not available_artifacts:
-            print(f"{CLR_ERROR}No artifacts available.{CLR_RESET}")
+            echo(f"{CLR_ERROR}No artifacts available.{CLR_RESET}")
             return
 
         # Display available artifacts
         for i, (name, data, cost) in enumerate(available_artifacts, 1):
-            print(
+            echo(
                 f"{i}. {name} - {data['description']} (Cost: {cost} credits)")
 
-        print(f"{len(available_artifacts) + 1}. Cancel")
+        echo(f"{len(available_artifacts) + 1}. Cancel")
 
         choice = get_valid_input("Select an artifact to buy: ",
                                  range(1, len(available_artifacts) + 2))
@@ -2160,26 +2480,19 @@ class Game:
 
         # Check if player has enough credits
         if self.player.cloud_credits < cost:
-            print(
+            echo(
                 f"{CLR_ERROR}You don't have enough credits to buy this artifact.{CLR_RESET}")
             return
 
         # Check if player has room in inventory
         if len(self.player.inventory.artifacts) >= self.player.inventory.max_artifacts:
-            print(f"{CLR_ERROR}Your artifact inventory is full.{CLR_RESET}")
+            echo(f"{CLR_ERROR}Your artifact inventory is full.{CLR_RESET}")
             return
 
         # Purchase the artifact
         self.player.cloud_credits -= cost
 
-        new_artifact = CloudArtifact(
-            selected_data["name"],
-            selected_data["description"],
-            selected_data["artifact_type"],
-            selected_data["aws_service"],
-            selected_data["cost"],
-            selected_data["power"]
-        )
+        new_artifact = create_artifact(selected_data)
 
         self.player.add_artifact(new_artifact)
         display_notification(
@@ -2188,11 +2501,11 @@ class Game:
     def buy_services(self, vendor) -> None:
         """Buy services from a vendor."""
         if "inventory" not in vendor or "services" not in vendor["inventory"] or not vendor["inventory"]["services"]:
-            print(f"{CLR_ERROR}This vendor doesn't sell services.{CLR_RESET}")
+            echo(f"{CLR_ERROR}This vendor doesn't sell services.{CLR_RESET}")
             return
 
-        print(f"\n{CLR_SECTION}[BUY SERVICES]{CLR_RESET}")
-        print(f"Your Credits: {self.player.cloud_credits}")
+        echo(f"\n{CLR_SECTION}[BUY SERVICES]{CLR_RESET}")
+        echo(f"Your Credits: {self.player.cloud_credits}")
 
         available_services = []
         for service_name in vendor["inventory"]["services"]:
@@ -2203,15 +2516,15 @@ class Game:
                 available_services.append((service_name, service_data, cost))
 
         if not available_services:
-            print(f"{CLR_ERROR}No services available.{CLR_RESET}")
+            echo(f"{CLR_ERROR}No services available.{CLR_RESET}")
             return
 
         # Display available services
         for i, (name, data, cost) in enumerate(available_services, 1):
-            print(
+            echo(
                 f"{i}. {name} - {data['description']} (Cost: {cost} credits)")
 
-        print(f"{len(available_services) + 1}. Cancel")
+        echo(f"{len(available_services) + 1}. Cancel")
 
         choice = get_valid_input("Select a service to buy: ",
                                  range(1, len(available_services) + 2))
@@ -2224,27 +2537,19 @@ class Game:
 
         # Check if player has enough credits
         if self.player.cloud_credits < cost:
-            print(
+            echo(
                 f"{CLR_ERROR}You don't have enough credits to buy this service.{CLR_RESET}")
             return
 
         # Check if player has room in inventory
         if len(self.player.inventory.services) >= self.player.inventory.max_services:
-            print(f"{CLR_ERROR}Your service inventory is full.{CLR_RESET}")
+            echo(f"{CLR_ERROR}Your service inventory is full.{CLR_RESET}")
             return
 
         # Purchase the service
         self.player.cloud_credits -= cost
 
-        new_service = CloudService(
-            selected_data["name"],
-            selected_data["description"],
-            selected_data["service_type"],
-            selected_data["cost_per_hour"],
-            selected_data["deploy_cost"],
-            selected_data["region_availability"],
-            selected_data["dependencies"]
-        )
+        new_service = create_service(selected_data, self.new_instance_id())
 
         self.player.add_service(new_service)
         display_notification(
@@ -2253,11 +2558,11 @@ class Game:
     def buy_consumables(self, vendor) -> None:
         """Buy consumables from a vendor."""
         if "inventory" not in vendor or "consumables" not in vendor["inventory"] or not vendor["inventory"]["consumables"]:
-            print(f"{CLR_ERROR}This vendor doesn't sell consumables.{CLR_RESET}")
+            echo(f"{CLR_ERROR}This vendor doesn't sell consumables.{CLR_RESET}")
             return
 
-        print(f"\n{CLR_SECTION}[BUY CONSUMABLES]{CLR_RESET}")
-        print(f"Your Credits: {self.player.cloud_credits}")
+        echo(f"\n{CLR_SECTION}[BUY CONSUMABLES]{CLR_RESET}")
+        echo(f"Your Credits: {self.player.cloud_credits}")
 
         consumables = []
         for name, data in vendor["inventory"]["consumables"].items():
@@ -2265,10 +2570,10 @@ class Game:
 
         # Display available consumables
         for i, (name, data) in enumerate(consumables, 1):
-            print(
+            echo(
                 f"{i}. {name} - {data['description']} (Cost: {data['price']} credits)")
 
-        print(f"{len(consumables) + 1}. Cancel")
+        echo(f"{len(consumables) + 1}. Cancel")
 
         choice = get_valid_input("Select a consumable to buy: ",
                                  range(1, len(consumables) + 2))
@@ -2287,7 +2592,7 @@ class Game:
 
         # Check if player has enough credits
         if self.player.cloud_credits < total_cost:
-            print(
+            echo(
                 f"{CLR_ERROR}You don't have enough credits to buy {quantity} {selected_name}.{CLR_RESET}")
             return
 
@@ -2302,11 +2607,11 @@ class Game:
 
     def sell_items(self, vendor) -> None:
         """Sell items to a vendor."""
-        print(f"\n{CLR_SECTION}[SELL ITEMS]{CLR_RESET}")
-        print("What would you like to sell?")
-        print("1. Artifacts")
-        print("2. Services")
-        print("3. Cancel")
+        echo(f"\n{CLR_SECTION}[SELL ITEMS]{CLR_RESET}")
+        echo("What would you like to sell?")
+        echo("1. Artifacts")
+        echo("2. Services")
+        echo("3. Cancel")
 
         choice = get_valid_input("Enter your choice: ", range(1, 4))
 
@@ -2320,19 +2625,19 @@ class Game:
     def sell_artifacts(self, vendor) -> None:
         """Sell artifacts to a vendor."""
         if not self.player.inventory.artifacts:
-            print(f"{CLR_ERROR}You don't have any artifacts to sell.{CLR_RESET}")
+            echo(f"{CLR_ERROR}You don't have any artifacts to sell.{CLR_RESET}")
             return
 
-        print(f"\n{CLR_SECTION}[SELL ARTIFACTS]{CLR_RESET}")
+        echo(f"\n{CLR_SECTION}[SELL ARTIFACTS]{CLR_RESET}")
 
         # Display artifacts
         for i, artifact in enumerate(self.player.inventory.artifacts, 1):
             # Selling price is half the original cost
             sell_price = artifact.cost // 2
-            print(
+            echo(
                 f"{i}. {artifact.name} - {artifact.description} (Sell price: {sell_price} credits)")
 
-        print(f"{len(self.player.inventory.artifacts) + 1}. Cancel")
+        echo(f"{len(self.player.inventory.artifacts) + 1}. Cancel")
 
         choice = get_valid_input("Select an artifact to sell: ",
                                  range(1, len(self.player.inventory.artifacts) + 2))
@@ -2349,7 +2654,7 @@ class Game:
             return
 
         # Sell the artifact
-        self.player.inventory.artifacts.pop(choice - 1)
+        self.player.inventory.discard_artifact(selected_artifact)
         self.player.cloud_credits += sell_price
 
         display_notification(
@@ -2360,19 +2665,19 @@ class Game:
     def sell_services(self, vendor) -> None:
         """Sell services to a vendor."""
         if not self.player.inventory.services:
-            print(f"{CLR_ERROR}You don't have any services to sell.{CLR_RESET}")
+            echo(f"{CLR_ERROR}You don't have any services to sell.{CLR_RESET}")
             return
 
-        print(f"\n{CLR_SECTION}[SELL SERVICES]{CLR_RESET}")
+        echo(f"\n{CLR_SECTION}[SELL SERVICES]{CLR_RESET}")
 
         # Display services
         for i, service in enumerate(self.player.inventory.services, 1):
             # Selling price is half the deploy cost
             sell_price = service.deploy_cost
-            print(
+            echo(
                 f"{i}. {service.name} - {service.description} (Sell price: {sell_price} credits)")
 
-        print(f"{len(self.player.inventory.services) + 1}. Cancel")
+        echo(f"{len(self.player.inventory.services) + 1}. Cancel")
 
         choice = get_valid_input("Select a service to sell: ",
                                  range(1, len(self.player.inventory.services) + 2))
@@ -2389,7 +2694,7 @@ class Game:
             return
 
         # Sell the service
-        self.player.inventory.services.pop(choice - 1)
+        self.player.inventory.discard_service(selected_service)
         self.player.cloud_credits += sell_price
 
         display_notification(
@@ -2397,26 +2702,220 @@ class Game:
             "success"
         )
 
+    def _status_effect_templates(self) -> Dict[str, Dict[str, Any]]:
+        """Status effects by name, used to restore their callbacks on load."""
+        return {**self.catalogue.status_effects, **self.STATUS_EFFECTS}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Capture the full game state as plain values.
+
+        Static content (location descriptions, quest rewards, vendor stock,
+        ...) is not included; it comes from the content catalogue. Only
+        locations, quests and events the game has created are saved, the
+        others are still in their initial state.
+
+        Returns:
+            A dict of plain values that ``restore`` and ``savegame.packb``
+            accept. It shares containers with the live game, so encode it
+            before the game moves on
+        """
+        cooldowns = self.event_scheduler.cooldowns()
+        return {
+            "seed": self.seed,
+            "rng": dump_random_state(self.rng),
+            "fleet_rng": self.fleet.rng.bit_generator.state if self.fleet else None,
+            "weather_rng": dump_random_state(self.weather.rng),
+            "difficulty": self.difficulty,
+            "current_day": self.current_day,
+            "game_over": self.game_over,
+            "game_won": self.game_won,
+            "win_reason": self.win_reason,
+            "discovered_locations": self.discovered_locations,
+            "global_events": self.global_events,
+            "player": dump_player(self.player) if self.player else None,
+            "locations": {
+                name: {
+                    "visited": location.visited,
+                    "connections": location.connections,
+                    "secrets": location.discovered_secrets,
+                    "areas": location.unlocked_areas,
+                    "reputation": location.local_reputation,
+                }
+                for name, location in self.locations.loaded().items()
+            },
+            "weather": self.weather.dump(),
+            # Quest ID -> IDs of its completed objectives
+            "quests": {
+                quest_id: [obj["id"] for obj in quest.objectives if obj["completed"]]
+                for quest_id, quest in self.quests.loaded().items()
+                if any(obj["completed"] for obj in quest.objectives)
+            },
+            # Event ID -> [has occurred, turns of cooldown left]
+            "events": {
+                event_id: [event.has_occurred, cooldowns.get(event_id, 0)]
+                for event_id, event in self.events.loaded().items()
+                if event.has_occurred or event_id in cooldowns
+            },
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Replace the game state with a snapshot taken by ``snapshot``.
+
+        Args:
+            state: Output of ``snapshot``, possibly after a round trip
+                through a save file
+
+        Raises:
+            SaveGameError: If the snapshot is missing required fields or
+                holds values that cannot be loaded; the game is left as it was
+        """
+        try:
+            self._restore(state)
+        except (AttributeError, KeyError, TypeError, ValueError, IndexError) as e:
+            raise SaveGameError(f"Incomplete or corrupt save: {e!r}") from e
+
+    def _restore(self, state: Dict[str, Any]) -> None:
+        # The save is decoded into new objects, and the game only takes them
+        # once all of it has been read: a corrupt save leaves the game as it was
+        rng = random.Random()
+        load_random_state(rng, state["rng"])
+        weather_rng = random.Random()
+        if "weather_rng" in state:
+            load_random_state(weather_rng, state["weather_rng"])
+        else:  # Saves made before weather had its own generator
+            weather_rng.setstate(self.weather.rng.getstate())
+        seed = state["seed"]
+        difficulty = state["difficulty"]
+        current_day = state["current_day"]
+        game_over, game_won = state["game_over"], state["game_won"]
+        win_reason = state["win_reason"]
+        discovered_locations = set(state["discovered_locations"])
+        global_events = list(state["global_events"])
+
+        # Start from untouched content, then apply what the save changed
+        locations, quests, events, event_scheduler, quest_tracker = self._new_world()
+        routes = []  # Connections discovered during the saved game
+        for name, saved in state["locations"].items():
+            location = locations[name]
+            location.visited = saved["visited"]
+            if location.connections != saved["connections"]:
+                location.connections = saved["connections"]
+                routes.extend((name, connection) for connection in location.connections)
+            if saved["secrets"]:
+                location.discovered_secrets = set(saved["secrets"])
+            if saved["areas"]:
+                location.unlocked_areas = set(saved["areas"])
+            location.local_reputation = saved["reputation"]
+        graph = self.catalogue.graph.with_edges(routes)
+
+        weather = WeatherEngine(self.catalogue.weather, self.catalogue.locations, weather_rng)
+        weather.load(state["weather"])
+
+        for quest_id, completed in state["quests"].items():
+            for obj in quests[quest_id].objectives:
+                obj["completed"] = obj["id"] in completed
+
+        for event_id, (has_occurred, cooldown) in state["events"].items():
+            event = events[event_id]
+            event.has_occurred, event.cooldown = has_occurred, cooldown
+        event_scheduler.restore(events.loaded().values())
+
+        player = None
+        if state["player"] is not None:
+            player = load_player(state["player"], locations, self._status_effect_templates())
+            quest_tracker.attach(player)
+
+        fleet = None
+        if state["fleet_rng"] is not None and HAS_NUMPY and player:
+            fleet = ServiceFleet()
+            fleet.rng.bit_generator.state = state["fleet_rng"]
+            fleet.sync(player.inventory.deployed_services)
+
+        # Everything was read; nothing below can fail
+        if self.fleet is not None:
+            self.fleet.detach_all()
+        self.fleet = fleet
+        self.seed = seed
+        # The game keeps its generator objects (the profiler may be counting their draws)
+        self.rng.setstate(rng.getstate())
+        weather.rng = self.weather.rng
+        weather.rng.setstate(weather_rng.getstate())
+        self.weather = weather
+        self._rolls_ahead = []
+        self.difficulty = difficulty
+        self.current_day = current_day
+        self.game_over, self.game_won = game_over, game_won
+        self.win_reason = win_reason
+        self.discovered_locations = discovered_locations
+        self.global_events = global_events
+        self.locations, self.quests, self.events = locations, quests, events
+        self.event_scheduler, self.quest_tracker = event_scheduler, quest_tracker
+        self.graph = graph
+        self.player = player
+
+    def save_game(self, path: str, compress: bool = True) -> int:
+        """Write the game to a save file.
+
+        Args:
+            path: File to write
+            compress: Compress the snapshot with zlib
+
+        Returns:
+            Size of the save file in bytes
+        """
+        return write_save(path, self.snapshot(), compress)
+
+    def load_game(self, path: str) -> None:
+        """Replace the game state with the contents of a save file.
+
+        Raises:
+            SaveGameError: If the file is not a valid save
+            OSError: If the file cannot be read
+        """
+        self.restore(read_save(path))
+
+    def _prompt_save_slot(self) -> str:
+        slot = prompt("Save slot name (blank for quicksave): ").strip()
+        return save_path(slot or "quicksave")
+
     def system_menu(self) -> None:
         """Display system menu for game options."""
         while True:
-            print(f"\n{CLR_SECTION}[SYSTEM MENU]{CLR_RESET}")
-            print("1. Save Game")
-            print("2. Load Game")
-            print("3. Game Options")
-            print("4. View Help")
-            print("5. Credits")
-            print("6. Quit Game")
-            print("7. Return to Game")
-
-            choice = get_valid_input("Enter your choice: ", range(1, 8))
-
-            if choice == 1:
-                print("Save game functionality not implemented in this version.")
-                input("\nPress Enter to continue...")
+            echo(f"\n{CLR_SECTION}[SYSTEM MENU]{CLR_RESET}")
+            echo("1. Save Game")
+            echo("2. Load Game")
+            echo("3. Game Options")
+            echo("4. View Help")
+            echo("5. Credits")
+            echo("6. Quit Game")
+            echo("7. Return to Game")
+            if self.profiler:
+                echo("8. Profiler")
+
+            choice = get_valid_input("Enter your choice: ", range(1, 9 if self.profiler else 8))
+
+            if choice in (1, 2) and not self.io.local_files:
+                echo(f"{CLR_WARNING}Saves are not available in online games.{CLR_RESET}")
+                prompt("\nPress Enter to continue...")
+            elif choice == 1:
+                path = self._prompt_save_slot()
+                try:
+                    size = self.save_game(path)
+                    echo(f"{CLR_SUCCESS}Game saved to {path} ({size} bytes).{CLR_RESET}")
+                except (OSError, SaveGameError) as e:
+                    echo(f"{CLR_ERROR}Could not save the game: {e}{CLR_RESET}")
+                prompt("\nPress Enter to continue...")
             elif choice == 2:
-                print("Load game functionality not implemented in this version.")
-                input("\nPress Enter to continue...")
+                path = self._prompt_save_slot()
+                if not os.path.exists(path):
+                    echo(f"{CLR_WARNING}No save found at {path}.{CLR_RESET}")
+                elif confirm_action("Load this save? All unsaved progress will be lost."):
+                    try:
+                        self.load_game(path)
+                        echo(f"{CLR_SUCCESS}Game loaded. Day {self.current_day}.{CLR_RESET}")
+                    except (OSError, SaveGameError) as e:
+                        echo(f"{CLR_ERROR}Could not load the game: {e}{CLR_RESET}")
+                prompt("\nPress Enter to continue...")
             elif choice == 3:
                 self.game_options()
             elif choice == 4:
@@ -2430,21 +2929,71 @@ class Game:
                     return
             elif choice == 7:
                 return
+            elif choice == 8:
+                self.profiler_menu()
+
+    def profiler_menu(self) -> None:
+        """Show the turn profiler's timings and export them (debug mode only)."""
+        profiler = self.profiler
+        echo(f"\n{CLR_SECTION}[PROFILER]{CLR_RESET}")
+        echo(profiler.format_report())
+        echo("\n1. Export timings (JSON)")
+        echo("2. Export timings (CSV)")
+        echo(f"3. {'Stop cProfile capture and save it' if profiler.capturing else 'Start cProfile capture'}")
+        echo("4. Reset timings")
+        echo("5. Return")
+
+        choice = get_valid_input("Enter your choice: ", range(1, 6))
+
+        try:
+            if choice in (1, 2, 3) and not self.io.local_files:
+                echo(f"{CLR_WARNING}Profiles cannot be written in online games.{CLR_RESET}")
+            elif choice in (1, 2):
+                path = profile_path("turns", ".json" if choice == 1 else ".csv")
+                profiler.export(path)
+                echo(f"{CLR_SUCCESS}Timings written to {path}.{CLR_RESET}")
+            elif choice == 3:
+                if profiler.capturing:
+                    path = profile_path("cprofile", ".prof")
+                    profiler.stop_capture(path)
+                    echo(f"{CLR_SUCCESS}cProfile stats written to {path}.{CLR_RESET}")
+                else:
+                    profiler.start_capture()
+                    echo("cProfile capture started. Return here to stop it and save the stats.")
+            elif choice == 4:
+                profiler.reset()
+                echo("Timings reset.")
+            else:
+                return
+        except OSError as e:
+            echo(f"{CLR_ERROR}Could not write the profile: {e}{CLR_RESET}")
+        prompt("\nPress Enter to continue...")
+
+    def set_debug_mode(self, enabled: bool) -> None:
+        """Turn debug mode, and with it the turn profiler, on or off."""
+        self.debug_mode = enabled
+        if enabled and self.profiler is None:
+            self.profiler = TurnProfiler()
+            self.profiler.attach(self)
+        elif not enabled and self.profiler is not None:
+            self.profiler.detach()
+            self.profiler = None
 
     def game_options(self) -> None:
         """Display game options menu."""
-        print(f"\n{CLR_SECTION}[GAME OPTIONS]{CLR_RESET}")
-        print(f"1. Difficulty: {self.difficulty.capitalize()}")
-        print("2. Toggle Debug Mode")
-        print("3. Return")
+        echo(f"\n{CLR_SECTION}[GAME OPTIONS]{CLR_RESET}")
+        echo(f"1. Difficulty: {self.difficulty.capitalize()}")
+        echo("2. Toggle Debug Mode")
+        echo(f"3. Render Speed: {get_render_profile(self.io).capitalize()}")
+        echo("4. Return")
 
-        choice = get_valid_input("Enter your choice: ", range(1, 4))
+        choice = get_valid_input("Enter your choice: ", range(1, 5))
 
         if choice == 1:
-            print("\nSelect difficulty:")
-            print("1. Easy")
-            print("2. Normal")
-            print("3. Hard")
+            echo("\nSelect difficulty:")
+            echo("1. Easy")
+            echo("2. Normal")
+            echo("3. Hard")
 
             diff_choice = get_valid_input("Enter your choice: ", range(1, 4))
 
@@ -2455,17 +3004,30 @@ class Game:
             elif diff_choice == 3:
                 self.difficulty = "hard"
 
-            print(f"Difficulty set to {self.difficulty.capitalize()}.")
+            echo(f"Difficulty set to {self.difficulty.capitalize()}.")
         elif choice == 2:
-            self.debug_mode = not self.debug_mode
+            self.set_debug_mode(not self.debug_mode)
             status = "enabled" if self.debug_mode else "disabled"
-            print(f"Debug mode {status}.")
+            echo(f"Debug mode {status}.")
+            if self.debug_mode:
+                for warning in self.content_warnings:
+                    display_notification(f"Content: {warning}", "warning")
+        elif choice == 3:
+            echo("\nSelect render speed:")
+            profiles = list(RENDER_PROFILES)
+            for i, name in enumerate(profiles, 1):
+                echo(f"{i}. {name.capitalize()}")
+
+            profile_choice = get_valid_input(
+                "Enter your choice: ", range(1, len(profiles) + 1))
+            set_render_profile(profiles[profile_choice - 1], self.io)
+            echo(f"Render speed set to {get_render_profile(self.io).capitalize()}.")
 
-        input("\nPress Enter to continue...")
+        prompt("\nPress Enter to continue...")
 
     def view_help(self) -> None:
         """Display help information."""
-        print(f"\n{CLR_SECTION}[HELP]{CLR_RESET}")
+        echo(f"\n{CLR_SECTION}[HELP]{CLR_RESET}")
 
         help_topics = [
             "1. Basic Controls",
@@ -2476,57 +3038,57 @@ class Game:
         ]
 
         for topic in help_topics:
-            print(topic)
+            echo(topic)
 
         choice = get_valid_input(
             "Select a topic: ", range(1, len(help_topics) + 1))
 
         if choice == 1:
-            print(f"\n{CLR_CYAN}Basic Controls:{CLR_RESET}")
-            print("- Use number keys to navigate menus and make choices.")
-            print("- Explore locations to find resources and advance the story.")
-            print("- Travel between locations to discover new areas.")
-            print("- Manage your services to generate income.")
-            print("- Use artifacts to gain advantages and uncover secrets.")
-            print("- Complete quests to gain rewards and advance the storyline.")
+            echo(f"\n{CLR_CYAN}Basic Controls:{CLR_RESET}")
+            echo("- Use number keys to navigate menus and make choices.")
+            echo("- Explore locations to find resources and advance the story.")
+            echo("- Travel between locations to discover new areas.")
+            echo("- Manage your services to generate income.")
+            echo("- Use artifacts to gain advantages and uncover secrets.")
+            echo("- Complete quests to gain rewards and advance the storyline.")
         elif choice == 2:
-            print(f"\n{CLR_CYAN}Combat:{CLR_RESET}")
-            print("- Combat occurs when facing digital threats or hostile entities.")
-            print("- Use your artifacts as weapons and defenses.")
-            print("- Different threats are vulnerable to different artifacts.")
-            print("- Your skills affect your combat effectiveness.")
-            print(
+            echo(f"\n{CLR_CYAN}Combat:{CLR_RESET}")
+            echo("- Combat occurs when facing digital threats or hostile entities.")
+            echo("- Use your artifacts as weapons and defenses.")
+            echo("- Different threats are vulnerable to different artifacts.")
+            echo("- Your skills affect your combat effectiveness.")
+            echo(
                 "- Health is depleted during combat - restore it by resting or using items.")
         elif choice == 3:
-            print(f"\n{CLR_CYAN}Services & Artifacts:{CLR_RESET}")
-            print("- Services generate passive income when deployed.")
-            print("- Services can be damaged and require maintenance.")
-            print("- Artifacts are tools that provide special abilities.")
-            print("- Artifacts have cooldowns after use.")
-            print("- Some artifacts can be upgraded to increase their effectiveness.")
+            echo(f"\n{CLR_CYAN}Services & Artifacts:{CLR_RESET}")
+            echo("- Services generate passive income when deployed.")
+            echo("- Services can be damaged and require maintenance.")
+            echo("- Artifacts are tools that provide special abilities.")
+            echo("- Artifacts have cooldowns after use.")
+            echo("- Some artifacts can be upgraded to increase their effectiveness.")
         elif choice == 4:
-            print(f"\n{CLR_CYAN}Factions & Reputation:{CLR_RESET}")
-            print("- CorpSec: Corporate security forces maintaining order.")
-            print("- DataBrokers: Information traders and database specialists.")
-            print(
+            echo(f"\n{CLR_CYAN}Factions & Reputation:{CLR_RESET}")
+            echo("- CorpSec: Corporate security forces maintaining order.")
+            echo("- DataBrokers: Information traders and database specialists.")
+            echo(
                 "- ServerlessCollective: Progressive cloud engineers focused on serverless tech.")
-            print(
+            echo(
                 "- ShadowNetwork: Underground network of hackers with mysterious motives.")
-            print("- Higher reputation grants access to better quests and vendors.")
+            echo("- Higher reputation grants access to better quests and vendors.")
 
-        input("\nPress Enter to continue...")
+        prompt("\nPress Enter to continue...")
 
     def show_credits(self) -> None:
         """Show game credits."""
-        print(f"\n{CLR_SECTION}[CREDITS]{CLR_RESET}")
-        print("Cloud Ranger: Digital Frontier")
-        print("\nDeveloped by:")
-        print("- Python Gaming Studio")
-        print("\nSpecial thanks to:")
-        print("- AWS for cloud inspiration")
-        print("- Text-based adventure games everywhere")
+        echo(f"\n{CLR_SECTION}[CREDITS]{CLR_RESET}")
+        echo("Cloud Ranger: Digital Frontier")
+        echo("\nDeveloped by:")
+        echo("- Python Gaming Studio")
+        echo("\nSpecial thanks to:")
+        echo("- AWS for cloud inspiration")
+        echo("- Text-based adventure games everywhere")
 
-        input("\nPress Enter to continue...")
+        prompt("\nPress Enter to continue...")
 
     def check_events(self) -> bool:
         """Check for events at the current location.
@@ -2537,17 +3099,22 @@ class Game:
         if not self.player or not self.player.current_location:
             return False
 
-        # Get events that could trigger
-        triggerable_events = []
-        for event_id, event in self.events.items():
-            if event.can_trigger(self.player):
-                triggerable_events.append(event)
+        # DAILY_EVENT_CHANCE% chance for an event; rolled first so quiet turns cost nothing
+        if self._percent_roll() > DAILY_EVENT_CHANCE:
+            return False
+
+        # Get events that could trigger here
+        triggerable_events = [
+            event for event in self.event_scheduler.candidates(
+                self.player, self.player.current_location.name)
+            if event.roll(self.rng)
+        ]
 
         # Randomly trigger one event if available
-        # 30% chance for an event
-        if triggerable_events and random.randint(1, 100) <= 30:
-            event = random.choice(triggerable_events)
-            event.trigger(self.player)
+        if triggerable_events:
+            event = self.rng.choice(triggerable_events)
+            event.trigger(self.player, self.rng)
+            self.event_scheduler.fired(event)
             return True
 
         return False
@@ -2600,47 +3167,47 @@ class Game:
 
         if self.game_won:
             # Victory screen
-            print(
+            echo(
                 f"\n{CLR_SUCCESS}╔══════════════════════════════════════════════════════════╗{CLR_RESET}")
-            print(
+            echo(
                 f"{CLR_SUCCESS}║                       VICTORY!                           ║{CLR_RESET}")
-            print(
+            echo(
                 f"{CLR_SUCCESS}╚══════════════════════════════════════════════════════════╝{CLR_RESET}")
         else:
             # Game over screen
-            print(
+            echo(
                 f"\n{CLR_ERROR}╔══════════════════════════════════════════════════════════╗{CLR_RESET}")
-            print(
+            echo(
                 f"{CLR_ERROR}║                      GAME OVER                           ║{CLR_RESET}")
-            print(
+            echo(
                 f"{CLR_ERROR}╚══════════════════════════════════════════════════════════╝{CLR_RESET}")
 
-        print(f"\n{self.win_reason}")
+        echo(f"\n{self.win_reason}")
 
         # Display final stats if player exists
         if self.player:
-            print(f"\n{CLR_SECTION}[FINAL STATS]{CLR_RESET}")
-            print(f"Days Played: {self.current_day}")
-            print(f"Final Cloud Credits: {self.player.cloud_credits}")
-            print(
+            echo(f"\n{CLR_SECTION}[FINAL STATS]{CLR_RESET}")
+            echo(f"Days Played: {self.current_day}")
+            echo(f"Final Cloud Credits: {self.player.cloud_credits}")
+            echo(
                 f"Deployed Services: {len(self.player.inventory.deployed_services)}")
-            print(
+            echo(
                 f"Artifacts Collected: {len(self.player.inventory.artifacts)}")
-            print(f"Quests Completed: {len(self.player.completed_quests)}")
-            print(f"Locations Discovered: {len(self.discovered_locations)}")
+            echo(f"Quests Completed: {len(self.player.completed_quests)}")
+            echo(f"Locations Discovered: {len(self.discovered_locations)}")
 
             # Display skill levels
-            print(f"\n{CLR_SECTION}[FINAL SKILLS]{CLR_RESET}")
+            echo(f"\n{CLR_SECTION}[FINAL SKILLS]{CLR_RESET}")
             for skill, level in self.player.skills.items():
                 stars = '★' * level + '☆' * (10 - level)
-                print(f"{skill.capitalize()}: {stars}")
+                echo(f"{skill.capitalize()}: {stars}")
 
             # Display faction reputations
-            print(f"\n{CLR_SECTION}[FACTION STANDINGS]{CLR_RESET}")
+            echo(f"\n{CLR_SECTION}[FACTION STANDINGS]{CLR_RESET}")
             for faction, rep in self.player.faction_reputation.items():
                 standing = "Allied" if rep >= 75 else "Friendly" if rep >= 50 else "Neutral" if rep >= 25 else "Hostile"
-                print(f"{faction}: {rep}/100 ({standing})")
+                echo(f"{faction}: {rep}/100 ({standing})")
 
-        print(
+        echo(
             f"\n{CLR_TITLE}Thanks for playing Cloud Ranger: Digital Frontier!{CLR_RESET}")
-        input("\nPress Enter to exit...")
+        prompt("\nPress Enter to exit...")
@@ -0,0 +1,193 @@
+"""
+Location graph for the Neon Shadow game.
+
+Locations are numbered once when content loads and their connections kept as
+adjacency lists of node ids. All-pairs cheapest routes are precomputed, so the
+energy cost of getting anywhere, and the route itself, are table lookups.
+"""
+
+import heapq
+import math
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from neon_shadow.location import Location
+
+
+def travel_energy(from_difficulty: int, to_difficulty: int) -> int:
+    """Return the energy one hop costs between locations of these difficulties."""
+    return max(10, 15 + (to_difficulty - from_difficulty) * 2)
+
+
+class LocationGraph:
+    """Directed graph of locations, weighted by travel energy.
+
+    Routes minimise total energy and, among equally cheap routes, the number
+    of hops. Each distance is stored as ``energy * n + hops`` (``n`` being the
+    number of locations, which bounds the hops of any cheapest route) so one
+    integer comparison settles both.
+
+    Graphs are never modified: ``with_edges`` returns a new one.
+
+    Args:
+        names: Location names; a location's node id is its index here
+        difficulty: Difficulty of each location, by node id
+        adjacency: Node ids each location connects to, by node id
+    """
+
+    __slots__ = ("names", "ids", "difficulty", "adjacency", "broken", "_dist", "_next")
+
+    def __init__(self, names: List[str], difficulty: List[int],
+                 adjacency: List[Tuple[int, ...]]) -> None:
+        self.names = names
+        self.ids: Dict[str, int] = {name: node for node, name in enumerate(names)}
+        self.difficulty = difficulty
+        self.adjacency = adjacency
+        self.broken: List[Tuple[str, str]] = []  # (location, unknown connection)
+        self._solve()
+
+    @classmethod
+    def from_locations(cls, locations: Mapping[str, Location]) -> "LocationGraph":
+        """Build the graph of locations' connections.
+
+        Connections to names that are not locations are left out and listed
+        in ``broken``.
+        """
+        names = list(locations)
+        ids = {name: node for node, name in enumerate(names)}
+        adjacency = []
+        broken = []
+        for name, location in locations.items():
+            targets: List[int] = []
+            for connection in location.connections:
+                node = ids.get(connection)
+                if node is None:
+                    broken.append((name, connection))
+                elif node not in targets:
+                    targets.append(node)
+            adjacency.append(tuple(targets))
+        graph = cls(names, [location.difficulty for location in locations.values()], adjacency)
+        graph.broken = broken
+        return graph
+
+    def with_edges(self, edges: Iterable[Tuple[str, str]]) -> "LocationGraph":
+        """Return this graph plus some connections, or itself if it has them all.
+
+        Args:
+            edges: (from, to) location name pairs; unknown names are ignored
+        """
+        adjacency = list(self.adjacency)
+        for source, target in edges:
+            src, dst = self.ids.get(source), self.ids.get(target)
+            if src is not None and dst is not None and dst not in adjacency[src]:
+                adjacency[src] += (dst,)
+        if adjacency == self.adjacency:
+            return self
+        graph = LocationGraph(self.names, self.difficulty, adjacency)
+        graph.broken = self.broken
+        return graph
+
+    def _weight(self, src: int, dst: int) -> int:
+        return travel_energy(self.difficulty[src], self.difficulty[dst]) * len(self.names) + 1
+
+    def _solve(self) -> None:
+        """Fill the distance and next-hop tables (Floyd-Warshall)."""
+        n = len(self.names)
+        dist = [[math.inf] * n for _ in range(n)]
+        nxt = [[-1] * n for _ in range(n)]
+        for src, targets in enumerate(self.adjacency):
+            dist[src][src] = 0
+            nxt[src][src] = src
+            for dst in targets:
+                if dst != src:
+                    dist[src][dst] = self._weight(src, dst)
+                    nxt[src][dst] = dst
+
+        for k in range(n):
+            dist_k = dist[k]
+            for i in range(n):
+                dist_i = dist[i]
+                dist_ik = dist_i[k]
+                if dist_ik == math.inf:
+                    continue
+                next_i = nxt[i]
+                next_ik = next_i[k]
+                for j in range(n):
+                    d = dist_ik + dist_k[j]
+                    if d < dist_i[j]:
+                        dist_i[j] = d
+                        next_i[j] = next_ik
+        self._dist = dist
+        self._next = nxt
+
+    def neighbours(self, name: str) -> List[str]:
+        """Return the names of the locations directly reachable from name."""
+        return [self.names[node] for node in self.adjacency[self.ids[name]]]
+
+    def cost(self, source: str, target: str) -> Optional[int]:
+        """Return the energy of the cheapest route, or None if there is none."""
+        d = self._dist[self.ids[source]][self.ids[target]]
+        return None if d == math.inf else d // len(self.names)
+
+    def hops(self, source: str, target: str) -> Optional[int]:
+        """Return the number of hops on the cheapest route, or None if there is none."""
+        d = self._dist[self.ids[source]][self.ids[target]]
+        return None if d == math.inf else d % len(self.names)
+
+    def route(self, source: str, target: str,
+              max_difficulty: Optional[int] = None) -> Optional[List[str]]:
+        """Return the cheapest route between two locations.
+
+        Args:
+            source: Starting location name
+            target: Destination name
+            max_difficulty: If given, the route may only enter locations of at
+                most this difficulty
+
+        Returns:
+            Location names from source to target inclusive, or None if no
+            route exists
+        """
+        src, dst = self.ids[source], self.ids[target]
+        nxt = self._next
+        if nxt[src][dst] < 0:
+            return None
+        path = [src]
+        while path[-1] != dst:
+            path.append(nxt[path[-1]][dst])
+
+        if max_difficulty is not None and any(
+                self.difficulty[node] > max_difficulty for node in path[1:]):
+            path = self._bounded_route(src, dst, max_difficulty)
+            if path is None:
+                return None
+        return [self.names[node] for node in path]
+
+    def _bounded_route(self, src: int, dst: int, max_difficulty: int) -> Optional[List[int]]:
+        """Dijkstra over the locations of at most max_difficulty."""
+        best = {src: 0}
+        previous: Dict[int, int] = {}
+        heap = [(0, src)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            if node == dst:
+                path = [dst]
+                while path[-1] != src:
+                    path.append(previous[path[-1]])
+                return path[::-1]
+            if d > best[node]:
+                continue
+            for target in self.adjacency[node]:
+                if self.difficulty[target] > max_difficulty:
+                    continue
+                candidate = d + self._weight(node, target)
+                if candidate < best.get(target, math.inf):
+                    best[target] = candidate
+                    previous[target] = node
+                    heapq.heappush(heap, (candidate, target))
+        return None
+
+    def route_cost(self, route: List[str]) -> int:
+        """Return the total travel energy of a route of location names."""
+        difficulty, ids = self.difficulty, self.ids
+        return sum(travel_energy(difficulty[ids[a]], difficulty[ids[b]])
+                   for a, b in zip(route, route[1:]))
@@ -4,11 +4,50 @@ Inventory class for the Neon Shadow game.
 
 from typing import List, Dict
 from .constants import *
-from .utils import display_notification
+from .utils import display_notification, echo
+from .signals import Signal
+
+
+def _index_add(index, key, obj):
+    """Add obj under key in a name -> objects index."""
+    bucket = index.get(key)
+    if bucket is None:
+        index[key] = [obj]
+    else:
+        bucket.append(obj)
+
+
+def _index_remove(index, key, obj):
+    """Remove obj from a name -> objects index."""
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    for i, item in enumerate(bucket):
+        if item is obj:
+            del bucket[i]
+            break
+    if not bucket:
+        del index[key]
+
+
+def _remove_identical(items, obj):
+    """Remove the exact object obj from a list."""
+    for i, item in enumerate(items):
+        if item is obj:
+            del items[i]
+            return
 
 
 class Inventory:
-    """Handles the player's inventory of artifacts and cloud services."""
+    """Handles the player's inventory of artifacts and cloud services.
+
+    The artifact, service and deployed service lists keep their order for
+    display. They are also indexed by name, and deployed services by instance
+    ID, so lookups do not scan the lists. Always change the contents through
+    the methods below so the indexes stay in step and ``changed`` emits
+    ("artifact", name) or ("deployed", name) for every artifact or deployed
+    service added or removed.
+    """
 
     def __init__(self):
         self.artifacts = []
@@ -18,127 +57,154 @@ class Inventory:
         self.max_artifacts = 10
         self.max_services = 5
         self.consumables = {}  # Dictionary of consumable items with counts
+        self._artifacts_by_name = {}
+        self._services_by_name = {}
+        self._deployed_by_name = {}
+        self._deployed_by_id = {}
+        self.changed = Signal()
 
     def add_artifact(self, artifact):
         """Add an artifact to inventory if there's space."""
         if len(self.artifacts) < self.max_artifacts:
             self.artifacts.append(artifact)
+            _index_add(self._artifacts_by_name, artifact.name, artifact)
+            self.changed.emit("artifact", artifact.name)
             return True
         return False
 
     def remove_artifact(self, artifact_name):
         """Remove an artifact by name."""
-        for i, art in enumerate(self.artifacts):
-            if art.name == artifact_name:
-                return self.artifacts.pop(i)
-        return None
+        artifact = self.get_artifact(artifact_name)
+        if artifact is not None:
+            self.discard_artifact(artifact)
+        return artifact
+
+    def discard_artifact(self, artifact):
+        """Remove this exact artifact object."""
+        _remove_identical(self.artifacts, artifact)
+        _index_remove(self._artifacts_by_name, artifact.name, artifact)
+        self.changed.emit("artifact", artifact.name)
 
     def get_artifact(self, artifact_name):
         """Get an artifact by name."""
-        for art in self.artifacts:
-            if art.name == artifact_name:
-                return art
-        return None
+        bucket = self._artifacts_by_name.get(artifact_name)
+        return bucket[0] if bucket else None
 
     def has_artifact(self, artifact_name):
         """Check if player has an artifact."""
-        return any(art.name == artifact_name for art in self.artifacts)
+        return artifact_name in self._artifacts_by_name
 
     def add_service(self, service):
         """Add a service to inventory if there's space."""
         if len(self.services) < self.max_services:
             self.services.append(service)
+            _index_add(self._services_by_name, service.name, service)
             return True
         return False
 
     def remove_service(self, service_name):
         """Remove a service by name."""
-        for i, svc in enumerate(self.services):
-            if svc.name == service_name:
-                return self.services.pop(i)
-        return None
+        service = self.get_service(service_name)
+        if service is not None:
+            self.discard_service(service)
+        return service
+
+    def discard_service(self, service):
+        """Remove this exact service blueprint object."""
+        _remove_identical(self.services, service)
+        _index_remove(self._services_by_name, service.name, service)
 
     def get_service(self, service_name):
         """Get a service by name."""
-        for svc in self.services:
-            if svc.name == service_name:
-                return svc
-        return None
+        bucket = self._services_by_name.get(service_name)
+        return bucket[0] if bucket else None
 
     def has_service(self, service_name):
         """Check if player has a service."""
-        return any(svc.name == service_name for svc in self.services)
+        return service_name in self._services_by_name
 
     def display(self):
         """Display the inventory contents."""
-        print(f"\n{CLR_BRIGHT}{CLR_CYAN}══════ INVENTORY ══════{CLR_RESET}")
-        print(f"{CLR_CREDITS}Cloud Credits: {self.cloud_credits}{CLR_RESET}")
+        echo(f"\n{CLR_BRIGHT}{CLR_CYAN}══════ INVENTORY ══════{CLR_RESET}")
+        echo(f"{CLR_CREDITS}Cloud Credits: {self.cloud_credits}{CLR_RESET}")
 
-        print(
+        echo(
             f"\n{CLR_ARTIFACT}Artifacts ({len(self.artifacts)}/{self.max_artifacts}):{CLR_RESET}")
         if self.artifacts:
             for idx, artifact in enumerate(self.artifacts, 1):
                 cooldown_status = f" [COOLDOWN: {artifact.cooldown}]" if artifact.cooldown > 0 else ""
-                print(f"{idx}. {artifact} - {artifact.description}{cooldown_status}")
+                echo(f"{idx}. {artifact} - {artifact.description}{cooldown_status}")
         else:
-            print("No artifacts in inventory.")
+            echo("No artifacts in inventory.")
 
-        print(
+        echo(
             f"\n{CLR_CLOUD_SERVICE}Cloud Services ({len(self.services)}/{self.max_services}):{CLR_RESET}")
         if self.services:
             for idx, service in enumerate(self.services, 1):
-                print(f"{idx}. {service.name} - {service.description}")
+                echo(f"{idx}. {service.name} - {service.description}")
         else:
-            print("No cloud services in inventory.")
+            echo("No cloud services in inventory.")
 
-        print(f"\n{CLR_CLOUD_SERVICE}Deployed Services:{CLR_RESET}")
+        echo(f"\n{CLR_CLOUD_SERVICE}Deployed Services:{CLR_RESET}")
         if self.deployed_services:
             for idx, service in enumerate(self.deployed_services, 1):
                 status = f"{CLR_GREEN}ONLINE{CLR_RESET}" if service.is_deployed else f"{CLR_RED}OFFLINE{CLR_RESET}"
-                print(f"{idx}. {service.name} ({service.instance_id}) - {status}")
+                echo(f"{idx}. {service.name} ({service.instance_id}) - {status}")
                 if service.is_deployed:
-                    print(f"   Region: {service.deployment_region}")
-                    print(
+                    echo(f"   Region: {service.deployment_region}")
+                    echo(
                         f"   Health: {service.health}% | Security: {service.security_level}/10 | Performance: {service.performance}/10")
-                    print(
+                    echo(
                         f"   Revenue: {service.calculate_revenue():.2f} credits/hour | Uptime: {service.uptime_days} days")
                     if service.status_effects:
                         effects = ", ".join(
                             [f"{e['name']} ({e['duration']})" for e in service.status_effects])
-                        print(f"   Status Effects: {effects}")
+                        echo(f"   Status Effects: {effects}")
         else:
-            print("No deployed services.")
+            echo("No deployed services.")
 
         # Display consumables if any
         if self.consumables:
-            print(f"\n{CLR_ARTIFACT}Consumables:{CLR_RESET}")
+            echo(f"\n{CLR_ARTIFACT}Consumables:{CLR_RESET}")
             for item_name, count in self.consumables.items():
-                print(f"• {item_name} x{count}")
+                echo(f"• {item_name} x{count}")
 
     def remove_deployed_service(self, instance_id):
         """Remove a deployed service by its instance ID."""
-        for i, service in enumerate(self.deployed_services):
-            if service.instance_id == instance_id:
-                removed = self.deployed_services.pop(i)
-                display_notification(
-                    f"Service {removed.name} ({instance_id}) has been removed.", "warning")
-                return removed
-        return None
+        removed = self._deployed_by_id.pop(instance_id, None)
+        if removed is None:
+            return None
+        _remove_identical(self.deployed_services, removed)
+        _index_remove(self._deployed_by_name, removed.name, removed)
+        self.changed.emit("deployed", removed.name)
+        display_notification(
+            f"Service {removed.name} ({instance_id}) has been removed.", "warning")
+        return removed
 
     def get_deployed_service(self, instance_id):
         """Get a deployed service by its instance ID."""
-        for service in self.deployed_services:
-            if service.instance_id == instance_id:
-                return service
-        return None
+        return self._deployed_by_id.get(instance_id)
 
     def add_deployed_service(self, service):
         """Add a service to deployed services."""
-        if service not in self.deployed_services:
+        if self._deployed_by_id.get(service.instance_id) is not service:
             self.deployed_services.append(service)
+            self._deployed_by_id[service.instance_id] = service
+            _index_add(self._deployed_by_name, service.name, service)
+            self.changed.emit("deployed", service.name)
             return True
         return False
 
+    def has_deployed_service(self, service_name):
+        """Check if a service with this name is deployed and online."""
+        return any(service.is_deployed for service in self._deployed_by_name.get(service_name, ()))
+
+    def count_deployed(self, service_name=None):
+        """Count deployed instances of a service, or of all services if no name is given."""
+        if service_name is None:
+            return len(self.deployed_services)
+        return len(self._deployed_by_name.get(service_name, ()))
+
     def add_consumable(self, item_name, count=1):
         """Add consumable items to inventory."""
         if item_name in self.consumables:
@@ -156,7 +222,7 @@ class Inventory:
             return True
         return False
 
-    def update_all_artifacts(self):
-        """Update cooldowns for all artifacts."""
+    def update_all_artifacts(self, days=1):
+        """Update cooldowns for all artifacts by some days."""
         for artifact in self.artifacts:
-            artifact.update_cooldown()
+            artifact.update_cooldown(days)
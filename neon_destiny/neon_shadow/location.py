@@ -1,15 +1,24 @@
 from typing import Dict, List, Set, Union, Optional, Any
 
+from neon_shadow.ansi import StyledText
 from neon_shadow.constants import (
-    CLR_LOCATION_NAME, CLR_LOCATION_DESC, CLR_RESET,
+    CLR_LOCATION_NAME, CLR_LOCATION_DESC,
     CLR_INTERACTION, CLR_HAZARD, CLR_CLOUD_SERVICE
 )
-from neon_shadow.ui import display_notification
+from neon_shadow.ui import display_notification, echo
+
+# Shared empty containers; a location only allocates its own on first use
+_NO_ITEMS: tuple = ()
+_NO_IDS: frozenset = frozenset()
 
 
 class Location:
     """Represents a location in the game world."""
 
+    __slots__ = ("name", "description", "region", "connections", "events", "services",
+                 "difficulty", "visited", "discovered_secrets", "unlocked_areas",
+                 "hazards", "vendors", "local_reputation")
+
     def __init__(self, name: str, description: str, region: Optional[str] = None,
                  connections: Optional[List[str]] = None,
                  events: Optional[List[str]] = None,
@@ -30,14 +39,14 @@ class Location:
         self.description = description
         self.region = region
         self.connections = connections if connections else []
-        self.events = events if events else []
-        self.services = services if services else []
+        self.events = events if events else _NO_ITEMS
+        self.services = services if services else _NO_ITEMS
         self.difficulty = difficulty
         self.visited = False
-        self.discovered_secrets: Set[str] = set()
-        self.unlocked_areas: Set[str] = set()
-        self.hazards: List[Dict[str, Any]] = []
-        self.vendors: List[Dict[str, Any]] = []
+        self.discovered_secrets: Set[str] = _NO_IDS
+        self.unlocked_areas: Set[str] = _NO_IDS
+        self.hazards: List[Dict[str, Any]] = _NO_ITEMS
+        self.vendors: List[Dict[str, Any]] = _NO_ITEMS
         self.local_reputation = 0  # Location-specific reputation (0-100)
 
     def __str__(self) -> str:
@@ -45,35 +54,36 @@ class Location:
 
     def display(self) -> None:
         """Display location details."""
+        text = StyledText().line()
         if not self.visited:
             self.visited = True
-            print(
-                f"\n{CLR_LOCATION_NAME}[ NEW LOCATION DISCOVERED: {self.name} ]{CLR_RESET}")
+            text.line(f"[ NEW LOCATION DISCOVERED: {self.name} ]", CLR_LOCATION_NAME)
         else:
-            print(f"\n{CLR_LOCATION_NAME}[ {self.name} ]{CLR_RESET}")
+            text.line(f"[ {self.name} ]", CLR_LOCATION_NAME)
 
-        print(f"{CLR_LOCATION_DESC}{self.description}{CLR_RESET}")
+        text.line(self.description, CLR_LOCATION_DESC)
 
         if self.region:
-            print(f"{CLR_LOCATION_DESC}AWS Region: {self.region}{CLR_RESET}")
+            text.line(f"AWS Region: {self.region}", CLR_LOCATION_DESC)
 
         if self.difficulty:
             diff_stars = '★' * self.difficulty + '☆' * (10 - self.difficulty)
-            print(f"{CLR_LOCATION_DESC}Difficulty: {diff_stars}{CLR_RESET}")
+            text.line(f"Difficulty: {diff_stars}", CLR_LOCATION_DESC)
 
-        print(f"\n{CLR_INTERACTION}Connections:{CLR_RESET}")
+        text.line().line("Connections:", CLR_INTERACTION)
         for connection in self.connections:
-            print(f"• {connection}")
+            text.line(f"• {connection}")
 
         if self.hazards:
-            print(f"\n{CLR_HAZARD}Potential Hazards:{CLR_RESET}")
+            text.line().line("Potential Hazards:", CLR_HAZARD)
             for hazard in self.hazards:
-                print(f"• {hazard['name']} - {hazard['description']}")
+                text.line(f"• {hazard['name']} - {hazard['description']}")
 
         if self.vendors:
-            print(f"\n{CLR_CLOUD_SERVICE}Local Vendors:{CLR_RESET}")
+            text.line().line("Local Vendors:", CLR_CLOUD_SERVICE)
             for vendor in self.vendors:
-                print(f"• {vendor['name']} - {vendor['description']}")
+                text.line(f"• {vendor['name']} - {vendor['description']}")
+        echo(text, end="")
 
     def add_connection(self, location_name: str) -> None:
         """Add a connection to another location.
@@ -82,7 +92,8 @@ class Location:
             location_name: Name of location to connect to
         """
         if location_name not in self.connections:
-            self.connections.append(location_name)
+            # Rebind rather than append: the list may be shared with content data
+            self.connections = self.connections + [location_name]
 
     def has_secret(self, secret_id: str) -> bool:
         """Check if a particular secret has been discovered.
@@ -105,6 +116,8 @@ class Location:
             True if secret was newly discovered, False if already known
         """
         if secret_id not in self.discovered_secrets:
+            if not self.discovered_secrets:
+                self.discovered_secrets = set()
             self.discovered_secrets.add(secret_id)
             return True
         return False
@@ -115,7 +128,8 @@ class Location:
         Args:
             hazard: Dictionary containing hazard information
         """
-        self.hazards.append(hazard)
+        # Rebind rather than append: the list may be shared with other games
+        self.hazards = [*self.hazards, hazard]
 
     def add_vendor(self, vendor: Dict[str, Any]) -> None:
         """Add a vendor to this location.
@@ -123,7 +137,8 @@ class Location:
         Args:
             vendor: Dictionary containing vendor information
         """
-        self.vendors.append(vendor)
+        # Rebind rather than append: the list may be shared with other games
+        self.vendors = [*self.vendors, vendor]
 
     def unlock_area(self, area_id: str) -> bool:
         """Unlock a sub-area within this location.
@@ -135,6 +150,8 @@ class Location:
             True if area was newly unlocked, False if already unlocked
         """
         if area_id not in self.unlocked_areas:
+            if not self.unlocked_areas:
+                self.unlocked_areas = set()
             self.unlocked_areas.add(area_id)
             display_notification(
                 f"Unlocked new area in {self.name}: {area_id}", "success")
@@ -3,9 +3,11 @@ Player and CloudRanger classes for the Neon Shadow game.
 """
 
 from typing import Dict, Optional, List, Set
+from .ansi import StyledText
 from .constants import *
-from .utils import display_notification
+from .utils import display_notification, echo, prompt
 from .inventory import Inventory
+from .signals import Signal
 
 
 class Player:
@@ -34,7 +36,11 @@ class Player:
 
 
 class CloudRanger:
-    """Player character class representing a cloud security specialist."""
+    """Player character class representing a cloud security specialist.
+
+    ``changed`` emits ("location", name) on arriving somewhere and
+    ("clue", clue_id) on finding a new clue.
+    """
 
     def __init__(self, name, specialty, initial_skills=None):
         """Initialize a new CloudRanger character.
@@ -46,8 +52,9 @@ class CloudRanger:
         """
         self.name = name
         self.specialty = specialty
+        self.changed = Signal()
         self.inventory = Inventory()
-        self.current_location = None
+        self._current_location = None
         self.completed_missions = []
         self.active_missions = []
         self.reputation = {
@@ -83,6 +90,18 @@ class CloudRanger:
         self.max_energy = 100       # Maximum energy
         self.status_effects = []    # List of temporary status effects
 
+    @property
+    def current_location(self):
+        """Location the player is at."""
+        return self._current_location
+
+    @current_location.setter
+    def current_location(self, location):
+        """Move the player to a location."""
+        self._current_location = location
+        if location is not None:
+            self.changed.emit("location", location.name)
+
     @property
     def cloud_credits(self):
         """Get player's cloud credits."""
@@ -135,6 +154,7 @@ class CloudRanger:
         """Add a clue to the player's collection."""
         if clue_id not in self.clues:
             self.clues.add(clue_id)
+            self.changed.emit("clue", clue_id)
             display_notification(f"New Clue Added! ({clue_id})", "info")
             return True
         return False
@@ -187,25 +207,29 @@ class CloudRanger:
         from .utils import clear_screen  # Import here to avoid circular imports
 
         clear_screen()
-        print(
-            f"\n{CLR_BRIGHT}{CLR_CYAN}╔════════ PLAYER STATUS ════════╗{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} Name: {self.name}{' ' * (27 - len(self.name))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} Specialty: {self.specialty}{' ' * (23 - len(self.specialty))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} Location: {self.current_location.name if self.current_location else 'Unknown'}{' ' * (20 - len(self.current_location.name) if self.current_location else 13)}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} Cloud Credits: {self.cloud_credits}{' ' * (16 - len(str(self.cloud_credits)))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} Health: {self.health}/{self.max_health}{' ' * (22 - len(str(self.health)) - len(str(self.max_health)))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} Energy: {self.energy}/{self.max_energy}{' ' * (22 - len(str(self.energy)) - len(str(self.max_energy)))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} Bandwidth: {self.bandwidth}{' ' * (20 - len(str(self.bandwidth)))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} Time Left: {self.time_left} days{' ' * (16 - len(str(self.time_left)))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} Clues: {len(self.clues)} collected{' ' * (15 - len(str(len(self.clues))))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-
-        print(f"{CLR_BRIGHT}{CLR_CYAN}╠═════ FACTION REPUTATION ══════╣{CLR_RESET}")
+        border = CLR_BRIGHT + CLR_CYAN
+        text = StyledText()
+
+        def row(content):
+            text.add("║", border).add(f" {content}").line("║", border)
+
+        text.line().line("╔════════ PLAYER STATUS ════════╗", border)
+        row(f"Name: {self.name}{' ' * (27 - len(self.name))}")
+        row(f"Specialty: {self.specialty}{' ' * (23 - len(self.specialty))}")
+        row(f"Location: {self.current_location.name if self.current_location else 'Unknown'}{' ' * (20 - len(self.current_location.name) if self.current_location else 13)}")
+        row(f"Cloud Credits: {self.cloud_credits}{' ' * (16 - len(str(self.cloud_credits)))}")
+        row(f"Health: {self.health}/{self.max_health}{' ' * (22 - len(str(self.health)) - len(str(self.max_health)))}")
+        row(f"Energy: {self.energy}/{self.max_energy}{' ' * (22 - len(str(self.energy)) - len(str(self.max_energy)))}")
+        row(f"Bandwidth: {self.bandwidth}{' ' * (20 - len(str(self.bandwidth)))}")
+        row(f"Time Left: {self.time_left} days{' ' * (16 - len(str(self.time_left)))}")
+        row(f"Clues: {len(self.clues)} collected{' ' * (15 - len(str(len(self.clues))))}")
+
+        text.line("╠═════ FACTION REPUTATION ══════╣", border)
         for faction, rep in self.faction_reputation.items():
             rep_str = f"{faction}: {rep}/100"
-            print(
-                f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} {rep_str}{' ' * (29 - len(rep_str))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
+            row(f"{rep_str}{' ' * (29 - len(rep_str))}")
 
-        print(f"{CLR_BRIGHT}{CLR_CYAN}╠════════ SKILL LEVELS ══════════╣{CLR_RESET}")
+        text.line("╠════════ SKILL LEVELS ══════════╣", border)
 
         for skill, level in self.skills.items():
             stars = '★' * level + '☆' * (10 - level)
@@ -216,34 +240,30 @@ class CloudRanger:
                     skill_with_boost = f" (+{boost['amount']} for {boost['remaining_days']}d)"
                     break
 
-            print(f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} {skill.capitalize()}: {stars}{skill_with_boost}{' ' * max(0, 10 - len(skill) - len(skill_with_boost))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
+            row(f"{skill.capitalize()}: {stars}{skill_with_boost}{' ' * max(0, 10 - len(skill) - len(skill_with_boost))}")
 
-        print(f"{CLR_BRIGHT}{CLR_CYAN}╠════════ ACTIVE QUESTS ═════════╣{CLR_RESET}")
+        text.line("╠════════ ACTIVE QUESTS ═════════╣", border)
         if self.active_quests:
             for quest in self.active_quests[:3]:  # Show max 3 quests
-                print(
-                    f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} • {quest}{' ' * (28 - len(str(quest)))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
+                row(f"• {quest}{' ' * (28 - len(str(quest)))}")
             if len(self.active_quests) > 3:
-                print(
-                    f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} ... and {len(self.active_quests) - 3} more{' ' * 17}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
+                row(f"... and {len(self.active_quests) - 3} more{' ' * 17}")
         else:
-            print(
-                f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} No active quests{' ' * 15}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
+            row(f"No active quests{' ' * 15}")
 
         if self.status_effects:
-            print(
-                f"{CLR_BRIGHT}{CLR_CYAN}╠════════ STATUS EFFECTS ════════╣{CLR_RESET}")
+            text.line("╠════════ STATUS EFFECTS ════════╣", border)
             for effect in self.status_effects:
                 effect_text = f"{effect['name']} ({effect['duration']} turns)"
-                print(
-                    f"{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET} • {effect_text}{' ' * (28 - len(effect_text))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
+                row(f"• {effect_text}{' ' * (28 - len(effect_text))}")
 
-        print(f"{CLR_BRIGHT}{CLR_CYAN}╚══════════════════════════════════╝{CLR_RESET}")
+        text.line("╚══════════════════════════════════╝", border)
+        echo(text, end="")
 
         # Show full inventory
         self.inventory.display()
 
-        input(f"{CLR_PROMPT}Press Enter to continue...{CLR_RESET}")
+        prompt(f"{CLR_PROMPT}Press Enter to continue...{CLR_RESET}")
 
     def update_faction_reputation(self, faction: str, change: int) -> None:
         """Update reputation with a faction."""
@@ -279,7 +299,8 @@ class CloudRanger:
     def add_status_effect(self, effect: Dict) -> None:
         """Add a status effect to the player."""
         # Example effect: {"name": "Digital Burn", "duration": 3, "per_turn_effect": lambda player: player.take_damage(5, "burn")}
-        self.status_effects.append(effect)
+        # Copy so per-turn duration updates never touch shared content data
+        self.status_effects.append(dict(effect))
         display_notification(
             f"Status effect applied: {effect['name']}", "warning")
 
@@ -0,0 +1,283 @@
+"""
+Turn profiler for the Neon Shadow game.
+
+When debug mode is on, the game loop times each phase of a turn (and each
+main-menu action) with ``time.perf_counter_ns``. Every phase also records
+how many random numbers it drew, how many memory blocks it left allocated
+and how long it spent in UI pauses. The timings of a session are kept as
+power-of-two histograms and can be exported as JSON or CSV. A cProfile
+capture can be started and dumped from the system menu.
+"""
+
+import cProfile
+import csv
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".neon_shadow", "profiles")
+
+
+def profile_path(name: str, extension: str) -> str:
+    """Return a file path in the profile directory, stamped with the current time."""
+    return os.path.join(PROFILE_DIR, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}{extension}")
+
+
+class CountingRandom(random.Random):
+    """A random.Random that counts its draws.
+
+    Every method of random.Random is built on ``random()`` or
+    ``getrandbits()``, so counting those two counts every draw. The numbers
+    drawn are the same as those of a plain random.Random in the same state.
+    """
+
+    def __init__(self, state: Optional[tuple] = None) -> None:
+        super().__init__()
+        self.draws = 0
+        if state is not None:
+            self.setstate(state)
+
+    def random(self) -> float:
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.draws += 1
+        return super().getrandbits(k)
+
+
+class PhaseStats:
+    """Totals and a duration histogram for one phase of the turn.
+
+    ``buckets`` maps b to the number of calls that took less than 2**b
+    microseconds (and at least 2**(b-1), for b > 0).
+    """
+
+    __slots__ = ("calls", "total_ns", "max_ns", "draws", "blocks", "sleep_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.draws = 0
+        self.blocks = 0
+        self.sleep_ns = 0
+        self.buckets: Counter = Counter()
+
+    def add(self, elapsed_ns: int, draws: int, blocks: int, sleep_ns: int) -> None:
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.draws += draws
+        self.blocks += blocks
+        self.sleep_ns += sleep_ns
+        self.buckets[(elapsed_ns // 1000).bit_length()] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.calls / 1e3 if self.calls else 0.0,
+            "max_us": self.max_ns / 1e3,
+            "rng_draws": self.draws,
+            "alloc_blocks": self.blocks,
+            "sleep_ms": self.sleep_ns / 1e6,
+            "histogram_us": {str(1 << b): n for b, n in sorted(self.buckets.items())},
+        }
+
+
+class _Phase:
+    """Context manager that records one run of a phase."""
+
+    __slots__ = ("profiler", "name", "start", "draws", "blocks", "sleep_ns")
+
+    def __init__(self, profiler: "TurnProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> "_Phase":
+        profiler = self.profiler
+        self.draws = profiler.draws()
+        self.sleep_ns = profiler.sleep_ns
+        self.blocks = sys.getallocatedblocks()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed = time.perf_counter_ns() - self.start
+        profiler = self.profiler
+        stats = profiler.phases.get(self.name)
+        if stats is None:
+            stats = profiler.phases[self.name] = PhaseStats()
+        blocks = sys.getallocatedblocks() - self.blocks - profiler.block_overhead
+        stats.add(elapsed, profiler.draws() - self.draws, blocks, profiler.sleep_ns - self.sleep_ns)
+
+
+class TurnProfiler:
+    """Per-phase timings of one game session.
+
+    ``attach`` swaps the game's random number generators for counting ones
+    (in the same state, so the game plays out the same) and wraps its
+    driver's ``sleep``; ``detach`` undoes both.
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, PhaseStats] = {}
+        self.turns = 0
+        self.sleep_ns = 0
+        self.block_overhead = 0  # Blocks a phase holds for its own bookkeeping
+        self.game = None
+        self._rngs: List[CountingRandom] = []
+        self._turn: Optional[_Phase] = None
+        self._capture: Optional[cProfile.Profile] = None
+
+    # --- Attaching to a game --- #
+
+    def attach(self, game) -> None:
+        """Start profiling a game."""
+        self.game = game
+        game.rng = CountingRandom(game.rng.getstate())
+        game.weather.rng = CountingRandom(game.weather.rng.getstate())
+        self._rngs = [game.rng, game.weather.rng]
+
+        driver = game.io
+        sleep = driver.sleep
+
+        def timed_sleep(seconds: float) -> None:
+            start = time.perf_counter_ns()
+            sleep(seconds)
+            self.sleep_ns += time.perf_counter_ns() - start
+
+        driver.sleep = timed_sleep
+        self._calibrate()
+
+    def _calibrate(self) -> None:
+        """Measure the blocks an empty phase counts, to leave them out of every phase."""
+        self.block_overhead = 0
+        for runs in (1, 8):  # The first run also allocates the phase's stats
+            for _ in range(runs):
+                with self.phase("calibration"):
+                    pass
+            stats = self.phases.pop("calibration")
+        self.block_overhead = round(stats.blocks / stats.calls)
+
+    def detach(self) -> None:
+        """Stop profiling, giving the game back plain generators in the same state."""
+        game = self.game
+        if game is None:
+            return
+        self.stop_capture()
+        game.rng = random.Random()
+        game.rng.setstate(self._rngs[0].getstate())
+        game.weather.rng = random.Random()
+        game.weather.rng.setstate(self._rngs[1].getstate())
+        game.io.__dict__.pop("sleep", None)
+        self._rngs = []
+        self.game = None
+
+    def draws(self) -> int:
+        """Return the draws made so far from the game's generators."""
+        return sum(rng.draws for rng in self._rngs)
+
+    # --- Timing --- #
+
+    def phase(self, name: str) -> _Phase:
+        """Return a context manager that times one run of a phase."""
+        return _Phase(self, name)
+
+    def start_turn(self) -> None:
+        self._turn = _Phase(self, "turn").__enter__()
+
+    def end_turn(self) -> None:
+        if self._turn is not None:
+            self._turn.__exit__(None, None, None)
+            self._turn = None
+            self.turns += 1
+
+    def reset(self) -> None:
+        """Forget all timings recorded so far."""
+        self.phases = {}
+        self.turns = 0
+
+    def report(self) -> Dict[str, Any]:
+        """Return the session's timings, by phase, slowest total first."""
+        phases = sorted(self.phases.items(), key=lambda item: -item[1].total_ns)
+        return {
+            "turns": self.turns,
+            "phases": {name: stats.to_dict() for name, stats in phases},
+        }
+
+    def format_report(self, limit: int = 12) -> str:
+        """Format the slowest phases as a plain-text table."""
+        lines = [f"Turns profiled: {self.turns}",
+                 f"{'phase':<24} {'calls':>6} {'mean us':>10} {'max us':>10} "
+                 f"{'draws':>7} {'blocks':>8}"]
+        for name, stats in list(self.report()["phases"].items())[:limit]:
+            lines.append(f"{name:<24} {stats['calls']:>6} {stats['mean_us']:>10.1f} "
+                         f"{stats['max_us']:>10.1f} {stats['rng_draws']:>7} "
+                         f"{stats['alloc_blocks']:>8}")
+        return "\n".join(lines)
+
+    # --- Export --- #
+
+    def export(self, path: str) -> None:
+        """Write the session's timings to a file, as CSV if path ends in .csv, else JSON.
+
+        The CSV has one row per phase: its totals, then one column per
+        histogram bucket (calls that took less than that many microseconds).
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        report = self.report()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not path.endswith(".csv"):
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+            return
+
+        buckets = sorted({int(bound) for stats in report["phases"].values()
+                          for bound in stats["histogram_us"]})
+        totals = ["calls", "total_ms", "mean_us", "max_us", "rng_draws", "alloc_blocks", "sleep_ms"]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["phase"] + totals + [f"lt_{bound}us" for bound in buckets])
+            for name, stats in report["phases"].items():
+                histogram = stats["histogram_us"]
+                writer.writerow([name] + [stats[key] for key in totals]
+                                + [histogram.get(str(bound), 0) for bound in buckets])
+
+    # --- cProfile --- #
+
+    @property
+    def capturing(self) -> bool:
+        return self._capture is not None
+
+    def start_capture(self) -> None:
+        """Start recording every function call with cProfile."""
+        if self._capture is None:
+            self._capture = cProfile.Profile()
+            self._capture.enable()
+
+    def stop_capture(self, path: Optional[str] = None) -> None:
+        """Stop the cProfile capture, dumping its stats to path if given.
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        capture, self._capture = self._capture, None
+        if capture is None:
+            return
+        capture.disable()
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            capture.dump_stats(path)
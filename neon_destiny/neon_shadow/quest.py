@@ -2,11 +2,16 @@ from typing import Dict, List, Optional, Any, Union
 from neon_shadow.constants import (
     CLR_BRIGHT, CLR_YELLOW, CLR_RESET, CLR_GREEN, CLR_RED
 )
+from neon_shadow.ui import echo
 
 
 class Quest:
     """Represents a quest or mission that the player can undertake."""
 
+    __slots__ = ("id", "title", "description", "objectives", "reward", "prereq_quests",
+                 "min_skill_level", "min_faction_rep", "location", "time_limit",
+                 "difficulty", "hidden", "completion_date")
+
     def __init__(self, id: str, title: str, description: str,
                  objectives: List[Dict[str, Any]], reward: Dict[str, Any],
                  prereq_quests: Optional[List[str]] = None,
@@ -95,6 +100,17 @@ class Quest:
                 return True
         return False
 
+    def objective_completed(self, objective_id: str) -> bool:
+        """Check if an objective is completed.
+
+        Args:
+            objective_id: ID of the objective to check
+
+        Returns:
+            True if the objective exists and is completed, False otherwise
+        """
+        return any(obj['id'] == objective_id and obj['completed'] for obj in self.objectives)
+
     def check_completion(self) -> bool:
         """Check if all objectives are completed.
         
@@ -105,43 +121,43 @@ class Quest:
 
     def display(self) -> None:
         """Display quest details."""
-        print(
+        echo(
             f"\n{CLR_BRIGHT}{CLR_YELLOW}╔══════ QUEST: {self.title} ══════╗{CLR_RESET}")
-        print(f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} {self.description}{CLR_RESET}")
+        echo(f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} {self.description}{CLR_RESET}")
 
         if self.difficulty:
             diff_stars = '★' * self.difficulty + '☆' * (10 - self.difficulty)
-            print(
+            echo(
                 f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} Difficulty: {diff_stars}{CLR_RESET}")
 
         if self.time_limit:
-            print(
+            echo(
                 f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} Time Limit: {self.time_limit} days{CLR_RESET}")
 
-        print(f"{CLR_BRIGHT}{CLR_YELLOW}╠══════ OBJECTIVES ══════╣{CLR_RESET}")
+        echo(f"{CLR_BRIGHT}{CLR_YELLOW}╠══════ OBJECTIVES ══════╣{CLR_RESET}")
 
         for obj in self.objectives:
             status = f"{CLR_GREEN}✓{CLR_RESET}" if obj['completed'] else f"{CLR_RED}□{CLR_RESET}"
-            print(
+            echo(
                 f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} {status} {obj['description']}")
 
-        print(f"{CLR_BRIGHT}{CLR_YELLOW}╠══════ REWARDS ══════╣{CLR_RESET}")
+        echo(f"{CLR_BRIGHT}{CLR_YELLOW}╠══════ REWARDS ══════╣{CLR_RESET}")
         if 'credits' in self.reward:
-            print(
+            echo(
                 f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} • {self.reward['credits']} Cloud Credits")
         if 'artifacts' in self.reward:
             for artifact in self.reward['artifacts']:
-                print(f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} • Artifact: {artifact}")
+                echo(f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} • Artifact: {artifact}")
         if 'faction_rep' in self.reward:
             for faction, change in self.reward['faction_rep'].items():
-                print(f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} • {faction}: +{change}")
+                echo(f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} • {faction}: +{change}")
         if 'skill' in self.reward:
             for skill, amount in self.reward['skill'].items():
-                print(
+                echo(
                     f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} • Skill: {skill.capitalize()} +{amount}")
         if 'consumables' in self.reward:
             for item, count in self.reward['consumables'].items():
-                print(
+                echo(
                     f"{CLR_BRIGHT}{CLR_YELLOW}║{CLR_RESET} • {item} x{count}")
 
-        print(f"{CLR_BRIGHT}{CLR_YELLOW}╚═════════════════════════╝{CLR_RESET}")
+        echo(f"{CLR_BRIGHT}{CLR_YELLOW}╚═════════════════════════╝{CLR_RESET}")
@@ -0,0 +1,514 @@
+"""
+Save game snapshots for the Neon Shadow game.
+
+A save file is a small header followed by the game state encoded as
+MessagePack (a compact binary JSON), optionally zlib-compressed:
+
+    b"NSAV"     magic
+    version     1 byte, SAVE_VERSION
+    flags       1 byte, FLAG_ZLIB if the payload is compressed
+    payload     the snapshot dict
+
+The state is converted to plain values first (see ``Game.snapshot``), so a
+save never contains pickled objects and loading one never runs code. The
+encoder only handles the types a snapshot uses: None, bool, int, float, str,
+bytes, lists, tuples, sets and dicts. Integers too large for 64 bits (NumPy
+generator state) use extension type 1.
+"""
+
+import os
+import random
+import struct
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from neon_shadow.artifact import ArtifactTemplate, CloudArtifact
+from neon_shadow.inventory import Inventory
+from neon_shadow.player import CloudRanger
+from neon_shadow.service import CloudService, ServiceTemplate
+
+MAGIC = b"NSAV"
+SAVE_VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)  # Versions decode_snapshot accepts
+FLAG_ZLIB = 0x01
+SAVE_EXTENSION = ".nsav"
+SAVE_DIR = os.path.join(os.path.expanduser("~"), ".neon_shadow", "saves")
+
+_BIGINT_EXT = 1
+
+_U8 = struct.Struct(">B")
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+_U64 = struct.Struct(">Q")
+_I8 = struct.Struct(">b")
+_I16 = struct.Struct(">h")
+_I32 = struct.Struct(">i")
+_I64 = struct.Struct(">q")
+_F64 = struct.Struct(">d")
+
+
+class SaveGameError(ValueError):
+    """Raised when a save file cannot be written or read."""
+
+
+# --- Encoding --- #
+
+def _pack_int(value: int, out: bytearray) -> None:
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xFF)
+    elif 0 < value < 2 ** 64:
+        if value <= 0xFF:
+            out += b"\xcc" + _U8.pack(value)
+        elif value <= 0xFFFF:
+            out += b"\xcd" + _U16.pack(value)
+        elif value <= 0xFFFFFFFF:
+            out += b"\xce" + _U32.pack(value)
+        else:
+            out += b"\xcf" + _U64.pack(value)
+    elif -2 ** 63 <= value < 0:
+        if -0x80 <= value:
+            out += b"\xd0" + _I8.pack(value)
+        elif -0x8000 <= value:
+            out += b"\xd1" + _I16.pack(value)
+        elif -0x80000000 <= value:
+            out += b"\xd2" + _I32.pack(value)
+        else:
+            out += b"\xd3" + _I64.pack(value)
+    else:
+        raw = value.to_bytes((value.bit_length() + 8) // 8, "big", signed=True)
+        _pack_ext(_BIGINT_EXT, raw, out)
+
+
+def _pack_ext(code: int, raw: bytes, out: bytearray) -> None:
+    if len(raw) > 0xFF:
+        raise SaveGameError("Extension value too large")
+    out += b"\xc7" + _U8.pack(len(raw)) + _U8.pack(code)
+    out += raw
+
+
+def _pack_str(value: str, out: bytearray) -> None:
+    raw = value.encode("utf-8")
+    n = len(raw)
+    if n < 32:
+        out.append(0xA0 | n)
+    elif n <= 0xFF:
+        out += b"\xd9" + _U8.pack(n)
+    elif n <= 0xFFFF:
+        out += b"\xda" + _U16.pack(n)
+    else:
+        out += b"\xdb" + _U32.pack(n)
+    out += raw
+
+
+def _pack_bytes(value: bytes, out: bytearray) -> None:
+    n = len(value)
+    if n <= 0xFF:
+        out += b"\xc4" + _U8.pack(n)
+    elif n <= 0xFFFF:
+        out += b"\xc5" + _U16.pack(n)
+    else:
+        out += b"\xc6" + _U32.pack(n)
+    out += value
+
+
+def _pack_array_header(n: int, out: bytearray) -> None:
+    if n < 16:
+        out.append(0x90 | n)
+    elif n <= 0xFFFF:
+        out += b"\xdc" + _U16.pack(n)
+    else:
+        out += b"\xdd" + _U32.pack(n)
+
+
+def _pack_map_header(n: int, out: bytearray) -> None:
+    if n < 16:
+        out.append(0x80 | n)
+    elif n <= 0xFFFF:
+        out += b"\xde" + _U16.pack(n)
+    else:
+        out += b"\xdf" + _U32.pack(n)
+
+
+def _pack(value: Any, out: bytearray) -> None:
+    kind = type(value)
+    if kind is str:
+        _pack_str(value, out)
+    elif kind is int:
+        _pack_int(value, out)
+    elif value is None:
+        out.append(0xC0)
+    elif kind is bool:
+        out.append(0xC3 if value else 0xC2)
+    elif kind is dict:
+        _pack_map_header(len(value), out)
+        for key, item in value.items():
+            _pack(key, out)
+            _pack(item, out)
+    elif kind is list or kind is tuple:
+        _pack_array_header(len(value), out)
+        for item in value:
+            _pack(item, out)
+    elif kind is float:
+        out += b"\xcb" + _F64.pack(value)
+    elif kind is set or kind is frozenset:
+        # Sorted so the same state always encodes to the same bytes
+        _pack(sorted(value), out)
+    elif kind is bytes or kind is bytearray:
+        _pack_bytes(bytes(value), out)
+    elif isinstance(value, tuple):  # NamedTuple templates
+        _pack(tuple(value), out)
+    else:
+        raise SaveGameError(f"Cannot save a value of type {kind.__name__}")
+
+
+def packb(value: Any) -> bytes:
+    """Encode a plain value as MessagePack.
+
+    Raises:
+        SaveGameError: If the value contains an unsupported type
+    """
+    out = bytearray()
+    _pack(value, out)
+    return bytes(out)
+
+
+# --- Decoding --- #
+
+def _unpack(data: bytes, pos: int) -> Tuple[Any, int]:
+    code = data[pos]
+    pos += 1
+    if code < 0x80:
+        return code, pos
+    if code >= 0xE0:
+        return code - 0x100, pos
+    if 0xA0 <= code <= 0xBF:
+        end = pos + (code & 0x1F)
+        if end > len(data):
+            raise SaveGameError("Truncated save data")
+        return data[pos:end].decode("utf-8"), end
+    if 0x80 <= code <= 0x8F:
+        return _unpack_map(data, pos, code & 0x0F)
+    if 0x90 <= code <= 0x9F:
+        return _unpack_array(data, pos, code & 0x0F)
+    if code == 0xC0:
+        return None, pos
+    if code == 0xC2:
+        return False, pos
+    if code == 0xC3:
+        return True, pos
+    if code == 0xCB:
+        return _F64.unpack_from(data, pos)[0], pos + 8
+    if code in _FIXED_INTS:
+        fmt = _FIXED_INTS[code]
+        return fmt.unpack_from(data, pos)[0], pos + fmt.size
+    if code in _STR_LENGTHS:
+        fmt = _STR_LENGTHS[code]
+        start = pos + fmt.size
+        end = start + fmt.unpack_from(data, pos)[0]
+        if end > len(data):
+            raise SaveGameError("Truncated save data")
+        return data[start:end].decode("utf-8"), end
+    if code in _BIN_LENGTHS:
+        fmt = _BIN_LENGTHS[code]
+        start = pos + fmt.size
+        end = start + fmt.unpack_from(data, pos)[0]
+        if end > len(data):
+            raise SaveGameError("Truncated save data")
+        return bytes(data[start:end]), end
+    if code in _ARRAY_LENGTHS:
+        fmt = _ARRAY_LENGTHS[code]
+        return _unpack_array(data, pos + fmt.size, fmt.unpack_from(data, pos)[0])
+    if code in _MAP_LENGTHS:
+        fmt = _MAP_LENGTHS[code]
+        return _unpack_map(data, pos + fmt.size, fmt.unpack_from(data, pos)[0])
+    if code == 0xC7:
+        length = data[pos]
+        ext = data[pos + 1]
+        start = pos + 2
+        end = start + length
+        if end > len(data):
+            raise SaveGameError("Truncated save data")
+        if ext != _BIGINT_EXT:
+            raise SaveGameError(f"Unknown extension type {ext}")
+        return int.from_bytes(data[start:end], "big", signed=True), end
+    raise SaveGameError(f"Invalid type code 0x{code:02x} in save data")
+
+
+def _unpack_array(data: bytes, pos: int, n: int) -> Tuple[List[Any], int]:
+    items = []
+    for _ in range(n):
+        item, pos = _unpack(data, pos)
+        items.append(item)
+    return items, pos
+
+
+def _unpack_map(data: bytes, pos: int, n: int) -> Tuple[Dict[Any, Any], int]:
+    result = {}
+    for _ in range(n):
+        key, pos = _unpack(data, pos)
+        result[key], pos = _unpack(data, pos)
+    return result, pos
+
+
+_FIXED_INTS = {0xCC: _U8, 0xCD: _U16, 0xCE: _U32, 0xCF: _U64,
+               0xD0: _I8, 0xD1: _I16, 0xD2: _I32, 0xD3: _I64}
+_STR_LENGTHS = {0xD9: _U8, 0xDA: _U16, 0xDB: _U32}
+_BIN_LENGTHS = {0xC4: _U8, 0xC5: _U16, 0xC6: _U32}
+_ARRAY_LENGTHS = {0xDC: _U16, 0xDD: _U32}
+_MAP_LENGTHS = {0xDE: _U16, 0xDF: _U32}
+
+
+def unpackb(data: bytes) -> Any:
+    """Decode a MessagePack value produced by packb.
+
+    Raises:
+        SaveGameError: If the data is malformed or truncated
+    """
+    try:
+        value, pos = _unpack(data, 0)
+    except (IndexError, struct.error, UnicodeDecodeError, TypeError) as e:
+        # TypeError: a map key that is an array or a map
+        raise SaveGameError("Truncated or corrupt save data") from e
+    except RecursionError as e:
+        raise SaveGameError("Save data is nested too deeply") from e
+    if pos != len(data):
+        raise SaveGameError("Trailing bytes after save data")
+    return value
+
+
+def encode_snapshot(state: Dict[str, Any], compress: bool = True) -> bytes:
+    """Encode a snapshot dict into the save file format.
+
+    Args:
+        state: Snapshot from ``Game.snapshot``
+        compress: Compress the payload with zlib
+
+    Returns:
+        The complete save file contents
+    """
+    payload = packb(state)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 1)
+        flags |= FLAG_ZLIB
+    return MAGIC + bytes((SAVE_VERSION, flags)) + payload
+
+
+def decode_snapshot(data: bytes) -> Dict[str, Any]:
+    """Decode save file contents back into a snapshot dict.
+
+    Raises:
+        SaveGameError: If the data is not a save file, comes from an
+            unsupported version or is corrupt
+    """
+    if len(data) < len(MAGIC) + 2 or not data.startswith(MAGIC):
+        raise SaveGameError("Not a Neon Shadow save file")
+    version, flags = data[len(MAGIC)], data[len(MAGIC) + 1]
+    if version not in SUPPORTED_VERSIONS:
+        raise SaveGameError(f"Unsupported save version {version}")
+    payload = data[len(MAGIC) + 2:]
+    if flags & FLAG_ZLIB:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as e:
+            raise SaveGameError("Corrupt save data") from e
+    state = unpackb(payload)
+    if not isinstance(state, dict):
+        raise SaveGameError("Corrupt save data")
+    return state
+
+
+def save_path(slot: str) -> str:
+    """Return the file path of a named save slot."""
+    name = "".join(c for c in slot if c.isalnum() or c in "-_") or "quicksave"
+    return os.path.join(SAVE_DIR, name + SAVE_EXTENSION)
+
+
+def write_save(path: str, state: Dict[str, Any], compress: bool = True) -> int:
+    """Write a snapshot to a file, replacing it atomically.
+
+    Returns:
+        Number of bytes written
+    """
+    data = encode_snapshot(state, compress)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def read_save(path: str) -> Dict[str, Any]:
+    """Read a snapshot written by write_save.
+
+    Raises:
+        SaveGameError: If the file is not a valid save
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        return decode_snapshot(f.read())
+
+
+# --- Game objects to plain values and back --- #
+
+def dump_random_state(rng: random.Random) -> List[Any]:
+    """Return a random.Random state as [version, packed words, gauss_next]."""
+    version, words, gauss_next = rng.getstate()
+    return [version, struct.pack(f"<{len(words)}I", *words), gauss_next]
+
+
+def load_random_state(rng: random.Random, state: List[Any]) -> None:
+    """Restore a state produced by dump_random_state."""
+    version, raw, gauss_next = state
+    try:
+        words = struct.unpack(f"<{len(raw) // 4}I", raw)
+    except struct.error as e:
+        raise SaveGameError(f"Corrupt generator state: {e}") from e
+    rng.setstate((version, words, gauss_next))
+
+
+def _dump_effects(effects) -> List[Dict[str, Any]]:
+    # Callbacks are not saved; they are looked up by effect name on load
+    return [{key: value for key, value in effect.items() if not callable(value)}
+            for effect in effects]
+
+
+def _load_effects(saved: List[Dict[str, Any]],
+                  templates: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    effects = []
+    for data in saved:
+        template = templates.get(data.get("name"), {})
+        effect = {key: value for key, value in template.items() if callable(value)}
+        effect.update(data)
+        effects.append(effect)
+    return effects
+
+
+# Runtime fields saved per instance; content data is saved once as "template"
+_ARTIFACT_FIELDS = ("power", "upgrade_level", "cooldown")
+_SERVICE_FIELDS = (
+    "deployment_region", "instance_id", "last_maintenance", "incident_history", "health",
+    "security_level", "performance", "uptime_days", "cost_per_hour", "revenue_per_hour",
+    "is_deployed",
+)
+
+
+@lru_cache(maxsize=None)
+def _artifact_template(fields: Tuple[Any, ...]) -> ArtifactTemplate:
+    # Instances loaded with equal content data share one template
+    return ArtifactTemplate(*fields)
+
+
+@lru_cache(maxsize=None)
+def _service_template(fields: Tuple[Any, ...]) -> ServiceTemplate:
+    name, description, service_type, cost, deploy_cost, regions, dependencies = fields
+    return ServiceTemplate(name, description, service_type, cost, deploy_cost,
+                           tuple(regions), tuple(dependencies))
+
+
+def dump_artifact(artifact: CloudArtifact) -> Dict[str, Any]:
+    data = {field: getattr(artifact, field) for field in _ARTIFACT_FIELDS}
+    data["template"] = artifact.template
+    return data
+
+
+def load_artifact(data: Dict[str, Any]) -> CloudArtifact:
+    if "template" in data:
+        fields = tuple(data["template"])
+    else:  # Version 1 saves store the content data inline
+        fields = tuple(data[field] for field in ArtifactTemplate._fields)
+    artifact = CloudArtifact.from_template(_artifact_template(fields))
+    for field in _ARTIFACT_FIELDS:
+        setattr(artifact, field, data[field])
+    return artifact
+
+
+def dump_service(service: CloudService) -> Dict[str, Any]:
+    data = {field: getattr(service, field) for field in _SERVICE_FIELDS}
+    data["template"] = service.template
+    data["status_effects"] = _dump_effects(service.status_effects)
+    return data
+
+
+def load_service(data: Dict[str, Any],
+                 templates: Dict[str, Dict[str, Any]]) -> CloudService:
+    if "template" in data:
+        fields = tuple(tuple(f) if isinstance(f, list) else f for f in data["template"])
+    else:  # Version 1 saves store the content data inline
+        fields = (data["name"], data["description"], data["service_type"], data["_cost_per_hour"],
+                  data["deploy_cost"], tuple(data["region_availability"]),
+                  tuple(data["dependencies"]))
+        data = {field: data["_" + field] if "_" + field in data else data[field]
+                for field in _SERVICE_FIELDS + ("status_effects",)}
+    service = CloudService.from_template(_service_template(fields), data["instance_id"])
+    for field in _SERVICE_FIELDS:
+        setattr(service, field, data[field])
+    # Both are kept as tuples (see CloudService._start)
+    service.incident_history = tuple(service.incident_history)
+    service.status_effects = tuple(_load_effects(data["status_effects"], templates))
+    return service
+
+
+# CloudRanger attributes saved as they are
+_PLAYER_FIELDS = (
+    "name", "specialty", "skills", "bandwidth", "time_left", "faction_reputation",
+    "completed_quests", "active_quests", "temp_skill_boosts", "logs", "health",
+    "max_health", "energy", "max_energy", "completed_missions", "active_missions",
+    "reputation",
+)
+
+_INVENTORY_FIELDS = ("cloud_credits", "max_artifacts", "max_services", "consumables")
+
+
+def dump_player(player: CloudRanger) -> Dict[str, Any]:
+    """Convert a player, including its inventory, to plain values."""
+    data = {field: getattr(player, field) for field in _PLAYER_FIELDS}
+    data["clues"] = player.clues
+    data["achievements"] = player.achievements
+    data["status_effects"] = _dump_effects(player.status_effects)
+    data["location"] = player.current_location.name if player.current_location else None
+
+    inventory = player.inventory
+    data["inventory"] = {field: getattr(inventory, field) for field in _INVENTORY_FIELDS}
+    data["inventory"]["artifacts"] = [dump_artifact(a) for a in inventory.artifacts]
+    data["inventory"]["services"] = [dump_service(s) for s in inventory.services]
+    data["inventory"]["deployed"] = [dump_service(s) for s in inventory.deployed_services]
+    return data
+
+
+def load_player(data: Dict[str, Any], locations: Dict[str, Any],
+                templates: Dict[str, Dict[str, Any]]) -> CloudRanger:
+    """Rebuild a player from dump_player output.
+
+    Args:
+        data: Output of dump_player
+        locations: The game's locations, by name
+        templates: Status effects by name, used to restore their callbacks
+    """
+    player = CloudRanger(data["name"], data["specialty"], data["skills"])
+    for field in _PLAYER_FIELDS:
+        setattr(player, field, data[field])
+    player.clues = set(data["clues"])
+    player.achievements = set(data["achievements"])
+    player.status_effects = _load_effects(data["status_effects"], templates)
+    player.current_location = locations.get(data["location"])
+
+    saved = data["inventory"]
+    inventory = Inventory()
+    for field in _INVENTORY_FIELDS:
+        setattr(inventory, field, saved[field])
+    # Added one by one so the inventory indexes are rebuilt
+    for artifact in saved["artifacts"]:
+        inventory.add_artifact(load_artifact(artifact))
+    for service in saved["services"]:
+        inventory.add_service(load_service(service, templates))
+    for service in saved["deployed"]:
+        inventory.add_deployed_service(load_service(service, templates))
+    player.inventory = inventory
+    return player
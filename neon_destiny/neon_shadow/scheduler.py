@@ -0,0 +1,184 @@
+"""
+Event scheduler for the Neon Shadow game.
+
+Keeps track of which events can fire so a turn does not have to re-check
+every event in the catalogue. Events are indexed by location, by the player
+attributes their requirements read, and by the turn their cooldown expires.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from neon_shadow.event import CloudEvent
+from neon_shadow.location import Location
+
+RequirementKey = Tuple[str, str]
+
+
+def _read_requirement(player, key: RequirementKey):
+    """Return the current value of the player attribute behind key."""
+    kind, name = key
+    if kind == 'skill':
+        return player.skills.get(name, 0)
+    if kind == 'artifact':
+        return player.has_artifact(name)
+    if kind == 'clue':
+        return name in player.clues
+    return player.faction_reputation.get(name, 0)
+
+
+class EventIndex:
+    """The static half of event scheduling, shared by every game.
+
+    Args:
+        events: All events, by ID; only their requirements are read
+        locations: All locations, by name
+    """
+
+    def __init__(self, events: Mapping[str, CloudEvent], locations: Mapping[str, Location]) -> None:
+        self.events = events
+
+        # Location name -> IDs of the events bound to it
+        self.by_location: Dict[str, List[str]] = {}
+        bound: Set[str] = set()
+        for name, location in locations.items():
+            local = [event_id for event_id in location.events if event_id in events]
+            if local:
+                self.by_location[name] = local
+                bound.update(local)
+        self.unbound: List[str] = [event_id for event_id in events if event_id not in bound]
+        self.order = {event_id: i for i, event_id in enumerate(events)}
+
+        # Requirement key -> IDs of the events that read it
+        self.dependents: Dict[RequirementKey, List[str]] = {}
+        for event_id, event in events.items():
+            for key in event.requirement_keys():
+                self.dependents.setdefault(key, []).append(event_id)
+
+
+class EventScheduler:
+    """Tracks which events are eligible to fire.
+
+    An event listed in some location's ``events`` can only fire there; events
+    no location lists can fire anywhere. An event is re-checked only when a
+    player attribute its requirements read has changed, or when its cooldown
+    expires. Non-repeatable events are retired for good once they fire.
+
+    Requirements are checked against the index's events, so a game's own
+    event objects are only looked up once they are candidates to fire.
+
+    Args:
+        events: The game's events, by ID
+        index: Index over the same events and the game's locations
+    """
+
+    def __init__(self, events: Mapping[str, CloudEvent], index: EventIndex) -> None:
+        self.events = events
+        self.index = index
+        self.turn = 0
+
+        self._seen: Dict[RequirementKey, object] = {}  # Last value read per key
+        self._player_id: Optional[int] = None
+        self._eligible: Set[str] = set()  # Requirements met, not cooling down
+        self._dirty: Set[str] = set(index.order)  # Needs its requirements re-checked
+        self._cooldowns: List[Tuple[int, str]] = []  # Heap of (expiry turn, ID)
+        self._cooling: Set[str] = set()  # IDs in the heap
+        self._retired: Set[str] = set()
+
+    def restore(self, events: Iterable[CloudEvent]) -> None:
+        """Account for events already spent or cooling down.
+
+        Args:
+            events: Events restored from a save; a cooldown counts the turns
+                left from now
+        """
+        for event in events:
+            if not event.repeatable and event.has_occurred:
+                self._retire(event.id)
+            elif event.cooldown > 0:
+                self._start_cooldown(event.id, self.turn + event.cooldown)
+
+    def _start_cooldown(self, event_id: str, expiry: int) -> None:
+        self._eligible.discard(event_id)
+        self._dirty.discard(event_id)
+        self._cooling.add(event_id)
+        heapq.heappush(self._cooldowns, (expiry, event_id))
+
+    def _retire(self, event_id: str) -> None:
+        self._retired.add(event_id)
+        self._eligible.discard(event_id)
+        self._dirty.discard(event_id)
+
+    def advance(self, turns: int = 1) -> None:
+        """Move on by some turns, releasing events whose cooldown has expired."""
+        self.turn += turns
+        while self._cooldowns and self._cooldowns[0][0] <= self.turn:
+            _, event_id = heapq.heappop(self._cooldowns)
+            self._cooling.discard(event_id)
+            self.events[event_id].cooldown = 0
+            if event_id not in self._retired:
+                self._dirty.add(event_id)
+
+    def _refresh(self, player) -> None:
+        """Re-check the events whose requirements may have changed."""
+        if id(player) != self._player_id:
+            # A different player: forget everything we have seen
+            self._player_id = id(player)
+            self._seen.clear()
+            self._dirty.update(event_id for event_id in self.index.order
+                               if event_id not in self._retired and event_id not in self._cooling)
+
+        for key, dependents in self.index.dependents.items():
+            value = _read_requirement(player, key)
+            if self._seen.get(key, self) != value:
+                self._seen[key] = value
+                self._dirty.update(dependents)
+
+        requirements = self.index.events
+        for event_id in self._dirty:
+            if event_id in self._retired or event_id in self._cooling:
+                continue
+            if requirements[event_id].requirements_met(player):
+                self._eligible.add(event_id)
+            else:
+                self._eligible.discard(event_id)
+        self._dirty.clear()
+
+    def candidates(self, player, location_name: str) -> List[CloudEvent]:
+        """Return the events that may fire at a location this turn.
+
+        Args:
+            player: The player whose requirements are checked
+            location_name: Name of the player's current location
+
+        Returns:
+            Eligible events in catalogue order; each still has to pass its
+            chance roll
+        """
+        self._refresh(player)
+        if not self._eligible:
+            return []
+        ids = [event_id for event_id in self.index.by_location.get(location_name, ())
+               if event_id in self._eligible]
+        ids.extend(event_id for event_id in self.index.unbound if event_id in self._eligible)
+        ids.sort(key=self.index.order.__getitem__)
+        return [self.events[event_id] for event_id in ids]
+
+    def cooldowns(self) -> Dict[str, int]:
+        """Return the turns left on each event's cooldown, by event ID.
+
+        A new scheduler given events whose ``cooldown`` holds these values
+        through ``restore`` releases them on the same turns as this one.
+        """
+        return {event_id: expiry - self.turn for expiry, event_id in self._cooldowns}
+
+    def fired(self, event: CloudEvent) -> None:
+        """Record that an event fired this turn.
+
+        Args:
+            event: The event that was triggered
+        """
+        if not event.repeatable:
+            self._retire(event.id)
+        elif event.cooldown > 0:
+            self._start_cooldown(event.id, self.turn + event.cooldown)
@@ -0,0 +1,197 @@
+"""
+Frame-buffered screen output for the Neon Shadow game.
+
+Clearing the screen starts a frame. Everything written after that is
+composed in a buffer and drawn with a single write when the game next
+flushes, pauses or prompts. The screen is cleared with ANSI escape sequences
+rather than a ``clear`` subprocess. If the previous frame is still on screen
+untouched, only the lines that changed are redrawn.
+
+LineScreen does the same for a screen that is not a terminal, such as a
+browser page: it keeps the lines the output would leave on a terminal and
+works out which of them changed since the remote screen was last updated.
+A changed line the remote screen has had recently, such as a menu item or
+a row of the inventory drawn on an earlier screen, is sent as a number.
+"""
+
+import re
+import shutil
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .ansi import DEFAULT, Style, split_lines
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+CLEAR = "\x1b[H\x1b[2J\x1b[3J"  # Cursor home, clear the screen and the scrollback
+CLEAR_LINE = "\x1b[K"  # Clear from the cursor to the end of the line
+CLEAR_BELOW = "\x1b[J"  # Clear from the cursor to the end of the screen
+# An escape sequence (parameters and final letter), carriage return or newline
+_CONTROL = re.compile(r"\x1b\[([0-9;?]*)([A-Za-z])|(\r|\n)")
+
+
+def strip_ansi(text: str) -> str:
+    """Remove ANSI escape sequences from text."""
+    return ANSI_ESCAPE.sub("", text)
+
+
+def _move(row: int, column: int = 0) -> str:
+    """Return the sequence that moves the cursor to a 0-based row and column."""
+    return f"\x1b[{row + 1};{column + 1}H"
+
+
+class FrameRenderer:
+    """Composes frames and works out the least output that draws each one.
+
+    Args:
+        terminal_size: Returns the terminal's (columns, rows)
+    """
+
+    def __init__(self, terminal_size: Callable[[], Tuple[int, int]] = shutil.get_terminal_size) -> None:
+        self.terminal_size = terminal_size
+        self.open = False  # A frame is being composed
+        self._buffer: List[str] = []
+        # Lines of the frame on screen, while nothing else has been written
+        # over it, and the terminal size it was drawn at
+        self._previous: Optional[List[str]] = None
+        self._size: Optional[Tuple[int, int]] = None
+
+    def begin(self) -> None:
+        """Start a new frame, dropping anything composed but not yet drawn."""
+        self._buffer = []
+        self.open = True
+
+    def add(self, text: str) -> None:
+        """Append text to the frame being composed."""
+        self._buffer.append(text)
+
+    def touched(self) -> None:
+        """Record that something other than a frame was written to the screen."""
+        self._previous = None
+
+    def render(self, tail: str = "") -> str:
+        """Close the frame and return the text that draws it.
+
+        Args:
+            tail: Text to draw at the end of the frame, normally a prompt
+
+        Returns:
+            The whole frame after a clear or, if the previous frame is still
+            on screen, updates to the lines that differ from it
+        """
+        self._buffer.append(tail)
+        text = "".join(self._buffer)
+        self._buffer = []
+        self.open = False
+
+        lines = text.split("\n")
+        columns, rows = size = tuple(self.terminal_size())
+        previous = self._previous if size == self._size else None
+        # Row arithmetic only holds if no line wraps and nothing scrolls; the
+        # extra row leaves room for the newline that ends the player's input
+        fits = len(lines) < rows and all(len(strip_ansi(line)) < columns for line in lines)
+        self._previous = lines if fits else None
+        self._size = size
+        if previous is None or not fits:
+            return CLEAR + text
+
+        parts = []
+        # The last line of the previous frame also holds whatever was typed at it
+        last = len(previous) - 1
+        for row, line in enumerate(lines):
+            if row >= last or line != previous[row]:
+                parts.append(_move(row) + line + CLEAR_LINE)
+        parts.append(_move(len(lines) - 1, len(strip_ansi(lines[-1]))) + CLEAR_BELOW)
+        return "".join(parts)
+
+
+class LineScreen:
+    """The lines a stream of terminal output leaves on screen, for a remote screen.
+
+    Text is fed in as it would be written to a terminal. Clearing the screen
+    (``CLEAR``) starts over, a carriage return starts the line over and
+    colors are kept; other escape sequences are dropped. Every line is kept
+    styled on its own (see ``ansi.split_lines``), so a remote screen can
+    replace any one line without the others.
+
+    Lines sent to the remote screen are numbered from 0 in the order they
+    are sent. The remote screen keeps the last ``cache`` of them, and an
+    update refers to any of those by number instead of sending it again.
+
+    Args:
+        scrollback: Most lines kept; older lines are dropped from the top
+        cache: Lines sent that the remote screen keeps
+    """
+
+    def __init__(self, scrollback: int = 500, cache: int = 512) -> None:
+        self.scrollback = scrollback
+        self.cache = cache
+        self.lines: List[str] = [""]
+        self._raw = ""  # The last line as written, escape sequences and all
+        self._start = DEFAULT  # Style in effect where the last line starts
+        self._shown: List[str] = []  # Lines on the remote screen
+        self._dropped = 0  # Lines dropped from the top since the last update
+        self._numbers: Dict[str, int] = {}  # Numbers of the lines sent
+        self._sent = 0  # Lines sent so far
+
+    def feed(self, text: str) -> None:
+        """Add output to the screen."""
+        position = 0
+        for match in _CONTROL.finditer(text):
+            self._raw += text[position:match.start()]
+            position = match.end()
+            params, final, control = match.groups()
+            if final == "m":
+                self._raw += match.group()
+            elif control == "\n":
+                self.lines[-1], self._start = self._last()
+                self.lines.append("")
+                self._raw = ""
+            elif control == "\r" or (final == "J" and params in ("2", "3")):
+                _, self._start = self._last()
+                self._raw = ""
+                if final == "J":
+                    self.lines = [""]
+        self._raw += text[position:]
+        self.lines[-1], _ = self._last()
+        excess = len(self.lines) - self.scrollback
+        if excess > 0:
+            del self.lines[:excess]
+            del self._shown[:excess]
+            self._dropped += excess
+
+    def _last(self) -> Tuple[str, Optional[Style]]:
+        """Return the last line, styled on its own, and the style where it ends."""
+        lines, style = split_lines(self._raw, self._start)
+        return lines[0], style
+
+    def update(self) -> Optional[Dict[str, Any]]:
+        """Return the changes that bring the remote screen up to date, or None if there are none.
+
+        Returns:
+            ``drop``: lines to remove from the top first (only if any),
+            ``rows``: how many lines the screen has, and ``set``: [index, line]
+            for every line that differs from what the remote screen shows,
+            where line is the text or the number of a line sent before
+        """
+        shown = self._shown
+        changes = [[row, self._number(line)] for row, line in enumerate(self.lines)
+                   if row >= len(shown) or line != shown[row]]
+        if not changes and len(shown) == len(self.lines) and not self._dropped:
+            return None
+        update: Dict[str, Any] = {"rows": len(self.lines), "set": changes}
+        if self._dropped:
+            update = {"drop": self._dropped, **update}
+        self._shown = list(self.lines)
+        self._dropped = 0
+        return update
+
+    def _number(self, line: str) -> Union[int, str]:
+        """Return the number of a line the remote screen still has, or the line after numbering it."""
+        number = self._numbers.get(line)
+        if number is not None and number >= self._sent - self.cache:
+            return number
+        self._numbers[line] = self._sent
+        self._sent += 1
+        if len(self._numbers) > 2 * self.cache:
+            oldest = self._sent - self.cache
+            self._numbers = {text: n for text, n in self._numbers.items() if n >= oldest}
+        return line
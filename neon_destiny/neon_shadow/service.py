@@ -1,17 +1,86 @@
 import uuid
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, NamedTuple, Optional, Dict, Any, Callable, Tuple
 import random
 
 from neon_shadow.ui import display_notification
+from neon_shadow.fleet import FleetField
+from neon_shadow.templates import TemplateCache, template_field
+
+
+class ServiceTemplate(NamedTuple):
+    """Content data shared by every instance of a service."""
+    name: str
+    description: str
+    service_type: str  # e.g. 'Compute', 'Storage', 'Database'
+    cost_per_hour: float  # Base hourly cost
+    deploy_cost: int
+    region_availability: Tuple[str, ...]
+    dependencies: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "ServiceTemplate":
+        """Build a template from a SERVICES entry or an event's service effect."""
+        return cls(
+            name=data["name"],
+            description=data["description"],
+            service_type=data.get("service_type", data.get("type")),
+            cost_per_hour=data.get("cost_per_hour", 1),
+            deploy_cost=data.get("deploy_cost", 10),
+            region_availability=tuple(data.get("region_availability", ("us-east-1",))),
+            dependencies=tuple(data.get("dependencies", ())),
+        )
+
+
+_TEMPLATES: TemplateCache[ServiceTemplate] = TemplateCache(ServiceTemplate.from_data)
+
+
+def create_service(data: Dict[str, Any], instance_id: Optional[str] = None) -> "CloudService":
+    """Create a service instance from content data.
+
+    Every instance made from the same dict shares one ServiceTemplate.
+
+    Args:
+        data: A SERVICES entry or an event's service effect
+        instance_id: Unique instance ID; a random one is generated if omitted
+    """
+    return CloudService.from_template(_TEMPLATES.get(data), instance_id)
 
 
 class CloudService:
     """Represents an AWS service that can be deployed by the player."""
 
+    # Content data, shared through the template
+    name = template_field("name")
+    description = template_field("description")
+    service_type = template_field("service_type")
+    deploy_cost = template_field("deploy_cost")
+    region_availability = template_field("region_availability")
+    dependencies = template_field("dependencies")
+
+    # Hot numeric state; lives in a ServiceFleet's arrays while attached
+    health = FleetField(int)
+    security_level = FleetField(int)
+    performance = FleetField(int)
+    uptime_days = FleetField(int)
+    cost_per_hour = FleetField(float)
+    revenue_per_hour = FleetField(float)
+    is_deployed = FleetField(bool)
+
+    __slots__ = (
+        "template", "deployment_region", "instance_id", "last_maintenance",
+        "incident_history", "status_effects",
+        # Storage behind the FleetField attributes while detached
+        "_health", "_security_level", "_performance", "_uptime_days",
+        "_cost_per_hour", "_revenue_per_hour", "_is_deployed",
+        "_fleet",  # ServiceFleet this service is attached to, if any
+        "_slot",  # Index into the fleet's arrays
+    )
+
     def __init__(self, name: str, description: str, service_type: str,
                  cost_per_hour: float, deploy_cost: int,
                  region_availability: List[str],
-                 dependencies: Optional[List[str]] = None) -> None:
+                 dependencies: Optional[List[str]] = None,
+                 instance_id: Optional[str] = None) -> None:
         """Initialize a new cloud service.
         
         Args:
@@ -22,25 +91,78 @@ class CloudService:
             deploy_cost: One-time cost to deploy this service
             region_availability: List of AWS regions this service is available in
             dependencies: List of services required before this one can be deployed
+            instance_id: Unique instance ID; a random one is generated if omitted
         """
-        self.name = name
-        self.description = description
-        self.service_type = service_type
-        self.cost_per_hour = cost_per_hour
-        self.deploy_cost = deploy_cost
-        self.region_availability = region_availability
-        self.dependencies = dependencies if dependencies else []
+        template = ServiceTemplate(name, description, service_type, cost_per_hour, deploy_cost,
+                                   tuple(region_availability), tuple(dependencies or ()))
+        self._start(template, instance_id)
+
+    @classmethod
+    def from_template(cls, template: ServiceTemplate,
+                      instance_id: Optional[str] = None) -> "CloudService":
+        """Create a fresh instance sharing an existing template."""
+        service = cls.__new__(cls)
+        service._start(template, instance_id)
+        return service
+
+    def _start(self, template: ServiceTemplate, instance_id: Optional[str]) -> None:
+        """Set the runtime state of a new, undeployed instance."""
+        self._fleet = None
+        self._slot = -1
+        self.template = template
+        self.cost_per_hour = template.cost_per_hour
         self.is_deployed = False
         self.deployment_region = None
         self.health = 100  # Health of the service
         self.security_level = 1  # Security level (1-10)
         self.performance = 5  # Performance level (1-10)
-        self.revenue_per_hour = cost_per_hour * 1.5  # Base revenue
-        self.instance_id = str(uuid.uuid4())[:8]  # Generate unique instance ID
+        self.revenue_per_hour = template.cost_per_hour * 1.5  # Base revenue
+        self.instance_id = instance_id or str(uuid.uuid4())[:8]  # Unique instance ID
         self.uptime_days = 0  # Track how long service has been running
         self.last_maintenance = 0  # Day of last maintenance
-        self.incident_history = []  # Track past incidents
-        self.status_effects = []  # List of active effects on the service
+        # Both are read-only tuples, replaced as a whole when they change
+        # (see _record_incident and add_status_effect). A new instance shares
+        # the empty tuple
+        self.incident_history: Tuple[Dict[str, Any], ...] = ()  # Past incidents
+        self.status_effects: Tuple[Dict[str, Any], ...] = ()  # Active effects on the service
+
+    def clone(self, instance_id: str) -> "CloudService":
+        """Return a detached copy of this instance under a new instance ID.
+
+        The copy shares the template and gets its own runtime state.
+        """
+        service = CloudService.__new__(CloudService)
+        service._fleet = None
+        service._slot = -1
+        service.template = self.template
+        service.deployment_region = self.deployment_region
+        service.instance_id = instance_id
+        service.last_maintenance = self.last_maintenance
+        service.incident_history = tuple(dict(i) for i in self.incident_history)
+        service.status_effects = tuple(dict(e) for e in self.status_effects)
+        service.health = self.health
+        service.security_level = self.security_level
+        service.performance = self.performance
+        service.uptime_days = self.uptime_days
+        service.cost_per_hour = self.cost_per_hour
+        service.revenue_per_hour = self.revenue_per_hour
+        service.is_deployed = self.is_deployed
+        return service
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return a detached copy of the state (used by copy and pickle)."""
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        if self._fleet is not None:
+            for name in self._fleet.columns:
+                state["_" + name] = getattr(self, name)
+            state["_fleet"] = None
+            state["_slot"] = -1
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore state produced by __getstate__."""
+        for slot, value in state.items():
+            setattr(self, slot, value)
 
     def __str__(self) -> str:
         """String representation of the service."""
@@ -119,7 +241,7 @@ class CloudService:
             self.is_deployed = False
             display_notification(
                 f"{self.name} has failed and is now offline!", "error")
-            self.incident_history.append({
+            self._record_incident({
                 "type": "failure",
                 "amount": amount,
                 "day": self.uptime_days
@@ -127,13 +249,17 @@ class CloudService:
             return True  # Indicate service failure
 
         # Record incident
-        self.incident_history.append({
+        self._record_incident({
             "type": "damage",
             "amount": amount,
             "day": self.uptime_days
         })
         return False  # Service still operational
 
+    def _record_incident(self, incident: Dict[str, Any]) -> None:
+        """Add an incident to the end of the history."""
+        self.incident_history += (incident,)
+
     def repair(self, amount: int) -> int:
         """Repair the service.
         
@@ -187,12 +313,15 @@ class CloudService:
             effect: Dictionary with effect details including 'name', 'duration',
                    and optional callback functions
         """
-        self.status_effects.append(effect)
+        # Copy so per-turn duration updates never touch shared content data
+        self.status_effects += (dict(effect),)
         display_notification(
             f"{self.name} is now affected by: {effect['name']}", "warning")
 
     def update_status_effects(self) -> None:
         """Update all status effects and remove expired ones."""
+        if not self.status_effects:
+            return
         active_effects = []
         for effect in self.status_effects:
             effect['duration'] -= 1
@@ -208,4 +337,4 @@ class CloudService:
                 if 'end_effect' in effect and callable(effect['end_effect']):
                     effect['end_effect'](self)
 
-        self.status_effects = active_effects
+        self.status_effects = tuple(active_effects)
@@ -0,0 +1,210 @@
+"""
+Game sessions for network clients.
+
+The game engine is synchronous: it asks its driver for a line and expects
+the answer back. A server cannot make those calls on its event loop without
+stalling every other client, so each session plays in a worker thread of its
+own. Its ChannelDriver hands every write and read to the event loop, and
+the thread waits on the result. A session waiting for its player, pausing
+for an animation or playing a turn holds its own thread and nothing else.
+The event loop only moves bytes.
+
+How the bytes travel is up to the channel (see ``Channel``), so the same
+session can be served over a raw TCP line protocol or any other transport.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+import traceback
+from typing import Callable, List, Optional
+
+from .ansi import StyledText
+from .driver import IODriver, ScriptExhausted, use_driver
+from .game import Game
+from .profiler import PhaseStats
+from .screen import CLEAR, strip_ansi
+
+# Stack size of session threads. The engine never recurses deeply, and a
+# small stack lets one process hold thousands of waiting sessions.
+STACK_SIZE = 1024 * 1024
+
+
+class SessionClosed(ScriptExhausted):
+    """Raised in a session's thread once its client has gone."""
+
+
+class Channel:
+    """The event loop's side of a session: a connection to one client.
+
+    Every method runs on the event loop.
+    """
+
+    async def send(self, text: str, prompt: bool = False) -> None:
+        """Send output to the client, waiting while its connection is backed up.
+
+        Args:
+            text: Output, with "\\n" line endings
+            prompt: The text ends with a prompt the client should answer
+
+        Raises:
+            ConnectionError: If the client has gone
+        """
+        raise NotImplementedError
+
+    async def receive(self) -> Optional[str]:
+        """Wait for the client's next line, or return None once it has gone."""
+        raise NotImplementedError
+
+    def skip(self) -> bool:
+        """Drop one line the client has already sent, returning False if there is none."""
+        return False
+
+
+class ChannelDriver(IODriver):
+    """Driver for a game playing in a worker thread, talking to a client through a channel.
+
+    Output is buffered until the game flushes, pauses or prompts, then sent
+    in one piece. Color sequences are compacted (see ``neon_shadow.ansi``),
+    or stripped for clients that do not want them.
+
+    A turn runs from a line arriving to the next prompt going out. Its time,
+    not counting pauses, is added to ``turns`` on the event loop, so one
+    PhaseStats can be shared by every session of a server.
+
+    Args:
+        channel: The client's channel
+        loop: Event loop the channel belongs to
+        color: Send ANSI colors and screen clears
+        turns: Stats the time of every turn is added to
+    """
+
+    # Every session of a server shares its disk
+    local_files = False
+
+    def __init__(self, channel: Channel, loop: asyncio.AbstractEventLoop,
+                 color: bool = True, turns: Optional[PhaseStats] = None) -> None:
+        self.channel = channel
+        self.loop = loop
+        self.color = color
+        self.turns = turns
+        self.styles = StyledText() if color else None
+        self.closed = False
+        self._pending: List[str] = []
+        self._turn_start: Optional[int] = None  # perf_counter_ns when the last line arrived
+        self._slept_ns = 0  # Time paused since then
+
+    def _call(self, coro):
+        """Run a coroutine on the event loop and wait for its result."""
+        if self.closed:
+            coro.close()
+            raise SessionClosed("Client disconnected")
+        try:
+            return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+        except (ConnectionError, RuntimeError, concurrent.futures.CancelledError):
+            # RuntimeError or CancelledError: the loop has shut down
+            self.closed = True
+            raise SessionClosed("Client disconnected")
+
+    def write(self, text: str) -> None:
+        self._pending.append(text)
+
+    def _send(self, prompt: bool = False) -> None:
+        text = "".join(self._pending)
+        self._pending = []
+        if self.styles is not None:
+            text = self.styles.feed(text).flush().take()
+        else:
+            text = strip_ansi(text)
+        if prompt and self.turns is not None and self._turn_start is not None:
+            elapsed = time.perf_counter_ns() - self._turn_start
+            self._turn_start = None
+            self._call(self._end_turn(text, elapsed, self._slept_ns))
+        elif text or prompt:
+            self._call(self.channel.send(text, prompt))
+
+    async def _end_turn(self, text: str, elapsed_ns: int, slept_ns: int) -> None:
+        self.turns.add(elapsed_ns - slept_ns, 0, 0, slept_ns)
+        await self.channel.send(text, True)
+
+    def flush(self) -> None:
+        self._send()
+
+    def read_line(self, prompt: str = "") -> str:
+        self.write(prompt)
+        self._send(prompt=True)
+        line = self._call(self.channel.receive())
+        if line is None:
+            self.closed = True
+            raise SessionClosed("Client disconnected")
+        self._turn_start = time.perf_counter_ns()
+        self._slept_ns = 0
+        return line
+
+    def clear(self) -> None:
+        if self.color:
+            self._pending = [CLEAR]
+
+    def sleep(self, seconds: float) -> None:
+        self.flush()
+        start = time.perf_counter_ns()
+        time.sleep(seconds)
+        self._slept_ns += time.perf_counter_ns() - start
+
+    def key_pressed(self) -> bool:
+        # A line sent during an animation skips it
+        return self._call(self._skip())
+
+    async def _skip(self) -> bool:
+        return self.channel.skip()
+
+
+class GameSession:
+    """One client's game, played in its own worker thread.
+
+    Args:
+        channel: The client's channel
+        play: Plays a whole session with a new game (e.g. ``main.play``)
+        color: Send ANSI colors and screen clears
+        name: Name of the session's thread
+        turns: Stats the time of every turn is added to
+    """
+
+    def __init__(self, channel: Channel, play: Callable[[Game], None],
+                 color: bool = True, name: str = "session",
+                 turns: Optional[PhaseStats] = None) -> None:
+        self.channel = channel
+        self.play = play
+        self.color = color
+        self.name = name
+        self.turns = turns
+        self.driver: Optional[ChannelDriver] = None
+
+    async def run(self) -> None:
+        """Play the session to the end (the game's or the client's)."""
+        loop = asyncio.get_running_loop()
+        self.driver = ChannelDriver(self.channel, loop, self.color, self.turns)
+        done = loop.create_future()
+
+        def finished() -> None:
+            if not done.done():
+                done.set_result(None)
+
+        def target() -> None:
+            try:
+                # Everything the thread writes goes to its own client
+                with use_driver(self.driver):
+                    self.play(Game(io=self.driver))
+            except SessionClosed:
+                pass
+            except Exception:
+                traceback.print_exc()
+            finally:
+                try:
+                    loop.call_soon_threadsafe(finished)
+                except RuntimeError:  # The loop has shut down
+                    pass
+
+        threading.Thread(target=target, name=self.name, daemon=True).start()
+        await done
@@ -0,0 +1,37 @@
+"""
+State-change signals for the Neon Shadow game.
+
+Objects whose state other systems track (the player, the inventory) expose
+a ``changed`` signal and emit ``(kind, key)`` whenever that state changes,
+e.g. ``("location", "Cloud City")`` or ``("artifact", "IAM Auditor")``.
+"""
+
+from typing import Any, Callable, List
+
+
+class Signal:
+    """Callbacks run when some state changes.
+
+    Listeners are called with the arguments given to ``emit``, in the order
+    they connected.
+    """
+
+    __slots__ = ("_listeners",)
+
+    def __init__(self) -> None:
+        self._listeners: List[Callable[..., Any]] = []
+
+    def connect(self, listener: Callable[..., Any]) -> None:
+        """Call listener on every emit (once, however often it connects)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def disconnect(self, listener: Callable[..., Any]) -> None:
+        """Stop calling listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def emit(self, *args: Any) -> None:
+        """Call every listener with args."""
+        for listener in self._listeners:
+            listener(*args)
@@ -0,0 +1,525 @@
+"""
+Headless campaign simulator for balance testing.
+
+Plays many full campaigns with a scripted policy answering every prompt and
+aggregates the outcomes. Campaigns are spread across CPU cores with a process
+pool; every campaign gets its own seed derived from the master seed, so a run
+is fully reproducible whatever the number of workers.
+
+Usage:
+    python -m neon_shadow.sim --campaigns 100000 --policy greedy --seed 42
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from neon_shadow.catalogue import get_catalogue
+from neon_shadow.driver import IODriver
+from neon_shadow.game import Game
+
+MAIN_MENU_PROMPT = "\nEnter your choice (1-9): "
+SYSTEM_MENU_ACTION = 9
+REST_MENU_PROMPT = "\nEnter your choice (1-3): "
+
+# Days at which every campaign's credit balance is sampled
+CURVE_STEP = 30
+CURVE_DAYS = tuple(range(0, 401, CURVE_STEP))
+
+# Safety net against a policy that never leaves a menu
+MAX_DECISIONS = 50000
+
+
+class CampaignAborted(RuntimeError):
+    """Raised when a campaign exceeds the decision budget."""
+
+
+class Policy:
+    """Scripted player that answers the game's prompts.
+
+    Menus are recognised by their prompt text and by the main-menu action
+    that led to them (``self.context``). Anything a policy does not handle
+    falls back to the last option, which is "Cancel"/"Return" in every menu.
+    """
+
+    name = "base"
+
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+        self.context: Optional[int] = None
+        self.checked_quests_at: Optional[str] = None
+
+    def choose(self, game: Game, prompt_text: str, options: List[int]) -> int:
+        """Pick one of options for the given prompt."""
+        if prompt_text == MAIN_MENU_PROMPT:
+            self.context = self.main_action(game)
+            return self.context
+        if self.context == 7 and prompt_text == REST_MENU_PROMPT:
+            # Rest a day at a time, as every policy did before fast-forward
+            return 1
+        if prompt_text == "Enter quest number: ":
+            # Shows the first active quest's details, or accepts the first
+            # available quest
+            return 1 if 1 in options else 0
+        return self.submenu(game, prompt_text, options)
+
+    def confirm(self, game: Game, prompt_text: str) -> bool:
+        """Answer a yes/no question."""
+        return False
+
+    def main_action(self, game: Game) -> int:
+        """Pick a main-menu action (never the system menu)."""
+        raise NotImplementedError
+
+    def submenu(self, game: Game, prompt_text: str, options: List[int]) -> int:
+        """Pick an option in any menu other than the main menu."""
+        return max(options)
+
+    def _should_check_quests(self, game: Game) -> bool:
+        """Visit the quest board once per arrival at a location."""
+        location = game.player.current_location.name
+        if self.checked_quests_at != location:
+            self.checked_quests_at = location
+            return True
+        return False
+
+
+class RandomPolicy(Policy):
+    """Picks uniformly among the valid options of every menu."""
+
+    name = "random"
+
+    def main_action(self, game: Game) -> int:
+        return self.rng.randint(1, SYSTEM_MENU_ACTION - 1)
+
+    def submenu(self, game: Game, prompt_text: str, options: List[int]) -> int:
+        return self.rng.choice(options)
+
+    def confirm(self, game: Game, prompt_text: str) -> bool:
+        return self.rng.random() < 0.5
+
+
+class GreedyCreditsPolicy(Policy):
+    """Buys and deploys the cheapest services it can afford, then explores for credits."""
+
+    name = "greedy"
+
+    def __init__(self, rng: random.Random) -> None:
+        super().__init__(rng)
+        self.done_this_visit = False
+
+    def _deployable(self, game: Game) -> Optional[int]:
+        """Return the 1-based index of the first service that can be deployed now."""
+        player = game.player
+        region = player.current_location.region
+        for i, service in enumerate(player.inventory.services, 1):
+            if (service.deploy_cost <= player.cloud_credits
+                    and (region in service.region_availability
+                         or "global" in service.region_availability)
+                    and all(player.inventory.has_deployed_service(dep)
+                            for dep in service.dependencies)):
+                return i
+        return None
+
+    def _shop(self, game: Game) -> Optional[Tuple[int, List[Tuple[int, str]]]]:
+        """Return the vendor choice and its affordable services, cheapest first."""
+        player = game.player
+        if len(player.inventory.services) >= player.inventory.max_services:
+            return None
+        for i, vendor in enumerate(player.current_location.vendors, 1):
+            required = vendor.get("reputation_required", {})
+            if any(player.faction_reputation.get(f, level) < level for f, level in required.items()):
+                continue
+            names = [n for n in vendor.get("inventory", {}).get("services", [])
+                     if n in game.services]
+            affordable = sorted(
+                (game.services[n]["deploy_cost"] * 3, idx)
+                for idx, n in enumerate(names, 1)
+                if game.services[n]["deploy_cost"] * 3 <= player.cloud_credits)
+            if affordable:
+                return i, [(idx, names[idx - 1]) for _, idx in affordable]
+        return None
+
+    def main_action(self, game: Game) -> int:
+        self.done_this_visit = False
+        player = game.player
+        if self._should_check_quests(game):
+            return 3
+        if self._deployable(game):
+            return 5
+        if self._shop(game):
+            return 8
+        if player.energy >= 10:
+            return 1
+        return 7
+
+    def submenu(self, game: Game, prompt_text: str, options: List[int]) -> int:
+        if self.context == 5:
+            if prompt_text == "\nEnter your choice (1-4): ":
+                return 4 if self.done_this_visit else 1
+            if prompt_text == "\nEnter your choice: ":
+                self.done_this_visit = True
+                return self._deployable(game) or max(options)
+        elif self.context == 8:
+            shop = self._shop(game)
+            if prompt_text == "Select a vendor: ":
+                return shop[0] if shop else max(options)
+            if prompt_text == "Enter your choice: ":
+                return 2 if (2 in options and shop and not self.done_this_visit) else max(options)
+            if prompt_text == "Select a service to buy: ":
+                self.done_this_visit = True
+                return shop[1][0][0] if shop else max(options)
+        return max(options)
+
+    def confirm(self, game: Game, prompt_text: str) -> bool:
+        # Keep income flowing: repair and redeploy, never sell or quit
+        return prompt_text.startswith(("Repair", "Redeploy"))
+
+
+class ExplorerPolicy(Policy):
+    """Travels toward undiscovered locations and explores wherever it lands."""
+
+    name = "explorer"
+
+    def _destination(self, game: Game) -> Optional[int]:
+        """Return the 1-based index of the preferred reachable connection."""
+        player = game.player
+        graph = game.graph
+        current = player.current_location.name
+        max_skill = max(player.skills.values())
+        reachable = []
+        for i, name in enumerate(graph.neighbours(current), 1):
+            if graph.difficulty[graph.ids[name]] > max_skill + 3:
+                continue
+            if graph.route_cost([current, name]) <= player.energy:
+                reachable.append((name in game.discovered_locations, i))
+        if not reachable:
+            return None
+        undiscovered = [i for seen, i in reachable if not seen]
+        return self.rng.choice(undiscovered or [i for _, i in reachable])
+
+    def main_action(self, game: Game) -> int:
+        player = game.player
+        if self._should_check_quests(game):
+            return 3
+        if player.energy >= 40 and self._destination(game):
+            return 2
+        if player.energy >= 10:
+            return 1
+        return 7
+
+    def submenu(self, game: Game, prompt_text: str, options: List[int]) -> int:
+        if self.context == 2 and prompt_text == "\nEnter your choice: ":
+            return self._destination(game) or max(options)
+        return max(options)
+
+
+POLICIES = {
+    policy.name: policy
+    for policy in (RandomPolicy, GreedyCreditsPolicy, ExplorerPolicy)
+}
+
+
+class PolicyDriver(IODriver):
+    """Headless driver that hands every decision to a policy.
+
+    Args:
+        policy: Policy answering the prompts
+        max_decisions: Abort the campaign after this many decisions
+    """
+
+    headless = True
+
+    def __init__(self, policy: Policy, max_decisions: int = MAX_DECISIONS) -> None:
+        self.policy = policy
+        self.max_decisions = max_decisions
+        self.game: Optional[Game] = None
+        self.decisions = 0
+        self.curve: Dict[int, int] = {}
+
+    def write(self, text: str) -> None:
+        pass
+
+    def read_line(self, prompt: str = "") -> str:
+        # Only "Press Enter" and the name prompt reach here
+        return ""
+
+    def _count(self) -> None:
+        self.decisions += 1
+        if self.decisions > self.max_decisions:
+            raise CampaignAborted(f"No result after {self.max_decisions} decisions")
+
+    def read_choice(self, prompt: str, valid_range) -> int:
+        self._count()
+        if prompt == MAIN_MENU_PROMPT:
+            self._sample_credits()
+        return self.policy.choose(self.game, prompt, list(valid_range))
+
+    def confirm(self, prompt: str) -> bool:
+        self._count()
+        return self.policy.confirm(self.game, prompt)
+
+    def _sample_credits(self) -> None:
+        """Record the credit balance at every curve checkpoint passed so far."""
+        day = self.game.current_day
+        credits = self.game.player.cloud_credits
+        for checkpoint in CURVE_DAYS:
+            if checkpoint > day:
+                break
+            self.curve.setdefault(checkpoint, credits)
+
+
+def play_campaign(policy_name: str, seed: int,
+                  difficulty: str = "normal") -> Dict[str, Any]:
+    """Play one campaign headlessly and summarise the outcome.
+
+    Args:
+        policy_name: Key into POLICIES
+        seed: Campaign seed; the game and the policy each get a generator
+            derived from it, so the same seed replays the same campaign
+        difficulty: Game difficulty level
+
+    Returns:
+        Dictionary with the campaign's result, days, credit curve and quests
+    """
+    rng = random.Random(seed ^ 0x5EED)
+    driver = PolicyDriver(POLICIES[policy_name](rng))
+    game = Game(difficulty, io=driver, seed=seed)
+    driver.game = game
+    game.create_player("Sim Ranger", rng.randint(1, 4))
+
+    aborted = False
+    try:
+        game.game_loop()
+    except CampaignAborted:
+        aborted = True
+
+    return {
+        "won": game.game_won,
+        "aborted": aborted,
+        "days": game.current_day,
+        "reason": game.win_reason if not aborted else "aborted",
+        "credits": game.player.cloud_credits,
+        "curve": driver.curve,
+        "quests": list(game.player.completed_quests),
+    }
+
+
+def _empty_totals() -> Dict[str, Any]:
+    return {
+        "campaigns": 0,
+        "wins": 0,
+        "aborted": 0,
+        "days": Counter(),
+        "reasons": Counter(),
+        "final_credits": 0,
+        "curve_sum": Counter(),
+        "curve_count": Counter(),
+        "quests": Counter(),
+        "quests_completed": 0,
+    }
+
+
+def _add_result(totals: Dict[str, Any], result: Dict[str, Any]) -> None:
+    totals["campaigns"] += 1
+    totals["wins"] += result["won"]
+    totals["aborted"] += result["aborted"]
+    totals["days"][result["days"]] += 1
+    totals["reasons"][result["reason"]] += 1
+    totals["final_credits"] += result["credits"]
+    for day, credits in result["curve"].items():
+        totals["curve_sum"][day] += credits
+        totals["curve_count"][day] += 1
+    totals["quests"].update(result["quests"])
+    totals["quests_completed"] += len(result["quests"])
+
+
+def _merge_totals(totals: Dict[str, Any], other: Dict[str, Any]) -> None:
+    for key, value in other.items():
+        if isinstance(value, Counter):
+            # update() keeps zero and negative sums, unlike +=
+            totals[key].update(value)
+        else:
+            totals[key] += value
+
+
+def run_chunk(policy_name: str, seed: int, count: int,
+              difficulty: str = "normal") -> Dict[str, Any]:
+    """Play count campaigns from one seed and return their aggregate.
+
+    Runs inside a worker process; only the aggregate is sent back.
+    """
+    seeder = random.Random(seed)
+    totals = _empty_totals()
+    for _ in range(count):
+        _add_result(totals, play_campaign(policy_name, seeder.getrandbits(63), difficulty))
+    return totals
+
+
+def _chunks(campaigns: int, seed: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """Yield (seed, count) pairs that cover all campaigns."""
+    seeder = random.Random(seed)
+    remaining = campaigns
+    while remaining > 0:
+        count = min(chunk_size, remaining)
+        yield seeder.getrandbits(63), count
+        remaining -= count
+
+
+def simulate(campaigns: int, policy: str = "random", seed: int = 0,
+             workers: Optional[int] = None, difficulty: str = "normal",
+             chunk_size: Optional[int] = None) -> Dict[str, Any]:
+    """Play campaigns in parallel and return aggregate totals.
+
+    Args:
+        campaigns: Number of campaigns to play
+        policy: Name of the scripted policy ("random", "greedy" or "explorer")
+        seed: Master seed; the same seed always gives the same totals
+        workers: Worker processes (defaults to the CPU count; 1 runs inline)
+        difficulty: Game difficulty level
+        chunk_size: Campaigns per task sent to a worker
+
+    Returns:
+        Aggregated totals (see ``summarise`` for the derived statistics)
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}' (choose from {', '.join(POLICIES)})")
+
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # A few chunks per worker keeps the pool balanced without flooding it
+        chunk_size = max(1, min(250, campaigns // (workers * 4) or 1))
+
+    totals = _empty_totals()
+    chunks = list(_chunks(campaigns, seed, chunk_size))
+    if workers == 1:
+        for chunk_seed, count in chunks:
+            _merge_totals(totals, run_chunk(policy, chunk_seed, count, difficulty))
+        return totals
+
+    # Build the content catalogue before forking so every worker inherits it
+    get_catalogue()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_chunk, policy, chunk_seed, count, difficulty)
+                   for chunk_seed, count in chunks]
+        for future in futures:
+            _merge_totals(totals, future.result())
+    return totals
+
+
+def _percentile(histogram: Counter, fraction: float) -> int:
+    target = fraction * sum(histogram.values())
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen >= target:
+            return value
+    return 0
+
+
+def summarise(totals: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn aggregate totals into the balance report."""
+    n = totals["campaigns"] or 1
+    days = totals["days"]
+    return {
+        "campaigns": totals["campaigns"],
+        "win_rate": totals["wins"] / n,
+        "aborted": totals["aborted"],
+        "days": {
+            "mean": sum(d * c for d, c in days.items()) / n,
+            "p10": _percentile(days, 0.10),
+            "median": _percentile(days, 0.50),
+            "p90": _percentile(days, 0.90),
+        },
+        "mean_final_credits": totals["final_credits"] / n,
+        "credit_curve": [
+            {"day": day,
+             "campaigns": totals["curve_count"][day],
+             "mean_credits": totals["curve_sum"][day] / totals["curve_count"][day]}
+            for day in CURVE_DAYS if totals["curve_count"][day]
+        ],
+        "mean_quests_completed": totals["quests_completed"] / n,
+        "quest_completion": {
+            quest: count / n for quest, count in totals["quests"].most_common()
+        },
+        "end_reasons": dict(totals["reasons"].most_common()),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Format the balance report as plain text."""
+    days = report["days"]
+    lines = [
+        f"Campaigns:        {report['campaigns']} ({report['aborted']} aborted)",
+        f"Win rate:         {report['win_rate']:.2%}",
+        f"Days survived:    mean {days['mean']:.1f}, p10 {days['p10']}, "
+        f"median {days['median']}, p90 {days['p90']}",
+        f"Final credits:    mean {report['mean_final_credits']:.0f}",
+        f"Quests completed: mean {report['mean_quests_completed']:.2f}",
+        "",
+        "Credit curve (day: mean credits, campaigns still running)",
+    ]
+    for point in report["credit_curve"]:
+        lines.append(f"  {point['day']:>4}: {point['mean_credits']:>9.0f}  ({point['campaigns']})")
+    lines.append("")
+    lines.append("Quest completion rate")
+    for quest, rate in report["quest_completion"].items():
+        lines.append(f"  {quest:<28} {rate:.2%}")
+    lines.append("")
+    lines.append("End reasons")
+    for reason, count in report["end_reasons"].items():
+        lines.append(f"  {count:>7}  {reason}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m neon_shadow.sim",
+        description="Play many headless Neon Shadow campaigns and report balance statistics.")
+    parser.add_argument("-n", "--campaigns", type=int, default=1000,
+                        help="number of campaigns to play (default: 1000)")
+    parser.add_argument("-p", "--policy", choices=sorted(POLICIES), default="random",
+                        help="scripted player policy (default: random)")
+    parser.add_argument("-s", "--seed", type=int, default=0,
+                        help="master random seed (default: 0)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("-d", "--difficulty", choices=("easy", "normal", "hard"),
+                        default="normal", help="game difficulty (default: normal)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="campaigns per worker task")
+    parser.add_argument("--json", action="store_true",
+                        help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    totals = simulate(args.campaigns, args.policy, args.seed, args.workers,
+                      args.difficulty, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    report = summarise(totals)
+    report["policy"] = args.policy
+    report["difficulty"] = args.difficulty
+    report["seed"] = args.seed
+    report["elapsed_seconds"] = round(elapsed, 3)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(f"Policy: {args.policy}  Difficulty: {args.difficulty}  Seed: {args.seed}")
+        print(format_report(report))
+        print(f"\nElapsed: {elapsed:.1f}s "
+              f"({totals['campaigns'] / elapsed if elapsed else 0:.0f} campaigns/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+Template/instance split for items created from game content.
+
+Artifacts and services keep their content data (name, description, costs,
+regions, ...) in an immutable template shared by every instance made from
+the same content entry; an instance only stores its own runtime state.
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, Dict, Generic, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def template_field(name: str, doc: str = "") -> property:
+    """Attribute read from the object's ``template``.
+
+    Assigning to it gives the object its own copy of the template with that
+    field changed; other instances keep the shared one.
+    """
+    def set_field(obj, value) -> None:
+        obj.template = obj.template._replace(**{name: value})
+    return property(attrgetter("template." + name), set_field, doc=doc or None)
+
+
+class TemplateCache(Generic[T]):
+    """Templates built from content dicts, one per dict.
+
+    Content dicts live for the whole process, so they are keyed by identity;
+    the cache holds a reference to each dict so its id is never reused.
+
+    Args:
+        build: Creates a template from a content dict
+    """
+
+    def __init__(self, build: Callable[[Dict[str, Any]], T]) -> None:
+        self.build = build
+        self._by_id: Dict[int, Tuple[Dict[str, Any], T]] = {}
+
+    def get(self, data: Dict[str, Any]) -> T:
+        """Return the template for a content dict, building it on first use."""
+        entry = self._by_id.get(id(data))
+        if entry is None:
+            entry = self._by_id[id(data)] = (data, self.build(data))
+        return entry[1]
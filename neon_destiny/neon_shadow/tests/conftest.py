@@ -0,0 +1,97 @@
+"""
+Shared fixtures for the Neon Shadow benchmark suite.
+
+Every benchmark plays with a fixed seed and a headless driver, so the work
+measured is the same from run to run. Benchmarks that change the game they
+measure build a fresh game for every round in an untimed setup step.
+
+Usage (from the neon_destiny directory):
+    python -m pytest                                  # Run and compare with the stored baseline
+    python -m pytest --benchmark-disable              # Run every benchmark once, as a test
+    python -m pytest --benchmark-save=baseline        # Store a new baseline
+    python -m pytest --benchmark-compare --benchmark-compare-fail=mean:25%
+
+Baselines are kept where pytest-benchmark puts them, in ``.benchmarks``
+under the neon_destiny directory, one directory per machine and
+interpreter. They only compare meaningfully on the machine that stored them.
+"""
+
+import random
+from typing import Callable, Optional
+
+import pytest
+
+from neon_shadow.content.services import SERVICES
+from neon_shadow.driver import NullDriver, set_driver
+from neon_shadow.game import Game
+from neon_shadow.service import create_service
+
+SEED = 20240501
+
+
+def deploy_services(game: Game, count: int) -> None:
+    """Deploy count service instances at the player's location, cycling through every service."""
+    blueprints = [create_service(data) for data in SERVICES.values()]
+    region = game.player.current_location.region
+    inventory = game.player.inventory
+    for n in range(count):
+        service = blueprints[n % len(blueprints)].clone(game.new_instance_id())
+        service.is_deployed = True
+        service.deployment_region = region
+        inventory.add_deployed_service(service)
+
+
+@pytest.fixture
+def seed() -> int:
+    """The seed every benchmark plays with unless it needs several."""
+    return SEED
+
+
+@pytest.fixture
+def make_game() -> Callable[..., Game]:
+    """Return a factory for headless games with a player in Cloud City.
+
+    The factory takes the seed (``SEED`` by default), the number of services
+    to deploy and the difficulty.
+    """
+    def make(seed: int = SEED, services: int = 0, difficulty: str = "normal") -> Game:
+        game = Game(difficulty, io=NullDriver(), seed=seed)
+        game.create_player("Bench Ranger", random.Random(seed).randint(1, 4))
+        deploy_services(game, services)
+        return game
+
+    return make
+
+
+@pytest.fixture
+def game(make_game) -> Game:
+    """A fresh headless game with no services deployed."""
+    return make_game()
+
+
+@pytest.fixture(autouse=True)
+def headless() -> None:
+    """Never let a benchmark fall back to the terminal driver."""
+    set_driver(NullDriver())
+
+
+@pytest.fixture
+def bench_fresh(benchmark):
+    """Benchmark a function that changes the game it is given.
+
+    Returns a runner taking the function, a factory that builds the game, an
+    optional ``warm`` step run on the game before the round (e.g. one turn,
+    so lazily created objects exist) and the number of rounds. Building and
+    warming the game is not timed.
+    """
+    def run(target: Callable[[Game], object], factory: Callable[[], Game],
+            warm: Optional[Callable[[Game], None]] = None, rounds: int = 30):
+        def setup():
+            game = factory()
+            if warm is not None:
+                warm(game)
+            return (game,), {}
+
+        return benchmark.pedantic(target, setup=setup, rounds=rounds)
+
+    return run
@@ -0,0 +1,71 @@
+"""Benchmarks for event checks against catalogues far larger than the game's own."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from neon_shadow.catalogue import LazyObjects, spawn_event  # noqa: E402
+from neon_shadow.event import CloudEvent  # noqa: E402
+from neon_shadow.scheduler import EventIndex, EventScheduler  # noqa: E402
+
+SKILLS = ("security", "networking", "cloud", "database", "serverless", "investigation")
+CLUES = 50  # Distinct clues the generated events require and grant
+TURNS = 365  # Turns per benchmark, so every run plays out the same year
+
+
+def make_event(n: int) -> CloudEvent:
+    """Return the nth generated event, cycling through every requirement kind."""
+    kind = n % 4
+    if kind == 0:
+        requirements = {}
+    elif kind == 1:
+        requirements = {"min_skill": {SKILLS[n % len(SKILLS)]: 1 + n % 4}}
+    elif kind == 2:
+        requirements = {"clues": [f"Bench clue {n % CLUES}"]}
+    else:
+        requirements = {"min_faction_rep": {"CorpSec": n % 20}}
+    effects = {"clue": f"Bench clue {(n + 1) % CLUES}"} if n % 3 == 0 else {"credits": 1}
+    event = CloudEvent(f"bench_{n}", f"Bench Event {n}", "Generated for benchmarking.",
+                       "encounter", effects=effects, requirements=requirements,
+                       chance=5, repeatable=n % 5 != 0)
+    event.cooldown_duration = 3
+    return event
+
+
+def use_events(game, count: int) -> None:
+    """Replace a game's events with count generated ones."""
+    prototypes = {event.id: event for event in map(make_event, range(count))}
+    game.events = LazyObjects(prototypes, spawn_event)
+    game.event_scheduler = EventScheduler(
+        game.events, EventIndex(prototypes, game.catalogue.locations))
+
+
+@pytest.mark.parametrize("events", [100, 1000, 10000])
+def test_check_events(benchmark, game, events):
+    """Per-turn event checks over a year (cooldowns released, requirements refreshed, rolls)."""
+    use_events(game, events)
+    scheduler = game.event_scheduler
+
+    def turn():
+        scheduler.advance()
+        game.check_events()
+
+    benchmark.pedantic(turn, rounds=TURNS)
+
+
+def test_check_events_content(benchmark, game):
+    """The same checks against the game's own events."""
+    scheduler = game.event_scheduler
+
+    def turn():
+        scheduler.advance()
+        game.check_events()
+
+    benchmark.pedantic(turn, rounds=TURNS)
+
+
+def test_event_index(benchmark, game):
+    """Indexing 10,000 events by location and by the requirements they read."""
+    prototypes = {event.id: event for event in map(make_event, range(10000))}
+    index = benchmark(EventIndex, prototypes, game.catalogue.locations)
+    assert len(index.unbound) == len(prototypes)
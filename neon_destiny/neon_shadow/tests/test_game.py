@@ -0,0 +1,66 @@
+"""Benchmarks for the turn loop: the daily update, exploring and travelling."""
+
+import itertools
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("services", [0, 10, 100, 1000])
+def test_update_game_state(bench_fresh, make_game, services):
+    """One daily tick with this many services deployed (past the first, which builds the fleet)."""
+    def warm(game):
+        game.update_game_state()
+
+    bench_fresh(lambda game: game.update_game_state(),
+                lambda: make_game(services=services), warm=warm)
+
+
+def test_explore_location(bench_fresh, make_game):
+    """Exploring Cloud City, over many seeds so every kind of discovery is timed."""
+    seeds = itertools.count(1)
+    bench_fresh(lambda game: game.explore_location(),
+                lambda: make_game(seed=next(seeds)), rounds=100)
+
+
+def test_travel_to_neighbour(bench_fresh, make_game):
+    """A one-hop trip to each of Cloud City's neighbours in turn."""
+    game = make_game()
+    neighbours = game.graph.neighbours("Cloud City")
+    trips = itertools.count()
+
+    def travel(game):
+        assert game.travel_to(neighbours[next(trips) % len(neighbours)])
+
+    bench_fresh(travel, make_game)
+
+
+def test_route_planning(benchmark, game):
+    """Cheapest routes between every pair of locations."""
+    graph = game.graph
+    names = list(graph.names)
+
+    def plan_all():
+        return sum(1 for a in names for b in names
+                   if a != b and graph.route(a, b) is not None)
+
+    assert benchmark(plan_all) > 0
+
+
+def test_bounded_route_planning(benchmark, game):
+    """Routes that must avoid dangerous locations, which are searched for on demand."""
+    graph = game.graph
+    names = list(graph.names)
+    easiest = min(graph.difficulty)
+
+    def plan_all():
+        return sum(1 for a in names for b in names
+                   if a != b and graph.route(a, b, max_difficulty=easiest + 3) is not None)
+
+    benchmark(plan_all)
+
+
+def test_fast_forward_month(bench_fresh, make_game):
+    """Thirty idle days with a few services deployed (or until something happens)."""
+    bench_fresh(lambda game: game.fast_forward(30), lambda: make_game(services=5))
@@ -0,0 +1,55 @@
+"""Benchmarks for inventory lookups with a large deployed fleet."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from neon_shadow.artifact import create_artifact  # noqa: E402
+from neon_shadow.content.artifacts import ARTIFACTS  # noqa: E402
+
+
+@pytest.fixture
+def inventory(make_game):
+    """A full artifact inventory and 1,000 deployed services."""
+    game = make_game(services=1000)
+    inventory = game.player.inventory
+    for data in list(ARTIFACTS.values())[:inventory.max_artifacts]:
+        inventory.add_artifact(create_artifact(data))
+    return inventory
+
+
+def test_artifact_lookups(benchmark, inventory):
+    """has_artifact and get_artifact for every artifact in the content, held or not."""
+    names = [data["name"] for data in ARTIFACTS.values()]
+
+    def look_up():
+        return sum(1 for name in names
+                   if inventory.has_artifact(name) and inventory.get_artifact(name) is not None)
+
+    assert benchmark(look_up) == len(inventory.artifacts)
+
+
+def test_deployed_service_lookups(benchmark, inventory):
+    """get_deployed_service for every instance ID, then by-name checks and counts."""
+    ids = [service.instance_id for service in inventory.deployed_services]
+    names = sorted({service.name for service in inventory.deployed_services})
+
+    def look_up():
+        found = sum(1 for instance_id in ids if inventory.get_deployed_service(instance_id))
+        found += sum(inventory.count_deployed(name) for name in names
+                     if inventory.has_deployed_service(name))
+        return found
+
+    assert benchmark(look_up) == 2 * len(ids)
+
+
+def test_deploy_and_remove(benchmark, inventory):
+    """Removing a deployed service from the middle of the fleet and deploying it again."""
+    service = inventory.deployed_services[len(inventory.deployed_services) // 2]
+
+    def cycle():
+        inventory.remove_deployed_service(service.instance_id)
+        inventory.add_deployed_service(service)
+
+    benchmark(cycle)
+    assert inventory.get_deployed_service(service.instance_id) is service
@@ -0,0 +1,150 @@
+"""Checks on whole turns of play, run with or without pytest-benchmark."""
+
+import pytest
+
+from neon_shadow import savegame
+from neon_shadow.driver import ScriptExhausted, ScriptedDriver, get_driver, use_driver
+from neon_shadow.game import Game
+from neon_shadow.savegame import decode_snapshot, encode_snapshot, write_save
+from neon_shadow.ui import get_render_profile
+
+
+def test_games_keep_their_own_drivers():
+    """A game plays through its own driver, however many games were created after it."""
+    active = get_driver()
+    first = ScriptedDriver(["Ada", "1", ""], capture=True)
+    game = Game(io=first, seed=1)
+    second = ScriptedDriver(capture=True)
+    Game(io=second, seed=2)
+
+    assert get_driver() is active
+    with pytest.raises(ScriptExhausted):
+        game.start_game()
+    assert "Character created! Welcome, Ada" in first.text()
+    assert second.text() == ""
+    assert get_driver() is active
+
+
+def corrupt_player(state):
+    del state["player"]["inventory"]["deployed"]
+
+
+def corrupt_weather(state):
+    for entry in state["weather"].values():
+        entry[0] = "No Such Weather"
+
+
+def corrupt_rng(state):
+    state["rng"][1] = b"\x00" * 5
+
+
+@pytest.mark.parametrize("corrupt", [corrupt_player, corrupt_weather, corrupt_rng],
+                         ids=["player", "weather", "rng"])
+def test_corrupt_save_leaves_game_playable(make_game, tmp_path, monkeypatch, corrupt):
+    """Loading a corrupt save from the system menu changes nothing, and play goes on."""
+    monkeypatch.setattr(savegame, "SAVE_DIR", str(tmp_path))
+    game = make_game(services=40)
+    game.fast_forward(20)
+    state = decode_snapshot(encode_snapshot(game.snapshot()))
+    corrupt(state)
+    write_save(savegame.save_path("quicksave"), state)
+    before = encode_snapshot(game.snapshot())
+
+    # Load the quicksave, then return to the game
+    driver = ScriptedDriver(["2", "", "y", "", "7"], capture=True)
+    with use_driver(driver):
+        game.system_menu()
+
+    assert "Could not load the game" in driver.text()
+    assert encode_snapshot(game.snapshot()) == before
+    day = game.current_day
+    game.fast_forward(1)
+    assert game.current_day == day + 1
+
+
+def test_render_speed_is_per_player(game):
+    """Choosing a render speed changes it for this game's driver only."""
+    default = get_render_profile()
+    game.io = ScriptedDriver(["3", "3", ""])
+    with use_driver(game.io):
+        game.game_options()
+
+    assert get_render_profile(game.io) == "instant"
+    assert get_render_profile() == default
+    assert get_render_profile(ScriptedDriver()) == default
+
+
+def test_online_games_cannot_save(game, tmp_path, monkeypatch):
+    """Players of a shared server get no save slots on its disk."""
+    monkeypatch.setattr(savegame, "SAVE_DIR", str(tmp_path))
+    game.io = ScriptedDriver(["1", "", "2", "", "7"], capture=True)
+    game.io.local_files = False
+    with use_driver(game.io):
+        game.system_menu()
+
+    assert game.io.text().count("Saves are not available in online games.") == 2
+    assert not list(tmp_path.iterdir())
+
+
+def travel_script(game, destination, planned):
+    """Answers that travel to destination from the main menu, by a planned route or hop by hop.
+
+    Every other numbered menu (an event's, say) gets its first option; the
+    script runs out at the first main menu once the player has arrived.
+    """
+    travelling = False
+
+    def answer(text):
+        nonlocal travelling
+        if "(1-9)" in text:
+            if game.player.current_location.name == destination:
+                raise ScriptExhausted("Arrived")
+            travelling = True
+            return "2"
+        if travelling and "Enter your choice" in text:
+            travelling = False
+            neighbours = game.graph.neighbours(game.player.current_location.name)
+            if planned:
+                return str(len(neighbours) + 1)
+            route = game.graph.route(game.player.current_location.name, destination)
+            return str(neighbours.index(route[1]) + 1)
+        if "Select a destination" in text:
+            return "1"  # The only location discovered
+        if "(y/n)" in text:
+            return "n"
+        return "1" if "choice" in text.lower() else ""
+
+    return answer
+
+
+@pytest.mark.parametrize("seed", range(1, 9))
+def test_planned_route_plays_every_hop(make_game, seed):
+    """A two-hop planned route leaves the game as travelling both hops by hand does."""
+    games = make_game(seed=seed), make_game(seed=seed)
+    for game, planned in zip(games, (True, False)):
+        game.discovered_locations.add("Edge Outpost")
+        game.io = ScriptedDriver(travel_script(game, "Edge Outpost", planned))
+        with pytest.raises(ScriptExhausted):
+            game.game_loop()
+
+    planned, by_hand = games
+    assert planned.player.current_location.name == "Edge Outpost"
+    assert planned.current_day == 2 + 2 * 2  # The first tick, then each hop's day and tick
+    assert planned.snapshot() == by_hand.snapshot()
+
+
+@pytest.mark.parametrize("services,location", [
+    (0, None), (5, None), (40, None), (5, "DevOps Desert"),
+], ids=["idle", "services", "fleet", "hazards"])
+def test_fast_forward_matches_single_days(make_game, services, location):
+    """fast_forward(n) leaves the game as n one-day fast-forwards do, quiet days skipped or not."""
+    games = make_game(services=services), make_game(services=services)
+    if location:
+        for game in games:
+            game.player.current_location = game.locations[location]
+    batched, stepped = games
+    while batched.current_day < 150 and not batched.game_over:
+        passed, reason = batched.fast_forward(150 - batched.current_day)
+        stops = [stepped.fast_forward(1) for _ in range(passed)]
+        assert stops == [(1, None)] * (passed - 1) + [(1, reason)]
+        assert batched.snapshot() == stepped.snapshot()
@@ -0,0 +1,62 @@
+"""Benchmarks for saving and loading a game part-way through a campaign."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from neon_shadow.savegame import (  # noqa: E402
+    SaveGameError, decode_snapshot, encode_snapshot, packb, read_save, unpackb)
+
+DAYS = 60
+
+
+@pytest.fixture
+def played(make_game):
+    """A game with 100 services deployed, fast-forwarded to day DAYS."""
+    game = make_game(services=100)
+    while game.current_day < DAYS and not game.game_over:
+        game.fast_forward(DAYS - game.current_day)
+    return game
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["raw", "zlib"])
+def test_encode(benchmark, played, compress):
+    """Snapshot and encode the game."""
+    data = benchmark(lambda: encode_snapshot(played.snapshot(), compress))
+    assert decode_snapshot(data)["current_day"] == played.current_day
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["raw", "zlib"])
+def test_decode_and_restore(benchmark, played, make_game, compress):
+    """Decode a save and restore it into another game."""
+    data = encode_snapshot(played.snapshot(), compress)
+    game = make_game()
+    benchmark(lambda: game.restore(decode_snapshot(data)))
+    assert game.snapshot()["player"] == played.snapshot()["player"]
+
+
+def test_file_round_trip(benchmark, played, make_game, tmp_path):
+    """Write a save file, read it back and restore it."""
+    path = str(tmp_path / "bench.nsav")
+    game = make_game()
+
+    def round_trip():
+        played.save_game(path)
+        game.restore(read_save(path))
+
+    benchmark(round_trip)
+    assert game.current_day == played.current_day
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    packb("truncated")[:-1],
+    packb(2 ** 80)[:-1],
+    b"\xc7\x20\x01\x00",
+    b"\x81\x90\x00",
+    b"\x91" * 100_000,
+], ids=["empty", "fixstr", "bigint", "ext8-length", "array-key", "deep"])
+def test_malformed_data(data):
+    """Malformed save data raises SaveGameError, not whatever the decoder hit."""
+    with pytest.raises(SaveGameError):
+        unpackb(data)
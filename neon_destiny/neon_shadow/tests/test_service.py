@@ -0,0 +1,28 @@
+"""Checks that a service's incident history and status effects are always tuples."""
+
+from neon_shadow.content.services import SERVICES
+from neon_shadow.savegame import dump_service, load_service
+from neon_shadow.service import create_service
+
+
+def histories(service):
+    return type(service.incident_history), type(service.status_effects)
+
+
+def test_history_and_effects_stay_tuples():
+    """Fresh, damaged, affected, recovered, cloned and reloaded services all hold tuples."""
+    service = create_service(SERVICES["EC2_Instance"])
+    assert histories(service) == (tuple, tuple)
+
+    service.apply_damage(5)
+    service.add_status_effect({"name": "Slowdown", "duration": 1})
+    assert histories(service) == (tuple, tuple)
+    assert [incident["amount"] for incident in service.incident_history] == [5]
+    assert [effect["name"] for effect in service.status_effects] == ["Slowdown"]
+
+    service.update_status_effects()  # The effect runs out
+    assert service.status_effects == ()
+
+    for copy in (service.clone("copy"), load_service(dump_service(service), {})):
+        assert histories(copy) == (tuple, tuple)
+        assert copy.incident_history == service.incident_history
@@ -0,0 +1,21 @@
+"""Benchmarks for full headless campaigns, the end-to-end cost of the turn loop."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from neon_shadow.sim import POLICIES, play_campaign, simulate  # noqa: E402
+
+
+@pytest.mark.parametrize("policy", sorted(POLICIES))
+def test_play_campaign(benchmark, seed, policy):
+    """One campaign from start to finish with a scripted policy."""
+    result = benchmark.pedantic(play_campaign, args=(policy, seed), rounds=5)
+    assert not result["aborted"]
+    assert result == play_campaign(policy, seed)  # Same seed, same campaign
+
+
+def test_simulate_inline(benchmark, seed):
+    """A batch of 20 explorer campaigns in this process."""
+    totals = benchmark.pedantic(simulate, args=(20, "explorer", seed, 1), rounds=3)
+    assert totals["campaigns"] == 20
@@ -0,0 +1,47 @@
+"""Checks that the weather engine moves time on the same way however many days it skips."""
+
+import copy
+import random
+
+import pytest
+
+from neon_shadow.catalogue import get_catalogue
+from neon_shadow.weather import WeatherEngine
+
+
+def make_engine(seed: int) -> WeatherEngine:
+    """A weather engine for every location, with its starting weather drawn."""
+    catalogue = get_catalogue()
+    engine = WeatherEngine(catalogue.weather, catalogue.locations, random.Random(seed))
+    engine.roll()
+    return engine
+
+
+def engine_state(engine: WeatherEngine):
+    return (engine.day, engine.weather, engine.severity, engine.expiry,
+            sorted(engine._changes), engine.rng.getstate())
+
+
+@pytest.mark.parametrize("days", [1, 2, 5, 30, 365])
+def test_advance_many_days_at_once(seed, days):
+    """One advance(days) leaves the engine as days calls to advance(1) do."""
+    stepped, skipped = make_engine(seed), make_engine(seed)
+    changed = {}
+    for _ in range(days):
+        for name in stepped.advance(1):
+            changed.pop(name, None)
+            changed[name] = None
+
+    assert skipped.advance(days) == list(changed)
+    assert engine_state(skipped) == engine_state(stepped)
+
+
+def test_weather_moves_one_day_per_turn(make_game):
+    """The daily tick moves the weather on by one day, however long the last action took."""
+    game = make_game()
+    engine = copy.deepcopy(game.weather)
+    game.current_day += 2  # Say, a rest and a journey
+    game.update_game_state()  # The next turn
+    engine.advance(1)
+
+    assert engine_state(game.weather) == engine_state(engine)
@@ -0,0 +1,233 @@
+"""
+Quest progress tracker for the Neon Shadow game.
+
+Objectives the game can verify by itself declare a ``check`` in
+``content/quests.py``. Checks are compiled once into predicates over the
+player, each listening for the state-change signals it reads, so a quest is
+only re-evaluated after something its objectives depend on has changed.
+Quest availability is indexed by location and by prerequisite.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from neon_shadow.effects import ContentError
+from neon_shadow.quest import Quest
+
+# (kind, key) as emitted by a ``changed`` signal; a key of None matches any
+SignalKey = Tuple[str, Optional[str]]
+
+
+class ObjectiveCheck(NamedTuple):
+    """A compiled objective check.
+
+    Attributes:
+        keys: Signals after which the check may pass or fail differently
+        test: Returns True if the objective is met by the given player
+        after: ID of an objective of the same quest that must be completed first
+    """
+
+    keys: Tuple[SignalKey, ...]
+    test: Callable[[Any], bool]
+    after: Optional[str] = None
+
+
+def compile_check(spec: Dict[str, Any]) -> ObjectiveCheck:
+    """Compile an objective's ``check`` spec.
+
+    Supported types:
+        visit_location: ``location``; the player is there
+        own_artifact: optional ``artifact``; the player holds it (any artifact
+            if not given)
+        deploy_service: optional ``service`` and ``count`` (default 1); at
+            least count instances are deployed (of any service if not given)
+        collect_clue: ``clues``, one clue or a list; the player has them all
+
+    Any check may also name an objective of the same quest in ``after``.
+
+    Raises:
+        ContentError: If the spec is not understood
+    """
+    kind = spec.get("type")
+    try:
+        if kind == "visit_location":
+            location = spec["location"]
+            keys: Tuple[SignalKey, ...] = (("location", location),)
+
+            def test(player) -> bool:
+                current = player.current_location
+                return current is not None and current.name == location
+
+        elif kind == "own_artifact":
+            artifact = spec.get("artifact")
+            keys = (("artifact", artifact),)
+
+            def test(player) -> bool:
+                if artifact is None:
+                    return bool(player.inventory.artifacts)
+                return player.inventory.has_artifact(artifact)
+
+        elif kind == "deploy_service":
+            service = spec.get("service")
+            count = int(spec.get("count", 1))
+            keys = (("deployed", service),)
+
+            def test(player) -> bool:
+                return player.inventory.count_deployed(service) >= count
+
+        elif kind == "collect_clue":
+            clues = spec["clues"]
+            clues = (clues,) if isinstance(clues, str) else tuple(clues)
+            keys = tuple(("clue", clue) for clue in clues)
+
+            def test(player) -> bool:
+                return all(clue in player.clues for clue in clues)
+
+        else:
+            raise ContentError(f"unknown check type {kind!r}")
+    except (KeyError, TypeError, ValueError) as e:
+        raise ContentError(f"bad {kind} check: {e}") from e
+    return ObjectiveCheck(keys, test, spec.get("after"))
+
+
+class QuestIndex:
+    """The static half of quest tracking, shared by every game.
+
+    Args:
+        quests: All quests, by ID; only their requirements are read
+        checks: Compiled checks by quest ID, as (objective index, check) pairs
+    """
+
+    def __init__(self, quests: Mapping[str, Quest],
+                 checks: Mapping[str, List[Tuple[int, ObjectiveCheck]]]) -> None:
+        self.quests = quests
+        self.checks = checks
+        self.order = {quest_id: i for i, quest_id in enumerate(quests)}
+
+        # Location name (None for anywhere) -> IDs of the quests offered there
+        self.by_location: Dict[Optional[str], List[str]] = {}
+        # Quest ID -> IDs of the quests that list it as a prerequisite
+        self.unlocks: Dict[str, List[str]] = {}
+        for quest_id, quest in quests.items():
+            self.by_location.setdefault(quest.location or None, []).append(quest_id)
+            for prereq in quest.prereq_quests:
+                self.unlocks.setdefault(prereq, []).append(quest_id)
+
+        # Signal key -> IDs of the quests with a check listening for it
+        self.watchers: Dict[SignalKey, List[str]] = {}
+        for quest_id, quest_checks in checks.items():
+            for _, check in quest_checks:
+                for key in check.keys:
+                    watchers = self.watchers.setdefault(key, [])
+                    if quest_id not in watchers:
+                        watchers.append(quest_id)
+
+
+class QuestTracker:
+    """Tracks a player's progress through the game's quests.
+
+    A quest is re-evaluated only when it becomes active or when the player
+    or inventory signals a change one of its checks listens for. Quests whose
+    prerequisites are all completed are kept in a set, updated as quests are
+    completed, so offering quests at a location only looks at the quests
+    indexed there.
+
+    Args:
+        quests: The game's quests, by ID
+        index: Index over the same quests
+    """
+
+    def __init__(self, quests: Mapping[str, Quest], index: QuestIndex) -> None:
+        self.quests = quests
+        self.index = index
+        self.player = None
+        self._inventory = None
+        self._dirty: Set[str] = set()  # Quests to re-evaluate
+        self._unlocked: Set[str] = set()  # Quests whose prerequisites are completed
+
+    def attach(self, player) -> None:
+        """Start tracking a player (again, if its inventory was replaced)."""
+        if self.player is not None:
+            self.player.changed.disconnect(self._changed)
+            self._inventory.changed.disconnect(self._changed)
+        self.player = player
+        self._inventory = player.inventory
+        player.changed.connect(self._changed)
+        player.inventory.changed.connect(self._changed)
+
+        self._dirty = set(player.active_quests)
+        completed = set(player.completed_quests)
+        self._unlocked = {
+            quest_id for quest_id, quest in self.index.quests.items()
+            if all(prereq in completed for prereq in quest.prereq_quests)
+        }
+
+    @property
+    def pending(self) -> bool:
+        """True if a change is waiting for ``update`` to re-evaluate quests."""
+        return bool(self._dirty)
+
+    def _changed(self, kind: str, key: str) -> None:
+        watchers = self.index.watchers
+        self._dirty.update(watchers.get((kind, key), ()))
+        self._dirty.update(watchers.get((kind, None), ()))
+
+    def activate(self, quest_id: str) -> None:
+        """Record that a quest was added to the player's active quests."""
+        self._dirty.add(quest_id)
+
+    def completed(self, quest_id: str) -> None:
+        """Record that a quest was added to the player's completed quests."""
+        completed = self.player.completed_quests
+        for dependent in self.index.unlocks.get(quest_id, ()):
+            if all(prereq in completed for prereq in self.index.quests[dependent].prereq_quests):
+                self._unlocked.add(dependent)
+
+    def update(self) -> List[Tuple[Quest, List[Dict[str, Any]]]]:
+        """Complete the objectives of active quests whose checks now pass.
+
+        Returns:
+            (quest, objectives completed now) for every active quest that was
+            re-evaluated, in the order of the player's active quests
+        """
+        if not self._dirty or self.player is None:
+            return []
+        player = self.player
+        dirty = self._dirty
+        self._dirty = set()
+
+        progress = []
+        for quest_id in player.active_quests:
+            if quest_id not in dirty or quest_id not in self.quests:
+                continue
+            quest = self.quests[quest_id]
+            done = []
+            for i, check in self.index.checks.get(quest_id, ()):
+                objective = quest.objectives[i]
+                if objective["completed"]:
+                    continue
+                if check.after and not quest.objective_completed(check.after):
+                    continue
+                if check.test(player):
+                    objective["completed"] = True
+                    done.append(objective)
+            progress.append((quest, done))
+        return progress
+
+    def available(self, location_name: str) -> List[Quest]:
+        """Return the quests the player can accept at a location.
+
+        Returns:
+            Quests neither active nor completed whose requirements are met,
+            in catalogue order
+        """
+        player = self.player
+        by_location = self.index.by_location
+        ids = [quest_id for quest_id in by_location.get(location_name, ())
+               if quest_id in self._unlocked]
+        ids.extend(quest_id for quest_id in by_location.get(None, ())
+                   if quest_id in self._unlocked)
+        ids.sort(key=self.index.order.__getitem__)
+        return [self.quests[quest_id] for quest_id in ids
+                if quest_id not in player.active_quests
+                and quest_id not in player.completed_quests
+                and self.index.quests[quest_id].is_available(player)]
@@ -3,69 +3,160 @@ UI related functions for the Neon Shadow game, handling display and visual effec
 """
 
 import os
-import sys
 import time
 import random
+from .ansi import StyledText
 from .constants import *
+from .driver import get_driver
+
+# Render profiles: whether text effects are typed out one character at a
+# time, and how much of each effect's delay is kept
+RENDER_PROFILES = {
+    "cinematic": {"per_char": True, "time_scale": 1.0},
+    "fast": {"per_char": False, "time_scale": 0.1},
+    "instant": {"per_char": False, "time_scale": 0.0},
+}
+
+_render_profile = os.environ.get("NEON_SHADOW_RENDER", "cinematic")
+if _render_profile not in RENDER_PROFILES:
+    _render_profile = "cinematic"
+
+
+def set_render_profile(name: str, driver=None) -> None:
+    """Sets the render profile ("cinematic", "fast" or "instant") of a driver.
+
+    Without a driver, sets the process default, used by every driver whose
+    player has not chosen a profile.
+    """
+    global _render_profile
+    if name not in RENDER_PROFILES:
+        raise ValueError(f"Unknown render profile: {name}")
+    if driver is None:
+        _render_profile = name
+    else:
+        driver.render_profile = name
+
+
+def get_render_profile(driver=None) -> str:
+    """Returns the name of a driver's render profile, or of the process default."""
+    if driver is not None and driver.render_profile is not None:
+        return driver.render_profile
+    return _render_profile
+
+
+def _active_profile(driver) -> dict:
+    """Returns the profile to use with driver; headless drivers are always instant."""
+    if driver.headless:
+        return RENDER_PROFILES["instant"]
+    return RENDER_PROFILES[get_render_profile(driver)]
+
+
+def echo(*values, sep: str = " ", end: str = "\n", flush: bool = False) -> None:
+    """Writes values through the active I/O driver, like the built-in print."""
+    driver = get_driver()
+    driver.write(sep.join(str(value) for value in values) + end)
+    if flush:
+        driver.flush()
+
+
+def prompt(text: str = "") -> str:
+    """Reads a line of input through the active I/O driver."""
+    driver = get_driver()
+    driver.flush()
+    return driver.read_line(text)
+
+
+def pause(seconds: float) -> None:
+    """Sleeps through the active I/O driver (a no-op when headless)."""
+    get_driver().sleep(seconds)
 
 
 def clear_screen() -> None:
     """Clears the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    get_driver().clear()
 
 
 def print_slow(text: str, delay: float = 0.03, color: str = CLR_RESET, newline: bool = True) -> None:
-    """Prints text character by character with optional color."""
-    for char in text:
-        sys.stdout.write(color + char + CLR_RESET)
-        sys.stdout.flush()
-        time.sleep(delay)
+    """Prints text character by character with optional color.
+
+    Outside the cinematic profile the whole line is written at once. A
+    keypress during the effect prints the rest of the text immediately.
+    """
+    driver = get_driver()
+    profile = _active_profile(driver)
+    end = "\n" if newline else ""
+    if not profile["per_char"]:
+        driver.write(color + text + CLR_RESET + end)
+        if profile["time_scale"]:
+            driver.flush()
+            driver.sleep(delay * len(text) * profile["time_scale"])
+        return
+    with driver.skippable():
+        # The color is set once for the whole line, not around every character
+        driver.write(color)
+        for i, char in enumerate(text):
+            if driver.key_pressed():
+                driver.write(text[i:])
+                break
+            driver.write(char)
+            driver.flush()
+            driver.sleep(delay)
+        driver.write(CLR_RESET)
     if newline:
-        print()  # Newline at the end
+        echo()  # Newline at the end
 
 
 def display_ascii_art(art, color=CLR_WHITE):
     """Prints multi-line ASCII art string with specified color."""
-    print(color)
-    print(art)
-    print(CLR_RESET)
+    echo(color)
+    echo(art)
+    echo(CLR_RESET)
 
 
 def display_loading_bar(text, duration=2, segments=20):
     """Display a loading bar with text."""
-    print(text, end='')
-    sys.stdout.flush()
-    for i in range(segments + 1):
-        time.sleep(duration / segments)
-        completed = '█' * i
-        remaining = '░' * (segments - i)
-        percent = int((i / segments) * 100)
-        print(
-            f"\r{text} [{CLR_BRIGHT}{CLR_GREEN}{completed}{CLR_RESET}{remaining}] {percent}%", end='')
-        sys.stdout.flush()
-    print("\r" + " " * (len(text) + segments + 10), end="\r")  # Clear the line
+    driver = get_driver()
+    duration *= _active_profile(driver)["time_scale"]
+    if not duration:
+        return
+    echo(text, end='', flush=True)
+    with driver.skippable():
+        for i in range(segments + 1):
+            if driver.key_pressed():
+                break
+            driver.sleep(duration / segments)
+            completed = '█' * i
+            remaining = '░' * (segments - i)
+            percent = int((i / segments) * 100)
+            echo(
+                f"\r{text} [{CLR_BRIGHT}{CLR_GREEN}{completed}{CLR_RESET}{remaining}] {percent}%", end='', flush=True)
+    echo("\r" + " " * (len(text) + segments + 10), end="\r")  # Clear the line
 
 
 def terminal_effect(text, delay=0.005):
     """Creates a terminal typing effect."""
-    print(f"{CLR_TERMINAL}{CLR_BACK_BLACK}╔════ TERMINAL SESSION ════╗{CLR_RESET}")
-    print(f"{CLR_TERMINAL}{CLR_BACK_BLACK}║                          ║{CLR_RESET}")
+    echo(f"{CLR_TERMINAL}{CLR_BACK_BLACK}╔════ TERMINAL SESSION ════╗{CLR_RESET}")
+    echo(f"{CLR_TERMINAL}{CLR_BACK_BLACK}║                          ║{CLR_RESET}")
 
     lines = text.split('\n')
     for line in lines:
-        print(f"{CLR_TERMINAL}{CLR_BACK_BLACK}║ {CLR_RESET}", end="")
+        echo(f"{CLR_TERMINAL}{CLR_BACK_BLACK}║ {CLR_RESET}", end="")
         print_slow(line, delay=delay, color=CLR_TERMINAL_TEXT, newline=False)
         # Calculate padding
         padding = 24 - len(line)  # 24 is the width of our terminal
-        print(" " * padding, end="")
-        print(f"{CLR_TERMINAL}{CLR_BACK_BLACK} ║{CLR_RESET}")
+        echo(" " * padding, end="")
+        echo(f"{CLR_TERMINAL}{CLR_BACK_BLACK} ║{CLR_RESET}")
 
-    print(f"{CLR_TERMINAL}{CLR_BACK_BLACK}║                          ║{CLR_RESET}")
-    print(f"{CLR_TERMINAL}{CLR_BACK_BLACK}╚══════════════════════════╝{CLR_RESET}")
+    echo(f"{CLR_TERMINAL}{CLR_BACK_BLACK}║                          ║{CLR_RESET}")
+    echo(f"{CLR_TERMINAL}{CLR_BACK_BLACK}╚══════════════════════════╝{CLR_RESET}")
 
 
 def hacker_animation(duration=2):
     """Display a hacking animation for the given duration."""
+    driver = get_driver()
+    duration *= _active_profile(driver)["time_scale"]
+    if not duration:
+        return
     characters = ['/', '-', '\\', '|']
     operations = ['DECRYPTING', 'BYPASSING',
                   'ACCESSING', 'INJECTING', 'EXTRACTING']
@@ -73,33 +164,33 @@ def hacker_animation(duration=2):
 
     start_time = time.time()
     i = 0
-    while time.time() - start_time < duration:
-        operation = random.choice(operations)
-        target = random.choice(targets)
-        print(
-            f"\r{CLR_BRIGHT}{CLR_GREEN}{characters[i % len(characters)]} {operation} {target}... {CLR_RESET}", end='')
-        sys.stdout.flush()
-        time.sleep(0.1)
-        i += 1
+    with driver.skippable():
+        while time.time() - start_time < duration and not driver.key_pressed():
+            operation = random.choice(operations)
+            target = random.choice(targets)
+            echo(
+                f"\r{CLR_BRIGHT}{CLR_GREEN}{characters[i % len(characters)]} {operation} {target}... {CLR_RESET}", end='', flush=True)
+            driver.sleep(0.1)
+            i += 1
 
-    print("\r" + " " * 50, end="\r")  # Clear the line
+    echo("\r" + " " * 50, end="\r")  # Clear the line
 
 
 def display_choices(choices):
     """Display a list of choices with options."""
     for idx, choice in enumerate(choices, 1):
-        print(f"{CLR_PROMPT}[{idx}] {choice}{CLR_RESET}")
-    print(f"{CLR_PROMPT}Enter your choice (1-{len(choices)}): {CLR_RESET}", end='')
-    return input()
+        echo(f"{CLR_PROMPT}[{idx}] {choice}{CLR_RESET}")
+    echo(f"{CLR_PROMPT}Enter your choice (1-{len(choices)}): {CLR_RESET}", end='')
+    return prompt()
 
 
 def display_aws_info(service, description, uses):
     """Display AWS service information in a formatted box."""
-    print(f"\n{CLR_BRIGHT}{CLR_BACK_BLUE}┌─{'─' * (len(service) + 2)}─┐{CLR_RESET}")
-    print(f"{CLR_BRIGHT}{CLR_BACK_BLUE}│ {CLR_WHITE}{service} │{CLR_RESET}")
-    print(f"{CLR_BRIGHT}{CLR_BACK_BLUE}└─{'─' * (len(service) + 2)}─┘{CLR_RESET}")
-    print(f"{CLR_CLOUD_SERVICE}Description: {description}{CLR_RESET}")
-    print(f"{CLR_CLOUD_SERVICE}Common Uses: {uses}{CLR_RESET}")
+    echo(f"\n{CLR_BRIGHT}{CLR_BACK_BLUE}┌─{'─' * (len(service) + 2)}─┐{CLR_RESET}")
+    echo(f"{CLR_BRIGHT}{CLR_BACK_BLUE}│ {CLR_WHITE}{service} │{CLR_RESET}")
+    echo(f"{CLR_BRIGHT}{CLR_BACK_BLUE}└─{'─' * (len(service) + 2)}─┘{CLR_RESET}")
+    echo(f"{CLR_CLOUD_SERVICE}Description: {description}{CLR_RESET}")
+    echo(f"{CLR_CLOUD_SERVICE}Common Uses: {uses}{CLR_RESET}")
 
 
 def display_notification(message, type="info"):
@@ -127,32 +218,33 @@ def display_notification(message, type="info"):
 
     # Create the box
     top_border = "═" * (box_width - 2)
-    print(f"\n{color}╔{top_border}╗{CLR_RESET}")
+    box = StyledText().line().line(f"╔{top_border}╗", color)
 
     # Print message with dynamic padding
     remaining_space = padding - (len(prefix) + 2 + len(message))
-    print(f"{color}║ {prefix}: {message}{' ' * remaining_space} ║{CLR_RESET}")
+    box.line(f"║ {prefix}: {message}{' ' * remaining_space} ║", color)
 
     # Bottom border
-    print(f"{color}╚{top_border}╝{CLR_RESET}")
+    box.line(f"╚{top_border}╝", color)
+    echo(box, end="")
 
 
 def display_mini_map(current_location, locations):
     """Display a mini map of nearby locations."""
-    print(f"\n{CLR_BRIGHT}{CLR_CYAN}╔══ MINI MAP ══╗{CLR_RESET}")
+    echo(f"\n{CLR_BRIGHT}{CLR_CYAN}╔══ MINI MAP ══╗{CLR_RESET}")
     for location in locations:
         if location == current_location:
-            print(
+            echo(
                 f"{CLR_BRIGHT}{CLR_CYAN}║ {CLR_BRIGHT}{CLR_YELLOW}[*] {location}{CLR_RESET}{' ' * (12 - len(location))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
         else:
-            print(
+            echo(
                 f"{CLR_BRIGHT}{CLR_CYAN}║ {CLR_RESET}[ ] {location}{' ' * (12 - len(location))}{CLR_BRIGHT}{CLR_CYAN}║{CLR_RESET}")
-    print(f"{CLR_BRIGHT}{CLR_CYAN}╚═══════════════╝{CLR_RESET}")
+    echo(f"{CLR_BRIGHT}{CLR_CYAN}╚═══════════════╝{CLR_RESET}")
 
 
 def display_tutorial_tip(tip):
     """Display a tutorial tip."""
-    print(
+    echo(
         f"\n{CLR_TUTORIAL}┌─ TIP ───────────────────────────────────────┐{CLR_RESET}")
-    print(f"{CLR_TUTORIAL}│ {tip}{' ' * (44 - len(tip))} │{CLR_RESET}")
-    print(f"{CLR_TUTORIAL}└──────────────────────────────────────────────┘{CLR_RESET}")
+    echo(f"{CLR_TUTORIAL}│ {tip}{' ' * (44 - len(tip))} │{CLR_RESET}")
+    echo(f"{CLR_TUTORIAL}└──────────────────────────────────────────────┘{CLR_RESET}")
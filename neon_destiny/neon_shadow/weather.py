@@ -0,0 +1,233 @@
+"""
+Weather engine for the Neon Shadow game.
+
+Weather types are numbered once per process, each region gets an alias table
+for drawing its weather in O(1), and the numeric ``consequences`` of every
+weather type are compiled into a row of modifiers. A game keeps each
+location's weather, days left and severity in lists indexed by location, and
+systems ask the engine for a modifier at a location rather than checking
+weather names.
+
+Weather changes are kept in a heap keyed by the day they happen, so moving
+time on costs O(changes), however many days are skipped. The engine draws
+from its own random number generator, so when the draws happen does not
+affect (and is not affected by) the rest of the game.
+"""
+
+import heapq
+import random
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from neon_shadow.location import Location
+
+# Chance that new weather is one of the region's typical weathers
+REGIONAL_SHARE = 0.7
+DEFAULT_REGION = "unknown"
+
+
+class AliasTable:
+    """Draws an index with fixed weights in O(1) (Vose's alias method).
+
+    Args:
+        weights: Non-negative weight of each index, not all zero
+    """
+
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: List[float]) -> None:
+        n = len(weights)
+        total = sum(weights)
+        scaled = [weight * n / total for weight in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw an index using one call to rng.random()."""
+        x = rng.random() * len(self.prob)
+        i = int(x)
+        return i if x - i < self.prob[i] else self.alias[i]
+
+
+class WeatherTable:
+    """The static half of the weather engine, shared by every game.
+
+    Args:
+        weather_types: Weather type dicts, as in ``content.weather``
+        severity_levels: Severity level -> dict with a ``multiplier``
+        regional_tendencies: Region -> names of its typical weathers
+    """
+
+    def __init__(self, weather_types: List[Dict[str, Any]],
+                 severity_levels: Mapping[int, Dict[str, Any]],
+                 regional_tendencies: Mapping[str, List[str]]) -> None:
+        self.types = list(weather_types)
+        self.ids: Dict[str, int] = {weather["name"]: i for i, weather in enumerate(self.types)}
+        self.severity_levels = severity_levels
+        self.multipliers: Dict[int, float] = {
+            level: severity["multiplier"] for level, severity in severity_levels.items()
+        }
+
+        # Consequence name -> column; one row of modifiers per weather type
+        self.modifier_ids: Dict[str, int] = {}
+        for weather in self.types:
+            for name, value in weather.get("consequences", {}).items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    self.modifier_ids.setdefault(name, len(self.modifier_ids))
+        self.modifiers: List[List[float]] = []
+        for weather in self.types:
+            row = [0.0] * len(self.modifier_ids)
+            for name, value in weather.get("consequences", {}).items():
+                if name in self.modifier_ids:
+                    row[self.modifier_ids[name]] = float(value)
+            self.modifiers.append(row)
+
+        # Typical weathers the content names but does not define, as (region, name);
+        # their share of the draw goes to all weathers alike
+        self.unknown: List[Tuple[str, str]] = []
+        n = len(self.types)
+        self.regions: Dict[str, AliasTable] = {}
+        for region, names in regional_tendencies.items():
+            weights = [(1 - REGIONAL_SHARE) / n] * n
+            for name in names:
+                share = REGIONAL_SHARE / len(names)
+                if name in self.ids:
+                    weights[self.ids[name]] += share
+                else:
+                    self.unknown.append((region, name))
+                    weights = [weight + share / n for weight in weights]
+            self.regions[region] = AliasTable(weights)
+        self.default = self.regions.get(DEFAULT_REGION) or AliasTable([1.0] * n)
+
+    def region(self, name: Optional[str]) -> AliasTable:
+        """Return the alias table for a region (the default one if unknown)."""
+        return self.regions.get(name or DEFAULT_REGION, self.default)
+
+
+class WeatherEngine:
+    """Weather at every location of one game.
+
+    Weather lasts 2-5 days, then a new one is drawn from the location's
+    regional table. Severity is fixed per location when the game starts.
+
+    Advancing by n days gives the same weather as advancing by one day n
+    times: changes due on the same day are drawn in location order.
+
+    Args:
+        table: The catalogue's weather table
+        locations: All locations, by name
+        rng: Random number generator used for weather only
+    """
+
+    def __init__(self, table: WeatherTable, locations: Mapping[str, Location],
+                 rng: random.Random) -> None:
+        self.table = table
+        self.rng = rng
+        self.names: List[str] = list(locations)
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self._regions = [table.region(location.region) for location in locations.values()]
+        self._difficulty = [location.difficulty for location in locations.values()]
+        self.day = 0
+
+        # Per location, by index in names
+        self.weather: List[int] = [0] * len(self.names)
+        self.severity: List[int] = [1] * len(self.names)
+        self.expiry: List[int] = [1] * len(self.names)  # Day the weather changes
+        self._changes: List[Tuple[int, int]] = []  # Heap of (expiry day, location index)
+
+    def roll(self) -> None:
+        """Draw every location's starting weather and severity."""
+        rng = self.rng
+        for i, difficulty in enumerate(self._difficulty):
+            self.weather[i] = self._regions[i].sample(rng)
+            # Severity based on location difficulty
+            self.severity[i] = min(6, max(1, difficulty // 2 + rng.randint(-1, 1)))
+            self.expiry[i] = self.day + rng.randint(2, 5)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._changes = [(expiry, i) for i, expiry in enumerate(self.expiry)]
+        heapq.heapify(self._changes)
+
+    def advance(self, days: int = 1) -> List[str]:
+        """Move time on by some days.
+
+        Returns:
+            Names of the locations whose weather changed, once each, in the
+            order they last changed
+        """
+        self.day = day = self.day + days
+        changes, rng = self._changes, self.rng
+        changed: Dict[int, None] = {}
+        while changes and changes[0][0] <= day:
+            expiry, i = changes[0]
+            self.weather[i] = self._regions[i].sample(rng)
+            self.expiry[i] = expiry = expiry + rng.randint(2, 5)
+            heapq.heapreplace(changes, (expiry, i))
+            changed.pop(i, None)
+            changed[i] = None
+        return [self.names[i] for i in changed]
+
+    def days_left(self, location_name: str) -> int:
+        """Return the days until the weather at a location changes."""
+        return self.expiry[self.ids[location_name]] - self.day
+
+    def current(self, location_name: str) -> Optional[Dict[str, Any]]:
+        """Return the weather type at a location, or None for an unknown location."""
+        i = self.ids.get(location_name)
+        return None if i is None else self.table.types[self.weather[i]]
+
+    def severity_at(self, location_name: str) -> Optional[Dict[str, Any]]:
+        """Return the severity level dict at a location, or None for an unknown location."""
+        i = self.ids.get(location_name)
+        return None if i is None else self.table.severity_levels[self.severity[i]]
+
+    def modifier(self, location_name: str, consequence: str) -> float:
+        """Return a weather consequence at a location, scaled by its severity.
+
+        Args:
+            location_name: Where to look
+            consequence: Name of a numeric entry in weather ``consequences``
+
+        Returns:
+            The scaled value, or 0.0 if the weather there has no such
+            consequence (or the location is unknown)
+        """
+        i = self.ids.get(location_name)
+        column = self.table.modifier_ids.get(consequence)
+        if i is None or column is None:
+            return 0.0
+        return self.table.modifiers[self.weather[i]][column] * self.table.multipliers[self.severity[i]]
+
+    def dump(self) -> Dict[str, List[Any]]:
+        """Return location name -> [weather name, days left, severity level]."""
+        types = self.table.types
+        return {
+            name: [types[self.weather[i]]["name"], self.expiry[i] - self.day, self.severity[i]]
+            for i, name in enumerate(self.names)
+        }
+
+    def load(self, saved: Mapping[str, List[Any]]) -> None:
+        """Restore weather from dump output.
+
+        Raises:
+            KeyError: If a weather type or severity level is unknown
+        """
+        for name, (weather_name, days_left, severity_level) in saved.items():
+            i = self.ids.get(name)
+            if i is None:
+                continue
+            if severity_level not in self.table.multipliers:
+                raise KeyError(severity_level)
+            self.weather[i] = self.table.ids[weather_name]
+            # Weather with no days left changes on the next day
+            self.expiry[i] = self.day + max(1, days_left)
+            self.severity[i] = severity_level
+        self._rebuild()
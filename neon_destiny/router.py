@@ -0,0 +1,256 @@
+# router.py - Front end that shares Cloud Ranger sessions between worker processes
+"""
+Serve Cloud Ranger from several worker processes behind one port.
+
+A single process runs the engine's Python on one core at a time. The router
+starts N copies of ``server.py`` as workers and accepts every connection
+itself. It hands each connection's socket over to the worker with the
+fewest sessions, passing the file descriptor over a Unix socket (POSIX
+only). From then on the client talks to that worker directly. A session
+never moves between processes, and the router never touches its bytes.
+
+Workers report their session counts and turn times back to the router every
+second; the router prints them as a table. A worker that exits is started
+again. The sessions it held are lost, but no other worker's are.
+
+Usage (from the neon_destiny directory):
+    python router.py --port 4000 --workers 8
+    nc localhost 4000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+from typing import Any, Dict, List, Optional
+
+from neon_shadow.ui import RENDER_PROFILES
+
+SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+RESPAWN_DELAY = 1.0  # Seconds before a worker that exited is started again
+
+
+def percentile(histogram: Dict[str, int], fraction: float) -> int:
+    """Return the bucket bound (in microseconds) below which fraction of the calls took.
+
+    Args:
+        histogram: Bucket upper bound -> calls, as in ``PhaseStats.to_dict``
+    """
+    total = sum(histogram.values())
+    seen = 0
+    for bound, calls in sorted(histogram.items(), key=lambda item: int(item[0])):
+        seen += calls
+        if seen >= fraction * total:
+            return int(bound)
+    return 0
+
+
+class Worker:
+    """One worker process and what the router knows about it.
+
+    Args:
+        index: The worker's number
+        options: Command-line options for server.py
+    """
+
+    def __init__(self, index: int, options: List[str]) -> None:
+        self.index = index
+        self.options = options
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.control: Optional[socket.socket] = None
+        self.report: Dict[str, Any] = {}  # Latest stats from the worker
+        self.handed = 0  # Connections handed over since that report
+        self.restarts = 0
+        self.started = asyncio.Event()  # Set while connections can be handed over
+
+    @property
+    def ready(self) -> bool:
+        return self.started.is_set()
+
+    @property
+    def load(self) -> int:
+        """Sessions the worker holds, as far as the router knows."""
+        return self.report.get("active", 0) + self.handed
+
+    def hand_over(self, conn: socket.socket) -> bool:
+        """Pass a connection to the worker; return False if it could not take it."""
+        try:
+            socket.send_fds(self.control, [b"c"], [conn.fileno()])
+        except OSError:
+            return False
+        self.handed += 1
+        return True
+
+    async def run(self) -> None:
+        """Keep the worker running, reading its reports, until cancelled."""
+        while True:
+            parent, child = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.process = await asyncio.create_subprocess_exec(
+                sys.executable, SERVER, "--control-fd", str(child.fileno()), *self.options,
+                pass_fds=(child.fileno(),))
+            child.close()
+            self.report, self.handed = {}, 0
+            reader, writer = await asyncio.open_connection(sock=parent)
+            self.control = parent
+            self.started.set()
+            try:
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    self.report, self.handed = json.loads(line), 0
+            finally:
+                self.started.clear()
+                self.control = None
+                writer.close()
+            code = await self.process.wait()
+            print(f"Worker {self.index} (pid {self.process.pid}) exited with code {code}; "
+                  f"restarting", file=sys.stderr, flush=True)
+            self.restarts += 1
+            await asyncio.sleep(RESPAWN_DELAY)
+
+
+class Router:
+    """Accepts connections and hands each to the least loaded worker.
+
+    Args:
+        workers: Number of worker processes
+        options: Command-line options for every worker's server.py
+    """
+
+    def __init__(self, workers: int, options: List[str]) -> None:
+        self.workers = [Worker(i, options) for i in range(workers)]
+        self.routed = 0
+        self.refused = 0
+
+    def route(self, conn: socket.socket) -> bool:
+        """Hand a connection to the least loaded worker that takes it."""
+        for worker in sorted((w for w in self.workers if w.ready), key=lambda w: w.load):
+            if worker.hand_over(conn):
+                self.routed += 1
+                return True
+        return False
+
+    async def serve(self, host: str, port: int, stats_interval: float = 10,
+                    backlog: int = 1024) -> None:
+        """Serve until cancelled, printing the address once listening."""
+        loop = asyncio.get_running_loop()
+        listener = socket.create_server((host, port), backlog=backlog)
+        listener.setblocking(False)
+        address = listener.getsockname()
+        tasks = [loop.create_task(worker.run()) for worker in self.workers]
+        if stats_interval:
+            tasks.append(loop.create_task(self._print_stats(stats_interval)))
+        # Connections wait in the listen backlog until every worker has started
+        await asyncio.gather(*(worker.started.wait() for worker in self.workers))
+        print(f"Routing Cloud Ranger on {address[0]}:{address[1]} "
+              f"to {len(self.workers)} workers", flush=True)
+        try:
+            while True:
+                conn, _ = await loop.sock_accept(listener)
+                with conn:
+                    # The worker gets its own copy of the socket; the router's is closed
+                    if not self.route(conn):
+                        self.refused += 1
+                        conn.setblocking(True)
+                        try:
+                            conn.sendall(b"No game server is available. Please try again shortly.\r\n")
+                        except OSError:
+                            pass
+        finally:
+            listener.close()
+            for task in tasks:
+                task.cancel()
+            running = [worker.process for worker in self.workers
+                       if worker.process is not None and worker.process.returncode is None]
+            for process in running:
+                process.terminate()
+            if running:
+                # Reap them while the event loop still watches them
+                await asyncio.wait([asyncio.ensure_future(process.wait()) for process in running],
+                                   timeout=5)
+
+    async def _print_stats(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            print(self.format_stats(), flush=True)
+
+    def format_stats(self) -> str:
+        """Format every worker's sessions and turn times as a plain-text table."""
+        lines = [f"{'worker':>6} {'pid':>7} {'active':>7} {'served':>7} {'restarts':>8} "
+                 f"{'turns':>8} {'mean ms':>8} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>8}"]
+        totals = {"active": 0, "served": 0, "restarts": 0, "turns": 0}
+        for worker in self.workers:
+            report = worker.report
+            turns = report.get("turns", {})
+            histogram = turns.get("histogram_us", {})
+            pid = worker.process.pid if worker.process else "-"
+            longest = turns.get("max_us", 0)
+            p50, p99 = (min(longest, percentile(histogram, f)) for f in (0.5, 0.99))
+            lines.append(
+                f"{worker.index:>6} {pid:>7} {worker.load:>7} {report.get('served', 0):>7} "
+                f"{worker.restarts:>8} {turns.get('calls', 0):>8} "
+                f"{turns.get('mean_us', 0) / 1e3:>8.1f} {p50 / 1e3:>7.1f} {p99 / 1e3:>7.1f} "
+                f"{longest / 1e3:>8.1f}")
+            totals["active"] += worker.load
+            totals["served"] += report.get("served", 0)
+            totals["restarts"] += worker.restarts
+            totals["turns"] += turns.get("calls", 0)
+        lines.append(f"{'all':>6} {'':>7} {totals['active']:>7} {totals['served']:>7} "
+                     f"{totals['restarts']:>8} {totals['turns']:>8}   "
+                     f"(routed {self.routed}, refused {self.refused})")
+        lines.append("Percentiles are power-of-two bucket bounds; turn times leave out pauses.")
+        return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Serve Cloud Ranger from several worker processes behind one port.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=4000,
+                        help="port to listen on, 0 for any free port (default: 4000)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--stats", type=float, default=10,
+                        help="print worker stats every this many seconds, 0 for never (default: 10)")
+    parser.add_argument("--max-sessions", type=int, default=5000,
+                        help="most concurrent sessions per worker (default: 5000)")
+    parser.add_argument("--idle-timeout", type=float, default=0,
+                        help="disconnect clients idle this many seconds (default: never)")
+    parser.add_argument("--render", choices=sorted(RENDER_PROFILES), default="fast",
+                        help="render profile for every session (default: fast)")
+    parser.add_argument("--no-color", action="store_true",
+                        help="send plain text without ANSI sequences")
+    parser.add_argument("--go-ahead", action="store_true",
+                        help="end every prompt with telnet IAC GA, for MUD clients")
+    args = parser.parse_args(argv)
+
+    if not hasattr(socket, "send_fds"):
+        parser.error("handing connections to workers needs a POSIX system")
+    options = ["--max-sessions", str(args.max_sessions), "--idle-timeout", str(args.idle_timeout),
+               "--render", args.render]
+    options += ["--no-color"] * args.no_color + ["--go-ahead"] * args.go_ahead
+
+    router = Router(args.workers, options)
+
+    async def run() -> None:
+        # Stop cleanly on SIGTERM as on Ctrl-C
+        task = asyncio.current_task()
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+        await router.serve(args.host, args.port, args.stats)
+
+    try:
+        asyncio.run(run())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    print(router.format_stats())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
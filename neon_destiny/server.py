@@ -0,0 +1,254 @@
+# server.py - Network entry point: many Cloud Ranger sessions in one process
+"""
+Serve Cloud Ranger to many players at once over a plain TCP line protocol.
+
+Each connection gets its own game, played in a worker thread (see
+``neon_shadow.session``); the asyncio event loop only moves bytes, so a
+session pausing, waiting for its player or playing a turn never holds up
+another. Output is UTF-8 text with CRLF line endings and ANSI colors; input
+is one line per answer.
+
+Usage (from the neon_destiny directory):
+    python server.py --port 4000
+    nc localhost 4000          # or: telnet localhost 4000
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import re
+import socket
+import sys
+import threading
+from typing import Any, Dict, Optional
+
+# Clients get colors whatever the server's own stdout is
+os.environ.setdefault("FORCE_COLOR", "1")
+
+from main import play
+from neon_shadow.profiler import PhaseStats
+from neon_shadow.session import STACK_SIZE, Channel, GameSession
+from neon_shadow.ui import RENDER_PROFILES, set_render_profile
+
+# Lines a client can send ahead of the game before the server stops reading
+INPUT_BACKLOG = 16
+MAX_LINE = 1024  # Longest input line in bytes
+GO_AHEAD = b"\xff\xf9"  # Telnet IAC GA: marks the end of a prompt
+# Telnet option negotiation and commands a client may send
+TELNET_COMMAND = re.compile(rb"\xff(?:[\xfb-\xfe].|[\xf0-\xfa])", re.S)
+
+
+class TcpChannel(Channel):
+    """A client connected over TCP, sending and receiving lines.
+
+    Args:
+        reader: The connection's stream reader
+        writer: The connection's stream writer
+        idle_timeout: Seconds without input before the client is
+            disconnected (0 waits forever)
+        go_ahead: End every prompt with telnet IAC GA
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 idle_timeout: float = 0, go_ahead: bool = False) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.idle_timeout = idle_timeout or None
+        self.go_ahead = go_ahead
+        self.lines: asyncio.Queue = asyncio.Queue(maxsize=INPUT_BACKLOG)
+        self.gone = False
+
+    async def send(self, text: str, prompt: bool = False) -> None:
+        data = text.replace("\n", "\r\n").encode("utf-8", "replace")
+        if prompt and self.go_ahead:
+            data += GO_AHEAD
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def receive(self) -> Optional[str]:
+        if self.gone and self.lines.empty():
+            return None
+        return await self.lines.get()
+
+    def skip(self) -> bool:
+        if self.lines.empty():
+            return False
+        if self.lines.get_nowait() is None:
+            self.lines.put_nowait(None)  # Still gone
+            return False
+        return True
+
+    async def read_line(self) -> Optional[str]:
+        """Read the client's next line, or return None once it has disconnected."""
+        data = await self.reader.readline()
+        if not data:
+            return None
+        data = TELNET_COMMAND.sub(b"", data)
+        return data.decode("utf-8", "replace").rstrip("\r\n")
+
+    async def pump(self) -> None:
+        """Read the client's lines until it disconnects or idles out."""
+        try:
+            while True:
+                line = await asyncio.wait_for(self.read_line(), self.idle_timeout)
+                if line is None:
+                    break
+                await self.lines.put(line)
+        except (asyncio.TimeoutError, ConnectionError, ValueError):
+            # ValueError: a line longer than the limit, or one the protocol does not allow
+            pass
+        finally:
+            self.gone = True
+            if self.lines.empty():
+                self.lines.put_nowait(None)  # Wake the game if it is waiting
+
+    async def close(self) -> None:
+        """Disconnect the client."""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class GameServer:
+    """Accepts connections and plays a session with each.
+
+    Connections come from a listening socket (``serve``) or are handed over
+    by a router (``serve_handoff``, see ``router.py``).
+
+    Args:
+        max_sessions: Connections beyond this many are turned away
+        idle_timeout: Seconds without input before a client is disconnected
+        color: Send ANSI colors and screen clears
+        go_ahead: End every prompt with telnet IAC GA
+    """
+
+    def __init__(self, max_sessions: int = 5000, idle_timeout: float = 0,
+                 color: bool = True, go_ahead: bool = False) -> None:
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.color = color
+        self.go_ahead = go_ahead
+        self.active = 0
+        self.served = 0
+        self.turns = PhaseStats()  # Time from each answer to the next prompt
+        self._ids = itertools.count(1)
+        self._tasks = set()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        channel = TcpChannel(reader, writer, self.idle_timeout, self.go_ahead)
+        if self.active >= self.max_sessions:
+            writer.write(b"The server is full. Please try again later.\r\n")
+            await channel.close()
+            return
+        await self.run_session(channel)
+
+    async def run_session(self, channel: TcpChannel) -> None:
+        """Play a session with a connected client until one of them ends it, then disconnect."""
+        self.active += 1
+        self.served += 1
+        pump = asyncio.create_task(channel.pump())
+        try:
+            await GameSession(channel, play, self.color, f"session-{next(self._ids)}",
+                              self.turns).run()
+        finally:
+            self.active -= 1
+            pump.cancel()
+            await channel.close()
+
+    async def serve(self, host: str, port: int, backlog: int = 1024) -> None:
+        """Serve until cancelled, printing the address once listening."""
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE,
+                                            backlog=backlog)
+        address = server.sockets[0].getsockname()
+        print(f"Serving Cloud Ranger on {address[0]}:{address[1]}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the session counts and turn times so far."""
+        return {"active": self.active, "served": self.served, "turns": self.turns.to_dict()}
+
+    async def serve_handoff(self, control: socket.socket, interval: float = 1.0) -> None:
+        """Serve connections handed over on a Unix socket, until it closes.
+
+        Every message on the socket carries one connection's file
+        descriptor. Every interval seconds ``stats`` is written back on the
+        same socket as a line of JSON.
+        """
+        loop = asyncio.get_running_loop()
+        control.setblocking(False)
+        closed = loop.create_future()
+
+        def receive() -> None:
+            try:
+                message, fds, _, _ = socket.recv_fds(control, 1, 1)
+            except BlockingIOError:
+                return
+            except OSError:
+                message, fds = b"", []
+            for fd in fds:
+                task = loop.create_task(self._handle_socket(socket.socket(fileno=fd)))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            if not message and not closed.done():
+                closed.set_result(None)
+
+        loop.add_reader(control.fileno(), receive)
+        try:
+            while not closed.done():
+                await asyncio.wait([closed], timeout=interval)
+                try:
+                    await loop.sock_sendall(control, json.dumps(self.stats()).encode() + b"\n")
+                except OSError:
+                    break
+        finally:
+            loop.remove_reader(control.fileno())
+
+    async def _handle_socket(self, sock: socket.socket) -> None:
+        reader, writer = await asyncio.open_connection(sock=sock, limit=MAX_LINE)
+        await self.handle(reader, writer)
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Serve Cloud Ranger sessions over TCP.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=4000,
+                        help="port to listen on, 0 for any free port (default: 4000)")
+    parser.add_argument("--max-sessions", type=int, default=5000,
+                        help="most concurrent sessions (default: 5000)")
+    parser.add_argument("--idle-timeout", type=float, default=0,
+                        help="disconnect clients idle this many seconds (default: never)")
+    parser.add_argument("--render", choices=sorted(RENDER_PROFILES), default="fast",
+                        help="render profile for every session (default: fast)")
+    parser.add_argument("--no-color", action="store_true",
+                        help="send plain text without ANSI sequences")
+    parser.add_argument("--go-ahead", action="store_true",
+                        help="end every prompt with telnet IAC GA, for MUD clients")
+    # Used by router.py to run this server as one of its workers
+    parser.add_argument("--control-fd", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--report-interval", type=float, default=1.0, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    set_render_profile(args.render)
+    threading.stack_size(STACK_SIZE)
+    server = GameServer(args.max_sessions, args.idle_timeout, not args.no_color, args.go_ahead)
+    try:
+        if args.control_fd is not None:
+            control = socket.socket(fileno=args.control_fd)
+            asyncio.run(server.serve_handoff(control, args.report_interval))
+        else:
+            asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        if args.control_fd is None:
+            print(f"\nServed {server.served} sessions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,11 @@ setup(
     version="0.1",
     packages=find_packages(),
     install_requires=[
-        "colorama",
+        # Only older Windows consoles need help with ANSI colors
+        'colorama; platform_system == "Windows"',
     ],
+    extras_require={
+        # Vectorized updates for large service fleets
+        "fast": ["numpy"],
+    },
 )
@@ -0,0 +1,240 @@
+# web.py - Browser entry point: Cloud Ranger over HTTP and WebSocket
+"""
+Serve Cloud Ranger to web browsers.
+
+``GET /`` returns a page with a terminal (web/terminal.html), which opens a
+WebSocket to ``/play``. Each WebSocket gets its own game, played the way
+server.py plays one (see ``neon_shadow.session``). The browser does not get
+a stream of terminal output, though. It gets the screen as lines (see
+``neon_shadow.screen.LineScreen``), and each message carries only the lines
+that changed. A screen drawn again every turn, such as the inventory or the
+service analytics, costs only its changes. The player's answers come back
+as text messages, one line each.
+
+Only the standard library is used: the HTTP request and the WebSocket
+protocol (RFC 6455, without extensions) are handled here.
+
+Usage (from the neon_destiny directory):
+    python web.py --port 8000
+    then open http://localhost:8000/
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import sys
+import threading
+from typing import Dict, Optional
+
+# Imported first: it turns colors on before the game is imported
+from server import MAX_LINE, GameServer, TcpChannel
+from neon_shadow.screen import LineScreen
+from neon_shadow.session import STACK_SIZE
+from neon_shadow.ui import RENDER_PROFILES, set_render_profile
+
+PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "web", "terminal.html")
+MAX_REQUEST = 16 * 1024  # Longest request line and headers in bytes
+REQUEST_TIMEOUT = 10  # Seconds a client has to send its request
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# WebSocket opcodes
+TEXT, CLOSE, PING, PONG = 0x1, 0x8, 0x9, 0xA
+
+
+def accept_key(key: str) -> str:
+    """Return the Sec-WebSocket-Accept value that answers a Sec-WebSocket-Key."""
+    digest = hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def frame(opcode: int, payload: bytes = b"") -> bytes:
+    """Return a whole, unmasked WebSocket frame, as a server sends them."""
+    length = len(payload)
+    if length < 126:
+        head = bytes((0x80 | opcode, length))
+    elif length < 1 << 16:
+        head = bytes((0x80 | opcode, 126)) + length.to_bytes(2, "big")
+    else:
+        head = bytes((0x80 | opcode, 127)) + length.to_bytes(8, "big")
+    return head + payload
+
+
+class WebSocketChannel(TcpChannel):
+    """A browser connected over a WebSocket, shown the screen line by line.
+
+    Every message to the browser is a JSON object with the changes from
+    ``LineScreen.update``, and ``"prompt": true`` if the game waits for an
+    answer. The answers the player types are added to the screen as the
+    game reads them, the way a terminal echoes them.
+
+    Args:
+        reader: The connection's stream reader, after the handshake
+        writer: The connection's stream writer
+        idle_timeout: Seconds without input before the browser is
+            disconnected (0 waits forever)
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 idle_timeout: float = 0) -> None:
+        super().__init__(reader, writer, idle_timeout)
+        self.screen = LineScreen()
+
+    async def send(self, text: str, prompt: bool = False) -> None:
+        self.screen.feed(text)
+        update = self.screen.update() or {}
+        if prompt:
+            update["prompt"] = True
+        if update:
+            self.writer.write(frame(TEXT, json.dumps(update).encode("utf-8")))
+            await self.writer.drain()
+
+    async def receive(self) -> Optional[str]:
+        line = await super().receive()
+        if line is not None:
+            self.screen.feed(line + "\n")
+        return line
+
+    async def read_line(self) -> Optional[str]:
+        """Read the browser's next message, or return None once it has closed.
+
+        Raises:
+            ValueError: If a frame is not masked or the message is too long
+        """
+        message = b""
+        try:
+            while True:
+                first, second = await self.reader.readexactly(2)
+                length = second & 0x7F
+                if length == 126:
+                    length = int.from_bytes(await self.reader.readexactly(2), "big")
+                elif length == 127:
+                    length = int.from_bytes(await self.reader.readexactly(8), "big")
+                if not second & 0x80:
+                    raise ValueError("Client frames must be masked")
+                if len(message) + length > MAX_LINE:
+                    raise ValueError("Message too long")
+                mask = await self.reader.readexactly(4)
+                data = await self.reader.readexactly(length)
+                key = (mask * (length // 4 + 1))[:length]
+                payload = (int.from_bytes(data, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+                opcode = first & 0x0F
+                if opcode == CLOSE:
+                    return None
+                if opcode == PING:
+                    self.writer.write(frame(PONG, payload))
+                elif opcode != PONG:
+                    message += payload
+                    if first & 0x80:  # The message's last frame
+                        return message.decode("utf-8", "replace").rstrip("\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+
+    async def close(self) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(frame(CLOSE, (1000).to_bytes(2, "big")))  # Normal closure
+        await super().close()
+
+
+class WebServer(GameServer):
+    """Serves the browser page and plays a session with each WebSocket.
+
+    Args:
+        max_sessions: WebSockets beyond this many are turned away
+        idle_timeout: Seconds without input before a browser is disconnected
+    """
+
+    def __init__(self, max_sessions: int = 5000, idle_timeout: float = 0) -> None:
+        super().__init__(max_sessions, idle_timeout)
+        with open(PAGE, "rb") as f:
+            self.page = f.read()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), REQUEST_TIMEOUT)
+            request, *lines = head.decode("latin-1").split("\r\n")
+            method, target, _ = request.split(" ", 2)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                ConnectionError, ValueError):
+            writer.close()
+            return
+        headers: Dict[str, str] = {}
+        for line in lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        path = target.split("?", 1)[0]
+
+        if method != "GET":
+            await self._respond(writer, "405 Method Not Allowed", b"Only GET is supported.\n")
+        elif path in ("/", "/index.html"):
+            await self._respond(writer, "200 OK", self.page, "text/html; charset=utf-8")
+        elif path != "/play":
+            await self._respond(writer, "404 Not Found", b"Not found.\n")
+        elif headers.get("upgrade", "").lower() != "websocket" or "sec-websocket-key" not in headers:
+            await self._respond(writer, "400 Bad Request", b"Expected a WebSocket handshake.\n")
+        elif self.active >= self.max_sessions:
+            await self._respond(writer, "503 Service Unavailable",
+                                b"The server is full. Please try again later.\n")
+        else:
+            writer.write(
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept_key(headers['sec-websocket-key'])}\r\n"
+                "\r\n".encode("ascii"))
+            await self.run_session(WebSocketChannel(reader, writer, self.idle_timeout))
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: str, body: bytes,
+                       content_type: str = "text/plain; charset=utf-8") -> None:
+        """Send a whole HTTP response and close the connection."""
+        writer.write(f"HTTP/1.1 {status}\r\n"
+                     f"Content-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\n"
+                     "Connection: close\r\n"
+                     "\r\n".encode("ascii") + body)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def serve(self, host: str, port: int, backlog: int = 1024) -> None:
+        """Serve until cancelled, printing the page's address once listening."""
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_REQUEST,
+                                            backlog=backlog)
+        address = server.sockets[0].getsockname()
+        print(f"Serving Cloud Ranger on http://{address[0]}:{address[1]}/", flush=True)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Serve Cloud Ranger to web browsers.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="port to listen on, 0 for any free port (default: 8000)")
+    parser.add_argument("--max-sessions", type=int, default=5000,
+                        help="most concurrent sessions (default: 5000)")
+    parser.add_argument("--idle-timeout", type=float, default=0,
+                        help="disconnect browsers idle this many seconds (default: never)")
+    parser.add_argument("--render", choices=sorted(RENDER_PROFILES), default="fast",
+                        help="render profile for every session (default: fast)")
+    args = parser.parse_args(argv)
+
+    set_render_profile(args.render)
+    threading.stack_size(STACK_SIZE)
+    server = WebServer(args.max_sessions, args.idle_timeout)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\nServed {server.served} sessions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())